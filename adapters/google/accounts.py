@@ -1,8 +1,49 @@
+import asyncio
+import os
+import time
+from dataclasses import dataclass
+
 from structlog import get_logger
 from adapters.google.client import google_ads_client
+from core.infrastructure.cache import LRUCache
 
 logger = get_logger(__name__)
 
+# Hierarchies younger than the TTL are served as-is; older ones (up to the
+# stale limit) are served while a background refresh runs.
+ACCOUNTS_CACHE_TTL = float(os.getenv("GOOGLE_ACCOUNTS_CACHE_TTL_SECONDS", "900"))
+ACCOUNTS_CACHE_STALE = float(os.getenv("GOOGLE_ACCOUNTS_CACHE_STALE_SECONDS", "86400"))
+ACCOUNTS_CACHE_SIZE = int(os.getenv("GOOGLE_ACCOUNTS_CACHE_SIZE", "1000"))
+ACCOUNTS_CONCURRENCY = int(os.getenv("GOOGLE_ACCOUNTS_CONCURRENCY", "8"))
+
+
+@dataclass
+class _Expansion:
+    """One accessible customer: its manager flag, name and (for managers) sub-accounts."""
+
+    is_manager: bool
+    name: str
+    sub_accounts: list[dict]
+
+
+@dataclass
+class _Hierarchy:
+    accounts: list[dict]
+    expansions: dict[str, _Expansion]
+    fetched_at: float
+
+
+# Shared by every adapter instance; keyed by client_code.
+_hierarchies = LRUCache(maxsize=ACCOUNTS_CACHE_SIZE)
+_refreshing: dict[str, asyncio.Task] = {}
+# Invalidation counts per client_code (None counts invalidate-all); a refresh
+# started before an invalidation must not cache what it fetched.
+_generations: dict[str | None, int] = {}
+
+
+def _generation(client_code: str) -> tuple[int, int]:
+    return _generations.get(None, 0), _generations.get(client_code, 0)
+
 
 class GoogleAccountsAdapter:
     SUB_ACCOUNTS_QUERY = """
@@ -16,17 +57,124 @@ class GoogleAccountsAdapter:
     def __init__(self) -> None:
         self.client = google_ads_client
 
-    async def fetch_accessible_accounts(self, client_code: str) -> list:
-        """Fetch all accessible accounts, expanding manager accounts to sub-accounts."""
+    async def fetch_accessible_accounts(
+        self, client_code: str, refresh: bool = False
+    ) -> list:
+        """Fetch all accessible accounts, expanding manager accounts to sub-accounts.
+
+        The resolved hierarchy is cached per client_code (see ACCOUNTS_CACHE_TTL);
+        refresh=True bypasses the cache.
+        """
+        cached: _Hierarchy | None = _hierarchies.get(client_code)
+        age = time.monotonic() - cached.fetched_at if cached else None
+
+        if cached and not refresh and age < ACCOUNTS_CACHE_TTL:
+            return _copy(cached.accounts)
+        if cached and not refresh and age < ACCOUNTS_CACHE_STALE:
+            self._refresh(client_code)
+            logger.info("accounts_cache_stale", client_code=client_code, age=round(age))
+            return _copy(cached.accounts)
+
+        # Another caller's cancellation must not cancel the shared refresh.
+        hierarchy = await asyncio.shield(self._refresh(client_code))
+        return _copy(hierarchy.accounts)
+
+    @staticmethod
+    def invalidate(client_code: str | None = None) -> None:
+        """Drop the cached hierarchy for a client, or for every client.
+
+        Refreshes already in flight still answer their callers, but their
+        results are not cached and later callers start a new refresh.
+        """
+        _generations[client_code] = _generations.get(client_code, 0) + 1
+        if client_code is None:
+            _hierarchies.clear()
+            _refreshing.clear()
+        else:
+            _hierarchies.pop(client_code)
+            _refreshing.pop(client_code, None)
+
+    def _refresh(self, client_code: str) -> asyncio.Task:
+        """Start (or join) the single in-flight hierarchy refresh for a client."""
+        task = _refreshing.get(client_code)
+        if task is None:
+            task = asyncio.create_task(self._resolve_hierarchy(client_code))
+            _refreshing[client_code] = task
+            generation = _generation(client_code)
+            task.add_done_callback(
+                lambda t: self._on_refreshed(client_code, t, generation)
+            )
+        return task
+
+    @staticmethod
+    def _on_refreshed(
+        client_code: str, task: asyncio.Task, generation: tuple[int, int]
+    ) -> None:
+        if _refreshing.get(client_code) is task:
+            del _refreshing[client_code]
+        if task.cancelled():
+            return
+        if task.exception() is not None:
+            # Surfaced to awaiting callers; background refreshes only log it.
+            logger.warning(
+                "accounts_refresh_failed",
+                client_code=client_code,
+                error=str(task.exception()),
+            )
+            return
+        if _generation(client_code) != generation:
+            logger.info("accounts_refresh_discarded", client_code=client_code)
+            return
+        _hierarchies.set(client_code, task.result())
+
+    async def _resolve_hierarchy(self, client_code: str) -> _Hierarchy:
         customer_ids = await self._list_customer_ids(client_code)
+        previous: _Hierarchy | None = _hierarchies.get(client_code)
+        slots = asyncio.Semaphore(ACCOUNTS_CONCURRENCY)
+
+        async def expand(cid: str) -> _Expansion:
+            async with slots:
+                is_mgr = None
+                try:
+                    is_mgr, acct_name = await self._fetch_account_info(client_code, cid)
+                    sub_accounts = (
+                        await self._list_sub_accounts(client_code, cid)
+                        if is_mgr
+                        else []
+                    )
+                except Exception as e:
+                    # Keep serving this customer's last known expansion.
+                    if previous is None or cid not in previous.expansions:
+                        if is_mgr is not None:
+                            raise
+                        # Never seen and unreadable (e.g. a cancelled account):
+                        # list it as a plain account, as before caching.
+                        logger.warning(
+                            "accounts_info_failed",
+                            client_code=client_code,
+                            customer_id=cid,
+                            error=str(e),
+                        )
+                        return _Expansion(False, "", [])
+                    logger.warning(
+                        "accounts_expansion_failed_using_stale",
+                        client_code=client_code,
+                        customer_id=cid,
+                        error=str(e),
+                    )
+                    return previous.expansions[cid]
+            return _Expansion(is_mgr, acct_name, sub_accounts)
+
+        expanded = await asyncio.gather(*[expand(cid) for cid in customer_ids])
+        expansions = dict(zip(customer_ids, expanded))
 
         all_accounts = []
         seen_ids: set[str] = set()
 
-        for cid in customer_ids:
-            is_mgr, acct_name = await self._fetch_account_info(client_code, cid)
-            if is_mgr:
-                for acc in await self._list_sub_accounts(client_code, cid):
+        for cid, expansion in expansions.items():
+            acct_name = expansion.name
+            if expansion.is_manager:
+                for acc in expansion.sub_accounts:
                     if acc["customer_id"] not in seen_ids:
                         seen_ids.add(acc["customer_id"])
                         all_accounts.append(
@@ -56,7 +204,7 @@ class GoogleAccountsAdapter:
             client_code=client_code,
             count=len(all_accounts),
         )
-        return all_accounts
+        return _Hierarchy(all_accounts, expansions, time.monotonic())
 
     async def _list_customer_ids(self, client_code: str) -> list[str]:
         """List all accessible customer IDs for the authenticated user."""
@@ -70,19 +218,16 @@ class GoogleAccountsAdapter:
         self, client_code: str, customer_id: str
     ) -> tuple[bool, str]:
         """Fetch manager flag and descriptive name for an account."""
-        try:
-            results = await self.client.search_stream(
-                query="SELECT customer.manager, customer.descriptive_name FROM customer",
-                customer_id=customer_id,
-                login_customer_id=customer_id,
-                client_code=client_code,
-            )
-            customer = results[0].get("customer", {})
-            is_manager = customer.get("manager", False)
-            name = customer.get("descriptiveName", "")
-            return is_manager, name
-        except Exception:
-            return False, ""
+        results = await self.client.search_stream(
+            query="SELECT customer.manager, customer.descriptive_name FROM customer",
+            customer_id=customer_id,
+            login_customer_id=customer_id,
+            client_code=client_code,
+        )
+        customer = results[0].get("customer", {}) if results else {}
+        is_manager = customer.get("manager", False)
+        name = customer.get("descriptiveName", "")
+        return is_manager, name
 
     async def _list_sub_accounts(self, client_code: str, manager_id: str) -> list[dict]:
         """List sub-accounts under a manager (MCC) account."""
@@ -105,3 +250,7 @@ class GoogleAccountsAdapter:
 
         logger.info("Found sub-accounts", manager_id=manager_id, count=len(accounts))
         return accounts
+
+
+def _copy(accounts: list[dict]) -> list[dict]:
+    return [dict(account) for account in accounts]
@@ -1,11 +1,19 @@
+import asyncio
 import os
 import time
+from collections.abc import AsyncIterator
 
 import httpx
 import structlog
 
-from oserver.services.connection import fetch_google_api_token_simple
-from core.infrastructure.http_client import http_request
+from oserver.services.token_provider import (
+    get_google_api_token,
+    invalidate_google_api_token,
+    token_provider,
+)
+from core.infrastructure.http_client import get_http_client, http_request, http_stream
+from adapters.google.query_cache import get_gaql_cache
+from adapters.google.stream_parser import JsonArrayStreamParser
 
 from exceptions.custom_exceptions import (
     GoogleAPIException,
@@ -16,9 +24,7 @@ from exceptions.custom_exceptions import (
 logger = structlog.get_logger(__name__)
 
 GOOGLE_TOKEN_URL = "https://oauth2.googleapis.com/token"
-
-_cached_google_api_token: str | None = None
-_google_api_token_expiry: float = 0
+LOCAL_OAUTH_TOKEN_KEY = ("local", "GOOGLE_ADS_REFRESH_TOKEN")
 
 
 class GoogleAdsClient:
@@ -27,16 +33,12 @@ class GoogleAdsClient:
 
     def __init__(self) -> None:
         self.developer_token = os.getenv("GOOGLE_ADS_DEVELOPER_TOKEN")
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._timezone_lookups: dict[str, asyncio.Task] = {}
 
     async def get(self, endpoint: str, client_code: str) -> dict:
-        token = self._get_google_api_token(client_code)
         url = f"{self.BASE_URL}/{self.API_VERSION}/{endpoint}"
-        response = await http_request(
-            "GET",
-            url,
-            headers=self._build_auth_headers(token),
-            error_handler=_raise_google_error,
-        )
+        response = await self._request("GET", url, client_code)
         return response.json()
 
     async def search(
@@ -47,14 +49,9 @@ class GoogleAdsClient:
         client_code: str,
     ) -> list:
         """Execute GAQL query via googleAds:search."""
-        token = self._get_google_api_token(client_code)
         url = f"{self.BASE_URL}/{self.API_VERSION}/customers/{customer_id}/googleAds:search"
-        response = await http_request(
-            "POST",
-            url,
-            headers=self._build_auth_headers(token, login_customer_id),
-            json={"query": query},
-            error_handler=_raise_google_error,
+        response = await self._request(
+            "POST", url, client_code, login_customer_id, json={"query": query}
         )
         return response.json().get("results", [])
 
@@ -66,37 +63,223 @@ class GoogleAdsClient:
         login_customer_id: str | None = None,
     ) -> dict:
         """Execute mutate operations via googleAds:mutate."""
-        token = self._get_google_api_token(client_code)
         url = f"{self.BASE_URL}/{self.API_VERSION}/customers/{customer_id}/googleAds:mutate"
-        response = await http_request(
-            "POST",
-            url,
-            headers=self._build_auth_headers(token, login_customer_id),
-            json=mutate_payload,
-            error_handler=_raise_google_error,
+        response = await self._request(
+            "POST", url, client_code, login_customer_id, json=mutate_payload
         )
+        await get_gaql_cache().invalidate(customer_id)
         return response.json()
 
     async def search_stream(
-        self, query: str, customer_id: str, login_customer_id: str, client_code: str
+        self,
+        query: str,
+        customer_id: str,
+        login_customer_id: str,
+        client_code: str,
+        use_cache: bool = True,
+    ) -> list:
+        """Execute GAQL via googleAds:searchStream and return every row.
+
+        Concurrent calls for the same cacheable query share one request.
+        """
+        key = await self._cache_key(
+            query, customer_id, login_customer_id, client_code, use_cache
+        )
+        if key is None:
+            return await self._collect(
+                query, customer_id, login_customer_id, client_code, use_cache
+            )
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                self._collect(query, customer_id, login_customer_id, client_code, True)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _collect(
+        self,
+        query: str,
+        customer_id: str,
+        login_customer_id: str,
+        client_code: str,
+        use_cache: bool,
     ) -> list:
-        token = self._get_google_api_token(client_code)
+        results = []
+        async for batch in self.iter_search_stream(
+            query, customer_id, login_customer_id, client_code, use_cache
+        ):
+            results.extend(batch)
+        return results
+
+    async def iter_search_stream(
+        self,
+        query: str,
+        customer_id: str,
+        login_customer_id: str,
+        client_code: str,
+        use_cache: bool = True,
+    ) -> AsyncIterator[list]:
+        """Execute GAQL via googleAds:searchStream, yielding each batch of rows as it arrives.
+
+        The response array is parsed incrementally, so only the batch in
+        flight is held in memory and callers can start processing before the
+        download completes.
+
+        Reporting queries are served from the GAQL cache when possible (as a
+        single batch) and stored there once fully streamed; see
+        adapters.google.query_cache. use_cache=False always queries Google.
+        """
+        cache = get_gaql_cache()
+        key = await self._cache_key(
+            query, customer_id, login_customer_id, client_code, use_cache
+        )
+        if key is not None:
+            cached = await cache.get(key)
+            if cached is not None:
+                logger.info("gaql_cache_hit", customer_id=customer_id, rows=len(cached))
+                yield cached
+                return
+
+        started_at = time.time()
+        # Rows are kept for the cache only up to its per-entry limit.
+        buffered: list | None = [] if key is not None else None
+        async for batch in self._stream(
+            query, customer_id, login_customer_id, client_code
+        ):
+            if buffered is not None:
+                buffered.extend(batch)
+                if len(buffered) > cache.max_entry_rows:
+                    buffered = None
+            yield batch
+        if buffered is not None:
+            await cache.put(key, buffered, query, started_at)
+
+    async def _cache_key(
+        self,
+        query: str,
+        customer_id: str,
+        login_customer_id: str,
+        client_code: str,
+        use_cache: bool,
+    ) -> str | None:
+        """GAQL cache key, with date windows resolved in the customer's time zone."""
+        cache = get_gaql_cache()
+        if not use_cache or not cache.enabled or "segments.date" not in query:
+            return None
+        if not cache.has_timezone(customer_id):
+            task = self._timezone_lookups.get(customer_id)
+            if task is None:
+                task = asyncio.create_task(
+                    self._lookup_timezone(customer_id, login_customer_id, client_code)
+                )
+                self._timezone_lookups[customer_id] = task
+                task.add_done_callback(
+                    lambda _: self._timezone_lookups.pop(customer_id, None)
+                )
+            await asyncio.shield(task)
+        return cache.key_for(client_code, customer_id, query)
+
+    async def _lookup_timezone(
+        self, customer_id: str, login_customer_id: str, client_code: str
+    ) -> None:
+        try:
+            rows = await self._collect(
+                "SELECT customer.time_zone FROM customer",
+                customer_id,
+                login_customer_id,
+                client_code,
+                use_cache=False,
+            )
+        except Exception as e:
+            # The cache falls back to GAQL_CACHE_TIMEZONE; the lookup is retried next time.
+            logger.warning(
+                "gaql_cache_timezone_lookup_failed",
+                customer_id=customer_id,
+                error=str(e),
+            )
+            return
+        time_zone = rows[0].get("customer", {}).get("timeZone") if rows else None
+        if time_zone:
+            get_gaql_cache().set_timezone(customer_id, time_zone)
+
+    async def _stream(
+        self, query: str, customer_id: str, login_customer_id: str, client_code: str
+    ) -> AsyncIterator[list]:
         url = f"{self.BASE_URL}/{self.API_VERSION}/customers/{customer_id}/googleAds:searchStream"
 
-        # TODO: Use httpx stream reading (client.stream + aiter_lines) to process
-        # SearchStream batches as they arrive instead of buffering the full response.
-        response = await http_request(
-            "POST",
+        # A 401 is raised before the body is read, so retrying with a fresh
+        # token never replays batches that were already yielded.
+        for attempt in range(2):
+            token = await self._get_google_api_token(client_code)
+            parser = JsonArrayStreamParser()
+            try:
+                async with http_stream(
+                    "POST",
+                    url,
+                    headers=self._build_auth_headers(token, login_customer_id),
+                    json={"query": query},
+                    error_handler=_raise_google_error,
+                    retry_delay_parser=_extract_retry_delay,
+                ) as response:
+                    async for chunk in response.aiter_text():
+                        for batch in parser.feed(chunk):
+                            yield batch.get("results", [])
+                    for batch in parser.close():
+                        yield batch.get("results", [])
+                return
+            except GoogleAdsAuthException as e:
+                if attempt or not _is_unauthenticated(e):
+                    raise
+                self._invalidate_token(client_code, token)
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        client_code: str,
+        login_customer_id: str | None = None,
+        **kwargs,
+    ) -> httpx.Response:
+        """http_request with the account's token; on 401 the token is dropped and the call retried once."""
+        token = await self._get_google_api_token(client_code)
+        try:
+            return await self._send(method, url, token, login_customer_id, **kwargs)
+        except GoogleAdsAuthException as e:
+            if not _is_unauthenticated(e):
+                raise
+            self._invalidate_token(client_code, token)
+        token = await self._get_google_api_token(client_code)
+        return await self._send(method, url, token, login_customer_id, **kwargs)
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        token: str,
+        login_customer_id: str | None,
+        **kwargs,
+    ) -> httpx.Response:
+        return await http_request(
+            method,
             url,
             headers=self._build_auth_headers(token, login_customer_id),
-            json={"query": query},
             error_handler=_raise_google_error,
-            retry_delay_parser=_extract_retry_delay,
+            **kwargs,
         )
-        return self._parse_stream(response.json())
 
-    def _get_google_api_token(self, client_code: str) -> str:
-        return _get_oauth_token() or fetch_google_api_token_simple(client_code)
+    async def _get_google_api_token(self, client_code: str) -> str:
+        return await _get_oauth_token() or await get_google_api_token(client_code)
+
+    def _invalidate_token(self, client_code: str, token: str) -> None:
+        logger.warning(
+            "Google Ads rejected access token, refreshing", client_code=client_code
+        )
+        if os.getenv("GOOGLE_ADS_REFRESH_TOKEN"):
+            token_provider.invalidate(LOCAL_OAUTH_TOKEN_KEY, token)
+        else:
+            invalidate_google_api_token(client_code, token)
 
     def _build_auth_headers(
         self, access_token: str, login_customer_id: str | None = None
@@ -118,37 +301,29 @@ class GoogleAdsClient:
             headers["login-customer-id"] = login_customer_id
         return headers
 
-    def _parse_stream(self, response_json) -> list:
-        if isinstance(response_json, list):
-            results = []
-            for batch in response_json:
-                results.extend(batch.get("results", []))
-            return results
-        logger.warning("SearchStream returned non-list response")
-        return response_json.get("results", [])
-
 
-def _get_oauth_token() -> str | None:
-    global _cached_google_api_token, _google_api_token_expiry
+async def _get_oauth_token() -> str | None:
+    """Local development: exchange GOOGLE_ADS_REFRESH_TOKEN for an access token."""
     refresh_token = os.getenv("GOOGLE_ADS_REFRESH_TOKEN")
     if not refresh_token:
         return None
+    return await token_provider.get_token(
+        LOCAL_OAUTH_TOKEN_KEY,
+        lambda: _refresh_local_oauth_token(refresh_token),
+    )
 
-    if _cached_google_api_token and time.time() < _google_api_token_expiry:
-        return _cached_google_api_token
 
-    try:
-        response = httpx.post(
-            GOOGLE_TOKEN_URL,
-            data={
-                "grant_type": "refresh_token",
-                "refresh_token": refresh_token,
-                "client_id": os.getenv("GOOGLE_ADS_CLIENT_ID"),
-                "client_secret": os.getenv("GOOGLE_ADS_CLIENT_SECRET"),
-            },
-        )
-        response.raise_for_status()
-    except httpx.HTTPStatusError:
+async def _refresh_local_oauth_token(refresh_token: str) -> tuple[str, float]:
+    response = await get_http_client().post(
+        GOOGLE_TOKEN_URL,
+        data={
+            "grant_type": "refresh_token",
+            "refresh_token": refresh_token,
+            "client_id": os.getenv("GOOGLE_ADS_CLIENT_ID"),
+            "client_secret": os.getenv("GOOGLE_ADS_CLIENT_SECRET"),
+        },
+    )
+    if response.is_error:
         error_body = response.text
         logger.error(
             "Local OAuth token refresh failed",
@@ -162,11 +337,8 @@ def _get_oauth_token() -> str | None:
         )
 
     token_data = response.json()
-    _cached_google_api_token = token_data["access_token"]
-    _google_api_token_expiry = time.time() + token_data.get("expires_in", 3600) - 60
     logger.info("Google OAuth token refreshed", component="google-auth")
-
-    return _cached_google_api_token
+    return token_data["access_token"], token_data.get("expires_in", 3600)
 
 
 def _raise_google_error(response: httpx.Response) -> None:
@@ -209,6 +381,11 @@ def _raise_google_error(response: httpx.Response) -> None:
     )
 
 
+def _is_unauthenticated(error: GoogleAdsAuthException) -> bool:
+    """401 means the token itself was rejected; 403 is a permission problem a new token won't fix."""
+    return error.details.get("status_code") == 401
+
+
 def _extract_retry_delay(response: httpx.Response, default_delay: float) -> float:
     try:
         hint = (
@@ -60,27 +60,19 @@ class GoogleAgeAdapter:
         today = date.today().isoformat()
 
         try:
-            performance_results, targeting_results = await asyncio.gather(
-                self.client.search_stream(
-                    query=self.PERFORMANCE_QUERY.format(
+            targeting_map, (seen, ad_group_meta) = await asyncio.gather(
+                self._stream_targeting_map(account_id, parent_account_id),
+                self._stream_performance(
+                    self.PERFORMANCE_QUERY.format(
                         duration_clause=duration_clause,
                         today=today,
                     ),
-                    customer_id=account_id,
-                    login_customer_id=parent_account_id,
-                    client_code=auth_context.client_code,
-                ),
-                self.client.search_stream(
-                    query=self.TARGETING_QUERY,
-                    customer_id=account_id,
-                    login_customer_id=parent_account_id,
-                    client_code=auth_context.client_code,
+                    account_id,
+                    parent_account_id,
                 ),
             )
-
-            targeting_map = self._build_targeting_map(targeting_results)
             return self._merge_metrics_with_targeting(
-                performance_results, targeting_map
+                seen, ad_group_meta, targeting_map
             )
 
         except Exception as e:
@@ -91,9 +83,37 @@ class GoogleAgeAdapter:
             )
             return []
 
-    def _build_targeting_map(self, results: list) -> dict[str, set[str]]:
-        """Build ad_group_id → set of ENABLED targeted age ranges."""
+    async def _stream_targeting_map(
+        self, account_id: str, parent_account_id: str
+    ) -> dict[str, set[str]]:
         targeting_map: dict[str, set[str]] = {}
+        async for rows in self.client.iter_search_stream(
+            query=self.TARGETING_QUERY,
+            customer_id=account_id,
+            login_customer_id=parent_account_id,
+            client_code=auth_context.client_code,
+        ):
+            self._build_targeting_map(rows, targeting_map)
+        return targeting_map
+
+    async def _stream_performance(
+        self, query: str, account_id: str, parent_account_id: str
+    ) -> tuple[dict[tuple, dict], dict[str, dict]]:
+        seen: dict[tuple, dict] = {}
+        ad_group_meta: dict[str, dict] = {}
+        async for rows in self.client.iter_search_stream(
+            query=query,
+            customer_id=account_id,
+            login_customer_id=parent_account_id,
+            client_code=auth_context.client_code,
+        ):
+            self._collect_performance_rows(rows, seen, ad_group_meta)
+        return seen, ad_group_meta
+
+    def _build_targeting_map(
+        self, results: list, targeting_map: dict[str, set[str]]
+    ) -> dict[str, set[str]]:
+        """Fold one batch into ad_group_id → set of ENABLED targeted age ranges."""
         for entry in results:
             ad_group = entry.get("adGroup", {})
             criterion = entry.get("adGroupCriterion", {})
@@ -112,14 +132,13 @@ class GoogleAgeAdapter:
 
         return targeting_map
 
-    def _merge_metrics_with_targeting(
+    def _collect_performance_rows(
         self,
         performance_results: list,
-        targeting_map: dict[str, set[str]],
-    ) -> list[dict]:
-        seen: dict[tuple, dict] = {}
-        ad_group_meta: dict[str, dict] = {}
-
+        seen: dict[tuple, dict],
+        ad_group_meta: dict[str, dict],
+    ) -> None:
+        """Fold one age_range_view batch into seen, keyed by (ad_group_id, age_range)."""
         for entry in performance_results:
             campaign = entry.get("campaign", {})
             ad_group = entry.get("adGroup", {})
@@ -145,13 +164,11 @@ class GoogleAgeAdapter:
             conversions = float(metrics_raw.get("conversions", 0))
             cost = micros_to_rupees(cost_micros)
 
-            is_targeted = age_range in targeting_map.get(ad_group_id, set())
-
             seen[(ad_group_id, age_range)] = {
                 **ad_group_meta[ad_group_id],
                 "ad_group_id": ad_group_id,
                 "age_range": age_range,
-                "is_targeted": is_targeted,
+                "is_targeted": False,  # resolved once targeting has streamed
                 "resource_name": criterion.get("resourceName"),
                 "calculated_metrics": {
                     "cost": round(cost, 2),
@@ -163,6 +180,15 @@ class GoogleAgeAdapter:
                 },
             }
 
+    def _merge_metrics_with_targeting(
+        self,
+        seen: dict[tuple, dict],
+        ad_group_meta: dict[str, dict],
+        targeting_map: dict[str, set[str]],
+    ) -> list[dict]:
+        for (ad_group_id, age_range), row in seen.items():
+            row["is_targeted"] = age_range in targeting_map.get(ad_group_id, set())
+
         # Inject synthetic rows for age ranges not in age_range_view
         for ad_group_id, meta in ad_group_meta.items():
             for age_range in ALL_AGE_RANGES:
@@ -57,26 +57,20 @@ class GoogleGenderAdapter:
         today = date.today().isoformat()
 
         try:
-            performance_results, targeting_results = await asyncio.gather(
-                self.client.search_stream(
-                    query=self.PERFORMANCE_QUERY.format(
+            performance_rows, targeting_map = await asyncio.gather(
+                self._stream_performance(
+                    self.PERFORMANCE_QUERY.format(
                         duration_clause=duration_clause, today=today
                     ),
-                    customer_id=account_id,
-                    login_customer_id=parent_account_id,
-                    client_code=auth_context.client_code,
-                ),
-                self.client.search_stream(
-                    query=self.TARGETING_QUERY,
-                    customer_id=account_id,
-                    login_customer_id=parent_account_id,
-                    client_code=auth_context.client_code,
+                    account_id,
+                    parent_account_id,
                 ),
+                self._stream_targeting_map(account_id, parent_account_id),
             )
 
             return self._merge_metrics_with_targeting(
-                performance_results,
-                targeting_results,
+                performance_rows,
+                targeting_map,
             )
 
         except Exception as e:
@@ -87,61 +81,87 @@ class GoogleGenderAdapter:
             )
             return []
 
-    def _merge_metrics_with_targeting(
-        self,
-        performance_results: list[dict],
-        targeting_results: list[dict],
+    async def _stream_performance(
+        self, query: str, account_id: str, parent_account_id: str
     ) -> list[dict]:
-        """Transform raw Google Ads data into clean domain dicts.
-
-        Each entry is one gender's performance in one ad group:
-            - campaign_id, campaign_name, campaign_type
-            - ad_group_id, ad_group_name
-            - gender_type: "MALE" | "FEMALE" | "UNDETERMINED"
-            - metrics: {impressions, clicks, conversions, cost, ctr, average_cpc, cpl, conv_rate}
-            - is_targeted: whether this gender is currently targeted
-            - resource_name: criterion resource_name (None if not targeted)
-            - targeted_genders: all genders targeted in this ad group
-        """
+        rows: list[dict] = []
+        async for batch in self.client.iter_search_stream(
+            query=query,
+            customer_id=account_id,
+            login_customer_id=parent_account_id,
+            client_code=auth_context.client_code,
+        ):
+            rows.extend(self._transform_performance(batch))
+        return rows
+
+    async def _stream_targeting_map(
+        self, account_id: str, parent_account_id: str
+    ) -> dict[str, list[dict]]:
         targeting_map: dict[str, list[dict]] = {}
-
-        for entry in targeting_results:
-            ad_group_id = str(entry.get("adGroup", {}).get("id"))
-            criterion = entry.get("adGroupCriterion", {})
-
-            targeting_map.setdefault(ad_group_id, []).append(
-                {
-                    "gender": criterion.get("gender", {}).get("type"),
-                    "resource_name": criterion.get("resourceName"),
-                }
-            )
-
-        merged = []
-
+        async for batch in self.client.iter_search_stream(
+            query=self.TARGETING_QUERY,
+            customer_id=account_id,
+            login_customer_id=parent_account_id,
+            client_code=auth_context.client_code,
+        ):
+            for entry in batch:
+                ad_group_id = str(entry.get("adGroup", {}).get("id"))
+                criterion = entry.get("adGroupCriterion", {})
+
+                targeting_map.setdefault(ad_group_id, []).append(
+                    {
+                        "gender": criterion.get("gender", {}).get("type"),
+                        "resource_name": criterion.get("resourceName"),
+                    }
+                )
+        return targeting_map
+
+    def _transform_performance(self, performance_results: list[dict]) -> list[dict]:
+        """Reduce one gender_view batch to domain rows, targeting fields pending."""
+        transformed = []
         for entry in performance_results:
             campaign = entry.get("campaign", {})
             ad_group = entry.get("adGroup", {})
-            ad_group_id = str(ad_group.get("id"))
             gender_type = (
                 entry.get("adGroupCriterion", {}).get("gender", {}).get("type")
             )
 
-            criteria = targeting_map.get(ad_group_id, [])
-            matching = next((c for c in criteria if c["gender"] == gender_type), None)
-
-            merged.append(
+            transformed.append(
                 {
                     "campaign_id": str(campaign.get("id")),
                     "campaign_name": campaign.get("name"),
                     "campaign_type": campaign.get("advertisingChannelType"),
-                    "ad_group_id": ad_group_id,
+                    "ad_group_id": str(ad_group.get("id")),
                     "ad_group_name": ad_group.get("name"),
                     "gender_type": gender_type,
                     "metrics": build_metrics(entry.get("metrics", {})),
-                    "is_targeted": matching is not None,
-                    "resource_name": matching["resource_name"] if matching else None,
-                    "targeted_genders": [c["gender"] for c in criteria],
                 }
             )
+        return transformed
+
+    def _merge_metrics_with_targeting(
+        self,
+        performance_rows: list[dict],
+        targeting_map: dict[str, list[dict]],
+    ) -> list[dict]:
+        """Attach targeting state to the transformed performance rows.
+
+        Each entry is one gender's performance in one ad group:
+            - campaign_id, campaign_name, campaign_type
+            - ad_group_id, ad_group_name
+            - gender_type: "MALE" | "FEMALE" | "UNDETERMINED"
+            - metrics: {impressions, clicks, conversions, cost, ctr, average_cpc, cpl, conv_rate}
+            - is_targeted: whether this gender is currently targeted
+            - resource_name: criterion resource_name (None if not targeted)
+            - targeted_genders: all genders targeted in this ad group
+        """
+        for row in performance_rows:
+            criteria = targeting_map.get(row["ad_group_id"], [])
+            matching = next(
+                (c for c in criteria if c["gender"] == row["gender_type"]), None
+            )
+            row["is_targeted"] = matching is not None
+            row["resource_name"] = matching["resource_name"] if matching else None
+            row["targeted_genders"] = [c["gender"] for c in criteria]
 
-        return merged
+        return performance_rows
@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator
 from datetime import date
 from typing import Optional
 
@@ -20,20 +21,28 @@ class GoogleKeywordAdapter:
         self, account_id: str, parent_account_id: str
     ) -> list:
         """Fetch keyword performance metrics for a Google Ads account."""
+        keywords = []
+        async for batch in self.iter_keyword_metrics(account_id, parent_account_id):
+            keywords.extend(batch)
+        logger.info(
+            "keyword_metrics_fetched", account_id=account_id, count=len(keywords)
+        )
+        return keywords
+
+    async def iter_keyword_metrics(
+        self, account_id: str, parent_account_id: str
+    ) -> AsyncIterator[list[dict]]:
+        """Yield transformed keyword rows batch by batch as SearchStream delivers them."""
         query = _build_keyword_query(
             duration=self.DEFAULT_DURATION, include_metrics=True
         )
-        results = await self.client.search_stream(
+        async for rows in self.client.iter_search_stream(
             query=query,
             customer_id=account_id,
             login_customer_id=parent_account_id,
             client_code=auth_context.client_code,
-        )
-        keywords = [_transform_row(row) for row in results]
-        logger.info(
-            "keyword_metrics_fetched", account_id=account_id, count=len(keywords)
-        )
-        return keywords
+        ):
+            yield [_transform_row(row) for row in rows]
 
 
 def _build_keyword_query(
@@ -3,12 +3,7 @@ import asyncio
 from structlog import get_logger
 
 from core.infrastructure.context import auth_context
-from core.infrastructure.http_client import http_request
-from adapters.google.client import (
-    google_ads_client,
-    _raise_google_error,
-    _extract_retry_delay,
-)
+from adapters.google.client import google_ads_client, _extract_retry_delay
 
 logger = get_logger(__name__)
 
@@ -39,8 +34,6 @@ class GoogleKeywordPlannerAdapter:
         by keyword text, keeping the entry with the highest search volume.
         """
         location_ids = location_ids or self.DEFAULT_LOCATION_IDS
-        token = self.client._get_google_api_token(auth_context.client_code)
-        headers = self.client._build_auth_headers(token, login_customer_id)
         endpoint = (
             f"{self.client.BASE_URL}/{self.client.API_VERSION}"
             f"/customers/{customer_id}:generateKeywordIdeas"
@@ -55,12 +48,12 @@ class GoogleKeywordPlannerAdapter:
             payload = _build_payload(chunk, url, location_ids, language_id)
             logger.info("keyword_planner_chunk", chunk=chunk_num, seeds=len(chunk))
 
-            response = await http_request(
+            response = await self.client._request(
                 "POST",
                 endpoint,
-                headers=headers,
+                auth_context.client_code,
+                login_customer_id,
                 json=payload,
-                error_handler=_raise_google_error,
                 retry_delay_parser=_extract_retry_delay,
             )
 
@@ -29,13 +29,15 @@ class GoogleLocationAdapter:
           AND campaign_criterion.negative = FALSE
         """
 
-        results = await self.client.search_stream(
+        campaigns: dict[str, dict] = {}
+        async for rows in self.client.iter_search_stream(
             query=query,
             customer_id=account_id,
             login_customer_id=parent_account_id,
             client_code=auth_context.client_code,
-        )
-        return self._group_location_targets(results)
+        ):
+            self._group_location_targets(rows, campaigns)
+        return campaigns
 
     async def fetch_location_performance(
         self, account_id: str, parent_account_id: str
@@ -53,13 +55,15 @@ class GoogleLocationAdapter:
           AND segments.date DURING {self.DEFAULT_DURATION}
         """
 
-        results = await self.client.search_stream(
+        campaign_metrics: dict[str, dict] = {}
+        async for rows in self.client.iter_search_stream(
             query=query,
             customer_id=account_id,
             login_customer_id=parent_account_id,
             client_code=auth_context.client_code,
-        )
-        return self._group_location_performance(results)
+        ):
+            self._group_location_performance(rows, campaign_metrics)
+        return campaign_metrics
 
     async def fetch_geo_target_details(
         self, account_id: str, parent_account_id: str, geo_constants: list[str]
@@ -77,24 +81,26 @@ class GoogleLocationAdapter:
         WHERE geo_target_constant.resource_name IN ({geo_list})
         """
 
-        results = await self.client.search_stream(
+        details: dict[str, dict] = {}
+        async for rows in self.client.iter_search_stream(
             query=query,
             customer_id=account_id,
             login_customer_id=parent_account_id,
             client_code=auth_context.client_code,
-        )
-        return {
-            row["geoTargetConstant"]["resourceName"]: {
-                "geo_target_constant": row["geoTargetConstant"]["resourceName"],
-                "location_name": row["geoTargetConstant"]["name"],
-                "country_code": row["geoTargetConstant"]["countryCode"],
-                "location_type": row["geoTargetConstant"]["targetType"],
-            }
-            for row in results
-        }
-
-    def _group_location_targets(self, results: list) -> dict[str, dict]:
-        campaigns: dict[str, dict] = {}
+        ):
+            for row in rows:
+                details[row["geoTargetConstant"]["resourceName"]] = {
+                    "geo_target_constant": row["geoTargetConstant"]["resourceName"],
+                    "location_name": row["geoTargetConstant"]["name"],
+                    "country_code": row["geoTargetConstant"]["countryCode"],
+                    "location_type": row["geoTargetConstant"]["targetType"],
+                }
+        return details
+
+    def _group_location_targets(
+        self, results: list, campaigns: dict[str, dict]
+    ) -> dict[str, dict]:
+        """Fold one SearchStream batch into campaigns, keyed by campaign id."""
         for row in results:
             campaign = row.get("campaign", {})
             campaign_id = str(campaign.get("id"))
@@ -119,8 +125,10 @@ class GoogleLocationAdapter:
 
         return campaigns
 
-    def _group_location_performance(self, results: list) -> dict[str, dict]:
-        campaign_metrics: dict[str, dict] = {}
+    def _group_location_performance(
+        self, results: list, campaign_metrics: dict[str, dict]
+    ) -> dict[str, dict]:
+        """Fold one SearchStream batch into campaign_id -> geo constant -> metrics."""
         for row in results:
             geo_constant = self._extract_geo_constant(row)
             if not geo_constant:
@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator
 from datetime import date
 
 from structlog import get_logger
@@ -22,6 +23,23 @@ class GoogleSearchTermAdapter:
             "metrics": {"impressions", "clicks", "conversions", "cost",
                 "ctr", "average_cpc", "cost_per_conversion"}}]
         """
+        search_terms = []
+        try:
+            async for batch in self.iter_search_terms(account_id, parent_account_id):
+                search_terms.extend(batch)
+            return search_terms
+        except Exception as e:
+            logger.warning(
+                "Failed to fetch search terms",
+                account_id=account_id,
+                error=str(e),
+            )
+            return []
+
+    async def iter_search_terms(
+        self, account_id: str, parent_account_id: str
+    ) -> AsyncIterator[list[dict]]:
+        """Yield transformed search term rows batch by batch as SearchStream delivers them."""
         duration_clause = format_date_range(self.DEFAULT_DURATION)
 
         query = f"""
@@ -50,21 +68,13 @@ class GoogleSearchTermAdapter:
             AND campaign.end_date >= '{date.today().strftime("%Y-%m-%d")}'
         """
 
-        try:
-            results = await self.client.search_stream(
-                query=query,
-                customer_id=account_id,
-                login_customer_id=parent_account_id,
-                client_code=auth_context.client_code,
-            )
-            return self._transform_results(results)
-        except Exception as e:
-            logger.warning(
-                "Failed to fetch search terms",
-                account_id=account_id,
-                error=str(e),
-            )
-            return []
+        async for rows in self.client.iter_search_stream(
+            query=query,
+            customer_id=account_id,
+            login_customer_id=parent_account_id,
+            client_code=auth_context.client_code,
+        ):
+            yield self._transform_results(rows)
 
     # TODO: Replace with pydantic model when adapter models are finalized
     def _transform_results(self, results: list) -> list:
@@ -0,0 +1,298 @@
+"""Disk cache of GAQL reporting results served through GoogleAdsClient.
+
+Only reporting queries (those filtering on segments.date) are cached; their
+rows change at most once per reporting day. Entries are keyed by client code,
+customer id, the whitespace-normalized query and the concrete date window its
+DURING clauses resolve to today, so LAST_30_DAYS asked tomorrow is a new key.
+
+Reporting days follow each account's time zone: "today" and the day boundary
+are taken in the customer's customer.time_zone once GoogleAdsClient has looked
+it up (see set_timezone), otherwise in GAQL_CACHE_TIMEZONE (server local time
+when unset).
+
+- Entries expire at the next midnight in the account's time zone, the
+  reporting day boundary.
+  Windows that include today expire after GAQL_CACHE_INTRADAY_TTL_SECONDS,
+  still capped by the boundary.
+- Rows are stored column by column: nested fields are flattened to dotted
+  paths, repetitive columns are dictionary-encoded, and the result is
+  zlib-compressed JSON.
+- Results over GAQL_CACHE_MAX_ENTRY_ROWS rows or GAQL_CACHE_MAX_ENTRY_BYTES
+  compressed bytes are not cached.
+- A successful mutate invalidates every entry for that customer.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import struct
+import time
+import zlib
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from typing import Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from structlog import get_logger
+
+from core.infrastructure.cache import DiskCache, open_disk_cache
+
+logger = get_logger(__name__)
+
+GAQL_CACHE_ENABLED = os.getenv("GAQL_CACHE_ENABLED", "true").lower() == "true"
+GAQL_CACHE_MAX_MB = int(os.getenv("GAQL_CACHE_MAX_MB", "256"))
+GAQL_CACHE_MAX_ENTRY_BYTES = int(
+    os.getenv("GAQL_CACHE_MAX_ENTRY_BYTES", str(8 * 1024 * 1024))
+)
+GAQL_CACHE_MAX_ENTRY_ROWS = int(os.getenv("GAQL_CACHE_MAX_ENTRY_ROWS", "200000"))
+GAQL_CACHE_INTRADAY_TTL = float(os.getenv("GAQL_CACHE_INTRADAY_TTL_SECONDS", "900"))
+# IANA name, e.g. "Asia/Kolkata", for customers whose time zone is not known yet.
+GAQL_CACHE_TIMEZONE = os.getenv("GAQL_CACHE_TIMEZONE", "")
+
+_STAMP = struct.Struct(">d")
+_DURING = re.compile(r"segments\.date\s+DURING\s+([A-Z_0-9]+)", re.IGNORECASE)
+_QUOTED_OR_SPACE = re.compile(r"('(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\")|\s+")
+
+
+def normalize_query(query: str) -> str:
+    """Collapse whitespace outside string literals."""
+    return _QUOTED_OR_SPACE.sub(lambda m: m.group(1) or " ", query).strip()
+
+
+def resolve_window(name: str, today: date) -> Optional[tuple[date, date]]:
+    """Concrete (start, end) dates of a GAQL date enum, or None if unknown."""
+    name = name.upper()
+    yesterday = today - timedelta(days=1)
+    if name == "TODAY":
+        return today, today
+    if name == "YESTERDAY":
+        return yesterday, yesterday
+    if name.startswith("LAST_") and name.endswith("_DAYS"):
+        days = name[len("LAST_") : -len("_DAYS")]
+        if days.isdigit():
+            return today - timedelta(days=int(days)), yesterday
+        return None
+    monday = today - timedelta(days=today.weekday())
+    sunday = today - timedelta(days=(today.weekday() + 1) % 7)
+    if name == "THIS_WEEK_MON_TODAY":
+        return monday, today
+    if name == "THIS_WEEK_SUN_TODAY":
+        return sunday, today
+    if name in ("LAST_WEEK_MON_SUN", "LAST_BUSINESS_WEEK"):
+        start = monday - timedelta(days=7)
+        return start, start + timedelta(days=6 if name == "LAST_WEEK_MON_SUN" else 4)
+    if name == "LAST_WEEK_SUN_SAT":
+        return sunday - timedelta(days=7), sunday - timedelta(days=1)
+    if name == "THIS_MONTH":
+        return today.replace(day=1), today
+    if name == "LAST_MONTH":
+        end = today.replace(day=1) - timedelta(days=1)
+        return end.replace(day=1), end
+    return None
+
+
+def encode_rows(rows: list[dict]) -> bytes:
+    """Columnar, dictionary-encoded, zlib-compressed JSON of GAQL result rows."""
+    columns: dict[str, list] = {}
+    for index, row in enumerate(rows):
+        for path, value in _flatten(row):
+            # Fields Google omits on a row stay None; None is never a GAQL value.
+            columns.setdefault(path, [None] * len(rows))[index] = value
+
+    encoded = {}
+    for path, values in columns.items():
+        distinct: dict[str, int] = {}
+        codes = [
+            distinct.setdefault(json.dumps(v, sort_keys=True), len(distinct))
+            for v in values
+        ]
+        if len(distinct) * 2 <= len(values):
+            encoded[path] = {"dict": [json.loads(v) for v in distinct], "codes": codes}
+        else:
+            encoded[path] = {"values": values}
+    payload = {"rows": len(rows), "columns": encoded}
+    return zlib.compress(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+
+
+def decode_rows(blob: bytes) -> list[dict]:
+    payload = json.loads(zlib.decompress(blob))
+    rows: list[dict] = [{} for _ in range(payload["rows"])]
+    for path, column in payload["columns"].items():
+        if "codes" in column:
+            values = [column["dict"][code] for code in column["codes"]]
+        else:
+            values = column["values"]
+        keys = path.split(".")
+        for row, value in zip(rows, values):
+            if value is None:
+                continue
+            for key in keys[:-1]:
+                row = row.setdefault(key, {})
+            row[keys[-1]] = value
+    return rows
+
+
+def _flatten(row: dict, prefix: str = ""):
+    for key, value in row.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict) and value:
+            yield from _flatten(value, f"{path}.")
+        else:
+            yield path, value
+
+
+class GaqlCache:
+    def __init__(
+        self,
+        disk: DiskCache | None,
+        max_entry_bytes: int = GAQL_CACHE_MAX_ENTRY_BYTES,
+        max_entry_rows: int = GAQL_CACHE_MAX_ENTRY_ROWS,
+        intraday_ttl: float = GAQL_CACHE_INTRADAY_TTL,
+        default_timezone: str = GAQL_CACHE_TIMEZONE,
+    ):
+        self._disk = disk
+        self.max_entry_bytes = max_entry_bytes
+        self.max_entry_rows = max_entry_rows
+        self._intraday_ttl = intraday_ttl
+        self._default_timezone = (
+            ZoneInfo(default_timezone) if default_timezone else None
+        )
+        # customer_id -> account time zone; fixed for the life of an account.
+        self._timezones: dict[str, tzinfo] = {}
+        self._counters = {"hits": 0, "misses": 0, "stored": 0, "oversized": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self._disk is not None
+
+    def has_timezone(self, customer_id: str) -> bool:
+        return customer_id in self._timezones
+
+    def set_timezone(self, customer_id: str, name: str) -> None:
+        """Record a customer's customer.time_zone (an IANA name)."""
+        try:
+            self._timezones[customer_id] = ZoneInfo(name)
+        except (ZoneInfoNotFoundError, ValueError):
+            logger.warning(
+                "gaql_cache_unknown_timezone", customer_id=customer_id, timezone=name
+            )
+
+    def key_for(self, client_code: str, customer_id: str, query: str) -> Optional[str]:
+        """Cache key of a reporting query, or None if it must not be cached."""
+        if self._disk is None or "segments.date" not in query:
+            return None
+        today = self._now(customer_id).date()
+        windows = []
+        for name in _DURING.findall(query):
+            window = resolve_window(name, today)
+            if window is None:
+                return None
+            windows.append(f"{window[0].isoformat()}..{window[1].isoformat()}")
+        digest = hashlib.sha256(
+            "\n".join([normalize_query(query), *windows]).encode("utf-8")
+        ).hexdigest()
+        return f"gaql:{client_code}:{customer_id}:{digest}"
+
+    async def get(self, key: str) -> Optional[list[dict]]:
+        marker = _invalidation_key(key.split(":")[2])
+        found = await self._read([key, marker])
+        blob = found.get(key)
+        # Entries are prefixed with their store time; drop any older than a mutate.
+        if blob is not None and marker in found:
+            if _STAMP.unpack_from(blob)[0] <= _STAMP.unpack(found[marker])[0]:
+                blob = None
+        if blob is None:
+            self._counters["misses"] += 1
+            return None
+        self._counters["hits"] += 1
+        return await asyncio.to_thread(decode_rows, blob[_STAMP.size :])
+
+    async def put(
+        self, key: str, rows: list[dict], query: str, started_at: float
+    ) -> None:
+        """Store a result. started_at is when its request was sent (epoch seconds)."""
+        if len(rows) > self.max_entry_rows:
+            self._oversized(key, rows=len(rows))
+            return
+        blob = await asyncio.to_thread(encode_rows, rows)
+        if len(blob) > self.max_entry_bytes:
+            self._oversized(key, bytes=len(blob))
+            return
+        # Stamped with the request time so a mutate during the stream still wins.
+        ttl = self.ttl(query, key.split(":")[2])
+        await self._write(key, _STAMP.pack(started_at) + blob, ttl)
+        self._counters["stored"] += 1
+
+    async def invalidate(self, customer_id: str) -> None:
+        """Expire every cached result for a customer, e.g. after a mutate."""
+        # Entries never outlive the day boundary, so neither must the marker.
+        await self._write(
+            _invalidation_key(customer_id), _STAMP.pack(time.time()), 86400
+        )
+
+    def ttl(self, query: str, customer_id: str) -> float:
+        """Seconds until the customer's next reporting day boundary (midnight in its time zone)."""
+        now = self._now(customer_id)
+        midnight = datetime.combine(
+            now.date() + timedelta(days=1), datetime.min.time(), tzinfo=now.tzinfo
+        )
+        # Compared in UTC so a DST change before midnight is accounted for.
+        ttl = (
+            midnight.astimezone(timezone.utc) - now.astimezone(timezone.utc)
+        ).total_seconds()
+        today = now.date()
+        for name in _DURING.findall(query):
+            window = resolve_window(name, today)
+            if window is not None and window[1] >= today:
+                return min(ttl, self._intraday_ttl)
+        return ttl
+
+    def stats(self) -> dict:
+        return dict(self._counters)
+
+    def _now(self, customer_id: str) -> datetime:
+        # Naive local time when neither the account's nor a default zone is known.
+        return datetime.now(self._timezones.get(customer_id, self._default_timezone))
+
+    def _oversized(self, key: str, **size) -> None:
+        self._counters["oversized"] += 1
+        logger.info("gaql_cache_entry_too_large", key=key, **size)
+
+    async def _read(self, keys: list[str]) -> dict[str, bytes]:
+        if self._disk is None:
+            return {}
+        try:
+            return await asyncio.to_thread(self._disk.get_many, keys)
+        except sqlite3.Error as e:
+            logger.warning("gaql_cache_read_failed", error=str(e))
+            return {}
+
+    async def _write(self, key: str, value: bytes, ttl: Optional[float]) -> None:
+        if self._disk is None:
+            return
+        try:
+            await asyncio.to_thread(self._disk.set, key, value, ttl)
+        except sqlite3.Error as e:
+            logger.warning("gaql_cache_write_failed", error=str(e))
+
+
+def _invalidation_key(customer_id: str) -> str:
+    return f"gaql-invalidated:{customer_id}"
+
+
+_default_cache: Optional[GaqlCache] = None
+
+
+def get_gaql_cache() -> GaqlCache:
+    """Get the shared GAQL result cache instance."""
+    global _default_cache
+    if _default_cache is None:
+        disk = (
+            open_disk_cache("gaql", GAQL_CACHE_MAX_MB * 1024 * 1024)
+            if GAQL_CACHE_ENABLED
+            else None
+        )
+        _default_cache = GaqlCache(disk=disk)
+    return _default_cache
@@ -0,0 +1,62 @@
+import json
+
+_DECODER = json.JSONDecoder()
+_SEPARATORS = " \t\r\n[,"
+
+
+class JsonArrayStreamParser:
+    """Incrementally parse the top-level objects of a streamed JSON array.
+
+    googleAds:searchStream returns `[{batch}, {batch}, ...]`. Text is fed in
+    arbitrary chunks and complete top-level objects are returned as they
+    become decodable, so at most about two batches are buffered at a time.
+
+    Decoding is attempted with the C decoder once the buffer has grown past a
+    threshold that doubles after every incomplete attempt; this keeps the total
+    parsing work linear in the response size instead of rescanning the
+    in-flight batch on every chunk.
+    """
+
+    MIN_ATTEMPT_SIZE = 64 * 1024
+
+    def __init__(self) -> None:
+        self._buffer = ""
+        self._next_attempt = self.MIN_ATTEMPT_SIZE
+        self._finished = False
+
+    def feed(self, chunk: str) -> list[dict]:
+        self._buffer += chunk
+        if len(self._buffer) < self._next_attempt:
+            return []
+        return self._drain()
+
+    def close(self) -> list[dict]:
+        """Decode whatever remains; raises ValueError if the stream was truncated."""
+        objects = self._drain()
+        if self._buffer.strip(_SEPARATORS + "]"):
+            raise ValueError("SearchStream response ended inside an unfinished batch")
+        return objects
+
+    def _drain(self) -> list[dict]:
+        objects: list[dict] = []
+        buffer = self._buffer
+        pos = 0
+        while not self._finished:
+            while pos < len(buffer) and buffer[pos] in _SEPARATORS:
+                pos += 1
+            if pos == len(buffer):
+                break
+            if buffer[pos] == "]":
+                self._finished = True
+                pos = len(buffer)
+                break
+            try:
+                obj, pos_end = _DECODER.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                break
+            objects.append(obj)
+            pos = pos_end
+
+        self._buffer = buffer[pos:]
+        self._next_attempt = max(self.MIN_ATTEMPT_SIZE, len(self._buffer) * 2)
+        return objects
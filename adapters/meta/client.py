@@ -6,9 +6,14 @@ import structlog
 
 from adapters.meta.exceptions import MetaAPIError
 from core.infrastructure.http_client import http_request
-from oserver.services.connection import fetch_meta_api_token
+from oserver.services.token_provider import (
+    get_meta_api_token,
+    invalidate_meta_api_token,
+)
 
 META_BASE_URL = "https://graph.facebook.com/v22.0"
+# Graph API OAuthException code for an expired or revoked access token.
+META_INVALID_TOKEN_CODE = 190
 
 logger = structlog.get_logger(__name__)
 
@@ -23,15 +28,9 @@ class MetaClient:
         json: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        token = self._get_meta_api_token(client_code)
         url = f"{self.BASE_URL}{endpoint}"
-        response = await http_request(
-            "POST",
-            url,
-            json=json,
-            params=params,
-            headers=self._build_headers(token),
-            error_handler=_handle_meta_error,
+        response = await self._request(
+            "POST", url, client_code, json=json, params=params
         )
         return response.json()
 
@@ -41,22 +40,43 @@ class MetaClient:
         client_code: str,
         params: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        token = self._get_meta_api_token(client_code)
         url = f"{self.BASE_URL}{endpoint}"
-        response = await http_request(
-            "GET",
+        response = await self._request("GET", url, client_code, params=params)
+        return response.json()
+
+    async def _request(
+        self, method: str, url: str, client_code: str, **kwargs
+    ) -> httpx.Response:
+        """http_request with the client's token; a rejected token is dropped and the call retried once."""
+        token = await self._get_meta_api_token(client_code)
+        try:
+            return await self._send(method, url, token, **kwargs)
+        except MetaAPIError as e:
+            if os.getenv("META_ACCESS_TOKEN") or not _is_invalid_token(e):
+                raise
+            logger.warning(
+                "Meta rejected access token, refreshing", client_code=client_code
+            )
+            invalidate_meta_api_token(client_code, token)
+        token = await self._get_meta_api_token(client_code)
+        return await self._send(method, url, token, **kwargs)
+
+    async def _send(
+        self, method: str, url: str, token: str, **kwargs
+    ) -> httpx.Response:
+        return await http_request(
+            method,
             url,
-            params=params,
             headers=self._build_headers(token),
             error_handler=_handle_meta_error,
+            **kwargs,
         )
-        return response.json()
 
-    def _get_meta_api_token(self, client_code: str) -> str:
+    async def _get_meta_api_token(self, client_code: str) -> str:
         env_token = os.getenv("META_ACCESS_TOKEN")
         if env_token:
             return env_token
-        return fetch_meta_api_token(client_code)
+        return await get_meta_api_token(client_code)
 
     def _build_headers(self, access_token: str) -> dict[str, str]:
         return {
@@ -72,4 +92,10 @@ def _handle_meta_error(response: httpx.Response) -> None:
     raise MetaAPIError(error_msg, response.status_code, error_data)
 
 
+def _is_invalid_token(error: MetaAPIError) -> bool:
+    if error.status_code == 401:
+        return True
+    return error.error_data.get("error", {}).get("code") == META_INVALID_TOKEN_CODE
+
+
 meta_client = MetaClient()
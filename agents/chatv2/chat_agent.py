@@ -48,10 +48,8 @@ class ChatV2Agent:
 
     async def start_session(self) -> dict:
         """Create a new chat session with initialized state."""
-        session_id = self._session_store.create()
-
         chat_state: ChatState = create_initial_state()
-        self._session_store.update(session_id, chat_state)
+        session_id = await self._session_store.create(chat_state)
 
         logger.info("New chatv2 session started", session_id=session_id)
         return {
@@ -69,7 +67,7 @@ class ChatV2Agent:
 
         Three phases: drain pre-buffered → merged fan-in → finalize.
         """
-        state = self._session_store.get(session_id)
+        state = await self._session_store.get(session_id)
 
         competitor_names = _try_parse_competitor_selection(message)
         if competitor_names is not None:
@@ -77,7 +75,7 @@ class ChatV2Agent:
             ad_plan = state.get("ad_plan", {})
             ad_plan["competitors"] = competitor_names
             state["ad_plan"] = ad_plan
-            self._session_store.update(session_id, state)
+            await self._session_store.update(session_id, state)
             yield data_event("field_update", {"field": "competitors", "value": competitor_names})
             yield progress_event(node="competitors", phase="end", message=f"{len(competitor_names)} competitor(s) saved")
             confirmation = f"Got it! {len(competitor_names)} competitor(s) saved."
@@ -115,18 +113,18 @@ class ChatV2Agent:
             yield event
 
     async def get_session_details(self, session_id: str) -> SessionResponse:
-        state = self._session_store.get(session_id)
+        state = await self._session_store.get(session_id)
         if state is None:
             raise SessionException(session_id)
 
         if self._merge_scrape_if_ready(session_id, state):
-            self._session_store.update(session_id, state)
+            await self._session_store.update(session_id, state)
 
         ad_plan = state.get("ad_plan", {})
         status = ChatStatus.from_string(state.get("status", "in_progress"))
         payload = self._get_trackable_fields(ad_plan) or None
 
-        last_activity = self._session_store.get_last_activity(session_id)
+        last_activity = await self._session_store.get_last_activity(session_id)
 
         return SessionResponse(
             status=status.value,
@@ -136,18 +134,19 @@ class ChatV2Agent:
         )
 
     async def end_session(self, session_id: str) -> dict:
-        if not self._session_store.exists(session_id):
+        if not await self._session_store.exists(session_id):
             raise SessionException(session_id)
 
         self._scrape_tasks.cleanup(session_id)
         self._competitor_tasks.cleanup(session_id)
-        self._session_store.delete(session_id)
+        await self._session_store.delete(session_id)
+        await self.graph.checkpointer.adelete_thread(session_id)
         logger.info("Chatv2 session ended", session_id=session_id)
         return {"message": f"Session {session_id} ended successfully."}
 
-    def validate_session(self, session_id: str) -> None:
+    async def validate_session(self, session_id: str) -> None:
         """Raise SessionException if session is missing or completed."""
-        state = self._session_store.get(session_id)
+        state = await self._session_store.get(session_id)
         if state is None:
             raise SessionException(session_id, "can not find session")
 
@@ -205,7 +204,7 @@ class ChatV2Agent:
             yield done_event(status="error", reply="No result from graph")
             return
 
-        self._session_store.update(session_id, final_state)
+        await self._session_store.update(session_id, final_state)
 
         if self._scrape_tasks.has_active_scrape(session_id):
             async for step, phase, msg in self._scrape_tasks.subscribe_progress(session_id):
@@ -217,7 +216,7 @@ class ChatV2Agent:
 
         for event in buffered:
             yield event
-        self._session_store.update(session_id, final_state)
+        await self._session_store.update(session_id, final_state)
 
     # Private helpers
 
@@ -0,0 +1,183 @@
+"""LangGraph checkpointer backed by the shared session store backend.
+
+Only the latest checkpoint per (thread, namespace) is kept, together with
+the pending writes recorded against it, and both expire with the session
+timeout. ChatV2 threads are keyed by session_id, so checkpoints live and
+die with their session instead of accumulating in process memory.
+
+Subgraph namespaces used by a thread are recorded in a per-thread index so
+adelete_thread can remove every namespace, not just the root one.
+"""
+
+import asyncio
+from collections import defaultdict
+from typing import Any, AsyncIterator, Optional, Sequence
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+
+from core.infrastructure.session_store import SessionStore, pack, unpack
+
+
+class SessionCheckpointSaver(BaseCheckpointSaver):
+    """Async-only checkpoint saver storing msgpack records in a SessionBackend."""
+
+    def __init__(self, store: SessionStore):
+        super().__init__(serde=store.serde)
+        self._backend = store.backend
+        self._ttl = store.ttl
+        self._write_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        record = await self._load(_checkpoint_key(thread_id, checkpoint_ns))
+        if record is None:
+            return None
+
+        checkpoint: Checkpoint = record["checkpoint"]
+        checkpoint_id = get_checkpoint_id(config)
+        if checkpoint_id and checkpoint_id != checkpoint["id"]:
+            return None
+
+        writes = await self._load(_writes_key(thread_id, checkpoint_ns))
+        pending = []
+        if writes and writes["checkpoint_id"] == checkpoint["id"]:
+            pending = [tuple(w) for w in writes["writes"].values()]
+
+        parent_id = record["parent_id"]
+        return CheckpointTuple(
+            config=_config(thread_id, checkpoint_ns, checkpoint["id"]),
+            checkpoint=checkpoint,
+            metadata=record["metadata"],
+            parent_config=(
+                _config(thread_id, checkpoint_ns, parent_id) if parent_id else None
+            ),
+            pending_writes=pending,
+        )
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        if config is None or (limit is not None and limit <= 0):
+            return
+        saved = await self.aget_tuple(config)
+        if saved is None:
+            return
+        if before and (before_id := get_checkpoint_id(before)):
+            if saved.checkpoint["id"] >= before_id:
+                return
+        if filter and not all(saved.metadata.get(k) == v for k, v in filter.items()):
+            return
+        yield saved
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        record = {
+            "checkpoint": checkpoint,
+            "metadata": get_checkpoint_metadata(config, metadata),
+            "parent_id": config["configurable"].get("checkpoint_id"),
+        }
+        await self._backend.set(
+            _checkpoint_key(thread_id, checkpoint_ns),
+            pack(self.serde.dumps_typed(record)),
+            self._ttl,
+        )
+        if checkpoint_ns:
+            await self._track_namespace(thread_id, checkpoint_ns)
+        return _config(thread_id, checkpoint_ns, checkpoint["id"])
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+        key = _writes_key(thread_id, checkpoint_ns)
+
+        async with self._write_locks[key]:
+            record = await self._load(key)
+            if record is None or record["checkpoint_id"] != checkpoint_id:
+                record = {"checkpoint_id": checkpoint_id, "writes": {}}
+            stored = record["writes"]
+            for idx, (channel, value) in enumerate(writes):
+                write_idx = WRITES_IDX_MAP.get(channel, idx)
+                inner_key = f"{task_id}:{write_idx}"
+                if write_idx >= 0 and inner_key in stored:
+                    continue
+                stored[inner_key] = (task_id, channel, value)
+            await self._backend.set(
+                key, pack(self.serde.dumps_typed(record)), self._ttl
+            )
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        index_key = _namespaces_key(thread_id)
+        namespaces = {""} | set(await self._load(index_key) or [])
+        keys = [index_key]
+        for checkpoint_ns in namespaces:
+            writes_key = _writes_key(thread_id, checkpoint_ns)
+            self._write_locks.pop(writes_key, None)
+            keys += [_checkpoint_key(thread_id, checkpoint_ns), writes_key]
+        self._write_locks.pop(index_key, None)
+        await self._backend.delete(*keys)
+
+    async def _track_namespace(self, thread_id: str, checkpoint_ns: str) -> None:
+        """Add checkpoint_ns to the thread's namespace index, refreshing its TTL."""
+        key = _namespaces_key(thread_id)
+        async with self._write_locks[key]:
+            namespaces = set(await self._load(key) or [])
+            namespaces.add(checkpoint_ns)
+            await self._backend.set(
+                key, pack(self.serde.dumps_typed(sorted(namespaces))), self._ttl
+            )
+
+    async def _load(self, key: str) -> Optional[dict]:
+        value = await self._backend.get(key)
+        return self.serde.loads_typed(unpack(value)) if value is not None else None
+
+
+def _checkpoint_key(thread_id: str, checkpoint_ns: str) -> str:
+    return f"checkpoint:{thread_id}:{checkpoint_ns}"
+
+
+def _writes_key(thread_id: str, checkpoint_ns: str) -> str:
+    return f"checkpoint_writes:{thread_id}:{checkpoint_ns}"
+
+
+def _namespaces_key(thread_id: str) -> str:
+    return f"checkpoint_namespaces:{thread_id}"
+
+
+def _config(thread_id: str, checkpoint_ns: str, checkpoint_id: str) -> RunnableConfig:
+    return {
+        "configurable": {
+            "thread_id": thread_id,
+            "checkpoint_ns": checkpoint_ns,
+            "checkpoint_id": checkpoint_id,
+        }
+    }
@@ -37,11 +37,11 @@ Flow Diagram:
         END
 """
 
-from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import END, StateGraph
 from langgraph.graph.state import CompiledStateGraph
 from structlog import get_logger
 
+from agents.chatv2.checkpointer import SessionCheckpointSaver
 from agents.chatv2.nodes import (
     collect_data_node,
     confirm_location_node,
@@ -55,6 +55,7 @@ from agents.chatv2.nodes import (
 )
 from agents.chatv2.state import ChatState
 from core.chatv2.models import ChatStatus
+from core.infrastructure.session_store import get_session_store
 
 logger = get_logger(__name__)
 
@@ -147,7 +148,7 @@ def _build_graph() -> CompiledStateGraph:
     graph.add_edge(SHOW_SUMMARY, END)
     graph.add_edge(CONFIRM, END)
 
-    return graph.compile(checkpointer=MemorySaver())
+    return graph.compile(checkpointer=SessionCheckpointSaver(get_session_store()))
 
 
 def _route_entry(state: ChatState) -> str:
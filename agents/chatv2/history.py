@@ -0,0 +1,167 @@
+"""Conversation-history compaction for chatv2 LLM calls.
+
+Nodes send the static system prompt, then the history window built here,
+then any per-call context. The window is a rolling summary of older turns
+(one short digest line per message) followed by the most recent messages
+verbatim. Collected fields live in ad_plan and reach the model through the
+[CONTEXT] message, so the summary only has to keep the conversation's thread.
+
+CHATV2_HISTORY_TOKEN_BUDGET bounds the summary plus recent messages; the
+summary itself is capped at CHATV2_HISTORY_SUMMARY_TOKENS, oldest digests
+dropping first. Compaction runs in blocks: once the recent messages exceed
+their share of the budget, the oldest are folded into the summary until
+half that share remains. Between compactions the prompt only grows at the
+end, so the system prompt, summary and earlier turns stay a byte-stable
+prefix for provider prompt caching.
+"""
+
+import asyncio
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+from langchain_core.messages import BaseMessage, SystemMessage
+from structlog import get_logger
+
+from agents.chatv2.state import ChatState
+
+logger = get_logger(__name__)
+
+HISTORY_TOKEN_BUDGET = int(os.getenv("CHATV2_HISTORY_TOKEN_BUDGET", "2000"))
+SUMMARY_TOKEN_BUDGET = int(os.getenv("CHATV2_HISTORY_SUMMARY_TOKENS", "500"))
+MIN_RECENT_MESSAGES = int(os.getenv("CHATV2_HISTORY_MIN_RECENT", "4"))
+DIGEST_CHARS = 200
+TOKENIZER_ENCODING = "o200k_base"
+
+_ROLES = {"human": "User", "ai": "Assistant"}
+
+
+@lru_cache(maxsize=1)
+def _encoding():
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding(TOKENIZER_ENCODING)
+    except Exception as e:  # not installed, or the encoding cannot be downloaded
+        logger.warning("chat_tokenizer_unavailable", error=str(e))
+        return None
+
+
+async def warm_tokenizer() -> None:
+    """Load the tokenizer off the event loop; a cold load downloads the BPE file.
+
+    Called from the app lifespan so build_history never loads it inside a graph node.
+    """
+    await asyncio.to_thread(_encoding)
+
+
+@lru_cache(maxsize=4096)
+def count_tokens(text: str) -> int:
+    encoding = _encoding()
+    if encoding is None:
+        return len(text) // 4 + 1
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def _text(message: BaseMessage) -> str:
+    content = message.content
+    if isinstance(content, str):
+        return content
+    return " ".join(
+        block.get("text", "") if isinstance(block, dict) else str(block)
+        for block in content
+    )
+
+
+def _message_tokens(message: BaseMessage) -> int:
+    # ~4 tokens of per-message framing in the chat format.
+    return count_tokens(_text(message)) + 4
+
+
+def _digest(message: BaseMessage) -> str:
+    text = " ".join(_text(message).split())
+    if len(text) > DIGEST_CHARS:
+        text = text[: DIGEST_CHARS - 1] + "…"
+    return f"{_ROLES.get(message.type, message.type)}: {text}"
+
+
+@dataclass
+class HistoryWindow:
+    """Messages to send for one turn, plus the state updates that persist compaction."""
+
+    messages: list[BaseMessage]
+    updates: dict[str, Any] = field(default_factory=dict)
+    full_tokens: int = 0
+    sent_tokens: int = 0
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.full_tokens - self.sent_tokens
+
+
+def build_history(
+    state: ChatState,
+    budget: int = HISTORY_TOKEN_BUDGET,
+    summary_budget: int = SUMMARY_TOKEN_BUDGET,
+    min_recent: int = MIN_RECENT_MESSAGES,
+) -> HistoryWindow:
+    """Compact state["messages"] into a summary plus recent turns within the budget."""
+    messages = list(state.get("messages") or [])
+    summarized = min(state.get("summarized_messages") or 0, len(messages))
+    summary_lines = [
+        line for line in (state.get("history_summary") or "").split("\n") if line
+    ]
+
+    recent = messages[summarized:]
+    recent_tokens = [_message_tokens(m) for m in recent]
+    total = sum(recent_tokens)
+    recent_budget = max(budget - summary_budget, 0)
+    folded = 0
+    if total > recent_budget:
+        while len(recent) - folded > min_recent and total > recent_budget // 2:
+            summary_lines.append(_digest(recent[folded]))
+            total -= recent_tokens[folded]
+            folded += 1
+
+    updates: dict[str, Any] = {}
+    if folded:
+        # The summary rolls too: the oldest digests go once it outgrows its budget.
+        while (
+            len(summary_lines) > 1
+            and count_tokens("\n".join(summary_lines)) > summary_budget
+        ):
+            summary_lines.pop(0)
+        updates = {
+            "history_summary": "\n".join(summary_lines),
+            "summarized_messages": summarized + folded,
+        }
+
+    window: list[BaseMessage] = []
+    summary_tokens = 0
+    if summary_lines:
+        summary = SystemMessage(
+            content="[HISTORY] Earlier conversation, condensed:\n"
+            + "\n".join(summary_lines)
+        )
+        window.append(summary)
+        summary_tokens = _message_tokens(summary)
+    window.extend(recent[folded:])
+
+    full_tokens = sum(_message_tokens(m) for m in messages)
+    history = HistoryWindow(
+        messages=window,
+        updates=updates,
+        full_tokens=full_tokens,
+        sent_tokens=summary_tokens + total,
+    )
+    logger.info(
+        "chat_history_window",
+        messages=len(messages),
+        sent_messages=len(window),
+        compacted=folded,
+        history_tokens=full_tokens,
+        sent_tokens=history.sent_tokens,
+        tokens_saved=history.tokens_saved,
+    )
+    return history
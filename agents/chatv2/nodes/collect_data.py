@@ -10,19 +10,21 @@ from langgraph.config import get_config, get_stream_writer
 from structlog import get_logger
 
 from agents.chatv2.dependencies import get_llm_adapter
+from agents.chatv2.history import HistoryWindow, build_history
 from core.chatv2.fields import REQUIRED_FIELDS
 from core.chatv2.models import ChatStatus
 from agents.chatv2.state import ChatState
 from agents.chatv2.tools import UPDATE_AD_PLAN_TOOL_NAME, get_collection_tools
 from core.chatv2.validator import validate_fields
-from utils.prompt_loader import load_prompt
+from utils.prompt_registry import get_prompt_registry
 
 logger = get_logger(__name__)
 
+SYSTEM_PROMPT = get_prompt_registry().bind("chatv2/collect_data.txt", fields=("TODAY",))
+
 
 def _get_system_prompt() -> str:
-    template = load_prompt("chatv2/collect_data.txt")
-    return template.format(TODAY=datetime.now().strftime("%Y-%m-%d"))
+    return SYSTEM_PROMPT.render(TODAY=datetime.now().strftime("%Y-%m-%d"))
 
 
 async def collect_data_node(state: ChatState) -> dict[str, Any]:
@@ -39,9 +41,10 @@ async def collect_data_node(state: ChatState) -> dict[str, Any]:
     )
 
     ad_plan = dict(state.get("ad_plan") or {})
+    history = build_history(state)
     messages = [
         SystemMessage(content=_get_system_prompt()),
-        *state["messages"],
+        *history.messages,
         SystemMessage(content=_build_context(ad_plan)),
     ]
 
@@ -81,10 +84,10 @@ async def collect_data_node(state: ChatState) -> dict[str, Any]:
     else:
         if tool_result:
             reply_text = await _get_followup_response(
-                state, tool_calls, response, tool_result
+                history, tool_calls, response, tool_result
             )
         elif not reply_text.strip() and tool_calls:
-            reply_text = await _get_continuation_response(state, ad_plan)
+            reply_text = await _get_continuation_response(history, ad_plan)
         response_message = reply_text.strip()
         new_status = state["status"]
 
@@ -93,6 +96,7 @@ async def collect_data_node(state: ChatState) -> dict[str, Any]:
         "messages": [AIMessage(content=response_message)] if response_message else [],
         "response_message": response_message,
         "status": new_status,
+        **history.updates,
     }
 
 
@@ -153,7 +157,10 @@ async def _process_tool_call(
 
 
 async def _get_followup_response(
-    state: ChatState, tool_calls: list, first_response: AIMessage, tool_result: dict
+    history: HistoryWindow,
+    tool_calls: list,
+    first_response: AIMessage,
+    tool_result: dict,
 ) -> str:
     """Get AI response after tool validation failed."""
     tool_call = next(
@@ -162,7 +169,7 @@ async def _get_followup_response(
 
     messages = [
         SystemMessage(content=_get_system_prompt()),
-        *state["messages"],
+        *history.messages,
         AIMessage(content="", tool_calls=first_response.tool_calls),
         ToolMessage(content=json.dumps(tool_result), tool_call_id=tool_call["id"]),
     ]
@@ -171,14 +178,14 @@ async def _get_followup_response(
     return content
 
 
-async def _get_continuation_response(state: ChatState, ad_plan: dict) -> str:
+async def _get_continuation_response(history: HistoryWindow, ad_plan: dict) -> str:
     """Get AI response when tool succeeded but LLM didn't provide conversational reply."""
     context = _build_context(ad_plan)
     required = _get_dynamic_required(ad_plan)
     missing = [f for f in required if f not in ad_plan]
     messages = [
         SystemMessage(content=_get_system_prompt()),
-        *state["messages"],
+        *history.messages,
         SystemMessage(
             content=f"[SYSTEM] Tool call succeeded. {context} Acknowledge what was saved and ask for the next missing field ({missing[0] if missing else 'none'})."
         ),
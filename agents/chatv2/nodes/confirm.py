@@ -11,6 +11,7 @@ from agents.chatv2.state import ChatState
 from core.chatv2.models import AccountSelection, ChatStatus
 from core.chatv2.validator import validate_fields
 from agents.chatv2.dependencies import get_llm_adapter
+from agents.chatv2.history import HistoryWindow, build_history
 from agents.chatv2.tools import (
     CONFIRM_CAMPAIGN_TOOL_NAME,
     HANDLE_ACCOUNT_SELECTION_TOOL_NAME,
@@ -53,6 +54,11 @@ async def show_summary_node(state: ChatState) -> dict[str, Any]:
 async def confirm_node(state: ChatState) -> dict[str, Any]:
     """Handle user response to campaign summary — confirm, modify, or change account."""
     logger.info("Entering confirm_node")
+    history = build_history(state)
+    return {**await _respond(state, history), **history.updates}
+
+
+async def _respond(state: ChatState, history: HistoryWindow) -> dict[str, Any]:
     writer = get_stream_writer()
     writer(
         {
@@ -67,7 +73,7 @@ async def confirm_node(state: ChatState) -> dict[str, Any]:
 
     messages = [
         SystemMessage(content=_get_system_prompt()),
-        *state["messages"],
+        *history.messages,
     ]
 
     ai_content, tool_calls, _ = await get_llm_adapter().chat_with_tools(
@@ -1,6 +1,5 @@
 """Location Confirmation Node - Map-based location confirmation for real estate businesses."""
 
-import asyncio
 import json
 import os
 from typing import Any, Optional
@@ -168,20 +167,9 @@ async def _wait_for_scrape(
     session_id: str,
 ) -> Optional[WebsiteSummaryResponse]:
     """Wait for background scrape to complete with timeout."""
-    manager = get_scrape_task_manager()
-    elapsed = 0.0
-    while elapsed < SCRAPE_WAIT_TIMEOUT:
-        result = manager.get_result_if_ready(session_id)
-        if result:
-            return result
-        if manager.get_error(session_id):
-            return None
-        if not manager.has_active_scrape(session_id):
-            return None
-        await asyncio.sleep(1.0)
-        elapsed += 1.0
-    logger.warning("scrape_wait_timeout", session_id=session_id)
-    return None
+    return await get_scrape_task_manager().wait_for_result(
+        session_id, SCRAPE_WAIT_TIMEOUT
+    )
 
 
 def _is_real_estate(result: WebsiteSummaryResponse) -> bool:
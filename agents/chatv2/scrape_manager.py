@@ -20,15 +20,73 @@ class AuthParams:
     x_forwarded_port: str
 
 
+class ProgressBroadcast:
+    """Append-only progress log that any number of subscribers can follow.
+
+    Subscribers wake only when an event is published or the log is closed.
+    Events handed to any subscriber (or drained) count as delivered; a new
+    subscriber starts from the first undelivered event.
+    """
+
+    def __init__(self) -> None:
+        self.events: list[tuple[str, str, str]] = []
+        self.delivered = 0
+        self.closed = False
+        self._changed = asyncio.Event()
+
+    def publish(self, event: tuple[str, str, str]) -> None:
+        if self.closed:
+            return
+        self.events.append(event)
+        self._notify()
+
+    def close(self) -> None:
+        self.closed = True
+        self._notify()
+
+    def subscribe(self) -> AsyncIterator[tuple[str, str, str]]:
+        """Follow the log from the first event undelivered at call time."""
+        return self._follow(self.delivered)
+
+    async def _follow(self, cursor: int) -> AsyncIterator[tuple[str, str, str]]:
+        while True:
+            changed = self._changed
+            while cursor < len(self.events):
+                event = self.events[cursor]
+                cursor += 1
+                self.delivered = max(self.delivered, cursor)
+                yield event
+            if self.closed:
+                return
+            # Already set if anything was published while we were yielding.
+            await changed.wait()
+
+    def drain(self) -> list[tuple[str, str, str]]:
+        """Return undelivered events and mark them delivered."""
+        events = self.events[self.delivered :]
+        self.delivered = len(self.events)
+        return events
+
+    def _notify(self) -> None:
+        # Waiters hold the old event; swapping arms the next wait.
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+
 @dataclass
 class ScrapeJob:
     """Tracks one background scrape per session."""
 
     url: str
-    task: asyncio.Task
+    task: Optional[asyncio.Task] = field(default=None)
     result: Optional[WebsiteSummaryResponse] = field(default=None)
     error: Optional[str] = field(default=None)
-    progress: asyncio.Queue = field(default_factory=asyncio.Queue)
+    progress: ProgressBroadcast = field(default_factory=ProgressBroadcast)
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+
+    def finish(self) -> None:
+        self.progress.close()
+        self.done.set()
 
 
 class ScrapeTaskManager:
@@ -50,8 +108,9 @@ class ScrapeTaskManager:
                 return
             self._cancel_job(session_id, existing)
 
-        task = asyncio.create_task(self._run_scrape(session_id, url, auth))
-        self._scrape_jobs[session_id] = ScrapeJob(url=url, task=task)
+        job = ScrapeJob(url=url)
+        job.task = asyncio.create_task(self._run_scrape(session_id, job, auth))
+        self._scrape_jobs[session_id] = job
         logger.info("background_scrape_started", session_id=session_id, url=url)
 
     def get_result_if_ready(self, session_id: str) -> Optional[WebsiteSummaryResponse]:
@@ -68,40 +127,45 @@ class ScrapeTaskManager:
             return job.error
         return None
 
+    async def wait_for_result(
+        self, session_id: str, timeout: float
+    ) -> Optional[WebsiteSummaryResponse]:
+        """Wait for the session's scrape to finish; None on error, timeout or no scrape.
+
+        Follows a replacement scrape if the URL changes while waiting.
+        """
+        try:
+            async with asyncio.timeout(timeout):
+                while (job := self._scrape_jobs.get(session_id)) is not None:
+                    await job.done.wait()
+                    if self._scrape_jobs.get(session_id) is job:
+                        return job.result
+        except TimeoutError:
+            logger.warning("scrape_wait_timeout", session_id=session_id)
+        return None
+
     def has_active_scrape(self, session_id: str) -> bool:
         """Check if a scrape task is currently running for this session."""
         job = self._scrape_jobs.get(session_id)
         return job is not None and not job.task.done()
 
-    async def subscribe_progress(
-        self, session_id: str
-    ) -> AsyncIterator[tuple[str, str, str]]:
-        """Yield progress tuples in real-time. Exits when task completes and queue is empty."""
+    def subscribe_progress(self, session_id: str) -> AsyncIterator[tuple[str, str, str]]:
+        """Yield progress tuples as they are published. Exits once the scrape finishes.
+
+        Several subscribers may follow the same scrape; each sees every event
+        from the first one undelivered when it subscribed.
+        """
         job = self._scrape_jobs.get(session_id)
         if not job:
-            return
-        while True:
-            if job.task.done() and job.progress.empty():
-                break
-            try:
-                event = await asyncio.wait_for(job.progress.get(), timeout=0.5)
-                yield event
-            except asyncio.TimeoutError:
-                if job.task.done():
-                    break
+            return _no_progress()
+        return job.progress.subscribe()
 
     def drain_progress(self, session_id: str) -> list[tuple[str, str, str]]:
-        """Return and clear all buffered progress events (non-blocking)."""
+        """Return progress events no subscriber has seen yet (non-blocking)."""
         job = self._scrape_jobs.get(session_id)
         if not job:
             return []
-        events = []
-        while not job.progress.empty():
-            try:
-                events.append(job.progress.get_nowait())
-            except asyncio.QueueEmpty:
-                break
-        return events
+        return job.progress.drain()
 
     def cleanup(self, session_id: str) -> None:
         """Cancel and remove scrape job for a session."""
@@ -109,13 +173,15 @@ class ScrapeTaskManager:
         if job:
             self._cancel_job(session_id, job)
 
-    async def _run_scrape(self, session_id: str, url: str, auth: AuthParams) -> None:
+    async def _run_scrape(self, session_id: str, job: ScrapeJob, auth: AuthParams) -> None:
         from agents.scrape.scrape_agent import ScrapeAgent
 
+        # A replacement job may have the same URL, so jobs are matched by identity.
+        url = job.url
+
         def on_progress(step: str, phase: str, message: str) -> None:
-            job = self._scrape_jobs.get(session_id)
-            if job and job.url == url:
-                job.progress.put_nowait((step, phase, message))
+            if self._scrape_jobs.get(session_id) is job:
+                job.progress.publish((step, phase, message))
 
         try:
             result = await ScrapeAgent().run(
@@ -126,8 +192,7 @@ class ScrapeTaskManager:
                 x_forwarded_port=auth.x_forwarded_port,
                 on_progress=on_progress,
             )
-            job = self._scrape_jobs.get(session_id)
-            if job and job.url == url:
+            if self._scrape_jobs.get(session_id) is job:
                 job.result = result
                 logger.info(
                     "background_scrape_completed",
@@ -142,15 +207,22 @@ class ScrapeTaskManager:
             logger.warning(
                 "background_scrape_failed", session_id=session_id, error=str(e)
             )
-            job = self._scrape_jobs.get(session_id)
-            if job and job.url == url:
+            if self._scrape_jobs.get(session_id) is job:
                 job.error = str(e)
+        finally:
+            job.finish()
 
     def _cancel_job(self, session_id: str, job: ScrapeJob) -> None:
         if not job.task.done():
             job.task.cancel()
             logger.info("previous_scrape_cancelled", session_id=session_id, url=job.url)
         self._scrape_jobs.pop(session_id, None)
+        job.finish()
+
+
+async def _no_progress() -> AsyncIterator[tuple[str, str, str]]:
+    return
+    yield
 
 
 _manager: Optional[ScrapeTaskManager] = None
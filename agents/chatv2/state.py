@@ -18,6 +18,9 @@ class ChatState(TypedDict):
     response_message: str
     account_selection: Optional[dict[str, Any]]
     location_selection: Optional[dict[str, Any]]
+    # Rolling summary of messages[:summarized_messages]; see agents.chatv2.history.
+    history_summary: str
+    summarized_messages: int
 
 
 def create_initial_state() -> ChatState:
@@ -31,4 +34,6 @@ def create_initial_state() -> ChatState:
         response_message="",
         account_selection=None,
         location_selection=None,
+        history_summary="",
+        summarized_messages=0,
     )
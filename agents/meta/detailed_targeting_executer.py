@@ -6,7 +6,7 @@ import structlog
 from pydantic import ValidationError
 
 from adapters.meta.client import meta_client
-from agents.shared.llm import chat_completion
+from agents.shared.llm import chat_completion, evict_chat_completion
 from core.infrastructure.context import auth_context
 from core.models.meta import (
     TargetingSeedsResponse,
@@ -734,33 +734,40 @@ class MetaTargetingExecutor:
             ),
         )
 
+        messages = [
+            {
+                "role": "system",
+                "content": (
+                    "You are a ruthless Meta Ads relevance filter. "
+                    "Your default is to reject. Only keep candidates "
+                    "with a clear, direct, defensible connection to "
+                    "this specific business and buyer. Uncertain = reject."
+                ),
+            },
+            {"role": "user", "content": prompt},
+        ]
+        params = {
+            "model": FILTER_MODEL,
+            "temperature": 0.0,
+            "response_format": {"type": "json_object"},
+        }
+
         for attempt in range(LLM_MAX_ATTEMPTS):
             try:
                 async with LLM_SEMAPHORE:
+                    # Retries must reach the model rather than the cached reply.
                     response = await asyncio.wait_for(
-                        chat_completion(
-                            [
-                                {
-                                    "role": "system",
-                                    "content": (
-                                        "You are a ruthless Meta Ads relevance filter. "
-                                        "Your default is to reject. Only keep candidates "
-                                        "with a clear, direct, defensible connection to "
-                                        "this specific business and buyer. Uncertain = reject."
-                                    ),
-                                },
-                                {"role": "user", "content": prompt},
-                            ],
-                            model=FILTER_MODEL,
-                            temperature=0.0,
-                            response_format={"type": "json_object"},
-                        ),
+                        chat_completion(messages, cache=attempt == 0, **params),
                         timeout=LLM_TIMEOUT,
                     )
 
-                    parsed = TargetingFilterResponse.model_validate_json(
-                        response.choices[0].message.content
-                    )
+                    try:
+                        parsed = TargetingFilterResponse.model_validate_json(
+                            response.choices[0].message.content
+                        )
+                    except ValueError:
+                        evict_chat_completion(messages, **params)
+                        raise
                     return [
                         str(sid) for sid in parsed.selected_ids if str(sid) in valid_ids
                     ]
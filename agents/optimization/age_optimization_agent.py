@@ -1,16 +1,15 @@
-import asyncio
 import json
 from collections import defaultdict
 from structlog import get_logger
 
-from core.services.campaign_mapping import campaign_mapping_service
 from core.models.optimization import (
     OptimizationResponse,
     CampaignRecommendation,
 )
 from adapters.google.accounts import GoogleAccountsAdapter
 from adapters.google.optimization.age import GoogleAgeAdapter
-from core.services.recommendation_storage import recommendation_storage_service
+from agents.optimization.runner import RunResult, optimization_runner
+from agents.optimization.snapshot import OptimizationSnapshot, load_snapshot
 from services.openai_client import chat_completion
 from utils.prompt_loader import load_prompt
 
@@ -23,42 +22,38 @@ class AgeOptimizationAgent:
         self.age_adapter = GoogleAgeAdapter()
 
     async def generate_recommendations(self, client_code: str) -> dict:
-        accounts = await self.accounts_adapter.fetch_accessible_accounts(client_code)
-        if not accounts:
+        snapshot = await load_snapshot(client_code, self.accounts_adapter)
+        if not snapshot.accounts:
             logger.info("No accessible accounts found", client_code=client_code)
-            return {"recommendations": []}
+            return {"recommendations": [], "failures": []}
 
-        campaign_product_map = (
-            await campaign_mapping_service.get_campaign_mapping_with_summary(
-                client_code
-            )
-        )
-
-        results = await asyncio.gather(
-            *[
-                self._process_google_account(
-                    account=acc, campaign_product_map=campaign_product_map
-                )
-                for acc in accounts
-            ]
-        )
-        all_recommendations = [rec for recs in results for rec in recs]
+        all_recommendations = await self.collect(snapshot)
+        return {
+            "recommendations": [r.model_dump() for r in all_recommendations],
+            "failures": all_recommendations.failures,
+        }
 
-        await asyncio.gather(
-            *[
-                recommendation_storage_service.store(rec, client_code)
-                for rec in all_recommendations
-            ]
+    async def collect(
+        self, snapshot: OptimizationSnapshot, store: bool = True
+    ) -> RunResult:
+        # One LLM call per ad group; the runner isolates failed ad groups.
+        return await optimization_runner.run(
+            snapshot.client_code,
+            snapshot.accounts,
+            fetch=lambda account: self._fetch_google_adgroups(
+                account=account, campaign_product_map=snapshot.campaign_mapping
+            ),
+            analyze=self._analyze_adgroup,
+            agent="age",
+            store=store,
         )
 
-        return {"recommendations": [r.model_dump() for r in all_recommendations]}
-
-    async def _process_google_account(
+    async def _fetch_google_adgroups(
         self,
         account: dict,
         campaign_product_map: dict,
-    ) -> list[CampaignRecommendation]:
-        """Process a single Google Ads account."""
+    ) -> list[dict]:
+        """Fetch a single Google Ads account's age metrics, grouped by ad group."""
         account_id = account["customer_id"]
         parent_account_id = account["login_customer_id"]
 
@@ -105,25 +100,21 @@ class AgeOptimizationAgent:
         for row in linked_metrics:
             grouped[row["ad_group_id"]].append(row)
 
-        # One LLM call per ad group, all in parallel — isolated failures
-        results = await asyncio.gather(
-            *[
-                self._analyze_adgroup_metrics(
-                    adgroup_metrics, account_id, parent_account_id
-                )
-                for adgroup_metrics in grouped.values()
-            ],
-            return_exceptions=True,
-        )
-
-        all_recs: list[CampaignRecommendation] = []
-        for result in results:
-            if isinstance(result, Exception):
-                logger.error("Ad group LLM analysis failed", error=str(result))
-                continue
-            all_recs.extend(result)
+        return [
+            {
+                "metrics": adgroup_metrics,
+                "account_id": account_id,
+                "parent_account_id": parent_account_id,
+                "targeting_map": targeting_map,
+            }
+            for adgroup_metrics in grouped.values()
+        ]
 
-        return self._filter_recommendations(all_recs, targeting_map)
+    async def _analyze_adgroup(self, unit: dict) -> list[CampaignRecommendation]:
+        recs = await self._analyze_adgroup_metrics(
+            unit["metrics"], unit["account_id"], unit["parent_account_id"]
+        )
+        return self._filter_recommendations(recs, unit["targeting_map"])
 
     def _filter_linked_google_campaigns(
         self, metrics: list, campaign_product_map: dict
@@ -0,0 +1,96 @@
+import asyncio
+from typing import Iterable, Optional
+
+from structlog import get_logger
+
+from adapters.google.accounts import GoogleAccountsAdapter
+from agents.optimization.age_optimization_agent import age_optimization_agent
+from agents.optimization.gender_optimization_agent import gender_optimization_agent
+from agents.optimization.keyword_optimization_agent import keyword_optimization_agent
+from agents.optimization.location_optimization_agent import (
+    location_optimization_agent,
+)
+from agents.optimization.runner import optimization_runner
+from agents.optimization.search_term_optimization_agent import (
+    search_term_optimization_agent,
+)
+from agents.optimization.snapshot import load_snapshot
+from exceptions.custom_exceptions import BusinessValidationException
+
+logger = get_logger(__name__)
+
+
+class AllOptimizationsAgent:
+    """Runs every optimization dimension for a client over one shared snapshot.
+
+    Accounts, the campaign mapping and business contexts are loaded once; the
+    dimensions run concurrently without storing, and their recommendations are
+    then written in one pass, one record per campaign. A failed dimension is
+    reported in the response and does not stop the others, as are the
+    accounts and units a dimension skipped.
+    """
+
+    AGENTS = {
+        "keywords": keyword_optimization_agent,
+        "search-terms": search_term_optimization_agent,
+        "age": age_optimization_agent,
+        "gender": gender_optimization_agent,
+        "locations": location_optimization_agent,
+    }
+
+    def __init__(self):
+        self.accounts_adapter = GoogleAccountsAdapter()
+
+    async def generate_recommendations(
+        self, client_code: str, dimensions: Optional[Iterable[str]] = None
+    ) -> dict:
+        selected = list(dimensions or self.AGENTS)
+        unknown = [name for name in selected if name not in self.AGENTS]
+        if unknown:
+            raise BusinessValidationException(
+                "Unknown optimization dimensions",
+                details={"unknown": unknown, "allowed": list(self.AGENTS)},
+            )
+
+        snapshot = await load_snapshot(client_code, self.accounts_adapter)
+        if not snapshot.accounts:
+            logger.info("No accessible accounts found", client_code=client_code)
+            return {"recommendations": [], "dimensions": {}}
+
+        results = await asyncio.gather(
+            *[self.AGENTS[name].collect(snapshot, store=False) for name in selected],
+            return_exceptions=True,
+        )
+
+        summary: dict[str, dict] = {}
+        collected = []
+        for name, result in zip(selected, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    "optimization_dimension_failed", dimension=name, error=str(result)
+                )
+                summary[name] = {"status": "failed", "error": str(result)}
+                continue
+            summary[name] = {
+                "status": "success",
+                "recommendations": len(result),
+                "failures": getattr(result, "failures", []),
+            }
+            collected.extend(result)
+
+        stored = await optimization_runner.store_all(client_code, collected)
+
+        logger.info(
+            "all_optimizations_complete",
+            client_code=client_code,
+            accounts=len(snapshot.accounts),
+            recommendations=len(collected),
+            campaigns=len(stored),
+        )
+        return {
+            "recommendations": [r.model_dump() for r in stored],
+            "dimensions": summary,
+        }
+
+
+all_optimizations_agent = AllOptimizationsAgent()
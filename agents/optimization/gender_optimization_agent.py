@@ -1,9 +1,7 @@
-import asyncio
 import json
 from structlog import get_logger
 from collections import defaultdict
 
-from core.services.campaign_mapping import campaign_mapping_service
 from core.models.optimization import (
     GenderFieldRecommendation,
     CampaignRecommendation,
@@ -11,7 +9,8 @@ from core.models.optimization import (
 )
 from adapters.google.accounts import GoogleAccountsAdapter
 from adapters.google.optimization.gender import GoogleGenderAdapter
-from core.services.recommendation_storage import recommendation_storage_service
+from agents.optimization.runner import RunResult, optimization_runner
+from agents.optimization.snapshot import OptimizationSnapshot, load_snapshot
 from services.openai_client import chat_completion
 from utils.prompt_loader import load_prompt
 
@@ -24,41 +23,35 @@ class GenderOptimizationAgent:
         self.gender_adapter = GoogleGenderAdapter()
 
     async def generate_recommendations(self, client_code: str) -> dict:
-        accounts = await self.accounts_adapter.fetch_accessible_accounts(client_code)
-        if not accounts:
+        snapshot = await load_snapshot(client_code, self.accounts_adapter)
+        if not snapshot.accounts:
             logger.info("No accessible accounts found", client_code=client_code)
-            return {"recommendations": []}
-
-        campaign_product_map = (
-            await campaign_mapping_service.get_campaign_product_mapping(client_code)
-        )
-
-        results = await asyncio.gather(
-            *[
-                self._process_account(
-                    account=acc,
-                    campaign_product_map=campaign_product_map,
-                )
-                for acc in accounts
-            ]
-        )
-
-        all_recommendations = [rec for recs in results for rec in recs]
-
-        await asyncio.gather(
-            *[
-                recommendation_storage_service.store(rec, client_code)
-                for rec in all_recommendations
-            ]
+            return {"recommendations": [], "failures": []}
+
+        all_recommendations = await self.collect(snapshot)
+        return {
+            "recommendations": [rec.model_dump() for rec in all_recommendations],
+            "failures": all_recommendations.failures,
+        }
+
+    async def collect(
+        self, snapshot: OptimizationSnapshot, store: bool = True
+    ) -> RunResult:
+        campaign_product_map = snapshot.campaign_product_mapping
+        return await optimization_runner.run(
+            snapshot.client_code,
+            snapshot.accounts,
+            fetch=lambda account: self._fetch_adgroups(account, campaign_product_map),
+            analyze=lambda unit: self._analyze_adgroup_metrics(*unit),
+            agent="gender",
+            store=store,
         )
 
-        return {"recommendations": [rec.model_dump() for rec in all_recommendations]}
-
-    async def _process_account(
+    async def _fetch_adgroups(
         self,
         account: dict,
         campaign_product_map: dict,
-    ) -> list[CampaignRecommendation]:
+    ) -> list[tuple[list, str, str]]:
         account_id = account["customer_id"]
         parent_account_id = account["login_customer_id"]
 
@@ -81,16 +74,10 @@ class GenderOptimizationAgent:
         for metric_entry in linked_metrics:
             grouped_by_adgroup[metric_entry["ad_group_id"]].append(metric_entry)
 
-        results = await asyncio.gather(
-            *[
-                self._analyze_adgroup_metrics(
-                    adgroup_metrics, account_id, parent_account_id
-                )
-                for adgroup_metrics in grouped_by_adgroup.values()
-            ]
-        )
-
-        return [rec for sublist in results for rec in sublist]
+        return [
+            (adgroup_metrics, account_id, parent_account_id)
+            for adgroup_metrics in grouped_by_adgroup.values()
+        ]
 
     async def _analyze_adgroup_metrics(
         self,
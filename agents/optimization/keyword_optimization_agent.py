@@ -1,7 +1,5 @@
-import asyncio
 from structlog import get_logger
 
-from core.services.campaign_mapping import campaign_mapping_service
 from core.models.optimization import (
     OptimizationFields,
     CampaignRecommendation,
@@ -9,11 +7,11 @@ from core.models.optimization import (
 )
 from adapters.google.accounts import GoogleAccountsAdapter
 from adapters.google.optimization.keyword import GoogleKeywordAdapter
-from core.services.recommendation_storage import recommendation_storage_service
 from core.keyword.metric_performance_evaluator import MetricPerformanceEvaluator
 from core.keyword.metric_evaluator_config import KEYWORD_CONFIG, group_by_campaign
-from core.services.business_context_service import business_context_service
 from core.keyword.idea_service import KeywordIdeaService
+from agents.optimization.runner import GOOGLE, LLM, RunResult, optimization_runner
+from agents.optimization.snapshot import OptimizationSnapshot, load_snapshot
 
 logger = get_logger(__name__)
 
@@ -26,35 +24,41 @@ class KeywordOptimizationAgent:
         self.keyword_idea_service = KeywordIdeaService()
 
     async def generate_recommendations(self, client_code: str) -> dict:
-        accounts, campaign_product_mapping = await asyncio.gather(
-            self.accounts_adapter.fetch_accessible_accounts(client_code),
-            campaign_mapping_service.get_campaign_mapping_with_summary(client_code),
-        )
-        if not accounts:
+        snapshot = await load_snapshot(client_code, self.accounts_adapter)
+        if not snapshot.accounts:
             logger.info("keyword_opt_no_accounts", client_code=client_code)
-            return {"recommendations": []}
-
-        await business_context_service.extract_contexts_by_product(campaign_product_mapping)
-
-        #TO:DO waits for all recommendations to be generated then stores them think for better performance
-        results = await asyncio.gather(
-            *[self._process_account(acc, campaign_product_mapping) for acc in accounts]
-        )
-        all_recommendations = [rec for recs in results for rec in recs]
-
-        await asyncio.gather(
-            *[
-                recommendation_storage_service.store(rec, client_code)
-                for rec in all_recommendations
-            ]
+            return {"recommendations": [], "failures": []}
+
+        all_recommendations = await self.collect(snapshot)
+        return {
+            "recommendations": [r.model_dump() for r in all_recommendations],
+            "failures": all_recommendations.failures,
+        }
+
+    async def collect(
+        self, snapshot: OptimizationSnapshot, store: bool = True
+    ) -> RunResult:
+        campaign_product_mapping = await snapshot.campaign_mapping_with_contexts()
+
+        # Campaigns are stored as soon as they are analysed (see runner).
+        all_recommendations = await optimization_runner.run(
+            snapshot.client_code,
+            snapshot.accounts,
+            fetch=lambda account: self._fetch_campaign_groups(
+                account, campaign_product_mapping
+            ),
+            analyze=lambda unit: self._analyze_campaign(*unit),
+            agent="keyword",
+            analysis_budgets=(GOOGLE, LLM),
+            store=store,
         )
 
         logger.info("keyword_opt_complete", total=len(all_recommendations))
-        return {"recommendations": [r.model_dump() for r in all_recommendations]}
+        return all_recommendations
 
-    async def _process_account(
+    async def _fetch_campaign_groups(
         self, account: dict, campaign_product_mapping: dict
-    ) -> list[CampaignRecommendation]:
+    ) -> list[tuple[dict, str, str]]:
         account_id = account["customer_id"]
         parent_account_id = account["login_customer_id"]
 
@@ -69,13 +73,10 @@ class KeywordOptimizationAgent:
         self.evaluator.mark_top_performers(scored_keywords)
         keywords_by_campaign = group_by_campaign(scored_keywords, campaign_product_mapping)
 
-        results = await asyncio.gather(
-            *[
-                self._analyze_campaign(campaign_group, account_id, parent_account_id)
-                for campaign_group in keywords_by_campaign
-            ]
-        )
-        return [rec for rec in results if rec is not None]
+        return [
+            (campaign_group, account_id, parent_account_id)
+            for campaign_group in keywords_by_campaign
+        ]
 
     async def _analyze_campaign(
         self,
@@ -10,7 +10,8 @@ from core.models.optimization import (
 from adapters.google.accounts import GoogleAccountsAdapter
 from adapters.google.optimization.location import GoogleLocationAdapter
 from core.services.location_evaluator import LocationEvaluator
-from core.services.recommendation_storage import recommendation_storage_service
+from agents.optimization.runner import RunResult, optimization_runner
+from agents.optimization.snapshot import OptimizationSnapshot
 
 logger = get_logger(__name__)
 
@@ -22,24 +23,35 @@ class LocationOptimizationAgent:
         self.evaluator = LocationEvaluator()
 
     async def generate_recommendations(self, client_code: str) -> dict:
-        accounts = await self.accounts_adapter.fetch_accessible_accounts(client_code)
+        # Location evaluation does not use the campaign mapping.
+        accounts = await optimization_runner.fetch_accounts(
+            client_code, self.accounts_adapter
+        )
         if not accounts:
             logger.info("No accessible accounts found", client_code=client_code)
-            return {"recommendations": []}
-
-        results = await asyncio.gather(*[
-            self._process_account(acc) for acc in accounts
-        ])
-        all_recs = [rec for recs in results for rec in recs]
-
-        for rec in all_recs:
-            await recommendation_storage_service.store(rec, client_code)
-
-        return {"recommendations": [r.model_dump() for r in all_recs]}
+            return {"recommendations": [], "failures": []}
+
+        all_recs = await self.collect(OptimizationSnapshot(client_code, accounts))
+        return {
+            "recommendations": [r.model_dump() for r in all_recs],
+            "failures": all_recs.failures,
+        }
+
+    async def collect(
+        self, snapshot: OptimizationSnapshot, store: bool = True
+    ) -> RunResult:
+        # Evaluation is rule-based, so the analysis stage draws no LLM budget.
+        return await optimization_runner.run(
+            snapshot.client_code,
+            snapshot.accounts,
+            fetch=self._fetch_campaigns,
+            analyze=self._evaluate_campaign,
+            agent="location",
+            analysis_budgets=(),
+            store=store,
+        )
 
-    async def _process_account(
-        self, account: dict
-    ) -> list[CampaignRecommendation]:
+    async def _fetch_campaigns(self, account: dict) -> list[dict]:
         account_id = account["customer_id"]
         parent_id = account["login_customer_id"]
 
@@ -57,40 +69,47 @@ class LocationOptimizationAgent:
             account_id, parent_id, all_geo_constants
         )
 
-        recommendations = []
-        for campaign_id, campaign_data in targets.items():
-            if campaign_id not in performance:
-                continue
-
-            location_recs = self.evaluator.evaluate_campaign(
-                campaign_id,
-                campaign_data["targeted_locations"],
-                performance[campaign_id],
-                geo_details,
-            )
-            if not location_recs:
-                continue
-
-            recommendations.append(CampaignRecommendation(
-                platform="GOOGLE",
-                parent_account_id=parent_id,
-                account_id=account_id,
-                product_id=None,
-                campaign_id=campaign_id,
-                campaign_name=campaign_data["campaign_name"],
-                campaign_type=campaign_data.get("campaign_type", "SEARCH"),
-                completed=False,
-                fields=OptimizationFields(
-                    locationOptimizations=location_recs,
-                ),
-            ))
-
         logger.info(
-            "Location optimization processed",
+            "Location data fetched",
             account_id=account_id,
-            campaigns_with_recs=len(recommendations),
+            campaigns=len(targets),
+        )
+        return [
+            {
+                "account_id": account_id,
+                "parent_id": parent_id,
+                "campaign_id": campaign_id,
+                "campaign_data": campaign_data,
+                "performance": performance[campaign_id],
+                "geo_details": geo_details,
+            }
+            for campaign_id, campaign_data in targets.items()
+            if campaign_id in performance
+        ]
+
+    async def _evaluate_campaign(self, unit: dict) -> CampaignRecommendation | None:
+        campaign_data = unit["campaign_data"]
+        location_recs = self.evaluator.evaluate_campaign(
+            unit["campaign_id"],
+            campaign_data["targeted_locations"],
+            unit["performance"],
+            unit["geo_details"],
+        )
+        if not location_recs:
+            return None
+
+        return CampaignRecommendation(
+            platform="GOOGLE",
+            parent_account_id=unit["parent_id"],
+            account_id=unit["account_id"],
+            product_id=None,
+            campaign_id=unit["campaign_id"],
+            campaign_name=campaign_data["campaign_name"],
+            campaign_type=campaign_data.get("campaign_type", "SEARCH"),
+            completed=False,
+            fields=OptimizationFields(
+                locationOptimizations=location_recs,
+            ),
         )
-        return recommendations
-
 
 location_optimization_agent = LocationOptimizationAgent()
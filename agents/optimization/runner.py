@@ -0,0 +1,337 @@
+"""Pipelined runner shared by the optimization agents.
+
+An agent run is split into four stages, each with its own concurrency limit:
+
+    accounts  -> fetch_accessible_accounts (process-wide limit)
+    fetch     -> per-account metrics, split into work units (e.g. campaigns)
+    analysis  -> per-unit evaluation / LLM call, yielding recommendations
+    storage   -> recommendation_storage_service.store
+
+Stages are connected by bounded queues, so storing the first campaigns
+overlaps with analysing later ones and a slow stage applies back-pressure
+instead of buffering a whole client. Outbound calls also draw from per-client
+rate budgets (Google Ads and LLM), shared by every agent running for that
+client, so a client with dozens of accounts cannot burst into 429s.
+
+A failed account fetch or unit analysis is logged and skipped, and reported
+in the result's failures; if every account fetch fails (e.g. an expired
+token), the first fetch error is raised instead of an empty result. Storage
+failures are raised once the pipeline has drained. Recommendations for the
+same campaign are stored one at a time because storage merges with the
+campaign's previous record.
+
+With store=False, run() only collects recommendations; store_all() then
+writes recommendations from several agents in one pass, one record per
+campaign (see merge_by_campaign).
+"""
+
+import asyncio
+import os
+import time
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+from structlog import get_logger
+
+from adapters.google.accounts import GoogleAccountsAdapter
+from core.infrastructure.rate_budget import RateBudget
+from core.models.optimization import CampaignRecommendation
+from core.services.recommendation_storage import recommendation_storage_service
+
+logger = get_logger(__name__)
+
+ACCOUNT_CONCURRENCY = int(os.getenv("OPTIMIZATION_ACCOUNT_CONCURRENCY", "4"))
+FETCH_CONCURRENCY = int(os.getenv("OPTIMIZATION_FETCH_CONCURRENCY", "4"))
+ANALYSIS_CONCURRENCY = int(os.getenv("OPTIMIZATION_ANALYSIS_CONCURRENCY", "8"))
+STORAGE_CONCURRENCY = int(os.getenv("OPTIMIZATION_STORAGE_CONCURRENCY", "4"))
+QUEUE_SIZE = int(os.getenv("OPTIMIZATION_QUEUE_SIZE", "32"))
+GOOGLE_RATE = float(os.getenv("OPTIMIZATION_GOOGLE_RATE", "5"))
+GOOGLE_BURST = float(os.getenv("OPTIMIZATION_GOOGLE_BURST", "10"))
+LLM_RATE = float(os.getenv("OPTIMIZATION_LLM_RATE", "10"))
+LLM_BURST = float(os.getenv("OPTIMIZATION_LLM_BURST", "20"))
+
+GOOGLE = "google"
+LLM = "llm"
+
+FetchFn = Callable[[dict], Awaitable[list[Any]]]
+AnalyzeFn = Callable[
+    [Any], Awaitable[CampaignRecommendation | list[CampaignRecommendation] | None]
+]
+
+_DONE = object()
+
+
+def _as_list(
+    result: CampaignRecommendation | list[CampaignRecommendation] | None,
+) -> list[CampaignRecommendation]:
+    if result is None:
+        return []
+    if isinstance(result, CampaignRecommendation):
+        return [result]
+    return list(result)
+
+
+def merge_by_campaign(
+    recommendations: Iterable[CampaignRecommendation],
+) -> list[CampaignRecommendation]:
+    """Merge recommendations for the same campaign into one, concatenating each field.
+
+    The first recommendation for a campaign provides its account and campaign
+    details; product_id is the first one set.
+    """
+    merged: dict[str, CampaignRecommendation] = {}
+    for rec in recommendations:
+        current = merged.get(rec.campaign_id)
+        if current is None:
+            merged[rec.campaign_id] = rec.model_copy(
+                update={"fields": rec.fields.model_copy()}
+            )
+            continue
+        for name in type(rec.fields).model_fields:
+            items = getattr(rec.fields, name)
+            if items:
+                existing = getattr(current.fields, name) or []
+                setattr(current.fields, name, existing + items)
+        if current.product_id is None:
+            current.product_id = rec.product_id
+    return list(merged.values())
+
+
+class RunResult(list):
+    """Recommendations returned by run(), with the accounts and units that failed.
+
+    Each failure is a dict with the stage ("fetch" or "analysis"), the
+    account_id and the error message.
+    """
+
+    def __init__(
+        self, recommendations: Iterable[CampaignRecommendation] = (), failures=()
+    ):
+        super().__init__(recommendations)
+        self.failures: list[dict] = list(failures)
+
+
+class OptimizationRunner:
+    def __init__(
+        self,
+        account_concurrency: int = ACCOUNT_CONCURRENCY,
+        fetch_concurrency: int = FETCH_CONCURRENCY,
+        analysis_concurrency: int = ANALYSIS_CONCURRENCY,
+        storage_concurrency: int = STORAGE_CONCURRENCY,
+        queue_size: int = QUEUE_SIZE,
+        rates: Optional[dict[str, tuple[float, float]]] = None,
+        storage=recommendation_storage_service,
+    ):
+        self.fetch_concurrency = fetch_concurrency
+        self.analysis_concurrency = analysis_concurrency
+        self.storage_concurrency = storage_concurrency
+        self.queue_size = queue_size
+        self.rates = rates or {
+            GOOGLE: (GOOGLE_RATE, GOOGLE_BURST),
+            LLM: (LLM_RATE, LLM_BURST),
+        }
+        self.storage = storage
+        self._account_slots = asyncio.Semaphore(account_concurrency)
+        self._budgets: dict[tuple[str, str], RateBudget] = {}
+
+    def budget(self, client_code: str, resource: str) -> RateBudget:
+        """The client's rate budget for an upstream ("google" or "llm")."""
+        key = (client_code, resource)
+        budget = self._budgets.get(key)
+        if budget is None:
+            rate, burst = self.rates[resource]
+            budget = self._budgets[key] = RateBudget(rate, burst)
+        return budget
+
+    async def fetch_accounts(
+        self, client_code: str, adapter: GoogleAccountsAdapter
+    ) -> list[dict]:
+        async with self._account_slots:
+            await self.budget(client_code, GOOGLE).acquire()
+            return await adapter.fetch_accessible_accounts(client_code)
+
+    async def run(
+        self,
+        client_code: str,
+        accounts: list[dict],
+        fetch: FetchFn,
+        analyze: AnalyzeFn,
+        agent: str,
+        analysis_budgets: Iterable[str] = (LLM,),
+        store: bool = True,
+    ) -> RunResult:
+        """Fetch, analyse and store recommendations for every account.
+
+        fetch(account) returns the account's work units; analyze(unit) returns
+        zero or more recommendations. Returns the stored (or, with
+        store=False, collected) recommendations in account / unit order,
+        along with the skipped failures.
+        """
+        started = time.monotonic()
+        google = self.budget(client_code, GOOGLE)
+        budgets = [self.budget(client_code, r) for r in analysis_budgets]
+        units: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        recs: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        pending_accounts = iter(enumerate(accounts))
+        campaign_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        stored: list[tuple[tuple, CampaignRecommendation]] = []
+        storage_errors: list[Exception] = []
+        failures = {"fetch": 0, "analysis": 0}
+        fetch_errors: list[Exception] = []
+        failed: list[tuple[tuple, dict]] = []
+
+        async def fetch_worker() -> None:
+            # Workers share one iterator, so each account is fetched once.
+            for account_index, account in pending_accounts:
+                await google.acquire()
+                try:
+                    fetched = await fetch(account)
+                except Exception as e:
+                    failures["fetch"] += 1
+                    fetch_errors.append(e)
+                    failed.append(
+                        (
+                            (account_index,),
+                            {
+                                "stage": "fetch",
+                                "account_id": account.get("customer_id"),
+                                "error": str(e),
+                            },
+                        )
+                    )
+                    logger.error(
+                        "optimization_fetch_failed",
+                        agent=agent,
+                        account_id=account.get("customer_id"),
+                        error=str(e),
+                    )
+                    continue
+                for unit_index, unit in enumerate(fetched):
+                    await units.put(((account_index, unit_index), unit))
+
+        async def analysis_worker() -> None:
+            while (item := await units.get()) is not _DONE:
+                key, unit = item
+                for budget in budgets:
+                    await budget.acquire()
+                try:
+                    result = await analyze(unit)
+                except Exception as e:
+                    failures["analysis"] += 1
+                    account_id = accounts[key[0]].get("customer_id")
+                    failed.append(
+                        (
+                            key,
+                            {
+                                "stage": "analysis",
+                                "account_id": account_id,
+                                "error": str(e),
+                            },
+                        )
+                    )
+                    logger.error(
+                        "optimization_analysis_failed",
+                        agent=agent,
+                        account_id=account_id,
+                        error=str(e),
+                    )
+                    continue
+                for rec_index, rec in enumerate(_as_list(result)):
+                    await recs.put(((*key, rec_index), rec))
+
+        async def storage_worker() -> None:
+            while (item := await recs.get()) is not _DONE:
+                key, rec = item
+                if not store:
+                    stored.append((key, rec))
+                    continue
+                try:
+                    async with campaign_locks[rec.campaign_id]:
+                        await self.storage.store(rec, client_code)
+                except Exception as e:
+                    storage_errors.append(e)
+                    logger.error(
+                        "optimization_store_failed",
+                        agent=agent,
+                        campaign_id=rec.campaign_id,
+                        error=str(e),
+                    )
+                    continue
+                stored.append((key, rec))
+
+        async def stage(
+            worker: Callable[[], Awaitable[None]],
+            workers: int,
+            downstream: Optional[asyncio.Queue] = None,
+            downstream_workers: int = 0,
+        ) -> None:
+            await asyncio.gather(*[worker() for _ in range(workers)])
+            for _ in range(downstream_workers):
+                await downstream.put(_DONE)
+
+        fetch_workers = max(1, min(self.fetch_concurrency, len(accounts)))
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(
+                stage(fetch_worker, fetch_workers, units, self.analysis_concurrency)
+            )
+            tg.create_task(
+                stage(
+                    analysis_worker,
+                    self.analysis_concurrency,
+                    recs,
+                    self.storage_concurrency,
+                )
+            )
+            tg.create_task(stage(storage_worker, self.storage_concurrency))
+
+        logger.info(
+            "optimization_run_complete",
+            agent=agent,
+            client_code=client_code,
+            accounts=len(accounts),
+            recommendations=len(stored),
+            fetch_failures=failures["fetch"],
+            analysis_failures=failures["analysis"],
+            storage_failures=len(storage_errors),
+            elapsed_ms=round((time.monotonic() - started) * 1000),
+        )
+        if accounts and failures["fetch"] == len(accounts):
+            raise fetch_errors[0]
+        if storage_errors:
+            raise storage_errors[0]
+        return RunResult(
+            [rec for _, rec in sorted(stored, key=lambda item: item[0])],
+            [failure for _, failure in sorted(failed, key=lambda item: item[0])],
+        )
+
+    async def store_all(
+        self, client_code: str, recommendations: list[CampaignRecommendation]
+    ) -> list[CampaignRecommendation]:
+        """Store recommendations as one record per campaign, with bounded concurrency.
+
+        Every campaign is attempted; the first failure is raised afterwards.
+        """
+        merged = merge_by_campaign(recommendations)
+        slots = asyncio.Semaphore(self.storage_concurrency)
+
+        async def store_one(rec: CampaignRecommendation) -> None:
+            async with slots:
+                await self.storage.store(rec, client_code)
+
+        results = await asyncio.gather(
+            *[store_one(rec) for rec in merged], return_exceptions=True
+        )
+        errors = [r for r in results if isinstance(r, Exception)]
+        for rec, result in zip(merged, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    "optimization_store_failed",
+                    campaign_id=rec.campaign_id,
+                    error=str(result),
+                )
+        if errors:
+            raise errors[0]
+        return merged
+
+
+optimization_runner = OptimizationRunner()
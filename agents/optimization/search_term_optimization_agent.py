@@ -1,7 +1,5 @@
-import asyncio
 from structlog import get_logger
 
-from core.services.campaign_mapping import campaign_mapping_service
 from core.models.optimization import (
     CampaignRecommendation,
     OptimizationFields,
@@ -12,7 +10,8 @@ from core.models.optimization import (
 from adapters.google.accounts import GoogleAccountsAdapter
 from adapters.google.optimization.search_term import GoogleSearchTermAdapter
 from core.search_term.analyzer import SearchTermAnalyzer
-from core.services.recommendation_storage import recommendation_storage_service
+from agents.optimization.runner import RunResult, optimization_runner
+from agents.optimization.snapshot import OptimizationSnapshot, load_snapshot
 
 logger = get_logger(__name__)
 
@@ -24,30 +23,34 @@ class SearchTermOptimizationAgent:
         self.analyzer = SearchTermAnalyzer()
 
     async def generate_recommendations(self, client_code: str) -> dict:
-        accounts = await self.accounts_adapter.fetch_accessible_accounts(client_code)
-        if not accounts:
+        snapshot = await load_snapshot(client_code, self.accounts_adapter)
+        if not snapshot.accounts:
             logger.info("No accessible accounts found", client_code=client_code)
-            return {"recommendations": []}
-
-        campaign_mapping = (
-            await campaign_mapping_service.get_campaign_mapping_with_summary(
-                client_code
-            )
+            return {"recommendations": [], "failures": []}
+
+        all_recs = await self.collect(snapshot)
+        return {
+            "recommendations": [r.model_dump() for r in all_recs],
+            "failures": all_recs.failures,
+        }
+
+    async def collect(
+        self, snapshot: OptimizationSnapshot, store: bool = True
+    ) -> RunResult:
+        return await optimization_runner.run(
+            snapshot.client_code,
+            snapshot.accounts,
+            fetch=lambda account: self._fetch_campaigns(
+                account, snapshot.campaign_mapping
+            ),
+            analyze=self._analyze_campaign,
+            agent="search_term",
+            store=store,
         )
 
-        results = await asyncio.gather(
-            *[self._process_account(acc, campaign_mapping) for acc in accounts]
-        )
-        all_recs = [r for recs in results for r in recs]
-
-        for rec in all_recs:
-            await recommendation_storage_service.store(rec, client_code)
-
-        return {"recommendations": [r.model_dump() for r in all_recs]}
-
-    async def _process_account(
+    async def _fetch_campaigns(
         self, account: dict, campaign_mapping: dict
-    ) -> list[CampaignRecommendation]:
+    ) -> list[dict]:
         account_id = account["customer_id"]
         parent_id = account["login_customer_id"]
 
@@ -65,53 +68,55 @@ class SearchTermOptimizationAgent:
             campaigns=len(campaigns),
         )
 
-        recommendations = []
+        units = []
         for cid, data in campaigns.items():
             mapping = campaign_mapping.get(cid)
             if not mapping or not mapping.get("summary"):
                 continue
-
-            logger.info(
-                "Processing campaign", campaign_id=cid, term_count=len(data["terms"])
-            )
-
-            keywords, negative_keywords = await self._analyze_terms(
-                data["terms"], mapping["summary"]
-            )
-            if not keywords and not negative_keywords:
-                continue
-
-            recommendations.append(
-                CampaignRecommendation(
-                    _id=None,
-                    platform="GOOGLE",
-                    parent_account_id=parent_id,
-                    account_id=account_id,
-                    product_id=mapping["product_id"],
-                    campaign_id=cid,
-                    campaign_name=data["name"],
-                    campaign_type="SEARCH",
-                    completed=False,
-                    fields=OptimizationFields(
-                        keywords=keywords or None,
-                        negativeKeywords=negative_keywords or None,
-                    ),
-                )
+            units.append(
+                {
+                    "account_id": account_id,
+                    "parent_id": parent_id,
+                    "campaign_id": cid,
+                    "mapping": mapping,
+                    "data": data,
+                }
             )
+        return units
 
+    async def _analyze_campaign(self, unit: dict) -> CampaignRecommendation | None:
+        cid, data, mapping = unit["campaign_id"], unit["data"], unit["mapping"]
         logger.info(
-            "Account processed", account_id=account_id, campaigns=len(recommendations)
+            "Processing campaign", campaign_id=cid, term_count=len(data["terms"])
+        )
+
+        keywords, negative_keywords = await self._analyze_terms(
+            data["terms"], mapping["summary"]
+        )
+        if not keywords and not negative_keywords:
+            return None
+
+        return CampaignRecommendation(
+            _id=None,
+            platform="GOOGLE",
+            parent_account_id=unit["parent_id"],
+            account_id=unit["account_id"],
+            product_id=mapping["product_id"],
+            campaign_id=cid,
+            campaign_name=data["name"],
+            campaign_type="SEARCH",
+            completed=False,
+            fields=OptimizationFields(
+                keywords=keywords or None,
+                negativeKeywords=negative_keywords or None,
+            ),
         )
-        return recommendations
 
     async def _analyze_terms(
         self, terms: list, summary: str
     ) -> tuple[list[KeywordRecommendation], list[KeywordRecommendation]]:
-        results = await asyncio.gather(
-            *[
-                self.analyzer.analyze_term(summary, t["search_term"], t["metrics"])
-                for t in terms
-            ]
+        results = await self.analyzer.analyze_terms(
+            summary, [(t["search_term"], t["metrics"]) for t in terms]
         )
 
         keywords, negative_keywords = [], []
@@ -0,0 +1,55 @@
+"""Per-client data shared by the optimization agents of one run.
+
+Listing accessible accounts and reading the AISuggestedData campaign mapping
+is the same work for every dimension, so a combined run loads it once and
+hands the snapshot to each agent. Business contexts (an LLM call per product)
+are only needed by the keyword agent and are extracted lazily, at most once
+per snapshot.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Optional
+
+from adapters.google.accounts import GoogleAccountsAdapter
+from agents.optimization.runner import optimization_runner
+from core.services.business_context_service import business_context_service
+from core.services.campaign_mapping import campaign_mapping_service
+
+
+@dataclass
+class OptimizationSnapshot:
+    client_code: str
+    accounts: list[dict]
+    # {campaign_id: {"product_id", "summary", "business_url"}}
+    campaign_mapping: dict[str, dict] = field(default_factory=dict)
+    _contexts: Optional[asyncio.Task] = field(default=None, repr=False)
+
+    @property
+    def campaign_product_mapping(self) -> dict[str, str]:
+        """{campaign_id: product_id}, as returned by get_campaign_product_mapping."""
+        return {
+            campaign_id: details["product_id"]
+            for campaign_id, details in self.campaign_mapping.items()
+        }
+
+    async def campaign_mapping_with_contexts(self) -> dict[str, dict]:
+        """The campaign mapping enriched with brand_info / unique_features."""
+        if self._contexts is None:
+            self._contexts = asyncio.create_task(
+                business_context_service.extract_contexts_by_product(
+                    self.campaign_mapping
+                )
+            )
+        await self._contexts
+        return self.campaign_mapping
+
+
+async def load_snapshot(
+    client_code: str, accounts_adapter: GoogleAccountsAdapter
+) -> OptimizationSnapshot:
+    accounts, campaign_mapping = await asyncio.gather(
+        optimization_runner.fetch_accounts(client_code, accounts_adapter),
+        campaign_mapping_service.get_campaign_mapping_with_summary(client_code),
+    )
+    return OptimizationSnapshot(client_code, accounts, campaign_mapping)
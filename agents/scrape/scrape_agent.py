@@ -25,6 +25,7 @@ from oserver.models.storage_request_model import (
 from oserver.services.storage_service import StorageService
 from services.geo_target_service import GeoTargetService
 from services.openai_client import chat_completion
+from services.scrape_cache import get_scrape_cache
 from services.scraper_service import ScraperService
 from utils.helpers import normalize_url
 from utils.prompt_loader import format_prompt
@@ -225,16 +226,23 @@ class ScrapeAgent:
         self, scraped_data: dict
     ) -> tuple[str, str, Optional[LocationInfo]]:
         """Generate website summary via LLM. Returns (summary, business_type, location_info)."""
+
         prompt = format_prompt(
             "business/website_summary_prompt.txt", scraped_data=scraped_data
         )
-        response = await chat_completion(
-            messages=[{"role": "user", "content": prompt}],
-            model=OPENAI_MODEL,
-            temperature=0.2,
-            response_format={"type": "json_object"},
-        )
-        raw = response.choices[0].message.content.strip()
+        params = {
+            "model": OPENAI_MODEL,
+            "temperature": 0.2,
+            "response_format": {"type": "json_object"},
+        }
+
+        async def generate() -> str:
+            response = await chat_completion(
+                messages=[{"role": "user", "content": prompt}], **params
+            )
+            return response.choices[0].message.content.strip()
+
+        raw = await get_scrape_cache().website_summary(prompt, params, generate)
 
         try:
             parsed = json.loads(raw)
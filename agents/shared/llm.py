@@ -2,7 +2,11 @@ import asyncio
 from functools import lru_cache
 from openai import AsyncOpenAI
 import os
-from typing import List
+import sys
+from typing import Awaitable, List, Optional
+
+from core.infrastructure.embedding_cache import get_embedding_cache
+from core.infrastructure.llm_cache import LLM_CACHE_ENABLED, get_llm_cache, is_cacheable
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
@@ -15,7 +19,50 @@ def get_client() -> AsyncOpenAI:
     return AsyncOpenAI(api_key=OPENAI_API_KEY)
 
 
-async def chat_completion(messages: list, model: str = "gpt-4.1", **kwargs):
+def chat_completion(
+    messages: list,
+    model: str = "gpt-4.1",
+    cache: Optional[bool] = None,
+    call_site: Optional[str] = None,
+    **kwargs,
+) -> Awaitable:
+    """Create a chat completion.
+
+    Requests with an explicit temperature of 0 are served from the LLM
+    response cache, and concurrent identical requests share one call.
+    cache=True opts other requests in (e.g. reusable JSON classifications),
+    cache=False bypasses the cache; call_site labels the caller in cache
+    stats and defaults to the calling module and function.
+
+    Not a coroutine function so the caller's frame is still on the stack
+    when the call site is resolved, even for gather()/wait_for() calls.
+    """
+    if cache is None:
+        cache = is_cacheable(kwargs)
+    if not (cache and LLM_CACHE_ENABLED):
+        return _create_chat_completion(messages, model, kwargs)
+
+    if call_site is None:
+        caller = sys._getframe(1)
+        call_site = f"{caller.f_globals.get('__name__')}.{caller.f_code.co_name}"
+    return get_llm_cache().get_or_call(
+        model,
+        messages,
+        kwargs,
+        call_site,
+        lambda: _create_chat_completion(messages, model, kwargs),
+    )
+
+
+def evict_chat_completion(messages: list, model: str = "gpt-4.1", **kwargs) -> None:
+    """Drop a cached completion the caller rejected, so the next identical call reaches the model.
+
+    Takes the same messages, model and completion kwargs as the rejected call.
+    """
+    get_llm_cache().evict(model, messages, kwargs)
+
+
+async def _create_chat_completion(messages: list, model: str, kwargs: dict):
     async with _semaphore:
         client = get_client()
         response = await client.chat.completions.create(
@@ -27,7 +74,11 @@ async def chat_completion(messages: list, model: str = "gpt-4.1", **kwargs):
 async def generate_embeddings(
     texts: List[str], model: str = "text-embedding-3-small"
 ) -> List[List[float]]:
-    """Generate embeddings for a list of texts."""
+    """Generate embeddings for a list of texts, serving repeats from the embedding cache."""
+    return await get_embedding_cache().get_or_embed(texts, model, _create_embeddings)
+
+
+async def _create_embeddings(texts: List[str], model: str) -> List[List[float]]:
     async with _semaphore:
         client = get_client()
         response = await client.embeddings.create(model=model, input=texts)
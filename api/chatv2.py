@@ -21,7 +21,7 @@ async def start_session() -> dict[str, Any]:
 @router.post("/{session_id}/stream")
 async def stream_chat_process(session_id: str, message: str):
     """Process a chat message with SSE streaming response."""
-    chatv2_agent.validate_session(session_id)
+    await chatv2_agent.validate_session(session_id)
     event_stream = chatv2_agent.process_message_stream(session_id, message)
     return sse_response(event_stream)
 
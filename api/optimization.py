@@ -1,3 +1,5 @@
+from typing import List, Optional
+
 from fastapi import APIRouter, Query
 from core.models.optimization import CampaignRecommendation, MutationResponse
 from core.services.google_ads_mutation_service import (
@@ -15,6 +17,7 @@ from agents.optimization.location_optimization_agent import (
     location_optimization_agent,
 )
 from agents.optimization.gender_optimization_agent import gender_optimization_agent
+from agents.optimization.all_optimizations_agent import all_optimizations_agent
 
 router = APIRouter(prefix="/api/ds/optimize", tags=["optimization"])
 
@@ -59,6 +62,18 @@ async def generate_gender_optimization():
     return {"status": "success", "data": result}
 
 
+@router.post("/all")
+async def generate_all_optimizations(
+    dimensions: Optional[List[str]] = Query(None),
+):
+    """Runs all (or the selected) optimization dimensions over one shared data fetch."""
+    result = await all_optimizations_agent.generate_recommendations(
+        client_code=auth_context.client_code,
+        dimensions=dimensions,
+    )
+    return {"status": "success", "data": result}
+
+
 @router.post("/execute", response_model=MutationResponse)
 async def execute_google_ads_mutation(
     campaign: CampaignRecommendation,
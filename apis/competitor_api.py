@@ -1,4 +1,9 @@
+from typing import Optional
+
 from fastapi import APIRouter, Body
+from core.infrastructure.context import auth_context
+from core.infrastructure.jobs import Job, get_job_manager
+from core.streaming import sse_response
 from services.competitor.competitor_analysis_orchestrator import (
     competitor_analysis_orchestrator,
 )
@@ -14,15 +19,68 @@ async def analyze_competitors(
     login_customer_id: str = Body(..., embed=True),
     force_fresh_analysis: bool = False,
 ):
-    """Run competitor keyword analysis synchronously."""
-    result = await competitor_analysis_orchestrator.start_competitor_analysis(
+    """Run competitor keyword analysis and wait for the result.
+
+    Joins an analysis already running for the same business URL.
+    """
+    job, _ = competitor_analysis_orchestrator.submit_competitor_analysis(
         business_url=business_url,
         customer_id=customer_id,
         login_customer_id=login_customer_id,
         force_fresh_analysis=force_fresh_analysis,
     )
+    result = await job.wait()
 
     if not result.competitor_analysis:
         return error_response("Competitor analysis failed or no competitors found.")
 
     return success_response(result)
+
+
+@router.post("/analyze/jobs")
+async def submit_competitor_analysis(
+    business_url: str = Body(..., embed=True),
+    customer_id: str = Body(..., embed=True),
+    login_customer_id: str = Body(..., embed=True),
+    force_fresh_analysis: bool = False,
+):
+    """Start competitor analysis in the background and return its job id."""
+    job, created = competitor_analysis_orchestrator.submit_competitor_analysis(
+        business_url=business_url,
+        customer_id=customer_id,
+        login_customer_id=login_customer_id,
+        force_fresh_analysis=force_fresh_analysis,
+    )
+    return success_response(
+        {"job_id": job.id, "status": job.status, "deduplicated": not created}
+    )
+
+
+@router.get("/analyze/jobs/{job_id}")
+async def get_competitor_analysis_job(job_id: str):
+    """Return a job's status, and its result once completed."""
+    job = _get_job(job_id)
+    if job is None:
+        return error_response("Job not found", status_code=404)
+    return success_response(job.snapshot())
+
+
+@router.get("/analyze/jobs/{job_id}/events")
+async def stream_competitor_analysis_job(job_id: str):
+    """Stream a job's progress over SSE, ending with its result or error."""
+    job = _get_job(job_id)
+    if job is None:
+        return error_response("Job not found", status_code=404)
+    return sse_response(job.subscribe())
+
+
+def _get_job(job_id: str) -> Optional[Job]:
+    # Jobs are keyed (kind, client_code, business_url); hide other clients' jobs.
+    job = get_job_manager().get(job_id)
+    if (
+        job is None
+        or job.kind != competitor_analysis_orchestrator.JOB_KIND
+        or job.key[1] != auth_context.client_code
+    ):
+        return None
+    return job
@@ -0,0 +1,247 @@
+"""App-lifetime headless Chromium shared by the scraper and screenshot services.
+
+One browser process is launched at startup (or lazily on first use) and
+pages are leased from a bounded set of browser contexts. Contexts are reused
+across leases and recycled after BROWSER_CONTEXT_MAX_USES pages so cookies
+and cache do not accumulate indefinitely.
+
+Usage:
+    from core.infrastructure.browser_pool import get_browser_pool, settle_page
+
+    async with get_browser_pool().page() as page:
+        await page.goto(url, wait_until="load")
+        await settle_page(page)
+        html = await page.content()
+"""
+
+import asyncio
+import os
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import structlog
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    Page,
+    Playwright,
+    async_playwright,
+)
+from playwright.async_api import Error as PlaywrightError
+
+logger = structlog.get_logger(__name__)
+
+BROWSER_POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", "4"))
+BROWSER_CONTEXT_MAX_USES = int(os.getenv("BROWSER_CONTEXT_MAX_USES", "20"))
+NETWORK_IDLE_TIMEOUT_MS = 3000
+DOM_QUIET_MS = 500
+DOM_STABLE_TIMEOUT_MS = 2000
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# Resolves once the DOM has had no mutations for quietMs, or after maxMs.
+_DOM_STABLE_JS = """
+([quietMs, maxMs]) => new Promise((resolve) => {
+    const done = () => {
+        observer.disconnect();
+        clearTimeout(quiet);
+        clearTimeout(deadline);
+        resolve();
+    };
+    const observer = new MutationObserver(() => {
+        clearTimeout(quiet);
+        quiet = setTimeout(done, quietMs);
+    });
+    let quiet = setTimeout(done, quietMs);
+    const deadline = setTimeout(done, maxMs);
+    observer.observe(document.documentElement, {
+        childList: true, subtree: true, characterData: true,
+    });
+})
+"""
+
+
+async def settle_page(
+    page: Page,
+    network_idle_ms: int = NETWORK_IDLE_TIMEOUT_MS,
+    dom_quiet_ms: int = DOM_QUIET_MS,
+    dom_timeout_ms: int = DOM_STABLE_TIMEOUT_MS,
+) -> None:
+    """Wait for network idle and a quiet DOM, each capped, instead of a fixed sleep."""
+    try:
+        await page.wait_for_load_state("networkidle", timeout=network_idle_ms)
+    except PlaywrightError:
+        pass
+    try:
+        await page.evaluate(_DOM_STABLE_JS, [dom_quiet_ms, dom_timeout_ms])
+    except PlaywrightError as e:
+        logger.debug("dom_stable_wait_failed", error=str(e))
+
+
+class _PooledContext:
+    def __init__(self, context: BrowserContext):
+        self.context = context
+        self.uses = 0
+
+
+class BrowserPool:
+    """Bounded pool of browser contexts on a single shared Chromium process."""
+
+    def __init__(
+        self,
+        max_contexts: int = BROWSER_POOL_SIZE,
+        max_uses: int = BROWSER_CONTEXT_MAX_USES,
+    ):
+        self._max_uses = max_uses
+        self._slots = asyncio.Semaphore(max_contexts)
+        self._idle: list[_PooledContext] = []
+        self._start_lock = asyncio.Lock()
+        self._playwright: Playwright | None = None
+        self._browser: Browser | None = None
+        self._metrics = {
+            "pages_in_flight": 0,
+            "waiting": 0,
+            "pages_served": 0,
+            "contexts_created": 0,
+            "contexts_recycled": 0,
+            "browser_launches": 0,
+            "queue_wait_ms_total": 0.0,
+            "queue_wait_ms_max": 0.0,
+        }
+
+    async def start(self) -> None:
+        async with self._start_lock:
+            if self._browser is not None and self._browser.is_connected():
+                return
+            await self._shutdown_browser()
+            self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(headless=True)
+            self._metrics["browser_launches"] += 1
+            logger.info("Browser launched", component="browser_pool")
+
+    async def close(self) -> None:
+        async with self._start_lock:
+            await self._shutdown_browser()
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Page]:
+        """Lease a fresh page in a pooled context; waits if all contexts are busy."""
+        queued_at = time.monotonic()
+        self._metrics["waiting"] += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self._metrics["waiting"] -= 1
+        wait_ms = (time.monotonic() - queued_at) * 1000
+        self._metrics["queue_wait_ms_total"] += wait_ms
+        self._metrics["queue_wait_ms_max"] = max(
+            self._metrics["queue_wait_ms_max"], wait_ms
+        )
+
+        pooled = None
+        usable = False
+        self._metrics["pages_in_flight"] += 1
+        try:
+            pooled = await self._acquire_context()
+            pooled.uses += 1
+            page = await pooled.context.new_page()
+            usable = True
+            try:
+                yield page
+            finally:
+                await _close_quietly(page)
+        finally:
+            self._metrics["pages_in_flight"] -= 1
+            self._metrics["pages_served"] += 1
+            if pooled is not None:
+                await self._release_context(pooled, usable)
+            self._slots.release()
+            logger.debug(
+                "browser_page_released",
+                queue_wait_ms=round(wait_ms, 1),
+                in_flight=self._metrics["pages_in_flight"],
+                waiting=self._metrics["waiting"],
+            )
+
+    def stats(self) -> dict:
+        served = self._metrics["pages_served"]
+        return {
+            **self._metrics,
+            "contexts_idle": len(self._idle),
+            "queue_wait_ms_avg": (
+                round(self._metrics["queue_wait_ms_total"] / served, 1)
+                if served
+                else 0.0
+            ),
+        }
+
+    async def _acquire_context(self) -> _PooledContext:
+        if self._browser is None or not self._browser.is_connected():
+            self._idle.clear()
+            await self.start()
+        if self._idle:
+            return self._idle.pop()
+        context = await self._browser.new_context(user_agent=USER_AGENT)
+        self._metrics["contexts_created"] += 1
+        return _PooledContext(context)
+
+    async def _release_context(self, pooled: _PooledContext, usable: bool) -> None:
+        connected = self._browser is not None and self._browser.is_connected()
+        if usable and connected and pooled.uses < self._max_uses:
+            self._idle.append(pooled)
+            return
+        self._metrics["contexts_recycled"] += 1
+        await _close_quietly(pooled.context)
+
+    async def _shutdown_browser(self) -> None:
+        for pooled in self._idle:
+            await _close_quietly(pooled.context)
+        self._idle.clear()
+        if self._browser is not None:
+            await _close_quietly(self._browser)
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+
+async def _close_quietly(resource: Page | BrowserContext | Browser) -> None:
+    try:
+        await resource.close()
+    except PlaywrightError:
+        pass
+
+
+_pool: BrowserPool | None = None
+
+
+async def init_browser_pool() -> None:
+    """Create the shared pool and launch Chromium; launch failures are retried on first use."""
+    global _pool
+    _pool = BrowserPool()
+    try:
+        await _pool.start()
+    except Exception as e:
+        logger.warning(
+            "Browser launch failed, will retry on first use",
+            component="browser_pool",
+            error=str(e),
+        )
+
+
+async def close_browser_pool() -> None:
+    global _pool
+    if _pool:
+        await _pool.close()
+        _pool = None
+
+
+def get_browser_pool() -> BrowserPool:
+    global _pool
+    if _pool is None:
+        _pool = BrowserPool()
+    return _pool
@@ -0,0 +1,210 @@
+"""In-process LRU and SQLite-backed disk caches shared by service-level caches.
+
+Both tiers are synchronous and cheap; callers on the event loop should wrap
+DiskCache calls in asyncio.to_thread.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Hashable, Iterable
+
+from structlog import get_logger
+
+logger = get_logger(__name__)
+
+CACHE_DIR = os.getenv("CACHE_DIR", ".cache")
+
+_MISSING = object()
+
+
+class LRUCache:
+    """Bounded mapping that evicts the least recently used entry.
+
+    Entries can carry an optional TTL (seconds); expired entries are
+    dropped on access.
+    """
+
+    def __init__(self, maxsize: int, ttl: float | None = None):
+        self._data: OrderedDict[Hashable, tuple[Any, float | None]] = OrderedDict()
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                return default
+            value, expires_at = entry
+            if expires_at is not None and time.monotonic() >= expires_at:
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        ttl = ttl if ttl is not None else self._ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.pop(key, _MISSING)
+        return default if entry is _MISSING else entry[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class DiskCache:
+    """Size-bounded key/value store for bytes in a single SQLite file.
+
+    Least recently accessed rows are evicted once the stored payload exceeds
+    max_bytes. Entries may carry an absolute expiry (epoch seconds).
+    """
+
+    EVICT_CHECK_INTERVAL = 100
+
+    def __init__(self, name: str, max_bytes: int, directory: str | None = None):
+        path = Path(directory or CACHE_DIR)
+        path.mkdir(parents=True, exist_ok=True)
+        self.path = path / f"{name}.sqlite3"
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._writes_since_check = 0
+        self._conn = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries (accessed_at)"
+        )
+
+    def get(self, key: str) -> bytes | None:
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, bytes]:
+        keys = list(keys)
+        if not keys:
+            return {}
+        now = time.time()
+        found: dict[str, bytes] = {}
+        with self._lock:
+            for start in range(0, len(keys), 500):
+                batch = keys[start : start + 500]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, value, expires_at FROM entries WHERE key IN ({placeholders})",
+                    batch,
+                ).fetchall()
+                for key, value, expires_at in rows:
+                    if expires_at is not None and expires_at <= now:
+                        continue
+                    found[key] = value
+            if found:
+                self._conn.executemany(
+                    "UPDATE entries SET accessed_at = ? WHERE key = ?",
+                    [(now, key) for key in found],
+                )
+        return found
+
+    def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        self.set_many({key: value}, ttl=ttl)
+
+    def set_many(self, items: dict[str, bytes], ttl: float | None = None) -> None:
+        if not items:
+            return
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        rows = [
+            (key, value, len(value), expires_at, now) for key, value in items.items()
+        ]
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO entries (key, value, size, expires_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+            except sqlite3.Error:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+            self._writes_since_check += len(rows)
+            if self._writes_since_check >= self.EVICT_CHECK_INTERVAL:
+                self._writes_since_check = 0
+                self._evict()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _evict(self) -> None:
+        self._conn.execute(
+            "DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at <= ?",
+            (time.time(),),
+        )
+        total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()[0]
+        if total <= self._max_bytes:
+            return
+        excess = total - self._max_bytes
+        freed = 0
+        victims = []
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM entries ORDER BY accessed_at"
+        ):
+            victims.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        self._conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+        logger.info(
+            "disk_cache_evicted", path=str(self.path), entries=len(victims), bytes=freed
+        )
+
+
+def open_disk_cache(name: str, max_bytes: int) -> DiskCache | None:
+    """Open a DiskCache, falling back to memory-only caching if the disk is unusable."""
+    try:
+        return DiskCache(name, max_bytes=max_bytes)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("disk_cache_unavailable", name=name, error=str(e))
+        return None
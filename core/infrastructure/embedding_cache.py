@@ -0,0 +1,145 @@
+"""Content-addressed cache for text embeddings.
+
+Entries are keyed by (model, sha256 of whitespace-normalized text) and kept
+in two tiers: an in-process LRU and a persistent SQLite file under CACHE_DIR.
+Only texts missing from both tiers are sent to the embedding API.
+
+Usage:
+    from core.infrastructure.embedding_cache import get_embedding_cache
+    vectors = await get_embedding_cache().get_or_embed(texts, model, embed_fn)
+"""
+
+import asyncio
+import hashlib
+import os
+import sqlite3
+from array import array
+from typing import Awaitable, Callable, Optional
+
+from structlog import get_logger
+
+from core.infrastructure.cache import DiskCache, LRUCache, open_disk_cache
+
+logger = get_logger(__name__)
+
+EMBEDDING_CACHE_SIZE = int(os.getenv("EMBEDDING_CACHE_SIZE", "50000"))
+EMBEDDING_CACHE_MAX_MB = int(os.getenv("EMBEDDING_CACHE_MAX_MB", "1024"))
+
+EmbedFn = Callable[[list[str], str], Awaitable[list[list[float]]]]
+
+
+def normalize_text(text: str) -> str:
+    return " ".join(text.split())
+
+
+def embedding_key(model: str, normalized_text: str) -> str:
+    digest = hashlib.sha256(normalized_text.encode("utf-8")).hexdigest()
+    return f"{model}:{digest}"
+
+
+class EmbeddingCache:
+    """Two-tier (memory + disk) embedding cache with hit/miss counters."""
+
+    def __init__(self, memory_size: int, disk: DiskCache | None):
+        self._memory = LRUCache(maxsize=memory_size)
+        self._disk = disk
+        self._counters = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+
+    async def get_or_embed(
+        self, texts: list[str], model: str, embed_fn: EmbedFn
+    ) -> list[list[float]]:
+        """Return one embedding per text, calling embed_fn only for uncached texts."""
+        normalized = [normalize_text(t) for t in texts]
+        keys = [embedding_key(model, t) for t in normalized]
+
+        found: dict[str, list[float]] = {}
+        for key in keys:
+            vector = self._memory.get(key)
+            if vector is not None:
+                found[key] = vector
+        memory_hits = len(found)
+
+        pending = {k: t for k, t in zip(keys, normalized) if k not in found}
+        disk_hits = 0
+        if pending and self._disk is not None:
+            stored = await self._read_disk(list(pending))
+            for key, blob in stored.items():
+                vector = _decode(blob)
+                self._memory.set(key, vector)
+                found[key] = vector
+                pending.pop(key)
+            disk_hits = len(stored)
+
+        if pending:
+            vectors = await embed_fn(list(pending.values()), model)
+            fresh = dict(zip(pending, vectors))
+            for key, vector in fresh.items():
+                self._memory.set(key, vector)
+            found.update(fresh)
+            await self._write_disk({k: _encode(v) for k, v in fresh.items()})
+
+        self._counters["memory_hits"] += memory_hits
+        self._counters["disk_hits"] += disk_hits
+        self._counters["misses"] += len(pending)
+        logger.debug(
+            "embedding_cache_lookup",
+            model=model,
+            requested=len(texts),
+            memory_hits=memory_hits,
+            disk_hits=disk_hits,
+            misses=len(pending),
+        )
+        return [found[key] for key in keys]
+
+    async def _read_disk(self, keys: list[str]) -> dict[str, bytes]:
+        try:
+            return await asyncio.to_thread(self._disk.get_many, keys)
+        except sqlite3.Error as e:
+            logger.warning("embedding_cache_disk_read_failed", error=str(e))
+            return {}
+
+    async def _write_disk(self, items: dict[str, bytes]) -> None:
+        if self._disk is None:
+            return
+        try:
+            await asyncio.to_thread(self._disk.set_many, items)
+        except sqlite3.Error as e:
+            logger.warning("embedding_cache_disk_write_failed", error=str(e))
+
+    def stats(self) -> dict:
+        total = sum(self._counters.values())
+        hits = self._counters["memory_hits"] + self._counters["disk_hits"]
+        return {
+            **self._counters,
+            "memory_entries": len(self._memory),
+            "hit_rate": round(hits / total, 4) if total else 0.0,
+        }
+
+    def clear(self) -> None:
+        self._memory.clear()
+        if self._disk is not None:
+            self._disk.clear()
+
+
+def _encode(vector: list[float]) -> bytes:
+    return array("f", vector).tobytes()
+
+
+def _decode(blob: bytes) -> list[float]:
+    vector = array("f")
+    vector.frombytes(blob)
+    return vector.tolist()
+
+
+_default_cache: Optional[EmbeddingCache] = None
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Get the shared embedding cache instance."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = EmbeddingCache(
+            memory_size=EMBEDDING_CACHE_SIZE,
+            disk=open_disk_cache("embeddings", EMBEDDING_CACHE_MAX_MB * 1024 * 1024),
+        )
+    return _default_cache
@@ -1,6 +1,7 @@
 import asyncio
 import random
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
 
 import httpx
 import structlog
@@ -83,6 +84,65 @@ async def http_request(
     raise RuntimeError("Request failed after all retry attempts")
 
 
+@asynccontextmanager
+async def http_stream(
+    method: str,
+    url: str,
+    *,
+    max_attempts: int = 3,
+    base_delay: float = 2.0,
+    error_handler: Callable[[httpx.Response], None] | None = None,
+    retry_delay_parser: Callable[[httpx.Response, float], float] | None = None,
+    **kwargs,
+) -> AsyncIterator[httpx.Response]:
+    """Streaming variant of http_request; yields the response with an unread body.
+
+    Retries (same policy as http_request) apply only until a successful
+    status is received — once the body is being consumed, failures propagate.
+    """
+    client = get_http_client()
+
+    for attempt in range(max_attempts):
+        is_last = attempt == max_attempts - 1
+        try:
+            request = client.build_request(method, url, **kwargs)
+            response = await client.send(request, stream=True)
+        except httpx.TimeoutException:
+            if is_last:
+                raise
+            delay = _compute_delay(attempt, base_delay)
+            logger.warning(
+                "http_timeout_retry", attempt=attempt + 1, retry_in=round(delay, 2)
+            )
+            await asyncio.sleep(delay)
+            continue
+
+        if response.is_success:
+            try:
+                yield response
+            finally:
+                await response.aclose()
+            return
+
+        await response.aread()
+        await response.aclose()
+        if response.status_code not in RETRYABLE_STATUS_CODES or is_last:
+            if error_handler:
+                error_handler(response)
+            response.raise_for_status()
+
+        delay = _compute_delay(attempt, base_delay, response, retry_delay_parser)
+        logger.warning(
+            "http_retry",
+            status=response.status_code,
+            attempt=attempt + 1,
+            retry_in=round(delay, 2),
+        )
+        await asyncio.sleep(delay)
+
+    raise RuntimeError("Request failed after all retry attempts")
+
+
 def _compute_delay(
     attempt: int,
     base_delay: float,
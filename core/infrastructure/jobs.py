@@ -0,0 +1,214 @@
+"""In-process background jobs whose progress can be followed over SSE.
+
+A job runs as an asyncio task started from a request handler, so it
+inherits that request's contextvars (auth_context, structlog bindings) and
+outlives the request. Everything the job reports is appended to its event
+log as core.streaming StreamEvents. Each subscriber replays the log from
+the start and then follows it live, so a client that connects late (or
+reconnects) still sees the whole run. The log ends with a data event
+carrying the result followed by a done event, or with an error event.
+
+While a job is running, submitting the same (kind, key) returns the running
+job instead of starting a second one. Finished jobs stay readable for
+JOB_RETENTION_SECONDS. Jobs live in this process only: with several workers,
+status and events must be read from the worker that accepted the submit.
+"""
+
+import asyncio
+import os
+import time
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from fastapi.encoders import jsonable_encoder
+from structlog import get_logger
+
+from core.streaming.events import (
+    StreamEvent,
+    data_event,
+    done_event,
+    error_event,
+    progress_event,
+)
+
+logger = get_logger(__name__)
+
+JOB_RETENTION_SECONDS = float(os.getenv("JOB_RETENTION_SECONDS", "3600"))
+
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+
+
+@dataclass(eq=False)
+class Job:
+    """One background run and its event log."""
+
+    id: str
+    kind: str
+    key: tuple
+    status: str = RUNNING
+    result: Any = None
+    error: Optional[str] = None
+    exception: Optional[BaseException] = None
+    created_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    events: list[StreamEvent] = field(default_factory=list)
+    task: Optional[asyncio.Task] = None
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+    _changed: asyncio.Event = field(default_factory=asyncio.Event)
+
+    def progress(self, step: str, phase: str, message: str) -> None:
+        """on_progress(step, phase, message) callback: start phases carry a label."""
+        if phase == "start":
+            self.publish(progress_event(node=step, phase="start", label=message))
+        else:
+            self.publish(progress_event(node=step, phase=phase, message=message))
+
+    def publish(self, event: StreamEvent) -> None:
+        if self.done.is_set():
+            return
+        self.events.append(event)
+        # Followers hold the old event; swapping arms their next wait.
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def subscribe(self) -> AsyncIterator[StreamEvent]:
+        """Replay the event log from the start, then follow it until the job ends."""
+        return self._follow()
+
+    async def _follow(self) -> AsyncIterator[StreamEvent]:
+        cursor = 0
+        while True:
+            changed = self._changed
+            while cursor < len(self.events):
+                cursor += 1
+                yield self.events[cursor - 1]
+            if self.done.is_set():
+                return
+            await changed.wait()
+
+    async def wait(self) -> Any:
+        """Wait for the job to end; return its result or re-raise its exception."""
+        await self.done.wait()
+        if self.exception is not None:
+            raise self.exception
+        return self.result
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "error": self.error,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+            "result": self.result if self.status == COMPLETED else None,
+        }
+
+    def _complete(self, result: Any) -> None:
+        self.result = result
+        payload = jsonable_encoder(result)
+        if not isinstance(payload, dict):
+            payload = {"value": payload}
+        self.publish(data_event(self.kind, payload))
+        self.publish(done_event(job_id=self.id, status=COMPLETED))
+        self.status = COMPLETED
+        self._finish()
+
+    def _fail(self, exception: BaseException, message: str) -> None:
+        self.exception = exception
+        self.error = message
+        self.publish(error_event(message))
+        self.status = FAILED
+        self._finish()
+
+    def _finish(self) -> None:
+        self.finished_at = time.time()
+        self.done.set()
+        self._changed.set()
+
+
+JobRunner = Callable[[Job], Awaitable[Any]]
+
+
+class JobManager:
+    """Starts, de-duplicates and tracks background jobs."""
+
+    def __init__(self, retention_seconds: float = JOB_RETENTION_SECONDS) -> None:
+        self.retention_seconds = retention_seconds
+        self._jobs: dict[str, Job] = {}
+        self._running: dict[tuple, Job] = {}
+
+    def submit(self, kind: str, key: tuple, run: JobRunner) -> tuple[Job, bool]:
+        """Start run(job) in the background, or join the running job with this key.
+
+        Returns the job and whether it was newly created.
+        """
+        self._prune()
+        job_key = (kind, *key)
+        existing = self._running.get(job_key)
+        if existing is not None:
+            logger.info("job_deduplicated", job_id=existing.id, kind=kind)
+            return existing, False
+
+        job = Job(id=uuid.uuid4().hex, kind=kind, key=job_key)
+        self._jobs[job.id] = job
+        self._running[job_key] = job
+        job.task = asyncio.create_task(self._run(job, run))
+        logger.info("job_submitted", job_id=job.id, kind=kind)
+        return job, True
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    async def close(self) -> None:
+        """Cancel running jobs (application shutdown)."""
+        tasks = [job.task for job in self._running.values() if job.task]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run(self, job: Job, run: JobRunner) -> None:
+        started = time.perf_counter()
+        try:
+            result = await run(job)
+        except asyncio.CancelledError as e:
+            job._fail(e, "Job cancelled")
+            raise
+        except Exception as e:
+            logger.exception("job_failed", job_id=job.id, kind=job.kind)
+            job._fail(e, str(e) or type(e).__name__)
+        else:
+            job._complete(result)
+            logger.info(
+                "job_completed",
+                job_id=job.id,
+                kind=job.kind,
+                duration_ms=round((time.perf_counter() - started) * 1000),
+            )
+        finally:
+            if self._running.get(job.key) is job:
+                del self._running[job.key]
+
+    def _prune(self) -> None:
+        cutoff = time.time() - self.retention_seconds
+        expired = [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.finished_at is not None and job.finished_at < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+
+_job_manager: Optional[JobManager] = None
+
+
+def get_job_manager() -> JobManager:
+    global _job_manager
+    if _job_manager is None:
+        _job_manager = JobManager()
+    return _job_manager
@@ -7,9 +7,14 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine
 import structlog
 
+from agents.chatv2.history import warm_tokenizer
+from core.infrastructure.browser_pool import init_browser_pool, close_browser_pool
 from core.infrastructure.http_client import init_http_client, close_http_client
+from core.infrastructure.jobs import get_job_manager
+from core.infrastructure.session_store import get_session_store
 from core.metadata import SERVICE_NAME, VERSION
 from db import db_session
+from utils.prompt_registry import get_prompt_registry
 
 logger = structlog.get_logger(__name__)
 
@@ -62,6 +67,15 @@ async def lifespan(app: FastAPI):
         init_http_client()
         logger.info("HTTP client initialized", component="http")
 
+        get_prompt_registry()
+
+        await warm_tokenizer()
+
+        await init_browser_pool()
+
+        get_session_store().start_sweeper()
+        logger.info("Session sweeper started", component="sessions")
+
         environment = os.getenv("ENVIRONMENT", "local")
         log_level = os.getenv("LOG_LEVEL", "INFO").upper()
         python_version = sys.version.split()[0]
@@ -91,3 +105,9 @@ async def lifespan(app: FastAPI):
             await cleanup_database(engine)
         await close_http_client()
         logger.info("HTTP client closed", component="http")
+        await close_browser_pool()
+        logger.info("Browser pool closed", component="browser_pool")
+        await get_job_manager().close()
+        logger.info("Background jobs cancelled", component="jobs")
+        await get_session_store().close()
+        logger.info("Session store closed", component="sessions")
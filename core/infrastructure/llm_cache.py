@@ -0,0 +1,137 @@
+"""Response cache and in-flight de-duplication for deterministic chat completions.
+
+A request is cached automatically only when it explicitly asks for
+temperature 0 and uses no tools, streaming or multiple choices. A JSON
+response format alone is not enough: callers whose JSON calls are safe to
+reuse opt in with cache=True, and cache=False always bypasses the cache.
+Callers that reject a response (e.g. it fails validation) evict it so a
+retry reaches the model again. Cacheable requests are keyed by
+sha256 of (model, messages, params). Concurrent identical requests share one
+upstream call, and completed responses are kept in an in-process LRU with a
+TTL. Hits and misses are counted per call site (the caller's module and
+function, unless a call_site is given).
+
+Cached responses are shared between callers and must be treated as read-only.
+
+Usage:
+    from core.infrastructure.llm_cache import get_llm_cache
+    response = await get_llm_cache().get_or_call(model, messages, params, call_site, fn)
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from structlog import get_logger
+
+from core.infrastructure.cache import LRUCache
+
+logger = get_logger(__name__)
+
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+LLM_CACHE_SIZE = int(os.getenv("LLM_CACHE_SIZE", "2000"))
+LLM_CACHE_TTL = float(os.getenv("LLM_CACHE_TTL_SECONDS", "3600"))
+
+_NON_DETERMINISTIC_PARAMS = ("tools", "functions", "stream")
+
+
+def is_cacheable(params: Dict[str, Any]) -> bool:
+    """Whether a request with these params (excluding model/messages) is deterministic enough to cache."""
+    if any(params.get(name) for name in _NON_DETERMINISTIC_PARAMS):
+        return False
+    if params.get("n", 1) != 1:
+        return False
+    return params.get("temperature") == 0
+
+
+def request_key(model: str, messages: list, params: Dict[str, Any]) -> str:
+    payload = json.dumps(
+        {"model": model, "messages": messages, "params": params},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """In-process LRU of completed responses plus a map of in-flight requests."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._responses = LRUCache(maxsize=maxsize, ttl=ttl)
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._counters: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"hits": 0, "joined": 0, "misses": 0}
+        )
+
+    async def get_or_call(
+        self,
+        model: str,
+        messages: list,
+        params: Dict[str, Any],
+        call_site: str,
+        fn: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Return the cached response for an identical request, else run fn once and cache it."""
+        key = request_key(model, messages, params)
+        counters = self._counters[call_site]
+
+        response = self._responses.get(key)
+        if response is not None:
+            counters["hits"] += 1
+            logger.debug("llm_cache_hit", call_site=call_site, model=model)
+            return response
+
+        task = self._inflight.get(key)
+        if task is None:
+            counters["misses"] += 1
+            task = asyncio.create_task(self._call(key, fn))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            counters["joined"] += 1
+            logger.debug("llm_cache_joined", call_site=call_site, model=model)
+        # A cancelled caller (e.g. wait_for timeout) must not cancel the shared call.
+        return await asyncio.shield(task)
+
+    def evict(self, model: str, messages: list, params: Dict[str, Any]) -> bool:
+        """Drop the cached response for a request the caller rejected. Returns True if one was cached."""
+        return self._responses.pop(request_key(model, messages, params)) is not None
+
+    async def _call(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        response = await fn()
+        self._responses.set(key, response)
+        return response
+
+    def stats(self) -> dict:
+        """Hit/joined/miss counts and hit rate per call site."""
+        sites = {}
+        for call_site, counters in self._counters.items():
+            total = sum(counters.values())
+            served = counters["hits"] + counters["joined"]
+            sites[call_site] = {
+                **counters,
+                "hit_rate": round(served / total, 4) if total else 0.0,
+            }
+        return {
+            "entries": len(self._responses),
+            "inflight": len(self._inflight),
+            "call_sites": sites,
+        }
+
+    def clear(self) -> None:
+        self._responses.clear()
+        self._counters.clear()
+
+
+_default_cache: Optional[LLMResponseCache] = None
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """Get the shared LLM response cache instance."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = LLMResponseCache(maxsize=LLM_CACHE_SIZE, ttl=LLM_CACHE_TTL)
+    return _default_cache
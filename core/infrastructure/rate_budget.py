@@ -0,0 +1,38 @@
+"""Token-bucket rate budgets for outbound API calls.
+
+A budget refills at `rate` tokens per second up to `burst` tokens; each call
+takes one token (or `cost`) and waits when the bucket is empty. Waiters are
+served in arrival order. A rate of 0 or less disables the budget.
+
+Usage:
+    budget = RateBudget(rate=5, burst=10)
+    await budget.acquire()
+"""
+
+import asyncio
+import time
+
+
+class RateBudget:
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = max(burst, 1.0)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, cost: float = 1.0) -> None:
+        if self.rate <= 0:
+            return
+        # Holding the lock while sleeping keeps waiters in FIFO order.
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= cost:
+                    self._tokens -= cost
+                    return
+                await asyncio.sleep((cost - self._tokens) / self.rate)
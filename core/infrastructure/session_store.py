@@ -1,19 +1,272 @@
 """
 Session Store - Shared session storage for services.
 
-A cleaner, class-based session store that can be used by new services.
-Easy to swap to Redis for production scalability.
+Sessions are serialized with LangGraph's msgpack serializer (so LangChain
+messages and enums survive the round trip) and kept in a pluggable
+SessionBackend:
+
+- InMemoryBackend: process-local, expired keys removed by a background sweeper.
+- RedisBackend: any Redis-protocol server, selected with SESSION_STORE_URL
+  (e.g. redis://:password@host:6379/0, or rediss:// for TLS). Expiry is
+  handled by the server.
+
+The chatv2 LangGraph checkpointer stores its checkpoints on the same backend.
 """
 
+import asyncio
+import os
+import ssl
+import time
 import uuid
+from abc import ABC, abstractmethod
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Any, Optional
+from urllib.parse import unquote, urlparse
 
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 from structlog import get_logger
 
 logger = get_logger(__name__)
 
 SESSION_TIMEOUT = timedelta(minutes=30)
+SESSION_STORE_URL = os.getenv("SESSION_STORE_URL", "")
+SESSION_SWEEP_INTERVAL = float(os.getenv("SESSION_SWEEP_INTERVAL_SECONDS", "60"))
+REDIS_POOL_SIZE = int(os.getenv("SESSION_REDIS_POOL_SIZE", "8"))
+REDIS_CONNECT_TIMEOUT = float(os.getenv("SESSION_REDIS_CONNECT_TIMEOUT_SECONDS", "5"))
+REDIS_COMMAND_TIMEOUT = float(os.getenv("SESSION_REDIS_TIMEOUT_SECONDS", "5"))
+
+
+def pack(typed: tuple[str, bytes]) -> bytes:
+    """Flatten a serializer (type, payload) pair into a single value."""
+    type_, payload = typed
+    return type_.encode() + b"\0" + payload
+
+
+def unpack(value: bytes) -> tuple[str, bytes]:
+    type_, _, payload = value.partition(b"\0")
+    return type_.decode(), payload
+
+
+class SessionBackend(ABC):
+    """Async key/value storage for serialized session values with per-key TTLs."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]: ...
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None: ...
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> int:
+        """Delete keys. Returns the number of keys that existed."""
+
+    @abstractmethod
+    async def exists(self, key: str) -> bool: ...
+
+    @abstractmethod
+    async def expire(self, key: str, ttl: float) -> bool:
+        """Reset a key's TTL. Returns False if the key does not exist."""
+
+    async def sweep(self) -> int:
+        """Remove expired keys. Returns the number removed."""
+        return 0
+
+    async def close(self) -> None:
+        pass
+
+
+class InMemoryBackend(SessionBackend):
+    """Process-local backend. Expired keys are dropped on access or by sweep()."""
+
+    def __init__(self):
+        self._data: dict[str, tuple[bytes, float]] = {}
+
+    def _live(self, key: str) -> Optional[bytes]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._data[key]
+            return None
+        return value
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self._live(key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._data[key] = (value, time.monotonic() + ttl)
+
+    async def delete(self, *keys: str) -> int:
+        existed = sum(1 for key in keys if self._live(key) is not None)
+        for key in keys:
+            self._data.pop(key, None)
+        return existed
+
+    async def exists(self, key: str) -> bool:
+        return self._live(key) is not None
+
+    async def expire(self, key: str, ttl: float) -> bool:
+        value = self._live(key)
+        if value is None:
+            return False
+        self._data[key] = (value, time.monotonic() + ttl)
+        return True
+
+    async def sweep(self) -> int:
+        now = time.monotonic()
+        expired = [key for key, (_, expires_at) in self._data.items() if now >= expires_at]
+        for key in expired:
+            del self._data[key]
+        return len(expired)
+
+
+class RedisError(Exception):
+    """Error reply from a Redis-protocol server."""
+
+
+class RedisBackend(SessionBackend):
+    """Backend speaking RESP2 to a Redis-compatible server over a small connection pool.
+
+    Connecting and each command round trip are bounded by timeouts, so an
+    unresponsive server fails requests with TimeoutError instead of hanging.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        pool_size: int = REDIS_POOL_SIZE,
+        connect_timeout: float = REDIS_CONNECT_TIMEOUT,
+        command_timeout: float = REDIS_COMMAND_TIMEOUT,
+    ):
+        parsed = urlparse(url)
+        self._host = parsed.hostname or "localhost"
+        self._port = parsed.port or 6379
+        self._password = unquote(parsed.password) if parsed.password else None
+        self._db = int(parsed.path.lstrip("/") or 0)
+        # rediss:// verifies the server certificate against the system CAs.
+        self._ssl = ssl.create_default_context() if parsed.scheme == "rediss" else None
+        self._idle: list[tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self._slots = asyncio.Semaphore(pool_size)
+        self._connect_timeout = connect_timeout
+        self._command_timeout = command_timeout
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self._execute("GET", key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        await self._execute("SET", key, value, "PX", _ttl_ms(ttl))
+
+    async def delete(self, *keys: str) -> int:
+        return await self._execute("DEL", *keys) if keys else 0
+
+    async def exists(self, key: str) -> bool:
+        return await self._execute("EXISTS", key) == 1
+
+    async def expire(self, key: str, ttl: float) -> bool:
+        return await self._execute("PEXPIRE", key, _ttl_ms(ttl)) == 1
+
+    async def close(self) -> None:
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
+
+    async def _execute(self, *args: Any) -> Any:
+        async with self._slots:
+            for attempt in range(2):
+                conn = self._idle.pop() if self._idle else await self._connect()
+                try:
+                    reply = await asyncio.wait_for(
+                        _request(conn, args), self._command_timeout
+                    )
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    conn[1].close()
+                    if attempt:
+                        raise
+                    continue
+                except TimeoutError:
+                    # The reply may still arrive later; the connection can't be reused.
+                    conn[1].close()
+                    raise
+                except RedisError:
+                    self._idle.append(conn)
+                    raise
+                self._idle.append(conn)
+                return reply
+
+    async def _connect(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        return await asyncio.wait_for(self._open(), self._connect_timeout)
+
+    async def _open(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        conn = await asyncio.open_connection(
+            self._host,
+            self._port,
+            ssl=self._ssl,
+            server_hostname=self._host if self._ssl else None,
+        )
+        try:
+            if self._password:
+                await _request(conn, ("AUTH", self._password))
+            if self._db:
+                await _request(conn, ("SELECT", self._db))
+        except BaseException:
+            conn[1].close()
+            raise
+        return conn
+
+
+def _ttl_ms(ttl: float) -> int:
+    return max(int(ttl * 1000), 1)
+
+
+async def _request(
+    conn: tuple[asyncio.StreamReader, asyncio.StreamWriter], args: tuple
+) -> Any:
+    reader, writer = conn
+    writer.write(_encode_command(args))
+    await writer.drain()
+    return await _read_reply(reader)
+
+
+def _encode_command(args: tuple) -> bytes:
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        if not isinstance(arg, bytes):
+            arg = str(arg).encode()
+        parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+    return b"".join(parts)
+
+
+async def _read_reply(reader: asyncio.StreamReader) -> Any:
+    line = await reader.readuntil(b"\r\n")
+    kind, body = line[:1], line[1:-2]
+    if kind == b"+":
+        return body.decode()
+    if kind == b"-":
+        raise RedisError(body.decode())
+    if kind == b":":
+        return int(body)
+    if kind == b"$":
+        length = int(body)
+        if length < 0:
+            return None
+        data = await reader.readexactly(length + 2)
+        return data[:-2]
+    if kind == b"*":
+        length = int(body)
+        if length < 0:
+            return None
+        return [await _read_reply(reader) for _ in range(length)]
+    raise RedisError(f"Unexpected reply type: {line!r}")
+
+
+def create_backend(url: str = SESSION_STORE_URL) -> SessionBackend:
+    """Create the backend for a SESSION_STORE_URL; empty means in-memory."""
+    if not url:
+        return InMemoryBackend()
+    if urlparse(url).scheme in ("redis", "rediss"):
+        return RedisBackend(url)
+    raise ValueError(f"Unsupported SESSION_STORE_URL scheme: {url}")
 
 
 class SessionStore:
@@ -21,69 +274,112 @@ class SessionStore:
     Generic session store with expiration handling.
 
     Stores arbitrary dict data per session. Services handle
-    their own data schema.
+    their own data schema. Every read returns a freshly deserialized
+    copy, so callers must update() to persist changes.
     """
 
-    def __init__(self, timeout: timedelta = SESSION_TIMEOUT):
-        self._sessions: dict[str, dict] = {}
+    def __init__(
+        self,
+        backend: Optional[SessionBackend] = None,
+        timeout: timedelta = SESSION_TIMEOUT,
+    ):
+        self.backend = backend or InMemoryBackend()
+        self.serde = JsonPlusSerializer()
         self._timeout = timeout
+        self._sweeper: Optional[asyncio.Task] = None
+
+    @property
+    def ttl(self) -> float:
+        return self._timeout.total_seconds()
 
-    def create(self, initial_data: Optional[dict] = None) -> str:
+    async def create(self, initial_data: Optional[dict] = None) -> str:
         """Create a new session. Returns session ID."""
         session_id = str(uuid.uuid4())
-        self._sessions[session_id] = {
-            "data": initial_data or {},
-            "last_activity": datetime.now(timezone.utc),
-        }
+        await self._write(session_id, initial_data or {})
         logger.info("Session created", session_id=session_id)
         return session_id
 
-    def get(self, session_id: str, update_activity: bool = True) -> Optional[dict]:
+    async def get(self, session_id: str, update_activity: bool = True) -> Optional[dict]:
         """
         Get session data by ID.
         Returns None if session doesn't exist or has expired.
         """
-        session = self._sessions.get(session_id)
-        if session is None:
-            return None
-
-        current_time = datetime.now(timezone.utc)
-        if current_time - session["last_activity"] > self._timeout:
-            logger.info("Session expired", session_id=session_id)
-            self.delete(session_id)
+        value = await self.backend.get(_data_key(session_id))
+        if value is None:
             return None
 
         if update_activity:
-            session["last_activity"] = current_time
+            await self.backend.set(
+                _activity_key(session_id), str(time.time()).encode(), self.ttl
+            )
+            await self.backend.expire(_data_key(session_id), self.ttl)
 
-        return dict(session["data"])
+        return self.serde.loads_typed(unpack(value))
 
-    def update(self, session_id: str, data: dict) -> bool:
+    async def update(self, session_id: str, data: dict) -> bool:
         """Replace session data entirely. Returns False if session doesn't exist."""
-        if session_id not in self._sessions:
+        if not await self.backend.exists(_data_key(session_id)):
             return False
 
-        self._sessions[session_id]["data"] = data
-        self._sessions[session_id]["last_activity"] = datetime.now(timezone.utc)
+        await self._write(session_id, data)
         return True
 
-    def delete(self, session_id: str) -> bool:
+    async def delete(self, session_id: str) -> bool:
         """Delete a session. Returns True if existed."""
-        if session_id in self._sessions:
-            del self._sessions[session_id]
+        deleted = await self.backend.delete(
+            _data_key(session_id), _activity_key(session_id)
+        )
+        if deleted:
             logger.info("Session deleted", session_id=session_id)
-            return True
-        return False
+        return bool(deleted)
 
-    def exists(self, session_id: str) -> bool:
+    async def exists(self, session_id: str) -> bool:
         """Check if session exists (without updating activity)."""
-        return session_id in self._sessions
+        return await self.backend.exists(_data_key(session_id))
 
-    def get_last_activity(self, session_id: str) -> Optional[datetime]:
+    async def get_last_activity(self, session_id: str) -> Optional[datetime]:
         """Get the last activity timestamp for a session."""
-        session = self._sessions.get(session_id)
-        return session["last_activity"] if session else None
+        value = await self.backend.get(_activity_key(session_id))
+        if value is None:
+            return None
+        return datetime.fromtimestamp(float(value), timezone.utc)
+
+    async def _write(self, session_id: str, data: dict) -> None:
+        await self.backend.set(
+            _data_key(session_id), pack(self.serde.dumps_typed(data)), self.ttl
+        )
+        await self.backend.set(
+            _activity_key(session_id), str(time.time()).encode(), self.ttl
+        )
+
+    def start_sweeper(self, interval: float = SESSION_SWEEP_INTERVAL) -> None:
+        """Periodically remove expired sessions in the background."""
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.create_task(self._sweep_loop(interval))
+
+    async def _sweep_loop(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                removed = await self.backend.sweep()
+                if removed:
+                    logger.info("Expired sessions swept", keys=removed)
+            except Exception as e:
+                logger.warning("Session sweep failed", error=str(e))
+
+    async def close(self) -> None:
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            self._sweeper = None
+        await self.backend.close()
+
+
+def _data_key(session_id: str) -> str:
+    return f"session:{session_id}"
+
 
+def _activity_key(session_id: str) -> str:
+    return f"session:{session_id}:activity"
 
 
 # Singleton instance
@@ -94,5 +390,5 @@ def get_session_store() -> SessionStore:
     """Get the shared session store instance."""
     global _default_store
     if _default_store is None:
-        _default_store = SessionStore()
+        _default_store = SessionStore(create_backend())
     return _default_store
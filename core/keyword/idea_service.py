@@ -12,10 +12,27 @@ from core.keyword.scorer import (
 )
 from services.openai_client import chat_completion
 from models.business_model import BusinessMetadata
-from utils.prompt_loader import load_prompt
+from utils.prompt_registry import get_prompt_registry
 
 logger = get_logger(__name__)
 
+SELECTION_PROMPT = get_prompt_registry().bind(
+    "optimization/keyword_suggestion_prompt.txt",
+    fields=(
+        "brand_name",
+        "business_type",
+        "service_areas",
+        "url",
+        "unique_features",
+        "business_summary",
+        "campaign_name",
+        "ad_group_keywords",
+        "suggestions_count",
+        "suggestions_list",
+        "anchor_summary",
+    ),
+)
+
 
 class KeywordIdeaService:
     def __init__(self):
@@ -162,7 +179,7 @@ class KeywordIdeaService:
             mt = entry.get("match_type", "phrase")
             match_types[mt] = match_types.get(mt, 0) + 1
 
-        return load_prompt("optimization/keyword_suggestion_prompt.txt").format(
+        return SELECTION_PROMPT.render(
             brand_name=brand_info.brand_name,
             business_type=brand_info.business_type,
             service_areas=", ".join(brand_info.service_areas)
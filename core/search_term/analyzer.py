@@ -3,7 +3,7 @@ import asyncio
 from functools import cache
 from structlog import get_logger
 
-from services.openai_client import chat_completion
+from services.openai_client import chat_completion, evict_chat_completion
 from services.json_utils import safe_json_parse
 from utils.prompt_loader import load_prompt
 logger = get_logger(__name__)
@@ -22,13 +22,45 @@ MATCH_LEVEL_TO_STRENGTH = {
 }
 
 
+NO_MATCH_OVERALL = {
+    "overall": {
+        "match": False,
+        "match_level": "No Match",
+        "intent_stage": "Irrelevant",
+        "suggestion_type": "negative",
+        "reason": "No brand, configuration, or location match.",
+    }
+}
+
+COMPETITOR_LOCATION = {
+    "location": {
+        "match": False,
+        "type": "skipped_due_to_competitor",
+        "match_level": "No Match",
+        "reason": "Search term contains a competitor brand.",
+    }
+}
+
+
 @cache
 def _load_prompt(file_name: str) -> str:
     return load_prompt(f"{PROMPT_DIR}/{file_name}")
 
 
+@cache
+def _load_batch_prompt(check_type: str) -> str:
+    prompt_file = (
+        "overall_relevancy_prompt.txt"
+        if check_type == "overall"
+        else f"{check_type}_relevancy_prompt.txt"
+    )
+    instructions = _load_prompt("batch_relevancy_instructions.txt")
+    return _load_prompt(prompt_file) + instructions.format(check_key=check_type)
+
+
 class SearchTermAnalyzer:
     MODEL = "gpt-4o-mini"
+    BATCH_SIZE = 25
 
     async def analyze_term(self, summary: str, search_term: str, metrics: dict) -> dict:
         """Run all relevancy checks for a single search term."""
@@ -40,24 +72,86 @@ class SearchTermAnalyzer:
             self._check_location(summary, search_term, brand_type),
         )
 
-        brand_match = brand_result.get("brand", {}).get("match", False)
-        config_match = config_result.get("configuration", {}).get("match", False)
-
-        if not brand_match and not config_match:
-            overall_result = {
-                "overall": {
-                    "match": False,
-                    "match_level": "No Match",
-                    "intent_stage": "Irrelevant",
-                    "suggestion_type": "negative",
-                    "reason": "No brand, configuration, or location match.",
-                }
-            }
-        else:
+        if _needs_overall_check(brand_result, config_result):
             overall_result = await self._check_overall(
                 summary, search_term, brand_result, config_result, location_result
             )
+        else:
+            overall_result = NO_MATCH_OVERALL
+
+        return self._build_result(
+            search_term,
+            metrics,
+            brand_result,
+            config_result,
+            location_result,
+            overall_result,
+        )
+
+    async def analyze_terms(
+        self, summary: str, terms: list[tuple[str, dict]]
+    ) -> list[dict]:
+        """Run all relevancy checks for many (search_term, metrics) pairs.
+
+        Each check type is sent as one prompt per BATCH_SIZE distinct terms
+        instead of one prompt per term. Terms whose batch item is missing or
+        unparseable fall back to the single-term call for that check.
+        """
+        unique_terms = list(dict.fromkeys(term for term, _ in terms))
+        if not unique_terms:
+            return []
+
+        brand_results = await self._check_relevancy_batch(
+            summary, unique_terms, "brand"
+        )
+        non_competitor = [
+            t
+            for t in unique_terms
+            if brand_results[t].get("brand", {}).get("type") != "competitor"
+        ]
+        config_results, location_results = await asyncio.gather(
+            self._check_relevancy_batch(summary, unique_terms, "configuration"),
+            self._check_relevancy_batch(summary, non_competitor, "location"),
+        )
+        for term in unique_terms:
+            location_results.setdefault(term, COMPETITOR_LOCATION)
+
+        overall_terms = [
+            t
+            for t in unique_terms
+            if _needs_overall_check(brand_results[t], config_results[t])
+        ]
+        overall_results = await self._check_overall_batch(
+            summary, overall_terms, brand_results, config_results, location_results
+        )
+
+        logger.info(
+            "search_term_batch_analyzed",
+            terms=len(terms),
+            unique_terms=len(unique_terms),
+            batch_size=self.BATCH_SIZE,
+        )
+        return [
+            self._build_result(
+                term,
+                metrics,
+                brand_results[term],
+                config_results[term],
+                location_results[term],
+                overall_results.get(term, NO_MATCH_OVERALL),
+            )
+            for term, metrics in terms
+        ]
 
+    def _build_result(
+        self,
+        search_term: str,
+        metrics: dict,
+        brand_result: dict,
+        config_result: dict,
+        location_result: dict,
+        overall_result: dict,
+    ) -> dict:
         overall = overall_result.get("overall", {})
         suggestion_type = str(overall.get("suggestion_type", "negative"))
         match_level = str(overall.get("match_level", "No Match"))
@@ -95,14 +189,7 @@ class SearchTermAnalyzer:
         self, summary: str, search_term: str, brand_type: str
     ) -> dict:
         if brand_type == "competitor":
-            return {
-                "location": {
-                    "match": False,
-                    "type": "skipped_due_to_competitor",
-                    "match_level": "No Match",
-                    "reason": "Search term contains a competitor brand.",
-                }
-            }
+            return COMPETITOR_LOCATION
         return await self._check_relevancy(summary, search_term, "location")
 
     # TODO: Use variable threshold based on product price and margin ratio
@@ -143,22 +230,120 @@ class SearchTermAnalyzer:
         )
         return await self._call_llm(system_msg, user_msg, "overall")
 
+    async def _check_relevancy_batch(
+        self, summary: str, search_terms: list[str], check_type: str
+    ) -> dict[str, dict]:
+        items = [{"search_term": t} for t in search_terms]
+        parsed = await self._run_batches(summary, search_terms, items, check_type)
+
+        missing = [t for t in search_terms if t not in parsed]
+        if missing:
+            logger.warning(
+                "search_term_batch_fallback", label=check_type, count=len(missing)
+            )
+            fallback = await asyncio.gather(
+                *[self._check_relevancy(summary, t, check_type) for t in missing]
+            )
+            parsed.update(zip(missing, fallback))
+        return parsed
+
+    async def _check_overall_batch(
+        self,
+        summary: str,
+        search_terms: list[str],
+        brand_results: dict[str, dict],
+        config_results: dict[str, dict],
+        location_results: dict[str, dict],
+    ) -> dict[str, dict]:
+        items = [
+            {
+                "search_term": t,
+                "brand_result": brand_results[t],
+                "config_result": config_results[t],
+                "location_result": location_results[t],
+            }
+            for t in search_terms
+        ]
+        parsed = await self._run_batches(summary, search_terms, items, "overall")
+
+        missing = [t for t in search_terms if t not in parsed]
+        if missing:
+            logger.warning("search_term_batch_fallback", label="overall", count=len(missing))
+            fallback = await asyncio.gather(
+                *[
+                    self._check_overall(
+                        summary,
+                        t,
+                        brand_results[t],
+                        config_results[t],
+                        location_results[t],
+                    )
+                    for t in missing
+                ]
+            )
+            parsed.update(zip(missing, fallback))
+        return parsed
+
+    async def _run_batches(
+        self,
+        summary: str,
+        search_terms: list[str],
+        items: list[dict],
+        check_type: str,
+    ) -> dict[str, dict]:
+        """Send items in BATCH_SIZE chunks; return parsed results keyed by search term."""
+        system_msg = _load_batch_prompt(check_type)
+        chunks = [
+            range(start, min(start + self.BATCH_SIZE, len(items)))
+            for start in range(0, len(items), self.BATCH_SIZE)
+        ]
+
+        async def run_chunk(indices: range) -> dict[str, dict]:
+            payload = [{"id": i, **items[i]} for i in indices]
+            user_msg = (
+                f"PROJECT SUMMARY:{summary}\n"
+                f"SEARCH TERMS:{json.dumps(payload, ensure_ascii=False)}"
+            )
+            response = await self._call_llm(system_msg, user_msg, f"{check_type}_batch")
+            results: dict[str, dict] = {}
+            entries = response.get("results") if isinstance(response, dict) else None
+            for entry in entries or []:
+                if not isinstance(entry, dict):
+                    continue
+                idx = entry.get("id")
+                check = entry.get(check_type)
+                if isinstance(idx, int) and idx in indices and isinstance(check, dict):
+                    results[search_terms[idx]] = {check_type: check}
+            return results
+
+        merged: dict[str, dict] = {}
+        for chunk_result in await asyncio.gather(*[run_chunk(c) for c in chunks]):
+            merged.update(chunk_result)
+        return merged
+
     async def _call_llm(self, system_msg: str, user_msg: str, label: str) -> dict:
         try:
             messages = [
                 {"role": "system", "content": system_msg},
                 {"role": "user", "content": user_msg},
             ]
-            response = await chat_completion(messages, model=self.MODEL)
+            # The same term is checked for every campaign it appears in.
+            response = await chat_completion(messages, model=self.MODEL, cache=True)
             content = (
                 response.choices[0].message.content.strip() if response.choices else ""
             )
             parsed = safe_json_parse(content)
             if not parsed or "error" in parsed:
                 logger.error("LLM JSON parsing failed", label=label)
+                evict_chat_completion(messages, model=self.MODEL)
                 return {}
             return parsed
         except Exception as e:
             logger.exception("LLM call failed", label=label, error=str(e))
             return {}
 
+
+def _needs_overall_check(brand_result: dict, config_result: dict) -> bool:
+    brand_match = brand_result.get("brand", {}).get("match", False)
+    config_match = config_result.get("configuration", {}).get("match", False)
+    return bool(brand_match or config_match)
@@ -16,11 +16,9 @@ class BusinessContextService:
         """Extract business metadata + features per unique product_id,
         merge into each product_mapping entry, and return enriched mapping.
 
-        Adds brand_info, unique_features to each product entry.
-
-        TODO: Cache extracted contexts in storage per product_id.
-        Fetch from cache instead of re-calling LLM on every optimization run.
-        Only re-extract when a rescrape updates the summary.
+        Adds brand_info, unique_features to each product entry. Extractions
+        are served from the LLM response cache, keyed by the summary, so they
+        are only redone when a rescrape changes it.
         """
         unique_products: dict[str, dict] = {}
         for product_details in product_mapping.values():
@@ -0,0 +1,57 @@
+"""Binary encoding of pgvector `vector` values for asyncpg connections.
+
+pgvector's binary wire format is a big-endian uint16 dimension count, a
+uint16 reserved field, then one big-endian float4 per dimension. Binding
+vectors this way skips formatting and parsing "[x,y,...]" strings.
+Once registered, `vector` parameters accept any sequence of floats
+(lists or numpy arrays), and `vector` columns are returned as lists.
+"""
+
+from typing import List, Sequence
+
+import numpy as np
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from structlog import get_logger  # type: ignore
+
+logger = get_logger(__name__)
+
+_HEADER = np.dtype(">u2")
+_VALUES = np.dtype(">f4")
+
+
+def encode_vector(values: Sequence[float]) -> bytes:
+    data = np.asarray(values, dtype=_VALUES)
+    return np.array([len(data), 0], dtype=_HEADER).tobytes() + data.tobytes()
+
+
+def decode_vector(data: bytes) -> List[float]:
+    dims = int(np.frombuffer(data, dtype=_HEADER, count=1)[0])
+    return np.frombuffer(data, dtype=_VALUES, count=dims, offset=4).tolist()
+
+
+async def _set_codec(connection) -> None:
+    await connection.set_type_codec(
+        "vector",
+        schema="public",
+        encoder=encode_vector,
+        decoder=decode_vector,
+        format="binary",
+    )
+
+
+def _on_connect(dbapi_connection, connection_record) -> None:
+    try:
+        dbapi_connection.run_async(_set_codec)
+    except ValueError as e:
+        # The database has no pgvector extension; nothing to register.
+        logger.warning("pgvector_codec_unavailable", error=str(e))
+
+
+def register_vector_codec(engine: AsyncEngine) -> None:
+    """Register the binary vector codec on every new asyncpg connection of the engine."""
+    sync_engine = engine.sync_engine
+    if sync_engine.dialect.driver != "asyncpg":
+        return
+    if not event.contains(sync_engine, "connect", _on_connect):
+        event.listen(sync_engine, "connect", _on_connect)
@@ -2,6 +2,8 @@ import os
 from typing import Optional
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine
 
+from db.pgvector import register_vector_codec
+
 _engine: Optional[AsyncEngine] = None
 
 
@@ -22,4 +24,5 @@ def get_engine(url: Optional[str] = None) -> AsyncEngine:
             pool_timeout=30,
             pool_recycle=1800,
         )
+        register_vector_codec(_engine)
     return _engine
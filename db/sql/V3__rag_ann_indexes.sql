@@ -0,0 +1,53 @@
+-- Denormalize the collection onto chunks so searches filter on one column
+-- instead of joining rag_documents and rag_collections.
+ALTER TABLE rag_chunks
+    ADD COLUMN IF NOT EXISTS collection_id UUID REFERENCES rag_collections (id) ON DELETE CASCADE;
+
+UPDATE rag_chunks c
+SET collection_id = d.collection_id
+FROM rag_documents d
+WHERE c.document_id = d.id
+  AND c.collection_id IS NULL;
+
+ALTER TABLE rag_chunks
+    ALTER COLUMN collection_id SET NOT NULL;
+
+-- Typed columns for the metadata fields keyword feedback filters on.
+ALTER TABLE rag_chunks
+    ADD COLUMN IF NOT EXISTS client_code   TEXT GENERATED ALWAYS AS (metadata ->> 'client_code') STORED,
+    ADD COLUMN IF NOT EXISTS keyword_type  TEXT GENERATED ALWAYS AS (metadata ->> 'keyword_type') STORED,
+    ADD COLUMN IF NOT EXISTS business_type TEXT GENERATED ALWAYS AS (metadata ->> 'business_type') STORED,
+    ADD COLUMN IF NOT EXISTS is_active     BOOLEAN GENERATED ALWAYS AS ((metadata ->> 'is_active')::boolean) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_chunks_collection_client
+    ON rag_chunks (collection_id, client_code, created_at DESC)
+    WHERE is_active;
+
+-- Any other metadata filter is a containment query (metadata @> '{...}').
+CREATE INDEX IF NOT EXISTS idx_chunks_metadata
+    ON rag_chunks USING GIN (metadata jsonb_path_ops);
+
+-- One HNSW index per collection (partial on collection_id), so a search only
+-- walks its own collection's graph. For new collections the index is built
+-- after their first ingest commits (EmbeddingService.ingest_many, via
+-- rag.repository.ensure_collection_index, CONCURRENTLY); this backfills
+-- existing ones. HNSW needs no training data and no ANALYZE, unlike the
+-- IVFFlat index it replaces.
+DROP INDEX IF EXISTS idx_chunks_embedding_ivfflat;
+
+DO
+$$
+    DECLARE
+        col RECORD;
+    BEGIN
+        FOR col IN SELECT id FROM rag_collections
+            LOOP
+                EXECUTE format(
+                        'CREATE INDEX IF NOT EXISTS %I ON rag_chunks USING hnsw (embedding vector_cosine_ops) WHERE collection_id = %L',
+                        'idx_chunks_hnsw_' || replace(col.id::text, '-', ''),
+                        col.id
+                        );
+            END LOOP;
+    END
+$$;
+
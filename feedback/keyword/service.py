@@ -63,6 +63,7 @@ class KeywordFeedbackService:
             raise ValueError("keyword_type must be either 'brand' or 'generic'")
 
         async with AsyncSession(self.engine) as session:
+            # Typed columns generated from metadata (see V3__rag_ann_indexes.sql).
             query = """
                 SELECT 
                     c.metadata->>'keyword' as keyword,
@@ -70,11 +71,11 @@ class KeywordFeedbackService:
                     c.metadata->>'rejection_category' as rejection_category,
                     c.created_at
                 FROM rag_chunks c
-                JOIN rag_documents d ON c.document_id = d.id
-                JOIN rag_collections col ON d.collection_id = col.id
-                WHERE col.name = :collection_name
-                    AND c.metadata->>'client_code' = :client_code
-                    AND c.metadata->>'is_active' = 'true'
+                WHERE c.collection_id = (
+                        SELECT id FROM rag_collections WHERE name = :collection_name
+                    )
+                    AND c.client_code = :client_code
+                    AND c.is_active
             """
 
             params = {
@@ -83,11 +84,11 @@ class KeywordFeedbackService:
             }
 
             if keyword_type:
-                query += " AND c.metadata->>'keyword_type' = :keyword_type"
+                query += " AND c.keyword_type = :keyword_type"
                 params["keyword_type"] = keyword_type
 
             if business_type:
-                query += " AND c.metadata->>'business_type' = :business_type"
+                query += " AND c.business_type = :business_type"
                 params["business_type"] = business_type
 
             query += " ORDER BY c.created_at DESC"
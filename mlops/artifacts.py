@@ -0,0 +1,176 @@
+"""Local cache for pickled model artifacts served from the file server.
+
+Downloaded artifacts are stored under ARTIFACT_CACHE_DIR, keyed by URL and an
+optional pinned version, next to a small JSON file holding their sha256 and
+ETag.
+
+- With a pinned version, a cached copy is used without any network request.
+- Without one, the cached copy is revalidated with If-None-Match and reused
+  on 304. It is also reused when the file server cannot be reached.
+- When a sha256 is pinned, a download or cached copy that does not match it
+  is rejected.
+
+Unpickling runs in a worker thread so loading never blocks the event loop.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Optional
+
+import httpx
+import structlog
+
+from core.infrastructure.cache import CACHE_DIR
+from core.infrastructure.http_client import get_http_client
+
+logger = structlog.get_logger()
+
+ARTIFACT_CACHE_DIR = os.getenv(
+    "ARTIFACT_CACHE_DIR", os.path.join(CACHE_DIR, "artifacts")
+)
+ARTIFACT_DOWNLOAD_TIMEOUT = float(os.getenv("ARTIFACT_DOWNLOAD_TIMEOUT", "120"))
+
+
+class ArtifactChecksumError(Exception):
+    """An artifact's content does not match its pinned sha256."""
+
+
+def _is_url(path: str) -> bool:
+    return path.startswith("http://") or path.startswith("https://")
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class ArtifactCache:
+    def __init__(self, directory: str = ARTIFACT_CACHE_DIR):
+        self.directory = Path(directory)
+
+    async def load(
+        self,
+        path: str,
+        description: str,
+        sha256: Optional[str] = None,
+        version: Optional[str] = None,
+    ) -> Any:
+        """Return the unpickled artifact at a local path or URL."""
+        data = await self.fetch(path, description, sha256, version)
+        return await asyncio.to_thread(pickle.loads, data)
+
+    async def fetch(
+        self,
+        path: str,
+        description: str,
+        sha256: Optional[str] = None,
+        version: Optional[str] = None,
+    ) -> bytes:
+        """Return the artifact's bytes, from the local cache when possible."""
+        if not _is_url(path):
+            data = await asyncio.to_thread(Path(path).read_bytes)
+            self._verify(data, sha256, description)
+            return data
+
+        key = _sha256(f"{path}#{version or ''}".encode())[:24]
+        blob_path = self.directory / f"{key}.bin"
+        meta_path = self.directory / f"{key}.json"
+        cached, meta = await asyncio.to_thread(self._read_cached, blob_path, meta_path)
+        if cached is not None and sha256 and meta.get("sha256") != sha256.lower():
+            cached, meta = None, {}
+
+        if cached is not None and version:
+            logger.info("artifact_cache_hit", description=description, version=version)
+            return cached
+
+        headers = (
+            {"If-None-Match": meta["etag"]}
+            if cached is not None and meta.get("etag")
+            else {}
+        )
+        logger.info("artifact_downloading", description=description, url=path)
+        try:
+            response = await _download(path, headers)
+            if response.status_code == 304 and cached is not None:
+                logger.info("artifact_cache_revalidated", description=description)
+                return cached
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            if cached is None:
+                raise
+            logger.warning(
+                "artifact_download_failed_using_cache",
+                description=description,
+                error=str(e),
+            )
+            return cached
+
+        data = response.content
+        self._verify(data, sha256, description)
+        meta = {
+            "url": path,
+            "version": version,
+            "sha256": _sha256(data),
+            "etag": response.headers.get("etag"),
+        }
+        await asyncio.to_thread(self._write_cached, blob_path, meta_path, data, meta)
+        return data
+
+    def _verify(self, data: bytes, sha256: Optional[str], description: str) -> None:
+        if sha256 and _sha256(data) != sha256.lower():
+            raise ArtifactChecksumError(
+                f"{description} checksum mismatch: expected {sha256}, got {_sha256(data)}"
+            )
+
+    def _read_cached(
+        self, blob_path: Path, meta_path: Path
+    ) -> tuple[Optional[bytes], dict]:
+        try:
+            meta = json.loads(meta_path.read_text())
+            data = blob_path.read_bytes()
+        except (OSError, ValueError):
+            return None, {}
+        # A torn or tampered file is treated as missing.
+        if _sha256(data) != meta.get("sha256"):
+            return None, {}
+        return data, meta
+
+    def _write_cached(
+        self, blob_path: Path, meta_path: Path, data: bytes, meta: dict
+    ) -> None:
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path = blob_path.with_suffix(f".tmp{os.getpid()}")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, blob_path)
+            meta_path.write_text(json.dumps(meta))
+        except OSError as e:
+            logger.warning(
+                "artifact_cache_write_failed", path=str(blob_path), error=str(e)
+            )
+
+
+async def _download(url: str, headers: dict) -> httpx.Response:
+    try:
+        client = get_http_client()
+    except RuntimeError:
+        # Loaded outside the app (scripts, notebooks): no shared client.
+        async with httpx.AsyncClient() as client:
+            return await client.get(
+                url, headers=headers, timeout=ARTIFACT_DOWNLOAD_TIMEOUT
+            )
+    return await client.get(url, headers=headers, timeout=ARTIFACT_DOWNLOAD_TIMEOUT)
+
+
+_default_cache: Optional[ArtifactCache] = None
+
+
+def get_artifact_cache() -> ArtifactCache:
+    """Get the shared artifact cache instance."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ArtifactCache()
+    return _default_cache
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import structlog
 from fastapi import APIRouter, FastAPI
@@ -5,6 +6,8 @@ from contextlib import asynccontextmanager
 from mlops.google_search.budget_prediction.schemas import (
     BudgetPredictionReq,
     BudgetAPIResponse,
+    BudgetCurveReq,
+    BudgetCurveAPIResponse,
 )
 from mlops.google_search.budget_prediction.predictor import BudgetPredictor
 from oserver.utils import helpers
@@ -15,6 +18,8 @@ logger = structlog.get_logger()
 
 # Global predictor instance
 predictor: BudgetPredictor | None = None
+# Background model load started at startup
+warmup_task: asyncio.Task | None = None
 
 
 def get_initialized_predictor() -> BudgetPredictor:
@@ -31,26 +36,37 @@ def get_initialized_predictor() -> BudgetPredictor:
 
         model_path = join_url(base_url, model_path)
 
-        predictor = BudgetPredictor(model_path=model_path)
+        predictor = BudgetPredictor(
+            model_path=model_path,
+            sha256=os.getenv("BUDGET_PREDICTOR_MODEL_SHA256"),
+            version=os.getenv("BUDGET_PREDICTOR_MODEL_VERSION"),
+        )
     return predictor
 
 
+async def _warm_up(current_predictor: BudgetPredictor) -> None:
+    try:
+        await current_predictor.load_model()
+        logger.info("budget_model_loaded_successfully")
+    except FileNotFoundError as e:
+        logger.error("budget_model_not_found", error=str(e))
+    except Exception as e:
+        logger.error("budget_model_load_failed", error=str(e))
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Initialize and load model
+    # Load the model in the background; requests see not_ready until it is in.
+    global warmup_task
     current_predictor = get_initialized_predictor()
     if current_predictor.model_path:
-        try:
-            await current_predictor.load_model()
-            logger.info("budget_model_loaded_successfully")
-        except FileNotFoundError as e:
-            logger.error("budget_model_not_found", error=str(e))
-        except Exception as e:
-            logger.error("budget_model_load_failed", error=str(e))
+        warmup_task = asyncio.create_task(_warm_up(current_predictor))
     else:
         logger.warning("budget_model_path_missing_skipping_load")
 
     yield
+    if warmup_task is not None:
+        warmup_task.cancel()
     logger.info("budget_prediction_service_shutdown")
 
 
@@ -82,10 +98,37 @@ async def recommend_budget(request: BudgetPredictionReq) -> BudgetAPIResponse:
     )
 
 
+@router.post("/curve", response_model=BudgetCurveAPIResponse)
+async def budget_curve(request: BudgetCurveReq) -> BudgetCurveAPIResponse:
+    """
+    Predict budgets for every combination of conversions, durations and conversion rates.
+    """
+    current_predictor = get_initialized_predictor()
+    if not current_predictor.is_ready():
+        raise ModelNotLoadedException("Budget prediction model not loaded.")
+
+    result = current_predictor.predict_curve(
+        conversions=request.conversions,
+        durations=request.duration_days,
+        conversion_rates=request.expected_conversion_rates,
+        buffer_percent=request.buffer_percent,
+    )
+    return BudgetCurveAPIResponse(
+        success=True,
+        data=result,
+    )
+
+
 @router.get("/health")
 async def health_check():
     current_predictor = get_initialized_predictor()
+    if current_predictor.is_ready():
+        status = "healthy"
+    elif warmup_task is not None and not warmup_task.done():
+        status = "loading"
+    else:
+        status = "not_ready"
     return {
-        "status": "healthy" if current_predictor.is_ready() else "not_ready",
+        "status": status,
         "model_loaded": current_predictor.is_ready(),
     }
@@ -1,4 +1,3 @@
-import io
 import math
 import pickle
 
@@ -6,20 +5,35 @@ import httpx
 import numpy as np
 import pandas as pd  # type: ignore
 import structlog
-from typing import Any
+from typing import Any, Optional, Sequence
 
 from exceptions.custom_exceptions import ModelNotLoadedException, PredictionException
-from mlops.google_search.budget_prediction.schemas import BudgetPredictionData
+from mlops.artifacts import ArtifactChecksumError, get_artifact_cache
+from mlops.google_search.budget_prediction.schemas import (
+    BudgetCurveData,
+    BudgetCurvePoint,
+    BudgetPredictionData,
+)
 
 
 logger = structlog.get_logger()
 
+FEATURE_COLUMNS = ["TotalClicks", "TotalConversions", "CampaignDuration"]
+MAX_CURVE_POINTS = 5000
+
 
 class BudgetPredictor:
     """Service for predicting budget using a linear regression model."""
 
-    def __init__(self, model_path: str):
+    def __init__(
+        self,
+        model_path: str,
+        sha256: Optional[str] = None,
+        version: Optional[str] = None,
+    ):
         self.model_path = model_path
+        self.sha256 = sha256
+        self.version = version
         self.model: Any = None
         self._is_loaded = False
 
@@ -80,31 +94,102 @@ class BudgetPredictor:
                 message="Budget prediction failed", details={"error": str(e)}
             )
 
+    def predict_curve(
+        self,
+        conversions: Sequence[int],
+        durations: Sequence[int],
+        conversion_rates: Sequence[float] = (12.0,),
+        buffer_percent: float = 0.20,
+    ) -> BudgetCurveData:
+        """
+        Predicts cost for every (conversions, duration, conversion rate) combination.
+
+        The whole grid is evaluated in one vectorized call; each point matches
+        what predict() returns for the same inputs.
+        """
+        if not self._is_loaded:
+            raise ModelNotLoadedException(
+                "Budget prediction model not loaded. Call load_model() first."
+            )
+
+        rates = np.asarray(conversion_rates, dtype=np.float64)
+        if np.any(rates <= 0):
+            raise PredictionException(
+                "Expected conversion rate must be greater than zero."
+            )
+        points = len(conversions) * len(durations) * len(rates)
+        if points > MAX_CURVE_POINTS:
+            raise PredictionException(
+                message="Budget curve grid is too large",
+                details={"points": points, "max_points": MAX_CURVE_POINTS},
+            )
+
+        conv, days, rate = (
+            axis.ravel()
+            for axis in np.meshgrid(
+                np.asarray(conversions, dtype=np.float64),
+                np.asarray(durations, dtype=np.float64),
+                rates,
+                indexing="ij",
+            )
+        )
+        clicks = np.ceil(conv / (rate / 100.0))
+        features = np.log1p(np.column_stack([clicks, conv, days]))
+
+        try:
+            cost_lin = np.expm1(self._predict_log_cost(features))
+        except Exception as e:
+            raise PredictionException(
+                message="Budget curve prediction failed", details={"error": str(e)}
+            )
+        suggested = np.ceil(cost_lin * (1.0 + buffer_percent)).astype(np.int64)
+        base = np.ceil(cost_lin).astype(np.int64)
+
+        return BudgetCurveData(
+            points=[
+                BudgetCurvePoint(
+                    conversions=c,
+                    duration_days=d,
+                    expected_conversion_rate=r,
+                    suggested_budget=s,
+                    base_cost_prediction=b,
+                )
+                for c, d, r, s, b in zip(
+                    conv.astype(np.int64).tolist(),
+                    days.astype(np.int64).tolist(),
+                    rate.tolist(),
+                    suggested.tolist(),
+                    base.tolist(),
+                )
+            ]
+        )
+
+    def _predict_log_cost(self, features: np.ndarray) -> np.ndarray:
+        # A fitted linear model is a single dot product; anything else (e.g. a
+        # pipeline) gets one frame for the whole grid.
+        coef = getattr(self.model, "coef_", None)
+        if coef is not None and hasattr(self.model, "intercept_"):
+            intercept = np.ravel(self.model.intercept_)
+            return features @ np.ravel(coef) + (intercept[0] if intercept.size else 0.0)
+        return np.asarray(
+            self.model.predict(pd.DataFrame(features, columns=FEATURE_COLUMNS))
+        ).ravel()
+
     def is_ready(self) -> bool:
         return self._is_loaded
 
     async def _load_artifact(self, path: str, description: str) -> Any:
         try:
-            if path.startswith("http://") or path.startswith("https://"):
-                logger.info(
-                    "budget_model_downloading_artifact",
-                    description=description,
-                    url=path,
-                    model="budget_prediction",
-                )
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(path, timeout=30)
-                    response.raise_for_status()
-                    return pickle.load(io.BytesIO(response.content))
-            else:
-                with open(path, "rb") as f:
-                    return pickle.load(f)
+            return await get_artifact_cache().load(
+                path, description, sha256=self.sha256, version=self.version
+            )
         except (
             FileNotFoundError,
             httpx.HTTPStatusError,
             httpx.RequestError,
             pickle.UnpicklingError,
             OSError,
+            ArtifactChecksumError,
         ) as e:
             logger.error(
                 "artifact_load_failed",
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, Field
 
 
@@ -59,3 +59,56 @@ class BudgetAPIResponse(BaseModel):
             }
         }
     }
+
+
+class BudgetCurveReq(BaseModel):
+    conversions: List[int] = Field(
+        ..., min_length=1, description="Conversion targets to evaluate"
+    )
+    duration_days: List[int] = Field(
+        ..., min_length=1, description="Campaign durations in days to evaluate"
+    )
+    expected_conversion_rates: List[float] = Field(
+        default_factory=lambda: [12.0],
+        min_length=1,
+        description="Expected conversion rates in percentage (default [12%])",
+    )
+    buffer_percent: float = Field(
+        0.20, description="Buffer percentage to add to prediction (default 20%)"
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "conversions": [10, 20, 50],
+                "duration_days": [15, 30],
+                "expected_conversion_rates": [8.0, 12.0],
+                "buffer_percent": 0.20,
+            }
+        }
+    }
+
+
+class BudgetCurvePoint(BaseModel):
+    conversions: int
+    duration_days: int
+    expected_conversion_rate: float
+    suggested_budget: int = Field(
+        ..., description="Recommended budget including buffer"
+    )
+    base_cost_prediction: int = Field(
+        ..., description="Raw cost prediction before buffer"
+    )
+
+
+class BudgetCurveData(BaseModel):
+    points: List[BudgetCurvePoint] = Field(
+        ...,
+        description="One point per grid combination, ordered by conversions, "
+        "then duration, then conversion rate",
+    )
+
+
+class BudgetCurveAPIResponse(BaseModel):
+    success: bool = Field(True, description="Response status indicator")
+    data: Optional[BudgetCurveData] = Field(None, description="Budget curve if success")
@@ -1,23 +1,109 @@
-import io
+import asyncio
 import math
 import os
-import pickle
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-import httpx
 import numpy as np
 import pandas as pd
 import structlog
 from sentence_transformers import SentenceTransformer
 
 from exceptions.custom_exceptions import ModelNotLoadedException, PredictionException
+from mlops.artifacts import get_artifact_cache
+from mlops.google_search.performance.keyword_embeddings import KeywordEmbeddingCache
 from mlops.google_search.performance.prediction_schemas import (
     PerformancePredictionData,
 )
 
 logger = structlog.get_logger()
 
+SENTENCE_MODEL_NAME = "all-MiniLM-L6-v2"
+# "onnx" runs a quantized ONNX export of the encoder on ONNX Runtime
+# (needs optimum[onnxruntime]); falls back to torch when unavailable.
+ENCODER_BACKEND = os.getenv("AD_PREDICTOR_ENCODER_BACKEND", "torch")
+ONNX_MODEL_FILE = os.getenv("AD_PREDICTOR_ONNX_FILE", "onnx/model_quint8_avx2.onnx")
+PERIOD_COLUMNS = {"Monthly": "monthly_columns", "Weekly": "weekly_columns"}
+
+
+@dataclass
+class PerformanceRequest:
+    """Inputs of one performance prediction."""
+
+    keyword_data: List[Dict[str, str]]
+    total_budget: float
+    bid_strategy: str
+    period: str = "Monthly"
+
+
+class FeatureLayout:
+    """Column positions of one model's feature matrix, resolved once at load time."""
+
+    def __init__(self, columns: List[str]):
+        self.columns = list(columns)
+        self.index = {name: i for i, name in enumerate(self.columns)}
+        self.time_columns = [
+            self.index.get(name) for name in ("Year", "Month", "Week_of_Year")
+        ]
+        self.cost_column = self.index.get("Cost")
+
+        embedding_pairs = [
+            (int(name[len("Keyword_Embedding_") :]), i)
+            for name, i in self.index.items()
+            if name.startswith("Keyword_Embedding_")
+        ]
+        self.embedding_dims = np.array([d for d, _ in embedding_pairs], dtype=np.intp)
+        self.embedding_columns = np.array(
+            [i for _, i in embedding_pairs], dtype=np.intp
+        )
+
+    def build(
+        self,
+        requests: List[PerformanceRequest],
+        embeddings: np.ndarray,
+        now: datetime,
+    ) -> pd.DataFrame:
+        """Assemble the requests' feature rows, in order, straight into model column order."""
+        n_rows = len(embeddings)
+        X = np.zeros((n_rows, len(self.columns)), dtype=np.float64)
+
+        time_values = (now.year, now.month, now.isocalendar()[1])
+        for column, value in zip(self.time_columns, time_values):
+            if column is not None:
+                X[:, column] = value
+
+        valid = self.embedding_dims < embeddings.shape[1]
+        X[:, self.embedding_columns[valid]] = embeddings[:, self.embedding_dims[valid]]
+
+        start = 0
+        for request in requests:
+            end = start + len(request.keyword_data)
+            if self.cost_column is not None:
+                X[start:end, self.cost_column] = request.total_budget / len(
+                    request.keyword_data
+                )
+            strategy_column = self.index.get(
+                f"Ad_Group_Bid_Strategy_Type_{request.bid_strategy}"
+            )
+            if strategy_column is not None:
+                X[start:end, strategy_column] = 1
+            match_rows: Dict[int, List[int]] = {}
+            for row, item in enumerate(request.keyword_data, start):
+                column = self.index.get(f"Search_Terms_Match_Type_{item['match_type']}")
+                if column is not None:
+                    match_rows.setdefault(column, []).append(row)
+            for column, rows in match_rows.items():
+                # As with the previous DataFrame construction, a match-type
+                # column used by any keyword of the request is NaN (missing to
+                # LightGBM), not 0, for the request's other keywords.
+                X[start:end, column] = np.nan
+                X[rows, column] = 1
+            start = end
+
+        # Wrapping keeps feature names for the models without copying the array.
+        return pd.DataFrame(X, columns=self.columns, copy=False)
+
 
 class AdPerformancePredictor:
     """Service for predicting ad performance using trained LightGBM models."""
@@ -27,36 +113,61 @@ class AdPerformancePredictor:
         lgbm_model_path: str,
         sigmas_path: str,
         columns_path: str,
+        checksums: Optional[Dict[str, Optional[str]]] = None,
+        version: Optional[str] = None,
     ):
         self.lgbm_model_path = lgbm_model_path
         self.sigmas_path = sigmas_path
         self.columns_path = columns_path
+        # Pinned sha256 per artifact path, and a version that keys the local cache
+        self.checksums = checksums or {}
+        self.version = version
 
         self.models: Optional[Dict[str, Any]] = None
         self.uncertainty_sigmas: Optional[Dict[str, float]] = None
         self.reference_columns: Optional[Dict[str, List[str]]] = None
         self.sentence_model: Optional[SentenceTransformer] = None
+        self.encoder_id = SENTENCE_MODEL_NAME
+        self.embedding_cache: Optional[KeywordEmbeddingCache] = None
+        self.feature_layouts: Dict[str, FeatureLayout] = {}
         self._is_loaded = False
 
     async def load_models(self) -> None:
         """
         Load models and artifacts from pickle files or URLs.
         Raises exception if loading fails.
+
+        Artifacts load concurrently and all blocking work (unpickling, encoder
+        construction) runs in worker threads, so this can run as a background
+        task without stalling requests.
         """
         if self._is_loaded:
             return
 
-        self.models = await self._load_artifact(self.lgbm_model_path, "LightGBM models")
-        self.uncertainty_sigmas = await self._load_artifact(
-            self.sigmas_path, "Uncertainty sigmas"
-        )
-        self.reference_columns = await self._load_artifact(
-            self.columns_path, "Reference columns"
+        (
+            self.models,
+            self.uncertainty_sigmas,
+            self.reference_columns,
+            _,
+        ) = await asyncio.gather(
+            self._load_artifact(self.lgbm_model_path, "LightGBM models"),
+            self._load_artifact(self.sigmas_path, "Uncertainty sigmas"),
+            self._load_artifact(self.columns_path, "Reference columns"),
+            asyncio.to_thread(self._load_sentence_transformer),
         )
 
-        self._load_sentence_transformer()
+        await asyncio.to_thread(self.prepare_inference)
         self._is_loaded = True
 
+    def prepare_inference(self) -> None:
+        """Precompute column layouts and the embedding cache from loaded artifacts."""
+        self.feature_layouts = {
+            period: FeatureLayout(self.reference_columns[key])
+            for period, key in PERIOD_COLUMNS.items()
+        }
+        dims = len(self.sentence_model.encode(["dimension probe"])[0])
+        self.embedding_cache = KeywordEmbeddingCache(self.encoder_id, dims)
+
     def predict(
         self,
         keyword_data: List[Dict[str, str]],
@@ -69,104 +180,85 @@ class AdPerformancePredictor:
 
         Dict containing predicted ranges for impressions, clicks, conversions.
         """
+        request = PerformanceRequest(keyword_data, total_budget, bid_strategy, period)
+        self.validate_request(request)
+        return self.predict_batch([request])[0]
+
+    def validate_request(self, request: PerformanceRequest) -> None:
+        """Raise if the predictor cannot serve this request."""
         if not self._is_loaded:
             raise ModelNotLoadedException(
                 "Models not loaded. Call load_models() first."
             )
 
-        if not keyword_data:
+        if not request.keyword_data:
             raise ValueError("keyword_data cannot be empty")
 
-        if period not in ["Weekly", "Monthly"]:
+        if request.period not in ["Weekly", "Monthly"]:
             raise ValueError("period must be 'Weekly' or 'Monthly'")
 
-        # Prepare batch inputs
-        keywords = [item["keyword"] for item in keyword_data]
-        match_types = [item["match_type"] for item in keyword_data]
-        budget_per_kw = total_budget / len(keyword_data)
-
-        # Batch encode embeddings
-        embeddings = self.sentence_model.encode(keywords)
+    def predict_batch(
+        self, requests: List[PerformanceRequest]
+    ) -> List[PerformancePredictionData]:
+        """
+        Predict several validated requests together.
 
-        # Vectorized feature engineering
+        Keywords not already in the embedding cache are encoded in one call.
+        Feature rows are written into one preallocated matrix per period, and
+        each model runs once over it. Per-keyword predictions are then summed
+        back per request.
+        """
+        keywords = [item["keyword"] for r in requests for item in r.keyword_data]
+        embeddings = self.embedding_cache.get_many(keywords, self.sentence_model.encode)
+        offsets = np.cumsum([0] + [len(r.keyword_data) for r in requests])
         now = datetime.now()
-        base_features = {
-            "Year": now.year,
-            "Month": now.month,
-            "Week_of_Year": now.isocalendar()[1],
-            "Cost": budget_per_kw,
-        }
 
-        # Create DataFrame from base features for all keywords
-        X_batch = pd.DataFrame([base_features] * len(keyword_data))
-
-        # Add embeddings (vectorized)
-        emb_cols = [f"Keyword_Embedding_{i}" for i in range(embeddings.shape[1])]
-        emb_df = pd.DataFrame(embeddings, columns=emb_cols)
-        X_batch = pd.concat([X_batch, emb_df], axis=1)
-
-        # Add one-hot encoded strategy and match types (vectorized)
-        X_batch[f"Ad_Group_Bid_Strategy_Type_{bid_strategy}"] = 1
-        for m_type in set(match_types):
-            X_batch.loc[
-                [i for i, mt in enumerate(match_types) if mt == m_type],
-                f"Search_Terms_Match_Type_{m_type}",
-            ] = 1
-
-        # Align with model columns once for the whole batch
-        ref_columns = (
-            self.reference_columns["monthly_columns"]
-            if period == "Monthly"
-            else self.reference_columns["weekly_columns"]
-        )
-        X_batch = X_batch.reindex(columns=ref_columns, fill_value=0)
+        aggregated = [
+            {"Impressions": 0.0, "Clicks": 0.0, "Conversions": 0.0} for _ in requests
+        ]
+        for period in {r.period for r in requests}:
+            members = [i for i, r in enumerate(requests) if r.period == period]
+            X_batch = self.feature_layouts[period].build(
+                [requests[i] for i in members],
+                np.concatenate(
+                    [embeddings[offsets[i] : offsets[i + 1]] for i in members]
+                ),
+                now,
+            )
+            bounds = np.cumsum([0] + [len(requests[i].keyword_data) for i in members])
 
-        # Batch Predictions and Aggregation
-        aggregated_metrics = {
-            "Impressions": 0.0,
-            "Clicks": 0.0,
-            "Conversions": 0.0,
-        }
+            for target in ["Impressions", "Clicks", "Conversions"]:
+                model_key = f"{period}_{target}_Model"
+                if model_key in self.models:
+                    preds_log = self.models[model_key].predict(X_batch)
+                    sigma = self.uncertainty_sigmas[model_key]
 
-        for target in ["Impressions", "Clicks", "Conversions"]:
-            model_key = f"{period}_{target}_Model"
-            if model_key in self.models:
-                preds_log = self.models[model_key].predict(X_batch)
-                sigma = self.uncertainty_sigmas[model_key]
+                    lows = np.expm1(preds_log - sigma)
+                    highs = np.expm1(preds_log + sigma)
+                    mid_estimates = (lows + highs) / 2
 
-                lows = np.expm1(preds_log - sigma)
-                highs = np.expm1(preds_log + sigma)
-                mid_estimates = (lows + highs) / 2
+                    sums = np.add.reduceat(mid_estimates, bounds[:-1])
+                    for i, total in zip(members, sums):
+                        aggregated[i][target] = float(total)
 
-                aggregated_metrics[target] = float(np.sum(mid_estimates))
-
-        return self._format_prediction_response(
-            aggregated_metrics, total_budget, period
-        )
+        return [
+            self._format_prediction_response(metrics, r.total_budget, r.period)
+            for metrics, r in zip(aggregated, requests)
+        ]
 
     def is_ready(self) -> bool:
         """Check if predictor is loaded."""
         return self._is_loaded
 
     async def _load_artifact(self, path: str, description: str) -> Any:
-        """Load a pickled artifact from a file path or URL."""
+        """Load a pickled artifact from a file path or URL via the artifact cache."""
         try:
-            if path.startswith("http://") or path.startswith("https://"):
-                logger.info(
-                    "performance_model_downloading_artifact",
-                    description=description,
-                    url=path,
-                    model="performance_prediction",
-                )
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(path, timeout=30)
-                    response.raise_for_status()
-                    return pickle.load(io.BytesIO(response.content))
-            else:
-                if not os.path.exists(path):
-                    raise FileNotFoundError(f"{description} not found: {path}")
-                with open(path, "rb") as f:
-                    return pickle.load(f)
+            return await get_artifact_cache().load(
+                path,
+                description,
+                sha256=self.checksums.get(path),
+                version=self.version,
+            )
         except Exception as e:
             raise PredictionException(
                 message=f"Failed to load {description}",
@@ -174,9 +266,31 @@ class AdPerformancePredictor:
             )
 
     def _load_sentence_transformer(self) -> None:
-        """Load SentenceTransformer model."""
+        """Load the SentenceTransformer encoder, on ONNX Runtime when configured."""
+        if ENCODER_BACKEND == "onnx":
+            try:
+                self.sentence_model = SentenceTransformer(
+                    SENTENCE_MODEL_NAME,
+                    backend="onnx",
+                    model_kwargs={"file_name": ONNX_MODEL_FILE},
+                )
+                self.encoder_id = (
+                    f"{SENTENCE_MODEL_NAME}-onnx-{os.path.basename(ONNX_MODEL_FILE)}"
+                )
+                logger.info(
+                    "performance_encoder_loaded", backend="onnx", file=ONNX_MODEL_FILE
+                )
+                return
+            except Exception as e:
+                logger.warning(
+                    "performance_onnx_encoder_unavailable",
+                    error=str(e),
+                    message="Falling back to the torch encoder",
+                )
+
         try:
-            self.sentence_model = SentenceTransformer("all-MiniLM-L6-v2")
+            self.sentence_model = SentenceTransformer(SENTENCE_MODEL_NAME)
+            self.encoder_id = SENTENCE_MODEL_NAME
         except Exception as e:
             raise PredictionException(
                 message="Failed to load SentenceTransformer model",
@@ -0,0 +1,215 @@
+"""Micro-batching executor for AdPerformancePredictor.
+
+Requests are queued and coalesced into one batch per time window
+(AD_PREDICTOR_BATCH_WINDOW_MS). Each batch runs predict_batch in a worker
+thread so sentence encoding and LightGBM inference never block the event
+loop. Requests that arrive while every worker is busy wait in the queue and
+join the next batch, so batches grow with load.
+
+Batch sizes and queue latency are recorded as histograms (see stats()).
+"""
+
+import asyncio
+import bisect
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+import structlog
+
+from mlops.google_search.performance.ad_performance_predictor import (
+    AdPerformancePredictor,
+    PerformanceRequest,
+)
+from mlops.google_search.performance.prediction_schemas import (
+    PerformancePredictionData,
+)
+
+logger = structlog.get_logger()
+
+BATCH_WINDOW_MS = float(os.getenv("AD_PREDICTOR_BATCH_WINDOW_MS", "10"))
+MAX_BATCH_KEYWORDS = int(os.getenv("AD_PREDICTOR_MAX_BATCH_KEYWORDS", "1024"))
+INFERENCE_WORKERS = int(os.getenv("AD_PREDICTOR_WORKERS", "1"))
+
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64)
+QUEUE_LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+
+class Histogram:
+    """Per-bucket (non-cumulative) counts; the last bucket is +Inf."""
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def snapshot(self) -> dict:
+        labels = [f"<={b:g}" for b in self.bounds] + ["+Inf"]
+        return {
+            "buckets": dict(zip(labels, self.counts)),
+            "count": self.count,
+            "mean": round(self.total / self.count, 3) if self.count else 0.0,
+        }
+
+
+@dataclass
+class _Queued:
+    request: PerformanceRequest
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class InferenceExecutor:
+    def __init__(
+        self,
+        predictor: AdPerformancePredictor,
+        window_ms: float = BATCH_WINDOW_MS,
+        max_batch_keywords: int = MAX_BATCH_KEYWORDS,
+        workers: int = INFERENCE_WORKERS,
+    ):
+        self.predictor = predictor
+        self.window = window_ms / 1000
+        self.max_batch_keywords = max_batch_keywords
+        self.workers = workers
+        self._pool = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="ad-predictor"
+        )
+        self._queue: Optional[asyncio.Queue] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._carry: Optional[_Queued] = None
+        self.batch_sizes = Histogram(BATCH_SIZE_BUCKETS)
+        self.queue_latency_ms = Histogram(QUEUE_LATENCY_BUCKETS_MS)
+
+    async def predict(
+        self,
+        keyword_data: List[Dict[str, str]],
+        total_budget: float,
+        bid_strategy: str,
+        period: str = "Monthly",
+    ) -> PerformancePredictionData:
+        """Queue one prediction and wait for the batch that serves it."""
+        request = PerformanceRequest(keyword_data, total_budget, bid_strategy, period)
+        # Invalid requests fail on their own instead of failing a whole batch.
+        self.predictor.validate_request(request)
+
+        if self._dispatcher is None or self._dispatcher.done():
+            self._queue = asyncio.Queue()
+            self._dispatcher = asyncio.create_task(self._dispatch())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(_Queued(request, future))
+        return await future
+
+    async def close(self) -> None:
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            try:
+                await self._dispatcher
+            except asyncio.CancelledError:
+                pass
+            self._dispatcher = None
+        waiting = [self._carry] if self._carry else []
+        while self._queue is not None and not self._queue.empty():
+            waiting.append(self._queue.get_nowait())
+        _cancel(waiting)
+        self._carry = None
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "window_ms": self.window * 1000,
+            "queued": self._queue.qsize() if self._queue else 0,
+            "batch_size": self.batch_sizes.snapshot(),
+            "queue_latency_ms": self.queue_latency_ms.snapshot(),
+        }
+
+    async def _dispatch(self) -> None:
+        slots = asyncio.Semaphore(self.workers)
+        running: set = set()
+        try:
+            while True:
+                await slots.acquire()
+                batch = await self._collect()
+                task = asyncio.create_task(self._run(batch))
+                running.add(task)
+                task.add_done_callback(running.discard)
+                task.add_done_callback(lambda _: slots.release())
+        finally:
+            for task in running:
+                task.cancel()
+
+    async def _collect(self) -> List[_Queued]:
+        """Wait for a first request, then gather more until the window or size limit."""
+        first = self._carry or await self._queue.get()
+        self._carry = None
+        batch = [first]
+        keywords = len(first.request.keyword_data)
+        deadline = time.monotonic() + self.window
+
+        while keywords < self.max_batch_keywords:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 and self._queue.empty():
+                break
+            try:
+                item = (
+                    self._queue.get_nowait()
+                    if remaining <= 0
+                    else await asyncio.wait_for(self._queue.get(), remaining)
+                )
+            except asyncio.TimeoutError:
+                break
+            if keywords + len(item.request.keyword_data) > self.max_batch_keywords:
+                self._carry = item
+                break
+            batch.append(item)
+            keywords += len(item.request.keyword_data)
+        return batch
+
+    async def _run(self, batch: List[_Queued]) -> None:
+        started = time.monotonic()
+        for item in batch:
+            self.queue_latency_ms.observe((started - item.enqueued_at) * 1000)
+        self.batch_sizes.observe(len(batch))
+
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(
+                self._pool,
+                self.predictor.predict_batch,
+                [item.request for item in batch],
+            )
+        except asyncio.CancelledError:
+            _cancel(batch)
+            raise
+        except Exception as e:
+            logger.error(
+                "performance_batch_failed", batch_size=len(batch), error=str(e)
+            )
+            for item in batch:
+                if not item.future.done():
+                    item.future.set_exception(e)
+            return
+
+        for item, result in zip(batch, results):
+            if not item.future.done():
+                item.future.set_result(result)
+        logger.debug(
+            "performance_batch_served",
+            batch_size=len(batch),
+            inference_ms=round((time.monotonic() - started) * 1000, 1),
+        )
+
+
+def _cancel(items: List[_Queued]) -> None:
+    for item in items:
+        if not item.future.done():
+            item.future.cancel()
@@ -0,0 +1,192 @@
+"""Keyword → embedding memo for the performance predictor's sentence encoder.
+
+Embeddings are kept in an in-process LRU keyed by the exact keyword text, so
+repeated keywords skip the encoder. When AD_PREDICTOR_EMBEDDING_DIR is set,
+they are also appended to a memory-mapped float32 matrix on disk; keywords
+are listed one per line in a sidecar file whose line number is the matrix
+row. Both files are named after the encoder and dimension, so a different
+model never reads another model's vectors. Once the matrix is full, new
+keywords are only kept in memory.
+
+The directory may be shared by several processes or replicas. Appends take
+an exclusive flock on a sidecar lock file and first index any rows other
+processes appended, so each row is written by exactly one process and the
+index never maps a keyword to another keyword's row. Rows added elsewhere
+become visible to this process at its next append.
+"""
+
+import fcntl
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import structlog
+
+from core.infrastructure.cache import LRUCache
+
+logger = structlog.get_logger()
+
+EMBEDDING_CACHE_SIZE = int(os.getenv("AD_PREDICTOR_EMBEDDING_CACHE_SIZE", "50000"))
+EMBEDDING_DIR = os.getenv("AD_PREDICTOR_EMBEDDING_DIR")
+EMBEDDING_MEMMAP_ROWS = int(os.getenv("AD_PREDICTOR_EMBEDDING_MEMMAP_ROWS", "262144"))
+
+EncodeFn = Callable[[List[str]], np.ndarray]
+
+
+class _MemmapStore:
+    """Append-only float32 matrix on disk with a keyword-per-line index."""
+
+    def __init__(self, directory: str, model_name: str, dims: int, capacity: int):
+        path = Path(directory)
+        path.mkdir(parents=True, exist_ok=True)
+        stem = path / f"{model_name.replace('/', '_')}-{dims}"
+        self._index_path = stem.with_suffix(".keywords")
+        self._lock_path = stem.with_suffix(".lock")
+        matrix_path = stem.with_suffix(".f32")
+
+        self.rows: Dict[str, int] = {}
+        self._next_row = 0
+        self._index_offset = 0
+        # Creating the matrix truncates it, so it must not race another process.
+        with self._file_lock():
+            mode = "r+" if matrix_path.exists() else "w+"
+            self._matrix = np.memmap(
+                matrix_path, dtype=np.float32, mode=mode, shape=(capacity, dims)
+            )
+            self._catch_up()
+
+    def get(self, keyword: str) -> Optional[np.ndarray]:
+        row = self.rows.get(keyword)
+        return None if row is None else np.array(self._matrix[row])
+
+    def append(self, keywords: List[str], vectors: np.ndarray) -> None:
+        with self._file_lock():
+            if self._catch_up():
+                # A writer died mid-line; terminate that line so it keeps its row.
+                with open(self._index_path, "ab") as f:
+                    f.write(b"\n")
+                self._catch_up()
+            room = len(self._matrix) - self._next_row
+            # Newlines would break the one-keyword-per-line index.
+            fresh = [
+                (k, v)
+                for k, v in zip(keywords, vectors)
+                if k not in self.rows and "\n" not in k
+            ]
+            fresh = fresh[:room]
+            if not fresh:
+                return
+            start = self._next_row
+            self._matrix[start : start + len(fresh)] = np.stack([v for _, v in fresh])
+            self._matrix.flush()
+            # Rows are written before the index so a crash never indexes a blank row.
+            lines = "".join(f"{k}\n" for k, _ in fresh).encode("utf-8")
+            with open(self._index_path, "ab") as f:
+                f.write(lines)
+            self._index_offset += len(lines)
+            for offset, (keyword, _) in enumerate(fresh):
+                self.rows[keyword] = start + offset
+            self._next_row = start + len(fresh)
+
+    def _catch_up(self) -> bool:
+        """Index the lines appended since this process last read the index file.
+
+        The line number is the matrix row, including lines other processes
+        wrote. Callers hold the file lock. Returns True if the file ends in
+        an unterminated line.
+        """
+        try:
+            with open(self._index_path, "rb") as f:
+                f.seek(self._index_offset)
+                data = f.read()
+        except FileNotFoundError:
+            return False
+        complete = data.rfind(b"\n") + 1
+        capacity = len(self._matrix)
+        for line in data[:complete].split(b"\n")[:-1]:
+            if self._next_row >= capacity:
+                break
+            self.rows.setdefault(line.decode("utf-8"), self._next_row)
+            self._next_row += 1
+        self._index_offset += complete
+        return complete < len(data)
+
+    @contextmanager
+    def _file_lock(self):
+        with open(self._lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+class KeywordEmbeddingCache:
+    """Thread-safe keyword embedding memo with an optional memory-mapped tier."""
+
+    def __init__(
+        self,
+        model_name: str,
+        dims: int,
+        maxsize: int = EMBEDDING_CACHE_SIZE,
+        directory: Optional[str] = EMBEDDING_DIR,
+        memmap_rows: int = EMBEDDING_MEMMAP_ROWS,
+    ):
+        self.dims = dims
+        self._memory = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+        self._disk: Optional[_MemmapStore] = None
+        if directory:
+            try:
+                self._disk = _MemmapStore(directory, model_name, dims, memmap_rows)
+            except (OSError, ValueError) as e:
+                logger.warning("keyword_embedding_memmap_unavailable", error=str(e))
+        self._counters = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+
+    def get_many(self, keywords: List[str], encode: EncodeFn) -> np.ndarray:
+        """Return one row per keyword, encoding only keywords seen for the first time."""
+        out = np.empty((len(keywords), self.dims), dtype=np.float32)
+        missing: Dict[str, List[int]] = {}
+        memory_hits = disk_hits = 0
+
+        for i, keyword in enumerate(keywords):
+            vector = self._memory.get(keyword)
+            if vector is None and self._disk is not None:
+                vector = self._disk.get(keyword)
+                if vector is not None:
+                    self._memory.set(keyword, vector)
+                    disk_hits += 1
+            elif vector is not None:
+                memory_hits += 1
+            if vector is None:
+                missing.setdefault(keyword, []).append(i)
+            else:
+                out[i] = vector
+
+        if missing:
+            fresh_keywords = list(missing)
+            vectors = np.asarray(encode(fresh_keywords), dtype=np.float32)
+            for keyword, vector in zip(fresh_keywords, vectors):
+                self._memory.set(keyword, vector)
+                out[missing[keyword]] = vector
+            if self._disk is not None:
+                with self._lock:
+                    self._disk.append(fresh_keywords, vectors)
+
+        self._counters["memory_hits"] += memory_hits
+        self._counters["disk_hits"] += disk_hits
+        self._counters["misses"] += len(missing)
+        return out
+
+    def stats(self) -> dict:
+        total = sum(self._counters.values())
+        hits = self._counters["memory_hits"] + self._counters["disk_hits"]
+        return {
+            **self._counters,
+            "memory_entries": len(self._memory),
+            "disk_entries": len(self._disk.rows) if self._disk is not None else 0,
+            "hit_rate": round(hits / total, 4) if total else 0.0,
+        }
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import structlog
 from fastapi import APIRouter, FastAPI
@@ -9,6 +10,7 @@ from mlops.google_search.performance.prediction_schemas import (
 from mlops.google_search.performance import (
     AdPerformancePredictor,
 )
+from mlops.google_search.performance.inference_executor import InferenceExecutor
 from oserver.utils import helpers
 from exceptions.custom_exceptions import (
     ModelNotLoadedException,
@@ -20,6 +22,9 @@ logger = structlog.get_logger()
 
 # Global predictor instance, initialized during lifespan startup
 predictor: AdPerformancePredictor = None
+executor: InferenceExecutor | None = None
+# Background model load started at startup
+warmup_task: asyncio.Task | None = None
 
 
 def get_initialized_predictor() -> AdPerformancePredictor:
@@ -49,15 +54,25 @@ def get_initialized_predictor() -> AdPerformancePredictor:
             lgbm_model_path=lgbm_path,
             sigmas_path=sigmas_path,
             columns_path=columns_path,
+            checksums={
+                lgbm_path: os.getenv("AD_PREDICTOR_LGBM_SHA256"),
+                sigmas_path: os.getenv("AD_PREDICTOR_SIGMAS_SHA256"),
+                columns_path: os.getenv("AD_PREDICTOR_COLUMNS_SHA256"),
+            },
+            version=os.getenv("AD_PREDICTOR_MODEL_VERSION"),
         )
     return predictor
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Lifespan context manager for startup and shutdown events."""
-    # Initialize and load models
-    current_predictor = get_initialized_predictor()
+def get_inference_executor() -> InferenceExecutor:
+    """Micro-batching executor that runs the predictor off the event loop."""
+    global executor
+    if executor is None:
+        executor = InferenceExecutor(get_initialized_predictor())
+    return executor
+
+
+async def _warm_up(current_predictor: AdPerformancePredictor) -> None:
     try:
         await current_predictor.load_models()
         logger.info("performance_models_loaded_successfully")
@@ -69,8 +84,19 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning("performance_models_load_failed", error=str(e))
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Lifespan context manager for startup and shutdown events."""
+    # Load models in the background; requests see not_ready until they are in.
+    global warmup_task
+    warmup_task = asyncio.create_task(_warm_up(get_initialized_predictor()))
+
     yield
     # Shutdown logic
+    warmup_task.cancel()
+    if executor is not None:
+        await executor.close()
     logger.info("prediction_service_shutdown")
 
 
@@ -97,7 +123,7 @@ async def forecast_performance(
     # Convert Pydantic models to dict format using model_dump()
     keyword_data = [kw.model_dump() for kw in request.keyword_data]
 
-    result = current_predictor.predict(
+    result = await get_inference_executor().predict(
         keyword_data=keyword_data,
         total_budget=request.total_budget,
         bid_strategy=request.bid_strategy,
@@ -111,7 +137,14 @@ async def forecast_performance(
 async def health_check():
     """Check if the prediction service is ready."""
     current_predictor = get_initialized_predictor()
+    if current_predictor.is_ready():
+        status = "healthy"
+    elif warmup_task is not None and not warmup_task.done():
+        status = "loading"
+    else:
+        status = "not_ready"
     return {
-        "status": "healthy" if current_predictor.is_ready() else "not_ready",
+        "status": status,
         "models_loaded": current_predictor.is_ready(),
+        "inference": executor.stats() if executor is not None else None,
     }
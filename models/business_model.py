@@ -128,6 +128,13 @@ class BlockReason(str, Enum):
     CONNECTION_ERROR = "connection_error"
 
 
+class FetchTier(str, Enum):
+    """Which fetch tier produced the scraped HTML."""
+
+    HTTP = "http"
+    BROWSER = "browser"
+
+
 class ScrapeWarning(BaseModel):
     """A warning about scraping restrictions (scraping still proceeds)."""
 
@@ -150,3 +157,6 @@ class ScrapeResult(BaseModel):
     warnings: list[ScrapeWarning] = []
     error: Optional[ScrapeError] = None
     data: Optional[dict] = None
+    tier: Optional[FetchTier] = None
+    content_hash: Optional[str] = None
+    from_cache: bool = False
@@ -103,6 +103,9 @@ class Competitor(BaseModel):
     reasoning: str | None = Field(
         None, description="AI reasoning for why this is a competitor"
     )
+    input_hash: str | None = Field(
+        None, description="Hash of the discovery inputs this analysis was built from"
+    )
 
 
 class CompetitorAnalysisResult(BaseModel):
@@ -126,3 +129,12 @@ class CompetitorAnalysisResult(BaseModel):
             if isinstance(c, dict)
         ]
         return raw_comps, existing_comps
+
+    @staticmethod
+    def load_checkpoints(record: dict) -> list[Competitor]:
+        """Per-competitor discovery results saved by a run that has not finished."""
+        return [
+            Competitor.model_validate(c)
+            for c in record.get("competitor_checkpoints") or []
+            if isinstance(c, dict)
+        ]
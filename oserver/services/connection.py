@@ -1,12 +1,15 @@
+import json
 import os
 from typing import Optional
 
+import httpx
 import requests
 from structlog import get_logger
 
 from oserver.utils.helpers import get_base_url
 from exceptions.custom_exceptions import CoreTokenException
 from core.infrastructure.context import auth_context
+from core.infrastructure.http_client import get_http_client
 
 logger = get_logger(__name__)
 
@@ -17,6 +20,44 @@ def fetch_oauth_token(
     appcode: Optional[str] = None,
 ) -> str:
     """Fetch OAuth token from connection service by connection name."""
+    url, headers = _token_request(client_code, connection_name, appcode)
+
+    try:
+        resp = requests.get(url, headers=headers, timeout=15)
+        resp.raise_for_status()
+    except requests.RequestException as e:
+        logger.error("Token service failed", connection=connection_name, error=str(e))
+        raise CoreTokenException("Token service failed") from e
+
+    token, _ = _parse_token_response(resp.text)
+    return token
+
+
+async def fetch_oauth_token_async(
+    client_code: str,
+    connection_name: str,
+    appcode: Optional[str] = None,
+) -> tuple[str, Optional[float]]:
+    """Non-blocking variant of fetch_oauth_token.
+
+    Returns (token, expires_in_seconds); expiry is None when the connection
+    service does not report one.
+    """
+    url, headers = _token_request(client_code, connection_name, appcode)
+
+    try:
+        resp = await get_http_client().get(url, headers=headers, timeout=15)
+        resp.raise_for_status()
+    except httpx.HTTPError as e:
+        logger.error("Token service failed", connection=connection_name, error=str(e))
+        raise CoreTokenException("Token service failed") from e
+
+    return _parse_token_response(resp.text)
+
+
+def _token_request(
+    client_code: str, connection_name: str, appcode: Optional[str]
+) -> tuple[str, dict]:
     base = get_base_url()
     url = f"{base}/api/core/connections/internal/oauth2/token/{connection_name}"
     resolved_appcode = appcode or os.getenv("APPCODE") or "marketingai"
@@ -30,20 +71,24 @@ def fetch_oauth_token(
         headers["X-Forwarded-Host"] = auth_context.x_forwarded_host
     if auth_context.x_forwarded_port:
         headers["X-Forwarded-Port"] = auth_context.x_forwarded_port
+    return url, headers
 
-    try:
-        resp = requests.get(url, headers=headers, timeout=15)
-        resp.raise_for_status()
-    except requests.RequestException as e:
-        logger.error("Token service failed", connection=connection_name, error=str(e))
-        raise CoreTokenException("Token service failed") from e
 
+def _parse_token_response(body: str) -> tuple[str, Optional[float]]:
     try:
-        data = resp.json()
-        token = data.get("access_token") or data.get("token") or data.get("id_token")
-        return token if token is not None else resp.text.strip()
+        data = json.loads(body)
     except ValueError:
-        return resp.text.strip()
+        return body.strip(), None
+    if not isinstance(data, dict):
+        return body.strip(), None
+
+    token = data.get("access_token") or data.get("token") or data.get("id_token")
+    expires_in = data.get("expires_in") or data.get("expiresIn")
+    try:
+        expires_in = float(expires_in) if expires_in is not None else None
+    except (TypeError, ValueError):
+        expires_in = None
+    return (token if token is not None else body.strip()), expires_in
 
 
 def fetch_google_api_token_simple(
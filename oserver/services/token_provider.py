@@ -0,0 +1,133 @@
+"""Async OAuth token provider with per-(client_code, connection) caching.
+
+Tokens are cached until shortly before expiry. Concurrent requests for the
+same key share a single in-flight fetch, and a token that is inside its
+refresh window is served from cache while a background refresh runs.
+
+Usage:
+    from oserver.services.token_provider import get_google_api_token
+    token = await get_google_api_token(client_code)
+"""
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional
+
+from structlog import get_logger
+
+from oserver.services.connection import fetch_oauth_token_async
+
+logger = get_logger(__name__)
+
+DEFAULT_TOKEN_TTL = float(os.getenv("OAUTH_TOKEN_TTL_SECONDS", "600"))
+REFRESH_MARGIN = float(os.getenv("OAUTH_TOKEN_REFRESH_MARGIN_SECONDS", "120"))
+EXPIRY_SKEW = 60.0
+
+TokenFetcher = Callable[[], Awaitable[tuple[str, Optional[float]]]]
+
+
+@dataclass
+class _CachedToken:
+    token: str
+    expires_at: float
+    refresh_at: float
+
+
+class TokenProvider:
+    def __init__(
+        self,
+        default_ttl: float = DEFAULT_TOKEN_TTL,
+        refresh_margin: float = REFRESH_MARGIN,
+    ):
+        self._default_ttl = default_ttl
+        self._refresh_margin = refresh_margin
+        self._tokens: dict[tuple[str, str], _CachedToken] = {}
+        self._inflight: dict[tuple[str, str], asyncio.Task] = {}
+
+    async def get_token(self, key: tuple[str, str], fetch: TokenFetcher) -> str:
+        """Return a cached token for key, fetching it at most once concurrently."""
+        now = time.monotonic()
+        cached = self._tokens.get(key)
+
+        if cached and now < cached.expires_at:
+            if now >= cached.refresh_at and key not in self._inflight:
+                self._start_refresh(key, fetch).add_done_callback(_log_refresh_failure)
+            return cached.token
+
+        task = self._inflight.get(key) or self._start_refresh(key, fetch)
+        return await asyncio.shield(task)
+
+    def invalidate(self, key: tuple[str, str], token: Optional[str] = None) -> None:
+        """Drop the cached token for key, e.g. after the API rejected it with 401.
+
+        When token is given it is only dropped if it is still the cached one,
+        so a token another caller already refreshed is kept.
+        """
+        cached = self._tokens.get(key)
+        if cached and (token is None or cached.token == token):
+            del self._tokens[key]
+            logger.info("OAuth token invalidated", connection=key[1])
+
+    def _start_refresh(self, key: tuple[str, str], fetch: TokenFetcher) -> asyncio.Task:
+        task = asyncio.create_task(self._refresh(key, fetch))
+        self._inflight[key] = task
+        return task
+
+    async def _refresh(self, key: tuple[str, str], fetch: TokenFetcher) -> str:
+        try:
+            token, expires_in = await fetch()
+            if not token:
+                return token
+            ttl = expires_in - EXPIRY_SKEW if expires_in else self._default_ttl
+            ttl = max(ttl, 1.0)
+            now = time.monotonic()
+            self._tokens[key] = _CachedToken(
+                token=token,
+                expires_at=now + ttl,
+                refresh_at=now + max(ttl - self._refresh_margin, ttl / 2),
+            )
+            logger.info("OAuth token refreshed", connection=key[1], ttl=round(ttl))
+            return token
+        finally:
+            self._inflight.pop(key, None)
+
+
+def _log_refresh_failure(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception():
+        logger.warning("Background token refresh failed", error=str(task.exception()))
+
+
+token_provider = TokenProvider()
+
+
+async def get_oauth_token(
+    client_code: str, connection_name: str, appcode: Optional[str] = None
+) -> str:
+    return await token_provider.get_token(
+        (client_code, connection_name),
+        lambda: fetch_oauth_token_async(client_code, connection_name, appcode),
+    )
+
+
+def invalidate_oauth_token(
+    client_code: str, connection_name: str, token: Optional[str] = None
+) -> None:
+    token_provider.invalidate((client_code, connection_name), token)
+
+
+async def get_google_api_token(client_code: str) -> str:
+    return await get_oauth_token(client_code, "GOOGLE_API")
+
+
+async def get_meta_api_token(client_code: str) -> str:
+    return await get_oauth_token(client_code, "META_API")
+
+
+def invalidate_google_api_token(client_code: str, token: Optional[str] = None) -> None:
+    invalidate_oauth_token(client_code, "GOOGLE_API", token)
+
+
+def invalidate_meta_api_token(client_code: str, token: Optional[str] = None) -> None:
+    invalidate_oauth_token(client_code, "META_API", token)
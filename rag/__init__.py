@@ -1,4 +1,4 @@
-from .models import RAGCollection, RAGDocument, RAGChunk
+from .models import RAGCollection, RAGDocument, RAGChunk, IngestItem
 from .repository import RAGRepository
 from .embedding_service import EmbeddingService
 
@@ -6,6 +6,7 @@ __all__ = [
     "RAGCollection",
     "RAGDocument",
     "RAGChunk",
+    "IngestItem",
     "RAGRepository",
     "EmbeddingService",
 ]
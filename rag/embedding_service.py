@@ -1,3 +1,5 @@
+import asyncio
+import os
 from structlog import get_logger    #type: ignore
 from typing import List, Optional, Dict, Any
 from uuid import UUID
@@ -5,15 +7,22 @@ from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from db import db_session
-from rag.models import RAGChunk
-from rag.repository import RAGRepository
+from rag.models import IngestItem, RAGChunk
+from rag.repository import RAGRepository, ensure_collection_index
 from services import openai_client
 
 logger = get_logger(__name__)
 
+# Embedding requests one ingest_many call keeps in flight at a time.
+EMBEDDING_MAX_CONCURRENCY = int(os.getenv("RAG_EMBEDDING_MAX_CONCURRENCY", "4"))
+
+# Collections whose HNSW index this process has already confirmed.
+_indexed_collections: set[UUID] = set()
+
 class EmbeddingService:
     
     EMBEDDING_MODEL = "text-embedding-3-small"
+    EMBEDDING_BATCH_SIZE = 256
     
     def __init__(self):
         self.engine = db_session.get_engine()
@@ -27,7 +36,43 @@ class EmbeddingService:
         source: str,
         description: Optional[str] = None
     ) -> UUID:
-    
+        chunk_ids = await self.ingest_many(
+            collection_name=collection_name,
+            items=[IngestItem(external_id=external_id, content=content, metadata=metadata)],
+            source=source,
+            description=description,
+        )
+        return chunk_ids[0]
+
+    async def ingest_many(
+        self,
+        collection_name: str,
+        items: List[IngestItem],
+        source: str,
+        description: Optional[str] = None
+    ) -> List[UUID]:
+        """
+        Embed and insert many chunks in one transaction.
+        Texts are embedded EMBEDDING_BATCH_SIZE per request, at most
+        EMBEDDING_MAX_CONCURRENCY requests at a time, and rows are inserted
+        with a single executemany. Returns chunk ids in input order.
+        """
+        if not items:
+            return []
+
+        batches = [
+            [item.content for item in items[i : i + self.EMBEDDING_BATCH_SIZE]]
+            for i in range(0, len(items), self.EMBEDDING_BATCH_SIZE)
+        ]
+        semaphore = asyncio.Semaphore(EMBEDDING_MAX_CONCURRENCY)
+
+        async def embed(batch: List[str]) -> List[List[float]]:
+            async with semaphore:
+                return await openai_client.generate_embeddings(batch, model=self.EMBEDDING_MODEL)
+
+        embedded = await asyncio.gather(*(embed(batch) for batch in batches))
+        embeddings = [vector for batch in embedded for vector in batch]
+
         async with AsyncSession(self.engine) as session:
             repo = RAGRepository(session)
             
@@ -36,38 +81,55 @@ class EmbeddingService:
                 description=description or f"Collection for {collection_name}"
             )
             
-            # file location link if its a file
-            uri = metadata.get("url") or metadata.get("uri") or ""
-            
-            document_id = await repo.get_or_create_document(
-                collection_id=collection_id,
-                external_id=external_id,
-                uri=uri,
-                source=source
-            )
-            
-            next_ord = await repo.get_next_ord(document_id)
+            document_ids: Dict[str, UUID] = {}
+            for item in items:
+                if item.external_id in document_ids:
+                    continue
+                # file location link if its a file
+                uri = item.metadata.get("url") or item.metadata.get("uri") or ""
+                document_ids[item.external_id] = await repo.get_or_create_document(
+                    collection_id=collection_id,
+                    external_id=item.external_id,
+                    uri=uri,
+                    source=source
+                )
             
-            embeddings = await openai_client.generate_embeddings([content], model=self.EMBEDDING_MODEL)
-            embedding = embeddings[0]
+            next_ords = await repo.get_next_ords(list(document_ids.values()))
             
-            if "created_at" not in metadata:
-                metadata["created_at"] = datetime.utcnow().isoformat()
+            created_at = datetime.utcnow().isoformat()
+            chunks = []
+            for item, embedding in zip(items, embeddings):
+                document_id = document_ids[item.external_id]
+                metadata = dict(item.metadata)
+                metadata.setdefault("created_at", created_at)
+                chunks.append({
+                    "collection_id": collection_id,
+                    "document_id": document_id,
+                    "ord": next_ords[document_id],
+                    "content": item.content,
+                    "metadata": metadata,
+                    "embedding": embedding,
+                    "tokens": len(item.content.split()),
+                })
+                next_ords[document_id] += 1
                 
-            # Insert chunk
-            chunk_id = await repo.create_chunk(
-                document_id=document_id,
-                ord=next_ord,
-                content=content,
-                metadata=metadata,
-                embedding=embedding,
-                tokens=len(content.split())
-            )
+            chunk_ids = await repo.create_chunks(chunks)
             
             await session.commit()
             
-            logger.info(f"Ingested content into collection '{collection_name}' (doc_id={document_id})")
-            return chunk_id
+            logger.info(
+                f"Ingested {len(chunk_ids)} chunks into collection '{collection_name}' "
+                f"({len(document_ids)} documents)"
+            )
+
+        if collection_id not in _indexed_collections:
+            try:
+                await ensure_collection_index(self.engine, collection_id)
+                _indexed_collections.add(collection_id)
+            except Exception as e:
+                # Searches still work without the index; the next ingest retries.
+                logger.warning(f"HNSW index creation failed for '{collection_name}': {e}")
+        return chunk_ids
 
     async def search_similar(
         self,
@@ -99,6 +161,7 @@ class EmbeddingService:
                 matches.append({
                     "chunk": RAGChunk(
                         id=row.id,
+                        collection_id=row.collection_id,
                         document_id=row.document_id,
                         ord=row.ord,
                         content=row.content,
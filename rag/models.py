@@ -20,10 +20,16 @@ class RAGDocument(BaseModel):
 
 class RAGChunk(BaseModel):
     id: Optional[UUID] = None
+    collection_id: Optional[UUID] = None
     document_id: UUID
     ord: int
     content: str
     metadata: Dict[str, Any] = {}
     tokens: Optional[int] = None
     embedding: Optional[List[float]] = None
-    created_at: Optional[datetime] = None
\ No newline at end of file
+    created_at: Optional[datetime] = None
+
+class IngestItem(BaseModel):
+    external_id: str
+    content: str
+    metadata: Dict[str, Any] = {}
@@ -1,14 +1,58 @@
 from structlog import get_logger    #type: ignore
 import hashlib
 import json
+import os
 from typing import List, Dict, Any, Optional, Sequence
-from uuid import UUID
+from uuid import UUID, uuid4
 from sqlalchemy import text, Row
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
 logger = get_logger(__name__)
 
+# Candidate list size for HNSW searches; raised to `limit` (up to pgvector's 1000) when a search asks for more.
+HNSW_EF_SEARCH = int(os.getenv("RAG_HNSW_EF_SEARCH", "40"))
+
+
+def _hnsw_index_name(collection_id: UUID) -> str:
+    return f"idx_chunks_hnsw_{collection_id.hex}"
+
+
+async def ensure_collection_index(engine: AsyncEngine, collection_id: UUID) -> None:
+    """
+    Create the collection's partial HNSW index (see V3__rag_ann_indexes.sql) if it is missing.
+    Built with CREATE INDEX CONCURRENTLY on an autocommit connection, outside any
+    ingest transaction, so inserts into rag_chunks are never blocked while it builds.
+    An invalid index left by an interrupted build is dropped and rebuilt.
+    """
+    index_name = _hnsw_index_name(collection_id)
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        result = await conn.execute(
+            text("""
+                SELECT i.indisvalid
+                FROM pg_class c JOIN pg_index i ON i.indexrelid = c.oid
+                WHERE c.relname = :name
+            """),
+            {"name": index_name},
+        )
+        row = result.fetchone()
+        if row and row.indisvalid:
+            return
+        if row:
+            logger.warning("Rebuilding invalid HNSW index", index=index_name)
+            await conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}"))
+        # DDL cannot take bind parameters; the id is a UUID, so inlining it is safe.
+        await conn.execute(
+            text(f"""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name}
+                ON rag_chunks USING hnsw (embedding vector_cosine_ops)
+                WHERE collection_id = '{UUID(str(collection_id))}'
+            """)
+        )
+        logger.info("Created HNSW index", index=index_name)
+
+
 class RAGRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -36,6 +80,13 @@ class RAGRepository:
             raise SQLAlchemyError(f"Failed to create collection '{name}'")
         return row.id
 
+    async def get_collection_id(self, name: str) -> Optional[UUID]:
+        result = await self.session.execute(
+            text("SELECT id FROM rag_collections WHERE name = :name"), {"name": name}
+        )
+        row = result.fetchone()
+        return row.id if row else None
+
     async def get_or_create_document(
         self, collection_id: UUID, external_id: str, uri: str, source: str
     ) -> UUID:
@@ -73,87 +124,97 @@ class RAGRepository:
             raise SQLAlchemyError(f"Failed to create document '{external_id}'")
         return row.id
 
+    async def get_next_ords(self, document_ids: Sequence[UUID]) -> Dict[UUID, int]:
+        """Get the next chunk ordinal for each document in one query"""
+        result = await self.session.execute(
+            text("""
+                SELECT document_id, MAX(ord) + 1 AS next_ord
+                FROM rag_chunks
+                WHERE document_id = ANY(:doc_ids)
+                GROUP BY document_id
+            """),
+            {"doc_ids": list(document_ids)},
+        )
+        next_ords = {row.document_id: row.next_ord for row in result.fetchall()}
+        return {doc_id: next_ords.get(doc_id, 0) for doc_id in document_ids}
+
     async def get_next_ord(self, document_id: UUID) -> int:
         """Get next ordinal number for chunks in a document"""
-        ord_result = await self.session.execute(
-            text(
-                "SELECT COALESCE(MAX(ord), -1) + 1 as next_ord FROM rag_chunks WHERE document_id = :doc_id"
-            ),
-            {"doc_id": document_id},
-        )
-        row = ord_result.fetchone()
-        if not row:
-            return 0  # Fallback (though this query should always return a row)
-        return row.next_ord
+        return (await self.get_next_ords([document_id]))[document_id]
 
     async def create_chunk(
         self,
+        collection_id: UUID,
         document_id: UUID,
         ord: int,
         content: str,
         metadata: Dict[str, Any],
-        embedding: List[float],
+        embedding: Sequence[float],
         tokens: int,
     ) -> UUID:
         """Create a new chunk with embedding"""
-        # Convert embedding list to PostgreSQL array format
-        # Why? asyncpg with SQLAlchemy text() doesn't auto-convert Python lists to PostgreSQL arrays
-        # We must manually format it as a string that PostgreSQL can parse as an array
-        
-        logger.info(f"🔍 EMBEDDING CONVERSION DEBUG:")
-        logger.info(f"  Input type: {type(embedding)}")
-        logger.info(f"  Input length: {len(embedding)}")
-        logger.info(f"  First 5 values: {embedding[:5]}")
-        
-        embedding_str = "[" + ",".join(str(x) for x in embedding) + "]"
-        
-        logger.info(f"  Converted string (first 100 chars): {embedding_str[:100]}...")
-        logger.info(f"  Converted string (last 50 chars): ...{embedding_str[-50:]}")
-        logger.info(f"  Reason: asyncpg needs string format '[x,y,z]' for vector type cast")
-        
-        result = await self.session.execute(
+        ids = await self.create_chunks(
+            [
+                {
+                    "collection_id": collection_id,
+                    "document_id": document_id,
+                    "ord": ord,
+                    "content": content,
+                    "metadata": metadata,
+                    "embedding": embedding,
+                    "tokens": tokens,
+                }
+            ]
+        )
+        return ids[0]
+
+    async def create_chunks(self, chunks: List[Dict[str, Any]]) -> List[UUID]:
+        """
+        Insert many chunks in one executemany round trip.
+        Each chunk has keys: collection_id, document_id, ord, content, metadata, embedding, tokens.
+        Embeddings are bound as binary pgvector values (see db/pgvector.py).
+        """
+        if not chunks:
+            return []
+        # Ids are generated here so the batch needs no RETURNING.
+        rows = [
+            {**chunk, "id": uuid4(), "metadata": json.dumps(chunk["metadata"])}
+            for chunk in chunks
+        ]
+        await self.session.execute(
             text("""
-                INSERT INTO rag_chunks 
-                (document_id, ord, content, metadata, tokens, embedding)
-                VALUES (:document_id, :ord, :content, :metadata, :tokens, CAST(:embedding_vec AS vector))
-                RETURNING id
+                INSERT INTO rag_chunks
+                (id, collection_id, document_id, ord, content, metadata, tokens, embedding)
+                VALUES (:id, :collection_id, :document_id, :ord, :content,
+                        CAST(:metadata AS jsonb), :tokens, :embedding)
             """),
-            {
-                "document_id": document_id,
-                "ord": ord,
-                "content": content,
-                "metadata": json.dumps(metadata),
-                "tokens": tokens,
-                "embedding_vec": embedding_str,
-            },
+            rows,
         )
-        row = result.fetchone()
-        if not row:
-            raise SQLAlchemyError(f"Failed to create chunk for document '{document_id}'")
-        return row.id
+        return [row["id"] for row in rows]
 
     async def search_similar_chunks(
         self,
         collection_name: str,
-        query_embedding: List[float],
+        query_embedding: Sequence[float],
         limit: int = 5,
         filters: Optional[Dict[str, Any]] = None,
     ) -> Sequence[Row]:
         """
         Search for similar chunks in a collection.
-        Returns rows with keys: id, document_id, ord, content, metadata, tokens, created_at, similarity_score
+        Filters match metadata by JSON containment, so values compare with their JSON types.
+        Returns rows with keys: id, collection_id, document_id, ord, content, metadata, tokens, created_at, similarity_score
         """
-        # Convert embedding list to PostgreSQL array format for similarity search
-        logger.info(f"🔍 SEARCH EMBEDDING CONVERSION:")
-        logger.info(f"  Query embedding length: {len(query_embedding)}")
-        
-        embedding_str = "[" + ",".join(str(x) for x in query_embedding) + "]"
-        
-        logger.info(f"  Converted for vector similarity: {embedding_str[:80]}...")
-        
-        query_sql = """
-            SELECT 
+        collection_id = await self.get_collection_id(collection_name)
+        if collection_id is None:
+            return []
+
+        # The collection id is inlined (it is a UUID from the database) so the
+        # planner can match the collection's partial HNSW index; a bind
+        # parameter would hide it under a generic prepared plan.
+        query_sql = f"""
+            SELECT
                 c.id,
+                c.collection_id,
                 c.document_id,
                 c.ord,
                 c.content,
@@ -162,27 +223,23 @@ class RAGRepository:
                 c.created_at,
                 1 - (c.embedding <=> CAST(:embedding_vec AS vector)) as similarity_score
             FROM rag_chunks c
-            JOIN rag_documents d ON c.document_id = d.id
-            JOIN rag_collections col ON d.collection_id = col.id
-            WHERE col.name = :collection_name
+            WHERE c.collection_id = '{UUID(str(collection_id))}'
         """
 
-        params = {
-            "collection_name": collection_name,
-            "embedding_vec": embedding_str,
+        params: Dict[str, Any] = {
+            "embedding_vec": query_embedding,
             "limit": limit,
         }
 
-        # Apply metadata filters
         if filters:
-            for key, value in filters.items():
-                # Basic sanitization for keys to prevent SQL injection via key name
-                # Ideally keys should be validated against a schema
-                safe_key = key.replace("'", "")
-                query_sql += f" AND c.metadata->>'{safe_key}' = :filter_{safe_key}"
-                params[f"filter_{safe_key}"] = str(value)
+            query_sql += " AND c.metadata @> CAST(:filters AS jsonb)"
+            params["filters"] = json.dumps(filters)
 
-        query_sql += " ORDER BY similarity_score DESC LIMIT :limit"
+        # Ordering by the distance operator itself is what lets the index serve the query.
+        query_sql += " ORDER BY c.embedding <=> CAST(:embedding_vec AS vector) LIMIT :limit"
 
+        await self.session.execute(
+            text(f"SET LOCAL hnsw.ef_search = {min(max(HNSW_EF_SEARCH, int(limit)), 1000)}")
+        )
         result = await self.session.execute(text(query_sql), params)
         return result.fetchall()
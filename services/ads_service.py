@@ -1,12 +1,20 @@
+import asyncio
 import json
-from difflib import SequenceMatcher
+import os
+from typing import Optional
 from services.json_utils import safe_json_parse
 from services.openai_client import chat_completion
 from utils import prompt_loader
+from utils.near_duplicates import NearDuplicateIndex
 from structlog import get_logger
 
 logger = get_logger(__name__)
 
+# Overlap temperature variants instead of running one retry after another.
+AD_ASSETS_PARALLEL = os.getenv("AD_ASSETS_PARALLEL", "true").lower() == "true"
+# How long an attempt may run before the next variant is started alongside it.
+AD_ASSETS_HEDGE_DELAY = float(os.getenv("AD_ASSETS_HEDGE_DELAY_SECONDS", "10"))
+
 
 class AdAssetsGenerator:
     def __init__(
@@ -14,8 +22,12 @@ class AdAssetsGenerator:
         max_attempts: int = 3,
         min_headlines: int = 15,
         min_descriptions: int = 4,
+        parallel: bool = AD_ASSETS_PARALLEL,
+        hedge_delay: float = AD_ASSETS_HEDGE_DELAY,
     ):
         self.max_attempts = max_attempts
+        self.parallel = parallel
+        self.hedge_delay = hedge_delay
         self.min_headlines = min_headlines
         self.min_descriptions = min_descriptions
 
@@ -33,6 +45,132 @@ class AdAssetsGenerator:
         }
 
     async def generate(self, summary, positive_keywords) -> dict:
+        if self.parallel:
+            return await self._generate_parallel(summary, positive_keywords)
+        return await self._generate_sequential(summary, positive_keywords)
+
+    async def _generate_parallel(self, summary, positive_keywords) -> dict:
+        """
+        Run temperature variants with overlap, evaluating them in attempt order.
+
+        The next variant starts as soon as the previous ones are known to be
+        insufficient, or once the newest running attempt has taken longer than
+        hedge_delay. No further calls are issued once the target is met, and
+        the remaining ones are cancelled.
+
+        Attempt k is only evaluated after attempts 0..k-1 have arrived, over
+        the pool merged from attempts 0..k, so the outcome does not depend on
+        which call finishes first.
+        """
+        tasks: dict[asyncio.Task, int] = {}
+        outcomes: dict[int, dict | Exception] = {}
+
+        def launch() -> None:
+            attempt_num = len(tasks)
+            logger.info("[AdAssets] Starting attempt", attempt=attempt_num + 1)
+            task = asyncio.create_task(
+                self._generate_single_attempt(
+                    summary, positive_keywords, self._get_attempt_config(attempt_num)
+                )
+            )
+            tasks[task] = attempt_num
+
+        all_raw_headlines: list[str] = []
+        all_raw_descriptions: list[str] = []
+        audiences: dict[int, dict] = {}
+        last_error: Optional[Exception] = None
+        next_to_check = 0
+        launch()
+        try:
+            while next_to_check < self.max_attempts:
+                while next_to_check in outcomes:
+                    outcome = outcomes.pop(next_to_check)
+                    if isinstance(outcome, Exception):
+                        last_error = outcome
+                    else:
+                        all_raw_headlines.extend(outcome["raw_headlines"])
+                        all_raw_descriptions.extend(outcome["raw_descriptions"])
+                        audiences[next_to_check] = outcome["filtered"].get(
+                            "audience", {}
+                        )
+                        merged = self._filter_merged_pool(
+                            all_raw_headlines,
+                            all_raw_descriptions,
+                            list(range(next_to_check + 1)),
+                        )
+                        if merged:
+                            logger.info(
+                                "[AdAssets] Success",
+                                attempt=next_to_check + 1,
+                                attempts_started=len(tasks),
+                                headlines=len(merged["headlines"]),
+                                descriptions=len(merged["descriptions"]),
+                            )
+                            merged["audience"] = _first_audience(audiences)
+                            return merged
+                    next_to_check += 1
+
+                if next_to_check >= self.max_attempts:
+                    break
+                if len(tasks) <= next_to_check:
+                    launch()
+
+                running = {task for task in tasks if not task.done()}
+                can_hedge = len(tasks) < self.max_attempts
+                done, _ = await asyncio.wait(
+                    running,
+                    timeout=self.hedge_delay if can_hedge else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    launch()
+                for task in done:
+                    attempt_num = tasks[task]
+                    try:
+                        outcomes[attempt_num] = task.result()
+                    except Exception as e:
+                        logger.error(
+                            "[AdAssets] Attempt exception",
+                            attempt=attempt_num + 1,
+                            error=str(e),
+                            error_type=type(e).__name__,
+                        )
+                        outcomes[attempt_num] = e
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        if not audiences:
+            logger.critical("[AdAssets] All attempts failed with exceptions")
+            raise last_error
+
+        logger.warning(
+            "[AdAssets] All attempts insufficient - activating rescue pool",
+            total_attempts=self.max_attempts,
+        )
+        result = self._rescue_pool_fallback(all_raw_headlines, all_raw_descriptions)
+        result["audience"] = _first_audience(audiences)
+        return result
+
+    def _filter_merged_pool(
+        self, headlines: list[str], descriptions: list[str], attempt_nums: list[int]
+    ) -> Optional[dict]:
+        """Filter the pool with each given attempt's config, strictest first."""
+        for attempt_num in attempt_nums:
+            config = self._get_attempt_config(attempt_num)
+            filtered_headlines = self._filter_headlines(headlines, config)
+            filtered_descriptions = self._filter_descriptions(descriptions, config)
+            if (
+                len(filtered_headlines) >= self.min_headlines
+                and len(filtered_descriptions) >= self.min_descriptions
+            ):
+                return {
+                    "headlines": filtered_headlines,
+                    "descriptions": filtered_descriptions,
+                }
+        return None
+
+    async def _generate_sequential(self, summary, positive_keywords) -> dict:
         all_raw_headlines = []
         all_raw_descriptions = []
         last_audience = {}
@@ -137,25 +275,21 @@ class AdAssetsGenerator:
                 seen_lower.add(item_lower)
                 unique_items.append(item)
 
-        # Second pass: remove semantically similar items
-        final_items: list[str] = []
+        # Second pass: remove near-duplicates of items already kept
+        index = NearDuplicateIndex(similarity_threshold)
         for item in unique_items:
-            is_similar = False
-            for existing in final_items:
-                ratio = SequenceMatcher(None, item.lower(), existing.lower()).ratio()
-                if ratio >= similarity_threshold:
-                    is_similar = True
-                    logger.debug(
-                        "[AdAssets] Removed similar item",
-                        removed=item,
-                        similar_to=existing,
-                        similarity=round(ratio, 2),
-                    )
-                    break
-            if not is_similar:
-                final_items.append(item)
+            match = index.match(item)
+            if match:
+                logger.debug(
+                    "[AdAssets] Removed similar item",
+                    removed=item,
+                    similar_to=match[0],
+                    similarity=round(match[1], 2),
+                )
+            else:
+                index.add(item)
 
-        return final_items
+        return index.texts
 
     def _filter_headlines(self, headlines: list[str], config: dict) -> list[str]:
         if not headlines:
@@ -297,3 +431,11 @@ class AdAssetsGenerator:
             "descriptions": rescued_descriptions,
             "audience": {},
         }
+
+
+def _first_audience(audiences: dict[int, dict]) -> dict:
+    """Audience from the lowest-temperature attempt that returned one."""
+    for attempt_num in sorted(audiences):
+        if audiences[attempt_num]:
+            return audiences[attempt_num]
+    return {}
@@ -2,7 +2,7 @@ from exceptions.custom_exceptions import AIProcessingException
 import json
 import re
 from services.openai_client import chat_completion
-from utils.prompt_loader import load_prompt
+from utils.prompt_registry import get_prompt_registry
 
 
 class BaseAssetService:
@@ -10,8 +10,7 @@ class BaseAssetService:
     async def generate_from_prompt(
         prompt_name: str, prompt_vars: dict, model: str = "gpt-4o-mini"
     ):
-        prompt_template = load_prompt(prompt_name)
-        prompt = prompt_template.format(**prompt_vars)
+        prompt = get_prompt_registry().render(prompt_name, **prompt_vars)
 
         response = await chat_completion(
             messages=[
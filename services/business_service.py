@@ -11,6 +11,7 @@ from exceptions.custom_exceptions import (
     ScraperException,
 )
 from services.scraper_service import ScraperService
+from services.scrape_cache import get_scrape_cache
 from utils import prompt_loader
 from models.business_model import (
     BusinessMetadata,
@@ -26,7 +27,7 @@ from oserver.models.storage_request_model import (
     StorageUpdateWithPayload,
 )
 from oserver.services.storage_service import StorageService
-from services.openai_client import chat_completion
+from services.openai_client import chat_completion, evict_chat_completion
 from services.geo_target_service import GeoTargetService
 from utils.helpers import normalize_url
 
@@ -42,14 +43,16 @@ class BusinessService:
         prompt = prompt_loader.format_prompt(
             "business_metadata_prompt.txt", scraped_data=scraped_data, url=url
         )
+        messages = [{"role": "user", "content": prompt}]
+        params = {
+            "model": self.OPENAI_MODEL,
+            "max_tokens": 500,
+            "temperature": 0.1,
+            "response_format": {"type": "json_object"},
+        }
         try:
-            resp = await chat_completion(
-                messages=[{"role": "user", "content": prompt}],
-                model=self.OPENAI_MODEL,
-                max_tokens=500,
-                temperature=0.1,
-                response_format={"type": "json_object"},
-            )
+            # Cached: optimization runs re-extract the same product summaries.
+            resp = await chat_completion(messages=messages, cache=True, **params)
 
             raw = resp.choices[0].message.content.strip()
             data = json.loads(raw)
@@ -59,6 +62,7 @@ class BusinessService:
             return brand_info
 
         except json.JSONDecodeError as e:
+            evict_chat_completion(messages, **params)
             logger.warning(f"JSON parsing failed: {e}, using defaults")
             return BusinessMetadata()
         except Exception as e:
@@ -70,20 +74,25 @@ class BusinessService:
             "business_usp_prompt.txt", scraped_data=scraped_data
         )
 
+        messages = [{"role": "user", "content": prompt}]
+        params = {
+            "model": self.OPENAI_MODEL,
+            "max_tokens": 400,
+            "temperature": 0.1,
+            "response_format": {"type": "json_object"},
+        }
         try:
-            resp = await chat_completion(
-                messages=[{"role": "user", "content": prompt}],
-                model=self.OPENAI_MODEL,
-                max_tokens=400,
-                temperature=0.1,
-                response_format={"type": "json_object"},
-            )
+            resp = await chat_completion(messages=messages, cache=True, **params)
             usp_data = json.loads(resp.choices[0].message.content.strip())
             unique_features = usp_data.get("features", [])
 
             logger.info(f"Extracted and validated USPs: {unique_features}")
             return unique_features
 
+        except json.JSONDecodeError as e:
+            evict_chat_completion(messages, **params)
+            logger.warning(f"USP extraction failed: {e}")
+            return []
         except Exception as e:
             logger.warning(f"USP extraction failed: {e}")
             return []
@@ -219,7 +228,9 @@ class BusinessService:
             # STEP 3: SCRAPE WEBSITE
             logger.info(f"Scraping website: {website_url}")
             scraper = ScraperService()
-            scrape_result: ScrapeResult = await scraper.scrape(website_url)
+            scrape_result: ScrapeResult = await scraper.scrape(
+                website_url, revalidate=rescrape
+            )
 
             if not scrape_result.success:
                 error_msg = (
@@ -423,20 +434,27 @@ class BusinessService:
                 "Scraped data is required for summary generation"
             )
 
-        try:
-            prompt = prompt_loader.format_prompt(
-                "business/website_summary_prompt.txt", scraped_data=scraped_data
-            )
+        params = {
+            "model": self.OPENAI_MODEL,
+            "temperature": 0.2,
+            "response_format": {"type": "json_object"},
+        }
+
+        async def generate() -> str:
             response = await chat_completion(
-                messages=[{"role": "user", "content": prompt}],
-                model=self.OPENAI_MODEL,
-                temperature=0.2,
-                response_format={"type": "json_object"},
+                messages=[{"role": "user", "content": prompt}], **params
             )
             logger.info("Summary generated successfully")
             logger.debug(f"Summary response: {response}")
             return response.choices[0].message.content.strip()
 
+        try:
+            prompt = prompt_loader.format_prompt(
+                "business/website_summary_prompt.txt", scraped_data=scraped_data
+            )
+            # Unchanged scraped content and prompt reuse the summary generated for them.
+            return await get_scrape_cache().website_summary(prompt, params, generate)
+
         except Exception as e:
             logger.error(f"Error generating summary: {e}")
             raise AIProcessingException("Failed to generate summary")
@@ -1,6 +1,7 @@
 from __future__ import annotations
 import asyncio
-from typing import Any
+import os
+from typing import Any, Callable, Optional
 from structlog import get_logger  # type: ignore
 import structlog.contextvars as sl_contextvars
 
@@ -14,6 +15,7 @@ from oserver.models.storage_request_model import (
 from services.business_service import BusinessService
 from models.business_model import BusinessMetadata
 from core.infrastructure.context import auth_context
+from core.infrastructure.jobs import Job, get_job_manager
 from models.competitor_model import (
     Competitor,
     CompetitorKeyword,
@@ -24,10 +26,59 @@ from exceptions.custom_exceptions import StorageException
 # Local sub-module imports
 from .competitor_discovery_service import competitor_discovery_service
 from .competitor_insight_service import competitor_insight_service
-from utils.competitor_extraction import filter_already_analyzed_competitors
+from utils.competitor_extraction import (
+    competitor_input_hash,
+    filter_already_analyzed_competitors,
+)
 
 logger = get_logger(__name__)
 
+# Competitors discovered at once per analysis. Scraping and LLM calls inside
+# each discovery are further bounded in competitor_discovery_service.
+DISCOVERY_CONCURRENCY = int(os.getenv("COMPETITOR_DISCOVERY_CONCURRENCY", "3"))
+
+ProgressCallback = Callable[[str, str, str], None]
+
+
+def _noop(step: str, phase: str, message: str) -> None:
+    pass
+
+
+class _CheckpointWriter:
+    """Saves each competitor's discovery result to the record as it completes.
+
+    Storage updates replace the whole competitor_checkpoints field, so writes
+    are serialized and each one carries every checkpoint so far.
+    """
+
+    def __init__(self, storage_id: str, checkpoints: list[Competitor]):
+        self.storage_id = storage_id
+        self.checkpoints = {c.url: c for c in checkpoints}
+        self._lock = asyncio.Lock()
+
+    async def save(self, competitor: Competitor) -> None:
+        async with self._lock:
+            self.checkpoints[competitor.url] = competitor
+            update_req = StorageUpdateWithPayload(
+                storageName=CompetitorAnalysisOrchestrator.STORAGE_NAME,
+                dataObjectId=self.storage_id,
+                clientCode=auth_context.client_code,
+                dataObject={
+                    "competitor_checkpoints": [
+                        c.model_dump() for c in self.checkpoints.values()
+                    ]
+                },
+                appCode=CompetitorAnalysisOrchestrator.APP_CODE,
+            )
+            resp = await storage_service.update_storage(request=update_req)
+        if not resp.success:
+            # Losing a checkpoint only costs redoing that competitor on a rerun.
+            logger.warning(
+                "Competitor analysis.checkpoint_failed",
+                url=competitor.url,
+                error=resp.error,
+            )
+
 
 class CompetitorAnalysisOrchestrator:
     """Lean orchestrator for multi-page competitor keyword extraction."""
@@ -35,8 +86,47 @@ class CompetitorAnalysisOrchestrator:
     STORAGE_NAME = "AISuggestedData"
     APP_CODE = "marketingai"
 
+    JOB_KIND = "competitor_analysis"
+
     def __init__(self):
         self.business_service = BusinessService()
+        self._discovery_sem: asyncio.Semaphore | None = None
+
+    @property
+    def discovery_sem(self) -> asyncio.Semaphore:
+        """Lazily initialize the semaphore inside the active event loop."""
+        if self._discovery_sem is None:
+            self._discovery_sem = asyncio.Semaphore(DISCOVERY_CONCURRENCY)
+        return self._discovery_sem
+
+    def submit_competitor_analysis(
+        self,
+        business_url: str,
+        customer_id: str,
+        login_customer_id: str,
+        force_fresh_analysis: bool = False,
+    ) -> tuple[Job, bool]:
+        """Run the analysis as a background job, joining one already running for
+        the same client, business URL, ad accounts and force_fresh_analysis.
+        Returns the job and whether it is new."""
+        key = (
+            auth_context.client_code,
+            normalize_url(business_url),
+            customer_id,
+            login_customer_id,
+            force_fresh_analysis,
+        )
+
+        async def run(job: Job) -> CompetitorAnalysisResult:
+            return await self.start_competitor_analysis(
+                business_url=business_url,
+                customer_id=customer_id,
+                login_customer_id=login_customer_id,
+                force_fresh_analysis=force_fresh_analysis,
+                on_progress=job.progress,
+            )
+
+        return get_job_manager().submit(self.JOB_KIND, key, run)
 
     async def start_competitor_analysis(
         self,
@@ -44,8 +134,13 @@ class CompetitorAnalysisOrchestrator:
         customer_id: str,
         login_customer_id: str,
         force_fresh_analysis: bool = False,
+        on_progress: Optional[ProgressCallback] = None,
     ) -> CompetitorAnalysisResult:
-        """Main entry point to start the competitor analysis process."""
+        """Main entry point to start the competitor analysis process.
+
+        on_progress(step, phase, message) is called as each stage starts and ends.
+        """
+        emit = on_progress or _noop
         sl_contextvars.bind_contextvars(
             business_url=business_url, client_code=auth_context.client_code
         )
@@ -53,32 +148,49 @@ class CompetitorAnalysisOrchestrator:
 
         try:
             # Load Initial User Context
+            emit("load_context", "start", f"Loading business context for {business_url}")
             (
                 record,
                 storage_id,
                 user_business_info,
             ) = await self._load_user_business_context(business_url=business_url)
+            emit("load_context", "end", "Business context loaded")
 
             # Instantiate strict Pydantic models at the database(storage) boundary (standardized)
             raw_comps, existing_comps = CompetitorAnalysisResult.load_from_record(
                 record
             )
+            checkpoints = (
+                []
+                if force_fresh_analysis
+                else CompetitorAnalysisResult.load_checkpoints(record)
+            )
 
-            # Find Keywords (Now includes per-competitor enrichment)
+            # Find Keywords, checkpointing each competitor as it completes so a
+            # failed run resumes from the competitors already discovered
             competitors = await self._find_competitor_keywords(
                 raw_competitors=raw_comps,
                 existing_analysis=existing_comps,
                 customer_id=customer_id,
                 login_customer_id=login_customer_id,
                 force_fresh_analysis=force_fresh_analysis,
+                emit=emit,
+                checkpoints=checkpoints,
+                checkpoint_writer=_CheckpointWriter(storage_id, checkpoints),
             )
 
             # Global Aggregation & Trend Analysis
+            emit("enrichment", "start", "Scoring keywords across competitors")
             result = await self._enrich_competitor_keyword_with_trends_and_save(
                 competitors=competitors,
                 user_business_info=user_business_info,
                 storage_id=storage_id,
             )
+            emit(
+                "enrichment",
+                "end",
+                f"{len(result.enriched_keywords)} keyword(s) scored and saved",
+            )
 
             logger.info(
                 "Competitor analysis.orchestration_complete", competitor_count=len(competitors)
@@ -147,6 +259,9 @@ class CompetitorAnalysisOrchestrator:
         customer_id: str,
         login_customer_id: str,
         force_fresh_analysis: bool = False,
+        emit: ProgressCallback = _noop,
+        checkpoints: Optional[list[Competitor]] = None,
+        checkpoint_writer: Optional[_CheckpointWriter] = None,
     ) -> list[Competitor]:
         """Parallel keyword discovery across all listed competitors with smart skipping."""
         if not raw_competitors:
@@ -158,6 +273,7 @@ class CompetitorAnalysisOrchestrator:
             raw_competitors=raw_competitors,
             existing_analysis=existing_analysis,
             force_fresh_analysis=force_fresh_analysis,
+            checkpoints=checkpoints,
         )
 
         if not to_discover:
@@ -175,16 +291,28 @@ class CompetitorAnalysisOrchestrator:
             force_fresh=force_fresh_analysis,
         )
 
-        # Discover only what's needed
+        # Discover only what's needed, a bounded number of competitors at a time
+        async def discover(competitor: Competitor) -> Competitor:
+            step = f"competitor:{competitor.name}"
+            async with self.discovery_sem:
+                emit(step, "start", f"Analyzing {competitor.name}")
+                try:
+                    found = await competitor_discovery_service.find_keywords_for_competitor(
+                        competitor_info=competitor,
+                        customer_id=customer_id,
+                        login_customer_id=login_customer_id,
+                    )
+                except Exception:
+                    emit(step, "failed", f"Could not analyze {competitor.name}")
+                    raise
+            found.input_hash = competitor_input_hash(competitor)
+            if checkpoint_writer is not None:
+                await checkpoint_writer.save(found)
+            emit(step, "end", f"{len(found.extracted_keywords)} keyword(s) found")
+            return found
+
         results = await asyncio.gather(
-            *[
-                competitor_discovery_service.find_keywords_for_competitor(
-                    competitor_info=competitor,
-                    customer_id=customer_id,
-                    login_customer_id=login_customer_id,
-                )
-                for competitor in to_discover
-            ],
+            *[discover(competitor) for competitor in to_discover],
             return_exceptions=True,
         )
 
@@ -310,7 +438,8 @@ class CompetitorAnalysisOrchestrator:
             storageName=self.STORAGE_NAME,
             dataObjectId=storage_id,
             clientCode=auth_context.client_code,
-            dataObject=result.model_dump(),
+            # The final analysis supersedes this run's checkpoints.
+            dataObject={**result.model_dump(), "competitor_checkpoints": []},
             appCode=self.APP_CODE,
         )
         await storage_service.update_storage(request=update_req)
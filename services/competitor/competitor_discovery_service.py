@@ -1,7 +1,8 @@
 from __future__ import annotations
+import os
 import json
 import asyncio
-from typing import Any
+from typing import Any, Awaitable, TypeVar
 from structlog import get_logger, contextvars as sl_contextvars  # type: ignore
 from contextvars import ContextVar
 
@@ -20,6 +21,15 @@ from adapters.google.optimization.keyword_planner import keyword_planner_adapter
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+# Process-wide limits per stage, shared by every competitor being discovered,
+# so a wide fan-out queues instead of exhausting the browser pool, the LLM
+# rate limit or the Google Ads keyword planner quota.
+SCRAPE_CONCURRENCY = int(os.getenv("COMPETITOR_SCRAPE_CONCURRENCY", "4"))
+LLM_CONCURRENCY = int(os.getenv("COMPETITOR_LLM_CONCURRENCY", "6"))
+PLANNER_CONCURRENCY = int(os.getenv("COMPETITOR_PLANNER_CONCURRENCY", "2"))
+
 
 class CompetitorDiscoveryService:
     """Service for per-competitor deep extraction and keyword discovery."""
@@ -37,6 +47,23 @@ class CompetitorDiscoveryService:
         self.keyword_service = GoogleKeywordService()
         self.business_service = BusinessService()
         self.planner = keyword_planner_adapter
+        self._stage_sems: dict[str, asyncio.Semaphore] = {}
+
+    def _stage_sem(self, stage: str) -> asyncio.Semaphore:
+        """Lazily initialize a stage's semaphore inside the active event loop."""
+        sem = self._stage_sems.get(stage)
+        if sem is None:
+            limit = {
+                "scrape": SCRAPE_CONCURRENCY,
+                "llm": LLM_CONCURRENCY,
+                "planner": PLANNER_CONCURRENCY,
+            }[stage]
+            sem = self._stage_sems[stage] = asyncio.Semaphore(limit)
+        return sem
+
+    async def _limited(self, stage: str, awaitable: Awaitable[T]) -> T:
+        async with self._stage_sem(stage):
+            return await awaitable
 
     async def find_keywords_for_competitor(
         self,
@@ -126,11 +153,14 @@ class CompetitorDiscoveryService:
         """Scrape the competitor site and build a strategic profile (Summary + Metadata + Features)."""
         # Competitor Website Scraping
         home_data, all_links = await self._scrape_homepage(url)
-        strategic_urls = await competitor_extraction.select_strategic_pages(
-            links=all_links,
-            base_url=url,
-            model=self.EXTRACTION_MODEL,
-            max_pages=self.MAX_STRATEGIC_PAGES,
+        strategic_urls = await self._limited(
+            "llm",
+            competitor_extraction.select_strategic_pages(
+                links=all_links,
+                base_url=url,
+                model=self.EXTRACTION_MODEL,
+                max_pages=self.MAX_STRATEGIC_PAGES,
+            ),
         )
         # Competitor Sub-Pages Scraping
         sub_pages = await self._scrape_strategic_pages(strategic_urls)
@@ -140,8 +170,9 @@ class CompetitorDiscoveryService:
         pages_scraped = len(all_page_data)
 
         # Competitor Website Summarization
-        summary_raw = await self.business_service.generate_website_summary(
-            scraped_data=merged_content
+        summary_raw = await self._limited(
+            "llm",
+            self.business_service.generate_website_summary(scraped_data=merged_content),
         )
         comp_summary = json.loads(summary_raw).get("summary", "")
 
@@ -154,7 +185,7 @@ class CompetitorDiscoveryService:
         )
 
         competitor_brand_info, competitor_features = await asyncio.gather(
-            metadata_task, features_task
+            self._limited("llm", metadata_task), self._limited("llm", features_task)
         )
 
         logger.info(
@@ -187,7 +218,9 @@ class CompetitorDiscoveryService:
             keyword_type=KeywordType.GENERIC,
         )
 
-        return await asyncio.gather(brand_task, generic_task)
+        return await asyncio.gather(
+            self._limited("llm", brand_task), self._limited("llm", generic_task)
+        )
 
     async def _discover_competitor_branch_keywords(
         self,
@@ -211,11 +244,14 @@ class CompetitorDiscoveryService:
         customer_id = ctx["customer_id"]
         login_customer_id = ctx["login_customer_id"]
 
-        planner_results = await self.planner.generate_keyword_ideas(
-            customer_id=customer_id,
-            login_customer_id=login_customer_id,
-            seed_keywords=full_seed_set,
-            url=ctx["url"],
+        planner_results = await self._limited(
+            "planner",
+            self.planner.generate_keyword_ideas(
+                customer_id=customer_id,
+                login_customer_id=login_customer_id,
+                seed_keywords=full_seed_set,
+                url=ctx["url"],
+            ),
         )
 
         # Competitor Keywords Strategic Selection
@@ -224,13 +260,16 @@ class CompetitorDiscoveryService:
         # Filter for volume > 0 as bidding on zero-volume terms is inefficient
         filtered_suggestions = [s for s in suggestions if s.volume > 0]
 
-        optimized = await self.keyword_service.select_positive_keywords(
-            all_suggestions=filtered_suggestions,
-            business_info=ctx["competitor_brand_info"],
-            unique_features=ctx["competitor_features"],
-            scraped_data=ctx["comp_summary"],
-            keyword_type=kw_type,
-            url=ctx["url"],
+        optimized = await self._limited(
+            "llm",
+            self.keyword_service.select_positive_keywords(
+                all_suggestions=filtered_suggestions,
+                business_info=ctx["competitor_brand_info"],
+                unique_features=ctx["competitor_features"],
+                scraped_data=ctx["comp_summary"],
+                keyword_type=kw_type,
+                url=ctx["url"],
+            ),
         )
 
         # Unified Mapping
@@ -264,7 +303,7 @@ class CompetitorDiscoveryService:
             logger.warning("competitor.invalid_domain", error=error)
             raise BusinessValidationException(f"Invalid domain: {error}")
 
-        result = await scraper_service.scrape(url=url)
+        result = await self._limited("scrape", scraper_service.scrape(url=url))
         if not result.success:
             err = result.error.message if result.error else "unknown"
             logger.warning("competitor.scrape_failed", error=err)
@@ -278,7 +317,8 @@ class CompetitorDiscoveryService:
             return []
 
         results = await asyncio.gather(
-            *[scraper_service.scrape(url=u) for u in urls], return_exceptions=True
+            *[self._limited("scrape", scraper_service.scrape(url=u)) for u in urls],
+            return_exceptions=True,
         )
         return [r.data for r in results if not isinstance(r, Exception) and r.success]
 
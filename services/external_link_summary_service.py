@@ -90,7 +90,9 @@ async def process_external_link(
         logger.info("[ExternalLink] New external URL → creating new summary entry")
     # STEP 4: SCRAPE the external URL
     scraper = ScraperService()
-    scrape_result: ScrapeResult = await scraper.scrape(external_url)
+    scrape_result: ScrapeResult = await scraper.scrape(
+        external_url, revalidate=rescrape
+    )
     logger.info(f"[ExternalLink] Scrape success: {scrape_result.success}")
 
     # Handle blocked scrapes
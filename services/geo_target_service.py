@@ -7,7 +7,7 @@ from asyncio import Semaphore
 from typing import List, Dict, Optional
 from structlog import get_logger  # type: ignore
 from models.maps_model import TargetPlaceLocation, TargetPlaceResponse
-from oserver.services.connection import fetch_google_api_token_simple
+from oserver.services.token_provider import get_google_api_token
 from core.infrastructure.http_client import get_http_client
 
 logger = get_logger(__name__)
@@ -27,11 +27,10 @@ class GeoTargetService:
     MIN_DISTANCE_KM = 2.0  # Deduplication threshold
 
     def __init__(self, client_code: str) -> None:
+        self._client_code = client_code
         self._google_maps_api_key = os.getenv("GOOGLE_MAPS_API_KEY")
         self._developer_token = os.getenv("GOOGLE_ADS_DEVELOPER_TOKEN")
-        self._access_token = os.getenv(
-            "GOOGLE_ADS_ACCESS_TOKEN"
-        ) or fetch_google_api_token_simple(client_code)
+        self._access_token = os.getenv("GOOGLE_ADS_ACCESS_TOKEN")
 
     async def suggest_geo_targets(
         self,
@@ -319,6 +318,8 @@ class GeoTargetService:
         locale: str = "en",
     ) -> TargetPlaceResponse:
         """Resolve location names to geoTargetConstants using Google Ads API."""
+        if not self._access_token:
+            self._access_token = await get_google_api_token(self._client_code)
         if not self._has_google_ads_credentials():
             logger.error("Missing Google Ads credentials")
             return TargetPlaceResponse(locations=[], unresolved=locations)
@@ -7,7 +7,7 @@ import httpx
 from typing import List
 from oserver.services.connection import fetch_google_api_token_simple
 from utils import text_utils, prompt_loader
-from services.openai_client import chat_completion
+from services.openai_client import chat_completion, evict_chat_completion
 from utils.keyword_utils import KeywordUtils
 from services.session_manager import sessions
 from fastapi import HTTPException
@@ -374,13 +374,14 @@ class GoogleKeywordService:
                 positive_keywords=optimized_positive_keywords,
             )
 
-            response = await chat_completion(
-                messages=[{"role": "user", "content": prompt}],
-                model=self.OPENAI_MODEL,
-                max_tokens=1500,
-                temperature=0.0,
-                response_format={"type": "json_object"},
-            )
+            messages = [{"role": "user", "content": prompt}]
+            params = {
+                "model": self.OPENAI_MODEL,
+                "max_tokens": 1500,
+                "temperature": 0.0,
+                "response_format": {"type": "json_object"},
+            }
+            response = await chat_completion(messages, **params)
 
             try:
                 raw = response.choices[0].message.content.strip()
@@ -390,6 +391,7 @@ class GoogleKeywordService:
                 logger.error(
                     f"Negative keyword JSON parsing failed: {e}, using fallback"
                 )
+                evict_chat_completion(messages, **params)
                 negatives_raw = text_utils.get_fallback_negative_keywords()
 
             cleaned_negatives = KeywordUtils.filter_and_validate_negatives(
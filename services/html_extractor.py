@@ -0,0 +1,206 @@
+"""Single-pass extraction of structured page data from a parsed HTML tree.
+
+Produces the same dict as the previous find_all-based extraction (one
+find_all per field, get_text(strip=True) per element) in one walk of the
+tree. Stripped text fragments are appended to a flat list in document order
+and every element remembers the slice it spans, so an element's text is a
+single join over its slice instead of a fresh descendant traversal — nested
+divs no longer re-walk their subtrees.
+
+The parser backend is chosen with SCRAPER_HTML_PARSER ("html.parser" by
+default; "lxml" is faster when installed).
+"""
+
+import os
+import re
+from typing import Any, Dict, List, Optional
+
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
+
+HTML_PARSER = os.getenv("SCRAPER_HTML_PARSER", "html.parser")
+
+HEADING_TAGS = ("h1", "h2", "h3", "h4", "h5", "h6")
+
+# get_text() only yields plain strings; comments, scripts, styles and
+# templates use NavigableString subclasses and are skipped.
+_TEXT_TYPES = (NavigableString, CData)
+
+_COORDINATES_RE = re.compile(r"!2d([-\d.]+)!3d([-\d.]+)")
+
+
+def parse_html(html: str) -> BeautifulSoup:
+    return BeautifulSoup(html, HTML_PARSER)
+
+
+def extract_coordinates(url: str) -> Optional[Dict[str, float]]:
+    """
+    Extract lat/lng coordinates from Google Maps embed URL.
+    Pattern: !2d<longitude>!3d<latitude>
+    """
+    if not url:
+        return None
+    match = _COORDINATES_RE.search(url)
+    if match:
+        try:
+            return {"lng": float(match.group(1)), "lat": float(match.group(2))}
+        except ValueError:
+            return None
+    return None
+
+
+def _is_map_embed(src: str) -> bool:
+    return "google.com/maps" in src or "maps.google.com" in src
+
+
+class _Walk:
+    """Collectors for one extraction pass. Text slots are filled when a tag closes."""
+
+    def __init__(self):
+        self.strings: List[str] = []
+        self.title_tag: Optional[Tag] = None
+        self.meta: Dict[str, Optional[str]] = {"description": None, "keywords": None}
+        self.headings: Dict[str, List[Any]] = {tag: [] for tag in HEADING_TAGS}
+        self.paragraphs: List[Any] = []
+        self.spans: List[Any] = []
+        self.divs: List[Any] = []
+        self.unordered: List[List[Any]] = []
+        self.ordered: List[List[Any]] = []
+        self.tables: List[Dict[str, Any]] = []
+        self.links: List[Dict[str, Any]] = []
+        self.images: List[Dict[str, Any]] = []
+        self.iframes: List[Dict[str, Any]] = []
+        self.map_embeds: List[Dict[str, Any]] = []
+        # Open ancestors whose find_all() would include the current element
+        self.open_lists: List[List[Any]] = []
+        self.open_tables: List[Dict[str, Any]] = []
+        self.open_rows: List[List[Any]] = []
+
+    def enter(self, tag: Tag) -> List[tuple]:
+        """Register tag with its collectors; returns (container, key) text slots."""
+        name = tag.name
+        slots: List[tuple] = []
+
+        if name in self.headings:
+            slots.append(_reserve(self.headings[name]))
+        elif name == "p":
+            slots.append(_reserve(self.paragraphs))
+        elif name == "span":
+            slots.append(_reserve(self.spans))
+        elif name == "div":
+            slots.append(_reserve(self.divs))
+        elif name == "li":
+            slots.extend(_reserve(items) for items in self.open_lists)
+        elif name == "th":
+            slots.extend(_reserve(table["headers"]) for table in self.open_tables)
+        elif name == "td":
+            slots.extend(_reserve(row) for row in self.open_rows)
+        elif name == "a":
+            href = tag.get("href")
+            if href is not None:
+                link = {"text": "", "href": href}
+                self.links.append(link)
+                slots.append((link, "text"))
+        elif name in ("ul", "ol"):
+            items: List[Any] = []
+            (self.unordered if name == "ul" else self.ordered).append(items)
+            self.open_lists.append(items)
+        elif name == "table":
+            table = {"headers": [], "rows": []}
+            self.tables.append(table)
+            self.open_tables.append(table)
+        elif name == "tr":
+            row: List[Any] = []
+            for table in self.open_tables:
+                table["rows"].append(row)
+            self.open_rows.append(row)
+        elif name == "img":
+            src = tag.get("src")
+            if src is not None:
+                self.images.append({"alt": tag.get("alt", ""), "src": src})
+        elif name == "iframe":
+            src = tag.get("src")
+            if src is not None:
+                self.iframes.append({"src": src, "title": tag.get("title", "")})
+                if src and _is_map_embed(src):
+                    self.map_embeds.append(
+                        {
+                            "src": src,
+                            "title": tag.get("title", ""),
+                            "coordinates": extract_coordinates(src),
+                        }
+                    )
+        elif name == "meta":
+            meta_name = tag.get("name")
+            if meta_name in self.meta and self.meta[meta_name] is None:
+                self.meta[meta_name] = tag.get("content", "").strip()
+        elif name == "title" and self.title_tag is None:
+            self.title_tag = tag
+
+        return slots
+
+    def exit(self, tag: Tag, start: int, slots: List[tuple]) -> None:
+        # Everything appended since the tag opened is its descendant text.
+        if slots:
+            text = "".join(self.strings[start:])
+            for container, key in slots:
+                container[key] = text
+
+        name = tag.name
+        if name in ("ul", "ol"):
+            self.open_lists.pop()
+        elif name == "table":
+            self.open_tables.pop()
+        elif name == "tr":
+            self.open_rows.pop()
+
+    def result(self) -> dict:
+        title = self.title_tag.string if self.title_tag is not None else None
+        return {
+            "title": title.strip() if title else "",
+            "meta": {key: value or "" for key, value in self.meta.items()},
+            "headings": self.headings,
+            "paragraphs": [text for text in self.paragraphs if text],
+            "spans": [text for text in self.spans if text],
+            "divs": [text for text in self.divs if text],
+            "lists": {"unordered": self.unordered, "ordered": self.ordered},
+            "tables": [
+                {
+                    "headers": table["headers"],
+                    "rows": [row for row in table["rows"] if row],
+                }
+                for table in self.tables
+            ],
+            "links": self.links,
+            "images": self.images,
+            "iframes": self.iframes,
+            "map_embeds": self.map_embeds,
+        }
+
+
+def _reserve(container: List[Any]) -> tuple:
+    container.append("")
+    return container, len(container) - 1
+
+
+def extract_page_data(soup: BeautifulSoup) -> dict:
+    """Extract structured data from the parsed HTML in a single traversal."""
+    walk = _Walk()
+    strings = walk.strings
+    # Entries are (node, None) to visit, or (tag, (start, slots)) to close.
+    stack: List[tuple] = [(child, None) for child in reversed(soup.contents)]
+
+    while stack:
+        node, closing = stack.pop()
+        if closing is not None:
+            walk.exit(node, *closing)
+            continue
+
+        if isinstance(node, Tag):
+            stack.append((node, (len(strings), walk.enter(node))))
+            stack.extend((child, None) for child in reversed(node.contents))
+        elif type(node) in _TEXT_TYPES:
+            text = node.strip()
+            if text:
+                strings.append(text)
+
+    return walk.result()
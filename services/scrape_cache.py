@@ -0,0 +1,223 @@
+"""Persistent cache of scrape results and of summaries derived from them.
+
+Pages are keyed by normalized URL and stored (raw HTML + extracted data,
+zlib-compressed JSON) in a size-bounded SQLite file under CACHE_DIR.
+
+- Within SCRAPE_CACHE_TTL_SECONDS an entry is served without any request.
+- After that, pages fetched over plain HTTP are revalidated with a
+  conditional GET (If-None-Match / If-Modified-Since). A 304, or a 200 with
+  an identical body, refreshes the entry instead of re-scraping. A 200 with
+  a changed body is handed back so the scraper parses it without refetching.
+- Entries are dropped after SCRAPE_CACHE_RETENTION_SECONDS.
+
+Website summaries are cached by a hash of the rendered prompt (template plus
+scraped data) and the completion parameters, so an unchanged page also skips
+LLM summarization while a prompt or parameter change regenerates it.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import zlib
+from typing import Awaitable, Callable, Optional
+from urllib.parse import urldefrag
+
+import httpx
+from structlog import get_logger
+
+from core.infrastructure.cache import DiskCache, open_disk_cache
+from core.infrastructure.http_client import get_http_client
+from models.business_model import FetchTier, ScrapeResult
+from utils.helpers import normalize_url
+
+logger = get_logger(__name__)
+
+SCRAPE_CACHE_TTL = float(os.getenv("SCRAPE_CACHE_TTL_SECONDS", "86400"))
+SCRAPE_CACHE_RETENTION = float(os.getenv("SCRAPE_CACHE_RETENTION_SECONDS", "604800"))
+SCRAPE_CACHE_MAX_MB = int(os.getenv("SCRAPE_CACHE_MAX_MB", "512"))
+REVALIDATE_TIMEOUT = 10.0
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def page_key(url: str) -> str:
+    return f"page:{normalize_url(urldefrag(url)[0])}"
+
+
+def _summary_key(kind: str, prompt: str, params: dict) -> str:
+    payload = json.dumps(
+        {"prompt": prompt, "params": params}, sort_keys=True, default=str
+    )
+    return f"summary:{kind}:{content_hash(payload)}"
+
+
+def _encode(entry: dict) -> bytes:
+    return zlib.compress(json.dumps(entry).encode("utf-8"))
+
+
+def _decode(blob: bytes) -> dict:
+    return json.loads(zlib.decompress(blob))
+
+
+class ScrapeCache:
+    def __init__(
+        self,
+        disk: DiskCache | None,
+        ttl: float = SCRAPE_CACHE_TTL,
+        retention: float = SCRAPE_CACHE_RETENTION,
+    ):
+        self._disk = disk
+        self._ttl = ttl
+        self._retention = retention
+        self._counters = {
+            "fresh_hits": 0,
+            "revalidated_hits": 0,
+            "misses": 0,
+            "summary_hits": 0,
+            "summary_misses": 0,
+        }
+
+    async def lookup(
+        self, url: str, headers: dict, revalidate: bool = False
+    ) -> tuple[Optional[ScrapeResult], Optional[httpx.Response]]:
+        """Return (cached result, None) if fresh or confirmed unchanged.
+
+        On a miss returns (None, response), where response is the full 200
+        the revalidation request received for a changed page (None if there
+        was none) so the caller can parse it instead of fetching again.
+        With revalidate=True the TTL is ignored and the origin is always asked.
+        """
+        key = page_key(url)
+        blob = await self._read(key)
+        if blob is None:
+            self._counters["misses"] += 1
+            return None, None
+
+        entry = _decode(blob)
+        if not revalidate and time.time() - entry["stored_at"] < self._ttl:
+            self._counters["fresh_hits"] += 1
+            logger.info("scrape_cache_hit", url=url, state="fresh")
+            return _to_result(entry), None
+
+        unchanged, response = await self._revalidate(url, entry, headers)
+        if unchanged:
+            entry["stored_at"] = time.time()
+            await self._write(key, _encode(entry), self._retention)
+            self._counters["revalidated_hits"] += 1
+            logger.info("scrape_cache_hit", url=url, state="revalidated")
+            return _to_result(entry), None
+
+        self._counters["misses"] += 1
+        return None, response
+
+    async def store(
+        self,
+        url: str,
+        html: str,
+        result: ScrapeResult,
+        headers: Optional[httpx.Headers],
+    ) -> None:
+        """Cache a successful scrape. headers are the origin's HTTP response headers, if any."""
+        entry = {
+            "html": html,
+            "result": result.model_dump(mode="json", exclude={"from_cache"}),
+            "etag": headers.get("etag") if headers else None,
+            "last_modified": headers.get("last-modified") if headers else None,
+            "stored_at": time.time(),
+        }
+        await self._write(page_key(url), _encode(entry), self._retention)
+
+    async def website_summary(
+        self, prompt: str, params: dict, generate: Callable[[], Awaitable[str]]
+    ) -> str:
+        """Return the cached summary for an identical prompt and params, generating it once.
+
+        prompt is the fully rendered summary prompt; params are the completion
+        arguments (model, temperature, ...) passed alongside it.
+        """
+        key = _summary_key("website", prompt, params)
+        blob = await self._read(key)
+        if blob is not None:
+            self._counters["summary_hits"] += 1
+            logger.info("website_summary_cache_hit")
+            return blob.decode("utf-8")
+
+        self._counters["summary_misses"] += 1
+        summary = await generate()
+        await self._write(key, summary.encode("utf-8"), self._retention)
+        return summary
+
+    def stats(self) -> dict:
+        return dict(self._counters)
+
+    async def _revalidate(
+        self, url: str, entry: dict, headers: dict
+    ) -> tuple[bool, Optional[httpx.Response]]:
+        """Ask the origin whether the page changed: (unchanged, changed 200 response)."""
+        result = entry["result"]
+        if result.get("tier") != FetchTier.HTTP.value:
+            return False, None
+        conditional = dict(headers)
+        if entry.get("etag"):
+            conditional["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            conditional["If-Modified-Since"] = entry["last_modified"]
+        try:
+            response = await get_http_client().get(
+                url,
+                headers=conditional,
+                timeout=REVALIDATE_TIMEOUT,
+                follow_redirects=True,
+            )
+        except (httpx.HTTPError, RuntimeError) as e:
+            logger.info("scrape_cache_revalidate_failed", url=url, error=str(e))
+            return False, None
+
+        if response.status_code == 304:
+            return True, None
+        if response.status_code != 200:
+            return False, None
+        if content_hash(response.text) == result.get("content_hash"):
+            return True, None
+        return False, response
+
+    async def _read(self, key: str) -> Optional[bytes]:
+        if self._disk is None:
+            return None
+        try:
+            return await asyncio.to_thread(self._disk.get, key)
+        except sqlite3.Error as e:
+            logger.warning("scrape_cache_read_failed", error=str(e))
+            return None
+
+    async def _write(self, key: str, value: bytes, ttl: float) -> None:
+        if self._disk is None:
+            return
+        try:
+            await asyncio.to_thread(self._disk.set, key, value, ttl)
+        except sqlite3.Error as e:
+            logger.warning("scrape_cache_write_failed", error=str(e))
+
+
+def _to_result(entry: dict) -> ScrapeResult:
+    result = ScrapeResult.model_validate(entry["result"])
+    result.from_cache = True
+    return result
+
+
+_default_cache: Optional[ScrapeCache] = None
+
+
+def get_scrape_cache() -> ScrapeCache:
+    """Get the shared scrape cache instance."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ScrapeCache(
+            disk=open_disk_cache("scrape", SCRAPE_CACHE_MAX_MB * 1024 * 1024)
+        )
+    return _default_cache
@@ -1,13 +1,21 @@
 from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright
+from collections import Counter
 from structlog import get_logger  # type: ignore
 from urllib.parse import urlparse
 from urllib.robotparser import RobotFileParser
 from typing import Optional, List, Tuple, Dict
+import asyncio
 import httpx
+import os
 import re
 
+from core.infrastructure.browser_pool import USER_AGENT, get_browser_pool, settle_page
+from core.infrastructure.cache import LRUCache
+from core.infrastructure.http_client import get_http_client
+from services.html_extractor import extract_page_data, parse_html
+from services.scrape_cache import content_hash, get_scrape_cache
 from models.business_model import (
+    FetchTier,
     ScrapeResult,
     ScrapeWarning,
     ScrapeError,
@@ -17,6 +25,33 @@ from models.business_model import (
 
 logger = get_logger(__name__)
 
+# "auto": plain HTTP first, Playwright only when needed. "browser": always Playwright.
+SCRAPER_FETCH_MODE = os.getenv("SCRAPER_FETCH_MODE", "auto")
+
+ROBOTS_CACHE_TTL = 3600
+ROBOTS_ERROR_TTL = 300
+
+# Shared across ScraperService instances (several call sites create their own).
+_robots_cache = LRUCache(maxsize=2048)
+_robots_inflight: Dict[str, asyncio.Task] = {}
+_tier_counts: Counter = Counter()
+
+_HIDDEN_BLOCK_RE = re.compile(
+    r"<(script|style|noscript|template|svg)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL
+)
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def get_tier_stats() -> dict:
+    """Count of scrapes served per fetch tier, plus the fast-path hit rate."""
+    total = sum(_tier_counts.values())
+    return {
+        **{tier.value: _tier_counts[tier.value] for tier in FetchTier},
+        "http_hit_rate": round(_tier_counts[FetchTier.HTTP.value] / total, 4)
+        if total
+        else 0.0,
+    }
+
 
 class ScraperService:
     """Web scraper with detection and extraction capabilities."""
@@ -45,6 +80,26 @@ class ScraperService:
         ("Enable JavaScript and cookies", "js_required"),
     ]
 
+    # Lowercased markers checked in order; CAPTCHA markers take precedence.
+    # A single lowercase pass plus substring checks is several times faster
+    # in CPython than one case-insensitive alternation regex over the page.
+    BLOCK_MARKERS = tuple(
+        [(pattern.lower(), pattern, None) for pattern in CAPTCHA_PATTERNS]
+        + [
+            (pattern.lower(), pattern, provider)
+            for pattern, provider in BOT_PROTECTION_PATTERNS
+        ]
+    )
+
+    # Minimum visible text for server-rendered HTML to skip the browser
+    FAST_PATH_MIN_TEXT_CHARS = 400
+    FAST_PATH_TIMEOUT = 15.0
+    FAST_PATH_HEADERS = {
+        "User-Agent": USER_AGENT,
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.9",
+    }
+
     # HTTP status to block reason mapping
     STATUS_BLOCK_MAP = {
         403: BlockReason.HTTP_FORBIDDEN,
@@ -52,14 +107,25 @@ class ScraperService:
         503: BlockReason.SERVICE_UNAVAILABLE,
     }
 
-    async def scrape(self, url: str) -> ScrapeResult:
+    async def scrape(self, url: str, revalidate: bool = False) -> ScrapeResult:
         """
         Main entry point - scrape a website with permission detection.
 
+        Successful results are cached per normalized URL. A cached result is
+        reused while fresh, or after the origin confirms the page is unchanged;
+        revalidate=True always asks the origin first.
+
         Returns:
             ScrapeResult with success status, warnings, errors, and extracted data.
         """
         logger.info(f"[Scraper] Starting scrape for: {url}")
+        cache = get_scrape_cache()
+        cached, prefetched = await cache.lookup(
+            url, self.FAST_PATH_HEADERS, revalidate=revalidate
+        )
+        if cached:
+            return cached
+
         warnings: List[ScrapeWarning] = []
 
         # STEP 1: Check robots.txt (WARNING only - still proceed)
@@ -67,37 +133,38 @@ class ScraperService:
         if robots_warning:
             warnings.append(robots_warning)
 
-        # STEP 2: Fetch HTML with Playwright
-        html, error_result = await self._fetch_html(url, warnings)
+        # STEP 2: Fetch HTML (plain HTTP first, Playwright only when needed)
+        html, tier, response_headers, error_result = await self._fetch_tiered(
+            url, warnings, prefetched
+        )
         if error_result:
             return error_result
 
-        # STEP 3: Check for CAPTCHA (BLOCK)
-        captcha_error = self._detect_captcha(html)
-        if captcha_error:
-            return ScrapeResult(
-                success=False, url=url, warnings=warnings, error=captcha_error
-            )
-
-        # STEP 4: Check for bot protection (BLOCK)
-        bot_error = self._detect_bot_protection(html)
-        if bot_error:
-            return ScrapeResult(
-                success=False, url=url, warnings=warnings, error=bot_error
-            )
+        # STEP 3: Check for CAPTCHA / bot protection (BLOCK)
+        # The HTTP tier already rejected pages carrying any block marker.
+        if tier == FetchTier.BROWSER:
+            block_error = self._detect_blocking(html)
+            if block_error:
+                return ScrapeResult(
+                    success=False,
+                    url=url,
+                    warnings=warnings,
+                    error=block_error,
+                    tier=tier,
+                )
 
-        # STEP 5: Parse content
-        soup = BeautifulSoup(html, "html.parser")
+        # STEP 4: Parse content
+        soup = parse_html(html)
 
-        # STEP 6: Check meta robots (WARNING only)
+        # STEP 5: Check meta robots (WARNING only)
         meta_warning = self._check_meta_robots(soup)
         if meta_warning:
             warnings.append(meta_warning)
 
-        # STEP 7: Extract data
+        # STEP 6: Extract data
         data = self._extract_page_data(soup)
 
-        # STEP 8: Validate content (BLOCK if empty)
+        # STEP 7: Validate content (BLOCK if empty)
         if not self._validate_content(data):
             logger.warning(f"[Scraper] No meaningful content extracted from {url}")
             return ScrapeResult(
@@ -108,74 +175,109 @@ class ScraperService:
                     type=BlockReason.EMPTY_CONTENT,
                     message="No meaningful content extracted. The site may be blocking bots or the page is empty.",
                 ),
+                tier=tier,
             )
 
         # SUCCESS
         self._log_success(url, data, warnings)
-        return ScrapeResult(success=True, url=url, warnings=warnings, data=data)
+        result = ScrapeResult(
+            success=True,
+            url=url,
+            warnings=warnings,
+            data=data,
+            tier=tier,
+            content_hash=content_hash(html),
+        )
+        await cache.store(url, html, result, response_headers)
+        return result
 
     async def _check_robots_txt(self, url: str) -> Optional[ScrapeWarning]:
         """Check robots.txt for the given URL. Returns warning if disallowed."""
         try:
-            parsed = urlparse(url)
-            robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
+            rp = await self._get_robots_parser(url)
+        except Exception as e:
+            logger.warning(f"[Scraper] Error checking robots.txt: {e}")
+            return None
 
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(robots_url)
+        if not rp.can_fetch("*", url):
+            logger.warning(f"[Scraper] robots.txt disallows scraping: {url}")
+            return ScrapeWarning(
+                type=WarningType.ROBOTS_TXT,
+                message="This website's robots.txt discourages automated scraping. Proceeding anyway.",
+            )
 
-                if response.status_code == 404:
-                    logger.info(f"[Scraper] No robots.txt found for {parsed.netloc}")
-                    return None
+        return None
 
-                if response.status_code != 200:
+    async def _get_robots_parser(self, url: str) -> RobotFileParser:
+        """Return the cached robots.txt parser for the URL's host, fetching it once."""
+        parsed = urlparse(url)
+        origin = f"{parsed.scheme}://{parsed.netloc}"
+
+        rp = _robots_cache.get(origin)
+        if rp is not None:
+            return rp
+
+        task = _robots_inflight.get(origin)
+        if task is None:
+            task = asyncio.create_task(self._fetch_robots(origin))
+            _robots_inflight[origin] = task
+            task.add_done_callback(lambda _: _robots_inflight.pop(origin, None))
+        return await asyncio.shield(task)
+
+    async def _fetch_robots(self, origin: str) -> RobotFileParser:
+        """Fetch and cache robots.txt. Missing or unreadable files allow everything."""
+        rp = RobotFileParser()
+        ttl = ROBOTS_CACHE_TTL
+        try:
+            response = await get_http_client().get(
+                f"{origin}/robots.txt", timeout=10.0, follow_redirects=True
+            )
+            if response.status_code == 200:
+                rp.parse(response.text.splitlines())
+            else:
+                if response.status_code == 404:
+                    logger.info(f"[Scraper] No robots.txt found for {origin}")
+                else:
                     logger.warning(
                         f"[Scraper] Could not fetch robots.txt: HTTP {response.status_code}"
                     )
-                    return None
-
-                rp = RobotFileParser()
-                rp.parse(response.text.splitlines())
-
-                if not rp.can_fetch("*", url):
-                    logger.warning(f"[Scraper] robots.txt disallows scraping: {url}")
-                    return ScrapeWarning(
-                        type=WarningType.ROBOTS_TXT,
-                        message="This website's robots.txt discourages automated scraping. Proceeding anyway.",
-                    )
-
-                return None
-
-        except Exception as e:
-            logger.warning(f"[Scraper] Error checking robots.txt: {e}")
-            return None
-
-    def _detect_captcha(self, html: str) -> Optional[ScrapeError]:
-        """Detect CAPTCHA elements in the HTML."""
+                    ttl = ROBOTS_ERROR_TTL
+                rp.parse([])
+        except httpx.HTTPError as e:
+            logger.warning(f"[Scraper] Error fetching robots.txt: {e}")
+            rp.parse([])
+            ttl = ROBOTS_ERROR_TTL
+
+        _robots_cache.set(origin, rp, ttl=ttl)
+        return rp
+
+    def _find_block_marker(self, html: str) -> Optional[Tuple[str, str, Optional[str]]]:
+        """Return the first CAPTCHA/bot-protection marker present in the HTML."""
         html_lower = html.lower()
-
-        for pattern in self.CAPTCHA_PATTERNS:
-            if pattern.lower() in html_lower:
-                logger.warning(f"[Scraper] CAPTCHA detected: {pattern}")
-                return ScrapeError(
-                    type=BlockReason.CAPTCHA_REQUIRED,
-                    message="This website requires CAPTCHA verification. Unable to scrape.",
-                )
-
+        for marker in self.BLOCK_MARKERS:
+            if marker[0] in html_lower:
+                return marker
         return None
 
-    def _detect_bot_protection(self, html: str) -> Optional[ScrapeError]:
-        """Detect bot protection/challenge pages."""
-        for pattern, provider in self.BOT_PROTECTION_PATTERNS:
-            if pattern.lower() in html.lower():
-                logger.warning(
-                    f"[Scraper] Bot protection detected: {provider} - {pattern}"
-                )
-                return ScrapeError(
-                    type=BlockReason.BOT_PROTECTION,
-                    message=f"This website uses {provider} bot protection. Unable to scrape.",
-                )
+    def _detect_blocking(self, html: str) -> Optional[ScrapeError]:
+        """Detect CAPTCHA elements or bot protection/challenge pages."""
+        marker = self._find_block_marker(html)
+        if marker is None:
+            return None
 
-        return None
+        _, pattern, provider = marker
+        if provider is None:
+            logger.warning(f"[Scraper] CAPTCHA detected: {pattern}")
+            return ScrapeError(
+                type=BlockReason.CAPTCHA_REQUIRED,
+                message="This website requires CAPTCHA verification. Unable to scrape.",
+            )
+
+        logger.warning(f"[Scraper] Bot protection detected: {provider} - {pattern}")
+        return ScrapeError(
+            type=BlockReason.BOT_PROTECTION,
+            message=f"This website uses {provider} bot protection. Unable to scrape.",
+        )
 
     def _check_meta_robots(self, soup: BeautifulSoup) -> Optional[ScrapeWarning]:
         """Check for meta robots tags that discourage indexing."""
@@ -202,107 +304,7 @@ class ScraperService:
 
     def _extract_page_data(self, soup: BeautifulSoup) -> dict:
         """Extract structured data from the parsed HTML."""
-        return {
-            "title": soup.title.string.strip()
-            if soup.title and soup.title.string
-            else "",
-            "meta": {
-                "description": (
-                    soup.find("meta", attrs={"name": "description"})
-                    .get("content", "")
-                    .strip()
-                    if soup.find("meta", attrs={"name": "description"})
-                    else ""
-                ),
-                "keywords": (
-                    soup.find("meta", attrs={"name": "keywords"})
-                    .get("content", "")
-                    .strip()
-                    if soup.find("meta", attrs={"name": "keywords"})
-                    else ""
-                ),
-            },
-            "headings": {
-                tag: [h.get_text(strip=True) for h in soup.find_all(tag)]
-                for tag in ["h1", "h2", "h3", "h4", "h5", "h6"]
-            },
-            "paragraphs": [
-                p.get_text(strip=True)
-                for p in soup.find_all("p")
-                if p.get_text(strip=True)
-            ],
-            "spans": [
-                span.get_text(strip=True)
-                for span in soup.find_all("span")
-                if span.get_text(strip=True)
-            ],
-            "divs": [
-                div.get_text(strip=True)
-                for div in soup.find_all("div")
-                if div.get_text(strip=True)
-            ],
-            "lists": {
-                "unordered": [
-                    [li.get_text(strip=True) for li in ul.find_all("li")]
-                    for ul in soup.find_all("ul")
-                ],
-                "ordered": [
-                    [li.get_text(strip=True) for li in ol.find_all("li")]
-                    for ol in soup.find_all("ol")
-                ],
-            },
-            "tables": [
-                {
-                    "headers": [th.get_text(strip=True) for th in table.find_all("th")],
-                    "rows": [
-                        [td.get_text(strip=True) for td in row.find_all("td")]
-                        for row in table.find_all("tr")
-                        if row.find_all("td")
-                    ],
-                }
-                for table in soup.find_all("table")
-            ],
-            "links": [
-                {"text": a.get_text(strip=True), "href": a["href"]}
-                for a in soup.find_all("a", href=True)
-            ],
-            "images": [
-                {"alt": img.get("alt", ""), "src": img["src"]}
-                for img in soup.find_all("img", src=True)
-            ],
-            "iframes": [
-                {"src": iframe.get("src", ""), "title": iframe.get("title", "")}
-                for iframe in soup.find_all("iframe", src=True)
-            ],
-            "map_embeds": [
-                {
-                    "src": iframe.get("src", ""),
-                    "title": iframe.get("title", ""),
-                    "coordinates": self._extract_coordinates(iframe.get("src", "")),
-                }
-                for iframe in soup.find_all("iframe", src=True)
-                if iframe.get("src")
-                and (
-                    "google.com/maps" in iframe.get("src", "")
-                    or "maps.google.com" in iframe.get("src", "")
-                )
-            ],
-        }
-
-    def _extract_coordinates(self, url: str) -> Optional[Dict[str, float]]:
-        """
-        Extract lat/lng coordinates from Google Maps embed URL.
-        Pattern: !2d<longitude>!3d<latitude>
-        """
-        if not url:
-            return None
-        match = re.search(r"!2d([-\d.]+)!3d([-\d.]+)", url)
-        if match:
-            try:
-                return {"lng": float(match.group(1)), "lat": float(match.group(2))}
-            except ValueError:
-                return None
-        return None
+        return extract_page_data(soup)
 
     def _validate_content(self, data: dict) -> bool:
         """Validate that meaningful content was extracted."""
@@ -319,11 +321,103 @@ class ScraperService:
         """Map HTTP status codes to block reasons."""
         return self.STATUS_BLOCK_MAP.get(status_code, BlockReason.HTTP_FORBIDDEN)
 
+    async def _fetch_tiered(
+        self,
+        url: str,
+        warnings: List[ScrapeWarning],
+        prefetched: Optional[httpx.Response] = None,
+    ) -> Tuple[
+        Optional[str], FetchTier, Optional[httpx.Headers], Optional[ScrapeResult]
+    ]:
+        """
+        Fetch HTML via the cheapest tier that yields usable content.
+
+        prefetched is a 200 response already downloaded for this URL (by cache
+        revalidation); it is used as the HTTP tier's response when acceptable.
+
+        Returns:
+            Tuple of (html_content, tier, response_headers, error_result).
+            response_headers are only available from the HTTP tier.
+        """
+        if SCRAPER_FETCH_MODE != "browser":
+            if prefetched is not None:
+                response = self._accept_fast_response(url, prefetched)
+            else:
+                response = await self._fetch_html_fast(url)
+            if response is not None:
+                self._record_tier(url, FetchTier.HTTP)
+                return response.text, FetchTier.HTTP, response.headers, None
+
+        html, error_result = await self._fetch_html(url, warnings)
+        self._record_tier(url, FetchTier.BROWSER)
+        if error_result:
+            error_result.tier = FetchTier.BROWSER
+        return html, FetchTier.BROWSER, None, error_result
+
+    async def _fetch_html_fast(self, url: str) -> Optional[httpx.Response]:
+        """
+        Fetch HTML with a plain GET through the shared HTTP client.
+
+        Returns None when the browser tier should be used instead: the request
+        failed or was blocked, the response is not HTML, or the page looks
+        like it needs JavaScript to render its content.
+        """
+        try:
+            response = await get_http_client().get(
+                url,
+                headers=self.FAST_PATH_HEADERS,
+                timeout=self.FAST_PATH_TIMEOUT,
+                follow_redirects=True,
+            )
+        except (httpx.HTTPError, RuntimeError) as e:
+            logger.info(f"[Scraper] Fast path failed for {url}: {e}")
+            return None
+        return self._accept_fast_response(url, response)
+
+    def _accept_fast_response(
+        self, url: str, response: httpx.Response
+    ) -> Optional[httpx.Response]:
+        """Return response if it is usable server-rendered HTML, else None."""
+        if response.status_code != 200:
+            logger.info(
+                f"[Scraper] Fast path got HTTP {response.status_code} for {url}"
+            )
+            return None
+
+        content_type = response.headers.get("content-type", "")
+        if "html" not in content_type.lower():
+            logger.info(
+                f"[Scraper] Fast path got non-HTML content ({content_type}) for {url}"
+            )
+            return None
+
+        reason = self._fast_path_rejection(response.text)
+        if reason:
+            logger.info(f"[Scraper] Fast path rejected for {url}: {reason}")
+            return None
+        return response
+
+    def _fast_path_rejection(self, html: str) -> Optional[str]:
+        """Return why server-rendered HTML is not good enough, or None if it is."""
+        marker = self._find_block_marker(html)
+        if marker:
+            return f"block marker '{marker[1]}'"
+
+        text = _TAG_RE.sub(" ", _HIDDEN_BLOCK_RE.sub(" ", html))
+        visible_chars = len("".join(text.split()))
+        if visible_chars < self.FAST_PATH_MIN_TEXT_CHARS:
+            return f"too little visible text ({visible_chars} chars)"
+        return None
+
+    def _record_tier(self, url: str, tier: FetchTier) -> None:
+        _tier_counts[tier.value] += 1
+        logger.info(f"[Scraper] Fetched via {tier.value} tier: {url}")
+
     async def _fetch_html(
         self, url: str, warnings: List[ScrapeWarning]
     ) -> Tuple[Optional[str], Optional[ScrapeResult]]:
         """
-        Fetch HTML content using Playwright.
+        Fetch HTML content using a page from the shared browser pool.
 
         Returns:
             Tuple of (html_content, error_result)
@@ -331,21 +425,11 @@ class ScraperService:
             - If failed: (None, ScrapeResult with error)
         """
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                page = await browser.new_page()
-
-                await page.set_extra_http_headers(
-                    {
-                        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-                    }
-                )
-
+            async with get_browser_pool().page() as page:
                 response = await page.goto(url, wait_until="load", timeout=60000)
 
                 # Check HTTP status (BLOCK on 403/429/503)
                 if response and response.status in [403, 429, 503]:
-                    await browser.close()
                     logger.warning(f"[Scraper] HTTP {response.status} - Access denied")
                     return None, ScrapeResult(
                         success=False,
@@ -357,10 +441,8 @@ class ScraperService:
                         ),
                     )
 
-                await page.wait_for_timeout(5000)
-                html = await page.content()
-                await browser.close()
-                return html, None
+                await settle_page(page)
+                return await page.content(), None
 
         except Exception as e:
             error_str = str(e)
@@ -1,7 +1,7 @@
 from structlog import get_logger  # type: ignore
 from typing import Optional
 from fastapi import HTTPException
-from playwright.async_api import async_playwright
+from core.infrastructure.browser_pool import get_browser_pool, settle_page
 from exceptions.custom_exceptions import BusinessValidationException
 from models.business_model import ScreenshotResponse
 from oserver.utils.helpers import generate_filename_from_url
@@ -47,17 +47,13 @@ class ScreenshotService:
     async def _take_and_upload_screenshot(self, url: str) -> str:
         logger.info(f"[ScreenshotService] Taking screenshot → {url}")
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
-
+        async with get_browser_pool().page() as page:
             logger.info("[ScreenshotService] Navigating page...")
             await page.goto(url, wait_until="load", timeout=60000)
-            await page.wait_for_timeout(2000)
+            await settle_page(page)
 
             logger.info("[ScreenshotService] Capturing screenshot...")
             screenshot_bytes = await page.screenshot(full_page=True)
-            await browser.close()
 
         logger.info("[ScreenshotService] Uploading screenshot to storage...")
 
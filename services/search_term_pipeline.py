@@ -10,9 +10,9 @@ from structlog import get_logger  # type: ignore
 import requests
 from third_party.google.services import ads_service, keywords_service
 from services.search_term_analyzer import analyze_search_term_performance
-from services.openai_client import chat_completion
+from services.openai_client import chat_completion, evict_chat_completion
 from utils import google_dateutils as date_utils
-from oserver.services.connection import fetch_google_api_token_simple
+from oserver.services.token_provider import get_google_api_token
 from services.json_utils import safe_json_parse
 from utils.google_dateutils import format_date_range
 from utils.helpers import micros_to_rupees
@@ -48,9 +48,7 @@ class SearchTermPipeline:
         self.access_token = access_token
 
         self.developer_token = os.getenv("GOOGLE_ADS_DEVELOPER_TOKEN")
-        self.google_ads_access_token = os.getenv("GOOGLE_ADS_ACCESS_TOKEN") or fetch_google_api_token_simple(
-            client_code=client_code
-        )
+        self.google_ads_access_token = os.getenv("GOOGLE_ADS_ACCESS_TOKEN")
 
     # LLM Caller (no silent failures)
     async def _call_llm(self, system_msg: str, user_msg: str, label: str) -> dict:
@@ -60,7 +58,8 @@ class SearchTermPipeline:
                 {"role": "user", "content": user_msg},
             ]
 
-            response = await chat_completion(messages, model=self.OPENAI_MODEL)
+            # The same term is checked for every campaign it appears in.
+            response = await chat_completion(messages, model=self.OPENAI_MODEL, cache=True)
             content = (
                 response.choices[0].message.content.strip() if response.choices else ""
             )
@@ -69,6 +68,7 @@ class SearchTermPipeline:
 
             if not parsed:
                 logger.error("LLM JSON parsing failed", label=label)
+                evict_chat_completion(messages, model=self.OPENAI_MODEL)
                 return {}
 
             return parsed
@@ -175,6 +175,8 @@ class SearchTermPipeline:
     # Fetch search terms
     async def fetch_search_terms(self, customer_id: str = None) -> list:
         target_customer_id = customer_id or self.customer_id
+        if not self.google_ads_access_token:
+            self.google_ads_access_token = await get_google_api_token(self.client_code)
         endpoint = f"https://googleads.googleapis.com/v23/customers/{target_customer_id}/googleAds:search"
         headers = {
             "Authorization": f"Bearer {self.google_ads_access_token}",
@@ -0,0 +1,132 @@
+"""Benchmark HTML parsing + extraction over a corpus of saved pages.
+
+Reports parse, extract and block-marker time per MB of HTML so changes to
+services/html_extractor.py can be tracked over time.
+
+    python tests/benchmarks/bench_html_extraction.py --save https://example.com
+    python tests/benchmarks/bench_html_extraction.py --parser lxml --repeat 5
+
+Pages are read from --corpus (*.html). Saved pages are not committed; when
+the corpus is empty a deterministic synthetic corpus is generated instead.
+"""
+
+import argparse
+import hashlib
+import random
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from bs4 import BeautifulSoup  # noqa: E402
+
+from core.infrastructure.browser_pool import USER_AGENT  # noqa: E402
+from services.html_extractor import HTML_PARSER, extract_page_data  # noqa: E402
+from services.scraper_service import ScraperService  # noqa: E402
+
+DEFAULT_CORPUS = Path(__file__).parent / "pages"
+
+
+def save_pages(urls: list[str], corpus: Path) -> None:
+    corpus.mkdir(parents=True, exist_ok=True)
+    headers = {"User-Agent": USER_AGENT}
+    with httpx.Client(headers=headers, follow_redirects=True, timeout=30) as client:
+        for url in urls:
+            response = client.get(url)
+            name = hashlib.sha1(url.encode()).hexdigest()[:12]
+            path = corpus / f"{name}.html"
+            path.write_text(response.text, encoding="utf-8")
+            print(f"saved {url} -> {path} ({len(response.text) / 1024:.0f} KB)")
+
+
+def synthetic_pages() -> dict[str, str]:
+    rng = random.Random(7)
+    words = "custom modular kitchen wardrobe interior design bangalore quote".split()
+
+    def text(n: int) -> str:
+        return " ".join(rng.choice(words) for _ in range(n))
+
+    def section(i: int, depth: int) -> str:
+        return (
+            "<div class='wrap'>" * depth
+            + f"<h2>{text(4)}</h2><p>{text(rng.randint(20, 80))}</p>"
+            + f"<span>{text(3)}</span><a href='/p/{i}'>{text(2)}</a>"
+            + f"<ul><li>{text(3)}</li><li>{text(3)}</li></ul><img src='/i/{i}.jpg' alt='{text(2)}'>"
+            + "</div>" * depth
+        )
+
+    def page(sections: int, depth: int) -> str:
+        body = "".join(section(i, depth) for i in range(sections))
+        return f"<html><head><title>{text(5)}</title><script>{'x' * 5000}</script></head><body>{body}</body></html>"
+
+    return {
+        "synthetic-flat": page(1500, 3),
+        "synthetic-nested": page(300, 40),
+        "synthetic-small": page(60, 5),
+    }
+
+
+def load_corpus(corpus: Path) -> dict[str, str]:
+    pages = {
+        p.name: p.read_text(encoding="utf-8", errors="replace")
+        for p in sorted(corpus.glob("*.html"))
+    }
+    return pages or synthetic_pages()
+
+
+def bench(pages: dict[str, str], parser: str, repeat: int) -> None:
+    scraper = ScraperService()
+    totals = {"parse": 0.0, "extract": 0.0, "markers": 0.0}
+    total_mb = 0.0
+
+    print(f"parser={parser} repeat={repeat}")
+    print(f"{'page':<28}{'KB':>8}{'parse ms':>11}{'extract ms':>12}{'markers ms':>12}")
+    for name, html in pages.items():
+        size_mb = len(html.encode("utf-8")) / 1_000_000
+        best = {key: float("inf") for key in totals}
+        for _ in range(repeat):
+            start = time.perf_counter()
+            soup = BeautifulSoup(html, parser)
+            parsed = time.perf_counter()
+            extract_page_data(soup)
+            extracted = time.perf_counter()
+            scraper._find_block_marker(html)
+            done = time.perf_counter()
+            best["parse"] = min(best["parse"], parsed - start)
+            best["extract"] = min(best["extract"], extracted - parsed)
+            best["markers"] = min(best["markers"], done - extracted)
+
+        for key in totals:
+            totals[key] += best[key]
+        total_mb += size_mb
+        print(
+            f"{name[:27]:<28}{size_mb * 1000:>8.0f}{best['parse'] * 1000:>11.1f}"
+            f"{best['extract'] * 1000:>12.1f}{best['markers'] * 1000:>12.2f}"
+        )
+
+    print(f"\ncorpus: {len(pages)} pages, {total_mb:.2f} MB")
+    for key, seconds in totals.items():
+        print(f"{key:<8} {seconds / total_mb * 1000:8.1f} ms/MB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS)
+    parser.add_argument("--parser", default=HTML_PARSER, help="html.parser or lxml")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--save", nargs="+", metavar="URL", help="fetch URLs into the corpus and exit"
+    )
+    args = parser.parse_args()
+
+    if args.save:
+        save_pages(args.save, args.corpus)
+        return
+    bench(load_corpus(args.corpus), args.parser, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Compare the torch and quantized ONNX encoders used by AdPerformancePredictor.
+
+Reports encode throughput, process RSS after loading, and how closely the
+ONNX embeddings match torch (cosine similarity per keyword). Use it to check
+a new AD_PREDICTOR_ONNX_FILE before switching AD_PREDICTOR_ENCODER_BACKEND.
+
+    pip install "optimum[onnxruntime]"
+    python tests/benchmarks/bench_sentence_encoder.py --onnx-file onnx/model_qint8_avx512.onnx
+"""
+
+import argparse
+import resource
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from sentence_transformers import SentenceTransformer  # noqa: E402
+
+from mlops.google_search.performance.ad_performance_predictor import (  # noqa: E402
+    ONNX_MODEL_FILE,
+    SENTENCE_MODEL_NAME,
+)
+
+KEYWORDS = [
+    f"{prefix} {subject} {place}"
+    for prefix in ("best", "affordable", "luxury", "custom", "near me")
+    for subject in ("modular kitchen", "wardrobe", "interior designer", "villa", "sofa")
+    for place in ("bangalore", "mumbai", "pune", "online")
+]
+
+
+def rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def bench(
+    model: SentenceTransformer, batch: int, repeat: int
+) -> tuple[np.ndarray, float]:
+    model.encode(KEYWORDS[:batch])
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        embeddings = model.encode(KEYWORDS[:batch])
+        best = min(best, time.perf_counter() - start)
+    return np.asarray(embeddings), best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--onnx-file", default=ONNX_MODEL_FILE)
+    parser.add_argument("--batch", type=int, default=len(KEYWORDS))
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    base_rss = rss_mb()
+    onnx = SentenceTransformer(
+        SENTENCE_MODEL_NAME, backend="onnx", model_kwargs={"file_name": args.onnx_file}
+    )
+    onnx_rss = rss_mb() - base_rss
+    onnx_emb, onnx_s = bench(onnx, args.batch, args.repeat)
+
+    torch_model = SentenceTransformer(SENTENCE_MODEL_NAME)
+    torch_emb, torch_s = bench(torch_model, args.batch, args.repeat)
+
+    cosine = np.sum(onnx_emb * torch_emb, axis=1) / (
+        np.linalg.norm(onnx_emb, axis=1) * np.linalg.norm(torch_emb, axis=1)
+    )
+    print(f"keywords={args.batch} repeat={args.repeat}")
+    print(f"torch  {torch_s * 1000:8.1f} ms")
+    print(
+        f"onnx   {onnx_s * 1000:8.1f} ms  ({torch_s / onnx_s:.1f}x)  +{onnx_rss:.0f} MB RSS"
+    )
+    print(f"cosine min={cosine.min():.4f} mean={cosine.mean():.4f}")
+
+
+if __name__ == "__main__":
+    main()
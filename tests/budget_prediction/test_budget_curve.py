@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LinearRegression
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+
+from exceptions.custom_exceptions import PredictionException
+from mlops.google_search.budget_prediction.predictor import (
+    FEATURE_COLUMNS,
+    BudgetPredictor,
+)
+
+
+def _training_frame() -> tuple[pd.DataFrame, np.ndarray]:
+    rng = np.random.default_rng(7)
+    conversions = rng.integers(1, 500, 200)
+    clicks = conversions * rng.uniform(5, 20, 200)
+    duration = rng.integers(7, 90, 200)
+    cost = clicks * rng.uniform(8, 30, 200)
+    X = np.log1p(
+        pd.DataFrame(
+            np.column_stack([clicks, conversions, duration]), columns=FEATURE_COLUMNS
+        )
+    )
+    return X, np.log1p(cost)
+
+
+def _predictor(model) -> BudgetPredictor:
+    predictor = BudgetPredictor(model_path="unused.pkl")
+    predictor.model = model.fit(*_training_frame())
+    predictor._is_loaded = True
+    return predictor
+
+
+@pytest.mark.parametrize(
+    "model", [LinearRegression(), make_pipeline(StandardScaler(), LinearRegression())]
+)
+def test_curve_matches_single_predictions(model):
+    predictor = _predictor(model)
+    conversions, durations, rates = [1, 10, 75, 300], [7, 30, 60], [3.5, 12.0]
+
+    curve = predictor.predict_curve(conversions, durations, rates, buffer_percent=0.15)
+
+    assert len(curve.points) == 24
+    for point in curve.points:
+        single = predictor.predict(
+            conversions=point.conversions,
+            duration_days=point.duration_days,
+            expected_conversion_rate=point.expected_conversion_rate,
+            buffer_percent=0.15,
+        )
+        assert point.suggested_budget == single.suggested_budget
+        assert point.base_cost_prediction == single.base_cost_prediction
+    assert [p.conversions for p in curve.points[:6]] == [1] * 6
+
+
+def test_curve_rejects_invalid_rates_and_oversized_grids():
+    predictor = _predictor(LinearRegression())
+
+    with pytest.raises(PredictionException):
+        predictor.predict_curve([10], [30], [12.0, 0.0])
+    with pytest.raises(PredictionException):
+        predictor.predict_curve(list(range(1, 101)), list(range(1, 101)), [12.0])
@@ -4,6 +4,7 @@ Provides database setup, cleanup, and sample data fixtures.
 """
 
 import os
+import pytest
 import pytest_asyncio  # type: ignore
 from typing import AsyncGenerator
 from dotenv import load_dotenv
@@ -20,6 +21,24 @@ else:
     load_dotenv(override=False)
 
 
+@pytest.fixture(autouse=True)
+def isolated_disk_caches(tmp_path, monkeypatch):
+    """Keep disk-backed caches out of the repo's .cache and fresh for each test."""
+    from adapters.google import query_cache
+    from core.infrastructure import cache, embedding_cache
+    from services import scrape_cache
+
+    monkeypatch.setattr(cache, "CACHE_DIR", str(tmp_path / "cache"))
+    modules = (query_cache, embedding_cache, scrape_cache)
+    for module in modules:
+        monkeypatch.setattr(module, "_default_cache", None)
+    yield
+    for module in modules:
+        opened = module._default_cache
+        if opened is not None and opened._disk is not None:
+            opened._disk.close()
+
+
 @pytest_asyncio.fixture(scope="function")
 async def test_engine() -> AsyncGenerator[AsyncEngine, None]:
     
@@ -0,0 +1,69 @@
+import hashlib
+import pickle
+import tempfile
+import unittest
+
+import httpx
+
+from core.infrastructure import http_client
+from mlops.artifacts import ArtifactCache, ArtifactChecksumError
+
+URL = "https://files.test/models/budget.pkl"
+PAYLOAD = pickle.dumps({"coef": [0.4, 1.2]})
+SHA256 = hashlib.sha256(PAYLOAD).hexdigest()
+
+
+class TestArtifactCache(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.requests: list[httpx.Request] = []
+        self.payload = PAYLOAD
+        self.fail = False
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            if self.fail:
+                raise httpx.ConnectError("file server down")
+            if (
+                request.headers.get("if-none-match") == '"v1"'
+                and self.payload == PAYLOAD
+            ):
+                return httpx.Response(304)
+            return httpx.Response(200, content=self.payload, headers={"etag": '"v1"'})
+
+        http_client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.cache = ArtifactCache(directory.name)
+
+    async def asyncTearDown(self):
+        await http_client.close_http_client()
+
+    async def test_pinned_version_is_served_from_disk(self):
+        first = await self.cache.load(URL, "model", sha256=SHA256, version="2026-10")
+        second = await self.cache.load(URL, "model", sha256=SHA256, version="2026-10")
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.requests), 1)
+
+    async def test_unpinned_copy_is_revalidated_and_survives_outage(self):
+        await self.cache.load(URL, "model")
+        await self.cache.load(URL, "model")
+        self.fail = True
+        artifact = await self.cache.load(URL, "model")
+
+        self.assertEqual(artifact, {"coef": [0.4, 1.2]})
+        self.assertEqual(self.requests[1].headers["if-none-match"], '"v1"')
+        self.assertEqual(len(self.requests), 3)
+
+    async def test_checksum_mismatch_is_rejected(self):
+        self.payload = pickle.dumps({"coef": "tampered"})
+
+        with self.assertRaises(ArtifactChecksumError):
+            await self.cache.load(URL, "model", sha256=SHA256, version="2026-10")
+        self.fail = True
+        with self.assertRaises(httpx.ConnectError):
+            await self.cache.load(URL, "model", sha256=SHA256, version="2026-10")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+import tempfile
+import unittest
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+
+from mlops.google_search.performance.keyword_embeddings import KeywordEmbeddingCache
+from tests.prediction.test_inference_executor import (
+    REQUESTS,
+    FakeEncoder,
+    make_predictor,
+)
+
+
+def legacy_features(predictor, request, embeddings) -> pd.DataFrame:
+    """The original dict-replicate / concat / reindex construction, kept as the reference."""
+    match_types = [item["match_type"] for item in request.keyword_data]
+    now = datetime.now()
+    base_features = {
+        "Year": now.year,
+        "Month": now.month,
+        "Week_of_Year": now.isocalendar()[1],
+        "Cost": request.total_budget / len(request.keyword_data),
+    }
+    X_batch = pd.DataFrame([base_features] * len(request.keyword_data))
+    emb_cols = [f"Keyword_Embedding_{i}" for i in range(embeddings.shape[1])]
+    X_batch = pd.concat([X_batch, pd.DataFrame(embeddings, columns=emb_cols)], axis=1)
+    X_batch[f"Ad_Group_Bid_Strategy_Type_{request.bid_strategy}"] = 1
+    for m_type in set(match_types):
+        X_batch.loc[
+            [i for i, mt in enumerate(match_types) if mt == m_type],
+            f"Search_Terms_Match_Type_{m_type}",
+        ] = 1
+    key = "monthly_columns" if request.period == "Monthly" else "weekly_columns"
+    return X_batch.reindex(columns=predictor.reference_columns[key], fill_value=0)
+
+
+class TestFeatureLayout(unittest.TestCase):
+    def test_matches_legacy_dataframe_construction(self):
+        predictor = make_predictor()
+        encoder = FakeEncoder()
+
+        for period in ("Monthly", "Weekly"):
+            requests = [r for r in REQUESTS if r.period == period]
+            embeddings = np.concatenate(
+                [
+                    encoder.encode([k["keyword"] for k in r.keyword_data])
+                    for r in requests
+                ]
+            )
+
+            built = predictor.feature_layouts[period].build(
+                requests, embeddings, datetime.now()
+            )
+            expected = pd.concat(
+                [
+                    legacy_features(
+                        predictor,
+                        r,
+                        encoder.encode([k["keyword"] for k in r.keyword_data]),
+                    )
+                    for r in requests
+                ],
+                ignore_index=True,
+            )
+
+            self.assertEqual(list(built.columns), list(expected.columns))
+            np.testing.assert_allclose(built.to_numpy(), expected.to_numpy(dtype=float))
+
+
+class TestKeywordEmbeddingCache(unittest.TestCase):
+    def test_encodes_each_keyword_once(self):
+        encoder = MagicMock(side_effect=FakeEncoder().encode)
+        cache = KeywordEmbeddingCache("fake", dims=4, directory=None)
+
+        first = cache.get_many(["kitchen", "wardrobe", "kitchen"], encoder)
+        second = cache.get_many(["wardrobe", "villa"], encoder)
+
+        self.assertEqual(
+            [c.args[0] for c in encoder.call_args_list],
+            [["kitchen", "wardrobe"], ["villa"]],
+        )
+        np.testing.assert_array_equal(first[0], first[2])
+        np.testing.assert_array_equal(first[1], second[0])
+        self.assertEqual(cache.stats()["misses"], 3)
+
+    def test_memmap_survives_restart_and_stops_when_full(self):
+        with tempfile.TemporaryDirectory() as directory:
+            encoder = MagicMock(side_effect=FakeEncoder().encode)
+            cache = KeywordEmbeddingCache(
+                "fake/model", dims=4, directory=directory, memmap_rows=2
+            )
+            expected = cache.get_many(["kitchen", "wardrobe", "villa"], encoder)
+
+            reopened = KeywordEmbeddingCache(
+                "fake/model", dims=4, directory=directory, memmap_rows=2
+            )
+            encoder.reset_mock()
+            restored = reopened.get_many(["kitchen", "wardrobe", "villa"], encoder)
+
+            np.testing.assert_array_equal(restored, expected)
+            encoder.assert_called_once_with(["villa"])
+            self.assertEqual(reopened.stats()["disk_hits"], 2)
+
+    def test_stores_sharing_a_directory_never_overwrite_each_other(self):
+        with tempfile.TemporaryDirectory() as directory:
+            encode = FakeEncoder().encode
+            a = KeywordEmbeddingCache("fake", dims=4, directory=directory)
+            b = KeywordEmbeddingCache("fake", dims=4, directory=directory)
+            expected = {}
+            for cache, keywords in (
+                (a, ["kitchen", "villa"]),
+                (b, ["wardrobe"]),
+                (a, ["loft"]),
+            ):
+                for keyword, row in zip(keywords, cache.get_many(keywords, encode)):
+                    expected[keyword] = row
+
+            reopened = KeywordEmbeddingCache("fake", dims=4, directory=directory)
+            encoder = MagicMock(side_effect=encode)
+            restored = reopened.get_many(list(expected), encoder)
+
+            encoder.assert_not_called()
+            np.testing.assert_array_equal(restored, np.stack(list(expected.values())))
+
+
+if __name__ == "__main__":
+    unittest.main()
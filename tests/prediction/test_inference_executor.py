@@ -0,0 +1,186 @@
+import asyncio
+import hashlib
+import time
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from mlops.google_search.performance import AdPerformancePredictor
+from mlops.google_search.performance.ad_performance_predictor import PerformanceRequest
+from mlops.google_search.performance.inference_executor import InferenceExecutor
+
+EMBEDDING_DIMS = 4
+BASE_COLUMNS = ["Year", "Month", "Week_of_Year", "Cost"]
+EMBEDDING_COLUMNS = [f"Keyword_Embedding_{i}" for i in range(EMBEDDING_DIMS)]
+ONE_HOT_COLUMNS = [
+    "Ad_Group_Bid_Strategy_Type_Maximize Conversions",
+    "Ad_Group_Bid_Strategy_Type_Manual CPC",
+    "Search_Terms_Match_Type_Exact match",
+    "Search_Terms_Match_Type_Broad match",
+]
+
+
+class FakeEncoder:
+    def encode(self, keywords):
+        return np.array(
+            [
+                [b / 255 for b in hashlib.sha256(k.encode()).digest()[:EMBEDDING_DIMS]]
+                for k in keywords
+            ],
+            dtype=np.float32,
+        )
+
+
+class FakeModel:
+    def __init__(self, scale: float):
+        self.scale = scale
+
+    def predict(self, X):
+        values = X.to_numpy(dtype=float)
+        return np.log1p(values[:, 3] * self.scale) + values[:, 4:].sum(axis=1) * 0.1
+
+
+def make_predictor() -> AdPerformancePredictor:
+    predictor = AdPerformancePredictor("lgbm.pkl", "sigmas.pkl", "columns.pkl")
+    predictor.models = {
+        f"{period}_{target}_Model": FakeModel(scale)
+        for period in ("Monthly", "Weekly")
+        for target, scale in (
+            ("Impressions", 40.0),
+            ("Clicks", 2.0),
+            ("Conversions", 0.1),
+        )
+    }
+    predictor.uncertainty_sigmas = {key: 0.2 for key in predictor.models}
+    predictor.reference_columns = {
+        "monthly_columns": BASE_COLUMNS + EMBEDDING_COLUMNS + ONE_HOT_COLUMNS,
+        "weekly_columns": BASE_COLUMNS + EMBEDDING_COLUMNS[:2] + ONE_HOT_COLUMNS[2:],
+    }
+    predictor.sentence_model = FakeEncoder()
+    predictor.prepare_inference()
+    predictor._is_loaded = True
+    return predictor
+
+
+REQUESTS = [
+    PerformanceRequest(
+        [
+            {"keyword": "modular kitchen bangalore", "match_type": "Exact match"},
+            {"keyword": "kitchen designers near me", "match_type": "Broad match"},
+        ],
+        50000,
+        "Maximize Conversions",
+        "Monthly",
+    ),
+    PerformanceRequest(
+        [{"keyword": "wardrobe price", "match_type": "Broad match"}],
+        8000,
+        "Manual CPC",
+        "Weekly",
+    ),
+    PerformanceRequest(
+        [
+            {"keyword": "luxury villas", "match_type": "Exact match"},
+            {"keyword": "villa interiors", "match_type": "Exact match"},
+            {"keyword": "interior designer", "match_type": "Broad match"},
+        ],
+        120000,
+        "Manual CPC",
+        "Monthly",
+    ),
+]
+
+
+def as_kwargs(request: PerformanceRequest) -> dict:
+    return {
+        "keyword_data": request.keyword_data,
+        "total_budget": request.total_budget,
+        "bid_strategy": request.bid_strategy,
+        "period": request.period,
+    }
+
+
+class TestPredictBatch(unittest.TestCase):
+    def test_batch_matches_individual_predictions(self):
+        predictor = make_predictor()
+
+        individual = [predictor.predict(**as_kwargs(r)) for r in REQUESTS]
+
+        self.assertEqual(predictor.predict_batch(REQUESTS), individual)
+
+
+class TestInferenceExecutor(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.predictor = make_predictor()
+        self.executor = InferenceExecutor(self.predictor, window_ms=20, workers=1)
+
+    async def asyncTearDown(self):
+        await self.executor.close()
+
+    async def test_concurrent_requests_share_one_batch(self):
+        expected = [self.predictor.predict(**as_kwargs(r)) for r in REQUESTS]
+
+        with patch.object(
+            self.predictor, "predict_batch", wraps=self.predictor.predict_batch
+        ) as predict_batch:
+            results = await asyncio.gather(
+                *(self.executor.predict(**as_kwargs(r)) for r in REQUESTS)
+            )
+
+        self.assertEqual(results, expected)
+        predict_batch.assert_called_once()
+        stats = self.executor.stats()
+        self.assertEqual(stats["batch_size"]["count"], 1)
+        self.assertEqual(stats["batch_size"]["buckets"]["<=4"], 1)
+        self.assertEqual(stats["queue_latency_ms"]["count"], len(REQUESTS))
+
+    async def test_invalid_request_fails_alone(self):
+        bad = {**as_kwargs(REQUESTS[0]), "period": "Daily"}
+
+        results = await asyncio.gather(
+            self.executor.predict(**bad),
+            self.executor.predict(**as_kwargs(REQUESTS[1])),
+            return_exceptions=True,
+        )
+
+        self.assertIsInstance(results[0], ValueError)
+        self.assertEqual(results[1].timeframe, "Weekly")
+
+    async def test_inference_does_not_block_event_loop(self):
+        original = self.predictor.predict_batch
+
+        def slow_batch(requests):
+            time.sleep(0.2)
+            return original(requests)
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticking = asyncio.create_task(ticker())
+        with patch.object(self.predictor, "predict_batch", side_effect=slow_batch):
+            await self.executor.predict(**as_kwargs(REQUESTS[0]))
+        ticking.cancel()
+
+        self.assertGreater(ticks, 5)
+
+    async def test_batches_split_at_keyword_limit(self):
+        self.executor.max_batch_keywords = 3
+
+        results = await asyncio.gather(
+            *(self.executor.predict(**as_kwargs(r)) for r in REQUESTS)
+        )
+
+        self.assertEqual(
+            [r.timeframe for r in results], ["Monthly", "Weekly", "Monthly"]
+        )
+        self.assertEqual(self.executor.stats()["batch_size"]["count"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
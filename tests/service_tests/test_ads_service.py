@@ -0,0 +1,170 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from services.ads_service import AdAssetsGenerator
+from utils.near_duplicates import NearDuplicateIndex
+
+HEADLINES = [
+    "Modular Kitchens In Bangalore",
+    "Free Design Visit This Week",
+    "Wardrobes Built To Your Size",
+    "Interiors Delivered On Time",
+    "Premium Finishes, Fair Price",
+    "Ten Year Warranty Included",
+    "See Our 3D Kitchen Previews",
+    "Homeowners Trust Acme Studio",
+    "Compact Flats, Smart Storage",
+    "Turnkey Villa Interior Work",
+    "Zero Cost EMI Options Open",
+    "Chat With An Expert Planner",
+    "German Hardware, Soft Close",
+    "Quartz Counters Now On Sale",
+    "Book Your Showroom Slot Now",
+    "Loved By 5000+ Families",
+    "Pooja Units & Crockery Racks",
+    "Kids Rooms Full Of Colour",
+    "Office Fitouts Done Quickly",
+    "Get A Quote Within One Day",
+]
+DESCRIPTIONS = [
+    "Custom modular kitchens designed, built and installed within forty five days flat.",
+    "Book a free home visit and get a detailed 3D design with transparent line pricing.",
+    "Wardrobes, lofts and storage units made to measure with a ten year warranty on all.",
+    "Our planners handle civil work, electricals and painting so you move in stress free.",
+    "Visit the Indiranagar showroom to touch every finish before you sign off on designs.",
+    "Zero cost EMI plans and seasonal offers make a premium interior easy on your budget.",
+]
+
+
+def attempt_result(headlines, descriptions, audience=None):
+    return {
+        "filtered": {"headlines": [], "descriptions": [], "audience": audience or {}},
+        "raw_headlines": headlines,
+        "raw_descriptions": descriptions,
+    }
+
+
+class TestNearDuplicateIndex(unittest.TestCase):
+    def test_matches_close_variants_only(self):
+        index = NearDuplicateIndex(threshold=0.8)
+        index.add("Custom Modular Kitchens Bangalore")
+
+        self.assertIsNotNone(index.match("custom modular kitchen bangalore"))
+        self.assertIsNone(index.match("Affordable Luxury Wardrobes"))
+
+    def test_grows_past_initial_capacity(self):
+        index = NearDuplicateIndex(threshold=0.9)
+        for i in range(40):
+            index.add(f"{i:03d} " + "abcdefghijklmnopqrstuvwxyz"[i % 26] * (i + 3))
+
+        self.assertEqual(len(index.texts), 40)
+        self.assertIsNotNone(index.match(index.texts[-1]))
+
+
+class TestAdAssetsGenerator(unittest.IsolatedAsyncioTestCase):
+    async def test_dedup_keeps_first_of_near_duplicates(self):
+        generator = AdAssetsGenerator()
+        items = [
+            "Custom Modular Kitchens Bangalore",
+            "CUSTOM MODULAR KITCHENS BANGALORE",
+            "Custom Modular Kitchen Bangalore",
+            "Affordable Luxury Wardrobes",
+        ]
+
+        deduped = generator._deduplicate_items(items, similarity_threshold=0.8)
+
+        self.assertEqual(
+            deduped,
+            ["Custom Modular Kitchens Bangalore", "Affordable Luxury Wardrobes"],
+        )
+
+    async def test_parallel_merges_pools_and_stops_early(self):
+        generator = AdAssetsGenerator(max_attempts=3, parallel=True, hedge_delay=5)
+        temperatures = []
+
+        async def attempt(summary, keywords, config):
+            temperatures.append(config["temp"])
+            if config["temp"] < 0.75:
+                return attempt_result(
+                    HEADLINES[:10], DESCRIPTIONS[:2], {"gender": ["MALE"]}
+                )
+            await asyncio.sleep(0.01)
+            return attempt_result(HEADLINES[10:], DESCRIPTIONS[2:])
+
+        with patch.object(generator, "_generate_single_attempt", side_effect=attempt):
+            result = await asyncio.wait_for(
+                generator.generate("summary", []), timeout=1
+            )
+
+        self.assertEqual(len(result["headlines"]), generator.min_headlines)
+        self.assertEqual(len(result["descriptions"]), generator.min_descriptions)
+        self.assertEqual(result["audience"], {"gender": ["MALE"]})
+        self.assertEqual(len(temperatures), 2)
+
+    async def test_parallel_issues_one_call_when_first_attempt_suffices(self):
+        generator = AdAssetsGenerator(max_attempts=3, parallel=True, hedge_delay=5)
+        calls = 0
+
+        async def attempt(summary, keywords, config):
+            nonlocal calls
+            calls += 1
+            return attempt_result(HEADLINES, DESCRIPTIONS)
+
+        with patch.object(generator, "_generate_single_attempt", side_effect=attempt):
+            await generator.generate("summary", [])
+
+        self.assertEqual(calls, 1)
+
+    async def test_parallel_hedges_slow_attempt_and_filters_in_attempt_order(self):
+        generator = AdAssetsGenerator(max_attempts=3, parallel=True, hedge_delay=0.01)
+        slow_cancelled = asyncio.Event()
+
+        async def attempt(summary, keywords, config):
+            if config["temp"] < 0.75:
+                await asyncio.sleep(0.05)
+                return attempt_result(HEADLINES, DESCRIPTIONS, {"gender": ["MALE"]})
+            if config["temp"] < 0.85:
+                # Arrives first and would pass on its own looser config.
+                return attempt_result(HEADLINES, DESCRIPTIONS, {"gender": ["FEMALE"]})
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                slow_cancelled.set()
+                raise
+
+        with patch.object(generator, "_generate_single_attempt", side_effect=attempt):
+            result = await asyncio.wait_for(
+                generator.generate("summary", []), timeout=1
+            )
+            await asyncio.sleep(0)
+
+        self.assertEqual(result["audience"], {"gender": ["MALE"]})
+        self.assertTrue(slow_cancelled.is_set())
+
+    async def test_parallel_falls_back_to_rescue_pool(self):
+        generator = AdAssetsGenerator(max_attempts=2, parallel=True)
+
+        async def attempt(summary, keywords, config):
+            if config["temp"] < 0.75:
+                raise RuntimeError("rate limited")
+            return attempt_result(HEADLINES[:3], DESCRIPTIONS[:1])
+
+        with patch.object(generator, "_generate_single_attempt", side_effect=attempt):
+            result = await generator.generate("summary", [])
+
+        self.assertEqual(len(result["headlines"]), 3)
+        self.assertEqual(result["audience"], {})
+
+    async def test_parallel_raises_when_every_attempt_fails(self):
+        generator = AdAssetsGenerator(max_attempts=2, parallel=True)
+
+        with patch.object(
+            generator, "_generate_single_attempt", side_effect=RuntimeError("down")
+        ):
+            with self.assertRaises(RuntimeError):
+                await generator.generate("summary", [])
+
+
+if __name__ == "__main__":
+    unittest.main()
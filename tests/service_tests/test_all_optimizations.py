@@ -0,0 +1,88 @@
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from agents.optimization import all_optimizations_agent as module
+from agents.optimization.all_optimizations_agent import AllOptimizationsAgent
+from agents.optimization.runner import OptimizationRunner
+from agents.optimization.snapshot import OptimizationSnapshot
+from core.models.optimization import (
+    CampaignRecommendation,
+    GenderFieldRecommendation,
+    OptimizationFields,
+)
+
+
+def gender_rec(campaign_id: str, ad_group_id: str) -> CampaignRecommendation:
+    return CampaignRecommendation(
+        platform="GOOGLE",
+        parent_account_id="9",
+        account_id="1",
+        product_id="p1",
+        campaign_id=campaign_id,
+        campaign_name=campaign_id,
+        campaign_type="SEARCH",
+        fields=OptimizationFields(
+            gender=[
+                GenderFieldRecommendation(
+                    ad_group_id=ad_group_id,
+                    ad_group_name=f"group {ad_group_id}",
+                    gender_type="MALE",
+                    recommendation="ADD",
+                    reason="converts",
+                )
+            ]
+        ),
+    )
+
+
+class FakeAgent:
+    def __init__(self, recs=None, error=None):
+        self.recs = recs or []
+        self.error = error
+        self.snapshots = []
+
+    async def collect(self, snapshot, store=True):
+        self.snapshots.append((snapshot, store))
+        if self.error:
+            raise self.error
+        return self.recs
+
+
+class TestAllOptimizationsAgent(unittest.IsolatedAsyncioTestCase):
+    async def test_shares_snapshot_and_stores_one_record_per_campaign(self):
+        snapshot = OptimizationSnapshot("c1", [{"customer_id": "1"}], {})
+        storage = AsyncMock()
+        agents = {
+            "gender": FakeAgent([gender_rec("10", "a"), gender_rec("10", "b")]),
+            "age": FakeAgent([gender_rec("11", "c")]),
+            "keywords": FakeAgent(error=RuntimeError("planner quota")),
+        }
+        agent = AllOptimizationsAgent.__new__(AllOptimizationsAgent)
+        agent.accounts_adapter = None
+        agent.AGENTS = agents
+
+        runner = OptimizationRunner(storage=storage)
+        load = AsyncMock(return_value=snapshot)
+
+        with (
+            patch.object(module, "load_snapshot", load),
+            patch.object(module, "optimization_runner", runner),
+        ):
+            result = await agent.generate_recommendations("c1")
+
+        load.assert_awaited_once()
+        for fake in agents.values():
+            self.assertEqual(fake.snapshots, [(snapshot, False)])
+        self.assertEqual(storage.store.await_count, 2)
+        stored = {
+            c.args[0].campaign_id: c.args[0] for c in storage.store.await_args_list
+        }
+        self.assertEqual(
+            [g.ad_group_id for g in stored["10"].fields.gender], ["a", "b"]
+        )
+        self.assertEqual(result["dimensions"]["keywords"]["status"], "failed")
+        self.assertEqual(result["dimensions"]["gender"]["recommendations"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
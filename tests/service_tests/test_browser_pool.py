@@ -0,0 +1,125 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from core.infrastructure.browser_pool import BrowserPool
+
+
+class _FakePage:
+    async def close(self):
+        pass
+
+
+class _FakeContext:
+    def __init__(self):
+        self.closed = False
+
+    async def new_page(self):
+        return _FakePage()
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakeBrowser:
+    def __init__(self):
+        self.contexts: list[_FakeContext] = []
+        self.connected = True
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self, **kwargs):
+        context = _FakeContext()
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.connected = False
+
+
+class _FakePlaywright:
+    def __init__(self):
+        self.launches = 0
+        self.chromium = self
+        self.browser = None
+
+    async def start(self):
+        return self
+
+    async def launch(self, **kwargs):
+        self.launches += 1
+        self.browser = _FakeBrowser()
+        return self.browser
+
+    async def stop(self):
+        pass
+
+
+class TestBrowserPool(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.playwright = _FakePlaywright()
+        patcher = patch(
+            "core.infrastructure.browser_pool.async_playwright",
+            return_value=self.playwright,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_concurrency_is_bounded_and_browser_launched_once(self):
+        pool = BrowserPool(max_contexts=2, max_uses=100)
+        peak = 0
+
+        async def lease():
+            nonlocal peak
+            async with pool.page():
+                peak = max(peak, pool.stats()["pages_in_flight"])
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*[lease() for _ in range(6)])
+
+        stats = pool.stats()
+        self.assertEqual(peak, 2)
+        self.assertEqual(self.playwright.launches, 1)
+        self.assertEqual(stats["contexts_created"], 2)
+        self.assertEqual(stats["pages_served"], 6)
+        self.assertEqual(stats["pages_in_flight"], 0)
+        self.assertGreater(stats["queue_wait_ms_max"], 0)
+
+    async def test_contexts_recycled_after_max_uses(self):
+        pool = BrowserPool(max_contexts=1, max_uses=2)
+
+        for _ in range(5):
+            async with pool.page():
+                pass
+
+        contexts = self.playwright.browser.contexts
+        self.assertEqual(len(contexts), 3)
+        self.assertEqual([c.closed for c in contexts], [True, True, False])
+        self.assertEqual(pool.stats()["contexts_recycled"], 2)
+
+    async def test_relaunches_after_browser_disconnect(self):
+        pool = BrowserPool(max_contexts=1)
+        async with pool.page():
+            pass
+
+        self.playwright.browser.connected = False
+        async with pool.page():
+            pass
+
+        self.assertEqual(self.playwright.launches, 2)
+
+    async def test_caller_error_releases_slot(self):
+        pool = BrowserPool(max_contexts=1)
+
+        with self.assertRaises(RuntimeError):
+            async with pool.page():
+                raise RuntimeError("navigation failed")
+
+        async with pool.page():
+            pass
+        self.assertEqual(pool.stats()["contexts_created"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
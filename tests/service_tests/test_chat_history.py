@@ -0,0 +1,86 @@
+import threading
+import unittest
+from unittest.mock import patch
+
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+from agents.chatv2 import history as history_module
+from agents.chatv2.history import build_history, warm_tokenizer
+from agents.chatv2.state import create_initial_state
+
+
+def _conversation(turns: int) -> list:
+    messages = []
+    for i in range(turns):
+        messages.append(HumanMessage(content=f"user turn {i} " + "detail " * 40))
+        messages.append(AIMessage(content=f"assistant turn {i} " + "reply " * 40))
+    return messages
+
+
+class TestBuildHistory(unittest.TestCase):
+    def test_short_history_is_sent_verbatim(self):
+        state = create_initial_state()
+        state["messages"] = _conversation(2)
+
+        history = build_history(state, budget=2000)
+
+        self.assertEqual(history.messages, state["messages"])
+        self.assertEqual(history.updates, {})
+        self.assertEqual(history.tokens_saved, 0)
+
+    def test_long_history_is_compacted_within_budget(self):
+        state = create_initial_state()
+        state["messages"] = _conversation(20)
+
+        history = build_history(state, budget=1000, summary_budget=400, min_recent=2)
+
+        summary, *recent = history.messages
+        self.assertIsInstance(summary, SystemMessage)
+        self.assertIn("turn 17", summary.content)
+        self.assertEqual(recent, state["messages"][-len(recent) :])
+        self.assertLessEqual(history.sent_tokens, 1000)
+        self.assertGreater(history.tokens_saved, 0)
+        self.assertEqual(
+            history.updates["summarized_messages"], len(state["messages"]) - len(recent)
+        )
+
+    def test_prefix_is_stable_until_the_next_compaction(self):
+        state = create_initial_state()
+        state["messages"] = _conversation(20)
+        first = build_history(state, budget=1000, summary_budget=400, min_recent=2)
+        state.update(first.updates)
+
+        state["messages"] = state["messages"] + [HumanMessage(content="one more")]
+        second = build_history(state, budget=1000, summary_budget=400, min_recent=2)
+
+        self.assertEqual(second.updates, {})
+        self.assertEqual(second.messages[: len(first.messages)], first.messages)
+
+    def test_summary_rolls_within_its_budget(self):
+        state = create_initial_state()
+        state["messages"] = _conversation(60)
+
+        history = build_history(state, budget=500, summary_budget=200, min_recent=2)
+
+        summary = history.updates["history_summary"]
+        self.assertNotIn("user turn 0 ", summary)
+        self.assertIn("turn 58", summary)
+
+
+class TestWarmTokenizer(unittest.IsolatedAsyncioTestCase):
+    async def test_loads_encoding_off_the_event_loop(self):
+        loop_thread = threading.get_ident()
+        loaded_in = []
+
+        def encoding():
+            loaded_in.append(threading.get_ident())
+
+        with patch.object(history_module, "_encoding", encoding):
+            await warm_tokenizer()
+
+        self.assertEqual(len(loaded_in), 1)
+        self.assertNotEqual(loaded_in[0], loop_thread)
+
+
+if __name__ == "__main__":
+    unittest.main()
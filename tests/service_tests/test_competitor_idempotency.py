@@ -2,6 +2,7 @@ import unittest
 from unittest.mock import AsyncMock, patch
 from models.competitor_model import Competitor, CompetitorKeyword
 from services.competitor.competitor_analysis_orchestrator import CompetitorAnalysisOrchestrator
+from utils.competitor_extraction import competitor_input_hash
 
 class TestCompetitorIdempotency(unittest.IsolatedAsyncioTestCase):
     def setUp(self):
@@ -117,5 +118,40 @@ class TestCompetitorIdempotency(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(results[0].extracted_keywords[0].keyword, "forced kw")
         mock_discovery.assert_called_once()
 
+    @patch("services.competitor.competitor_analysis_orchestrator.competitor_discovery_service.find_keywords_for_competitor", new_callable=AsyncMock)
+    async def test_resume_from_checkpoints(self, mock_discovery):
+        """Verify that checkpointed competitors are reused and new results checkpointed."""
+        done = Competitor(name="Done", url="https://done.com")
+        changed = Competitor(name="Changed", url="https://changed.com", reasoning="new")
+        checkpoints = [
+            Competitor(
+                name="Done", url="https://done.com", input_hash=competitor_input_hash(done),
+                extracted_keywords=[CompetitorKeyword(keyword="done kw")],
+            ),
+            Competitor(
+                name="Changed", url="https://changed.com", input_hash="stale",
+                extracted_keywords=[CompetitorKeyword(keyword="stale kw")],
+            ),
+        ]
+        mock_discovery.return_value = Competitor(
+            name="Changed", url="https://changed.com", extracted_keywords=[CompetitorKeyword(keyword="fresh kw")]
+        )
+        writer = AsyncMock()
+
+        results = await self.orchestrator._find_competitor_keywords(
+            raw_competitors=[done, changed],
+            existing_analysis=[],
+            customer_id="123",
+            login_customer_id="456",
+            checkpoints=checkpoints,
+            checkpoint_writer=writer,
+        )
+
+        keywords = {r.url: r.extracted_keywords[0].keyword for r in results}
+        self.assertEqual(keywords, {"https://done.com": "done kw", "https://changed.com": "fresh kw"})
+        mock_discovery.assert_called_once()
+        saved = writer.save.call_args[0][0]
+        self.assertEqual(saved.input_hash, competitor_input_hash(changed))
+
 if __name__ == "__main__":
     unittest.main()
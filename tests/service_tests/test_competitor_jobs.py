@@ -0,0 +1,142 @@
+import asyncio
+import sys
+import unittest
+from unittest.mock import patch
+
+from core.infrastructure.context import set_auth_context
+from core.infrastructure.jobs import COMPLETED, FAILED, JobManager
+from models.competitor_model import CompetitorAnalysisResult
+from services.competitor.competitor_analysis_orchestrator import (
+    CompetitorAnalysisOrchestrator,
+)
+
+# The package re-exports the orchestrator instance under the module's name.
+orchestrator_module = sys.modules[CompetitorAnalysisOrchestrator.__module__]
+
+
+class TestJobManager(unittest.IsolatedAsyncioTestCase):
+    async def test_events_replay_for_late_subscribers(self):
+        manager = JobManager()
+        gate = asyncio.Event()
+
+        async def run(job):
+            job.progress("fetch", "start", "Fetching")
+            await gate.wait()
+            job.progress("fetch", "end", "Fetched")
+            return {"answer": 42}
+
+        job, created = manager.submit("demo", ("a",), run)
+        self.assertTrue(created)
+        await asyncio.sleep(0)
+        early = asyncio.create_task(self._collect(job.subscribe()))
+        await asyncio.sleep(0)
+        gate.set()
+        self.assertEqual(await job.wait(), {"answer": 42})
+
+        late = await self._collect(job.subscribe())
+        self.assertEqual(await early, late)
+        self.assertEqual(
+            [e.event for e in late], ["progress", "progress", "data", "done"]
+        )
+        self.assertEqual(late[2].data["payload"], {"answer": 42})
+        self.assertEqual(job.status, COMPLETED)
+
+    async def test_failure_ends_with_error_event(self):
+        manager = JobManager()
+
+        async def run(job):
+            raise ValueError("boom")
+
+        job, _ = manager.submit("demo", ("a",), run)
+        with self.assertRaises(ValueError):
+            await job.wait()
+        events = await self._collect(job.subscribe())
+        self.assertEqual(events[-1].event, "error")
+        self.assertEqual(job.status, FAILED)
+
+    async def _collect(self, subscription) -> list:
+        return [event async for event in subscription]
+
+
+class TestCompetitorAnalysisJobs(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        set_auth_context(client_code="client")
+        self.manager = JobManager()
+        self.calls = 0
+        self.gate = asyncio.Event()
+
+        async def fake_analysis(
+            orchestrator,
+            business_url,
+            customer_id,
+            login_customer_id,
+            force_fresh_analysis=False,
+            on_progress=None,
+        ):
+            self.calls += 1
+            on_progress("load_context", "start", "Loading")
+            await self.gate.wait()
+            return CompetitorAnalysisResult(
+                competitor_analysis=[], enriched_keywords=[]
+            )
+
+        self.patches = [
+            patch.object(
+                orchestrator_module, "get_job_manager", return_value=self.manager
+            ),
+            patch.object(
+                CompetitorAnalysisOrchestrator,
+                "start_competitor_analysis",
+                fake_analysis,
+            ),
+        ]
+        for p in self.patches:
+            p.start()
+
+    async def asyncTearDown(self):
+        for p in self.patches:
+            p.stop()
+
+    async def test_identical_in_flight_jobs_are_deduplicated(self):
+        orchestrator = CompetitorAnalysisOrchestrator()
+        first, created = orchestrator.submit_competitor_analysis(
+            "https://Example.com/", "1", "2"
+        )
+        second, joined = orchestrator.submit_competitor_analysis(
+            "https://example.com", "1", "2"
+        )
+        other, _ = orchestrator.submit_competitor_analysis(
+            "https://other.com", "1", "2"
+        )
+        other_account, _ = orchestrator.submit_competitor_analysis(
+            "https://example.com", "3", "2"
+        )
+        forced, _ = orchestrator.submit_competitor_analysis(
+            "https://example.com", "1", "2", force_fresh_analysis=True
+        )
+
+        self.assertTrue(created)
+        self.assertFalse(joined)
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+        self.assertIsNot(first, other_account)
+        self.assertIsNot(first, forced)
+
+        self.gate.set()
+        await asyncio.gather(
+            first.wait(), other.wait(), other_account.wait(), forced.wait()
+        )
+        self.assertEqual(self.calls, 4)
+        self.assertEqual(first.events[0].data["node"], "load_context")
+
+        again, created = orchestrator.submit_competitor_analysis(
+            "https://example.com", "1", "2"
+        )
+        self.assertTrue(created)
+        self.assertIsNot(again, first)
+        self.gate.set()
+        await again.wait()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import tempfile
+import unittest
+
+from core.infrastructure.cache import DiskCache
+from core.infrastructure.embedding_cache import EmbeddingCache
+
+
+class TestEmbeddingCache(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.disk = DiskCache(
+            "embeddings", max_bytes=10_000_000, directory=self.tmp.name
+        )
+        self.calls: list[list[str]] = []
+
+    def tearDown(self):
+        self.disk.close()
+        self.tmp.cleanup()
+
+    async def _embed(self, texts: list[str], model: str) -> list[list[float]]:
+        self.calls.append(list(texts))
+        return [[float(len(t)), 0.5] for t in texts]
+
+    async def test_only_misses_reach_the_api(self):
+        cache = EmbeddingCache(memory_size=100, disk=self.disk)
+
+        first = await cache.get_or_embed(["buy shoes", "red shoes"], "m", self._embed)
+        second = await cache.get_or_embed(
+            ["red shoes", "blue shoes", "buy  shoes "], "m", self._embed
+        )
+
+        self.assertEqual(self.calls, [["buy shoes", "red shoes"], ["blue shoes"]])
+        self.assertEqual(first[1], second[0])
+        self.assertEqual(first[0], second[2])
+        stats = cache.stats()
+        self.assertEqual(stats["memory_hits"], 2)
+        self.assertEqual(stats["misses"], 3)
+
+    async def test_duplicate_texts_embedded_once(self):
+        cache = EmbeddingCache(memory_size=100, disk=None)
+
+        result = await cache.get_or_embed(["a b", "a b", "c"], "m", self._embed)
+
+        self.assertEqual(self.calls, [["a b", "c"]])
+        self.assertEqual(result[0], result[1])
+
+    async def test_disk_tier_survives_new_process_cache(self):
+        await EmbeddingCache(memory_size=100, disk=self.disk).get_or_embed(
+            ["running shoes"], "m", self._embed
+        )
+
+        fresh = EmbeddingCache(memory_size=100, disk=self.disk)
+        result = await fresh.get_or_embed(["running shoes"], "m", self._embed)
+
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(result, [[13.0, 0.5]])
+        self.assertEqual(fresh.stats()["disk_hits"], 1)
+
+    async def test_model_is_part_of_the_key(self):
+        cache = EmbeddingCache(memory_size=100, disk=self.disk)
+
+        await cache.get_or_embed(["shoes"], "model-a", self._embed)
+        await cache.get_or_embed(["shoes"], "model-b", self._embed)
+
+        self.assertEqual(len(self.calls), 2)
+
+
+class TestDiskCache(unittest.TestCase):
+    def test_evicts_least_recently_used_over_budget(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            disk = DiskCache("bounded", max_bytes=250, directory=tmp)
+            disk.EVICT_CHECK_INTERVAL = 1
+            for i in range(5):
+                disk.set(f"k{i}", b"x" * 100)
+
+            remaining = disk.get_many([f"k{i}" for i in range(5)])
+
+            self.assertLessEqual(sum(len(v) for v in remaining.values()), 250)
+            self.assertIn("k4", remaining)
+            disk.close()
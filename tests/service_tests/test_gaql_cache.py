@@ -0,0 +1,165 @@
+import asyncio
+import tempfile
+import unittest
+from datetime import date, datetime, timezone
+from unittest.mock import patch
+
+from adapters.google import client as client_module
+from adapters.google import query_cache as query_cache_module
+from adapters.google.client import GoogleAdsClient
+from adapters.google.query_cache import (
+    GaqlCache,
+    decode_rows,
+    encode_rows,
+    resolve_window,
+)
+from core.infrastructure.cache import DiskCache
+
+REPORT_QUERY = """
+    SELECT campaign.id, metrics.clicks
+    FROM keyword_view
+    WHERE segments.date DURING LAST_30_DAYS AND campaign.name = 'a  b'
+"""
+
+ROWS = [
+    {"campaign": {"id": "1", "name": "Brand"}, "metrics": {"clicks": "10"}},
+    {"campaign": {"id": "1", "name": "Brand"}, "metrics": {}},
+    {
+        "campaign": {"id": "2", "name": "Generic"},
+        "metrics": {"clicks": "3", "ctr": 0.5},
+    },
+]
+
+
+class TestColumnarEncoding(unittest.TestCase):
+    def test_round_trip_preserves_rows(self):
+        self.assertEqual(decode_rows(encode_rows(ROWS)), ROWS)
+        self.assertEqual(decode_rows(encode_rows([])), [])
+
+    def test_windows_resolve_relative_to_today(self):
+        today = date(2026, 3, 11)  # a Wednesday
+        self.assertEqual(
+            resolve_window("LAST_30_DAYS", today), (date(2026, 2, 9), date(2026, 3, 10))
+        )
+        self.assertEqual(
+            resolve_window("LAST_WEEK_MON_SUN", today),
+            (date(2026, 3, 2), date(2026, 3, 8)),
+        )
+        self.assertEqual(
+            resolve_window("LAST_MONTH", today), (date(2026, 2, 1), date(2026, 2, 28))
+        )
+        self.assertIsNone(resolve_window("NEXT_YEAR", today))
+
+
+class TestCachedSearchStream(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.disk = DiskCache("gaql", max_bytes=10_000_000, directory=self.tmp.name)
+        self.cache = GaqlCache(self.disk)
+        self.calls = 0
+        self.timezone_lookups = 0
+
+        async def fake_stream(
+            _self, query, customer_id, login_customer_id, client_code
+        ):
+            if "customer.time_zone" in query:
+                self.timezone_lookups += 1
+                yield [{"customer": {"timeZone": "Asia/Kolkata"}}]
+                return
+            self.calls += 1
+            await asyncio.sleep(0.01)
+            yield ROWS[:2]
+            yield ROWS[2:]
+
+        self.patches = [
+            patch.object(client_module, "get_gaql_cache", return_value=self.cache),
+            patch.object(GoogleAdsClient, "_stream", fake_stream),
+        ]
+        for p in self.patches:
+            p.start()
+        self.client = GoogleAdsClient()
+
+    async def asyncTearDown(self):
+        for p in self.patches:
+            p.stop()
+        self.disk.close()
+        self.tmp.cleanup()
+
+    async def test_reporting_query_served_from_cache(self):
+        first = await self.client.search_stream(REPORT_QUERY, "1", "2", "c")
+        reformatted = " ".join(REPORT_QUERY.split()).replace("'a b'", "'a  b'")
+        batches = [
+            b async for b in self.client.iter_search_stream(reformatted, "1", "2", "c")
+        ]
+
+        self.assertEqual(first, ROWS)
+        self.assertEqual(batches, [ROWS])
+        self.assertEqual(self.calls, 1)
+
+    async def test_key_depends_on_customer_and_literals(self):
+        await self.client.search_stream(REPORT_QUERY, "1", "2", "c")
+        await self.client.search_stream(REPORT_QUERY, "9", "2", "c")
+        await self.client.search_stream(
+            REPORT_QUERY.replace("'a  b'", "'a b'"), "1", "2", "c"
+        )
+        self.assertEqual(self.calls, 3)
+
+    async def test_concurrent_calls_share_one_request(self):
+        results = await asyncio.gather(
+            *[self.client.search_stream(REPORT_QUERY, "1", "2", "c") for _ in range(3)]
+        )
+        self.assertEqual(results, [ROWS] * 3)
+        self.assertEqual(self.calls, 1)
+
+    async def test_undated_and_opted_out_queries_bypass_cache(self):
+        for _ in range(2):
+            await self.client.search_stream(
+                "SELECT customer.id FROM customer", "1", "2", "c"
+            )
+            await self.client.search_stream(
+                REPORT_QUERY, "1", "2", "c", use_cache=False
+            )
+        self.assertEqual(self.calls, 4)
+
+    async def test_oversized_results_are_not_cached(self):
+        self.cache.max_entry_rows = 2
+        for _ in range(2):
+            await self.client.search_stream(REPORT_QUERY, "1", "2", "c")
+        self.assertEqual(self.calls, 2)
+
+    async def test_invalidate_expires_customer_entries(self):
+        await self.client.search_stream(REPORT_QUERY, "1", "2", "c")
+        await asyncio.sleep(0.001)
+        await self.cache.invalidate("1")
+        await self.client.search_stream(REPORT_QUERY, "1", "2", "c")
+        await self.client.search_stream(REPORT_QUERY, "1", "2", "c")
+        self.assertEqual(self.calls, 2)
+
+    async def test_windows_and_expiry_follow_the_account_time_zone(self):
+        await asyncio.gather(
+            *[self.client.search_stream(REPORT_QUERY, "1", "2", "c") for _ in range(2)]
+        )
+        self.assertEqual(self.timezone_lookups, 1)
+
+        utc_cache = GaqlCache(self.disk, default_timezone="UTC")
+        utc_cache.set_timezone("1", "Asia/Kolkata")
+        # 20:00 UTC is already the next reporting day (01:30) in IST.
+        late_utc = datetime(2026, 3, 10, 20, 0, tzinfo=timezone.utc)
+        with patch.object(query_cache_module, "datetime", wraps=datetime) as clock:
+            clock.now.side_effect = lambda tz=None: late_utc.astimezone(tz)
+            ist_key = utc_cache.key_for("c", "1", REPORT_QUERY)
+            utc_key = utc_cache.key_for("c", "9", REPORT_QUERY)
+            clock.now.side_effect = lambda tz=None: late_utc.replace(
+                hour=23
+            ).astimezone(tz)
+            later_ist_key = utc_cache.key_for("c", "1", REPORT_QUERY)
+            self.assertEqual(utc_cache.ttl(REPORT_QUERY, "1"), 19.5 * 3600)
+            self.assertEqual(utc_cache.ttl(REPORT_QUERY, "9"), 3600)
+
+        # Same query, so the digests differ only by the resolved window.
+        self.assertNotEqual(ist_key.split(":")[3], utc_key.split(":")[3])
+        self.assertEqual(ist_key, later_ist_key)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from adapters.google import accounts as module
+from adapters.google.accounts import GoogleAccountsAdapter
+
+
+class FakeAccountsAdapter(GoogleAccountsAdapter):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self.failing_managers: set[str] = set()
+        self.unreadable: set[str] = set()
+        self.sub_accounts = {"100": ["1", "2"], "200": ["2", "3"]}
+
+    async def _list_customer_ids(self, client_code):
+        self.calls += 1
+        return ["100", "200", "300"]
+
+    async def _fetch_account_info(self, client_code, customer_id):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.005)
+        self.active -= 1
+        if customer_id in self.unreadable:
+            raise RuntimeError("INTERNAL_ERROR")
+        return customer_id in self.sub_accounts, f"acct {customer_id}"
+
+    async def _list_sub_accounts(self, client_code, manager_id):
+        if manager_id in self.failing_managers:
+            raise RuntimeError("RESOURCE_EXHAUSTED")
+        return [
+            {"customer_id": cid, "name": f"sub {cid}"}
+            for cid in self.sub_accounts[manager_id]
+        ]
+
+
+def ids(accounts):
+    return [(a["customer_id"], a["login_customer_id"]) for a in accounts]
+
+
+class TestAccountHierarchyCache(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        GoogleAccountsAdapter.invalidate()
+        self.adapter = FakeAccountsAdapter()
+
+    async def test_expands_concurrently_and_caches_per_client(self):
+        with patch.object(module, "ACCOUNTS_CONCURRENCY", 2):
+            first, second = await asyncio.gather(
+                self.adapter.fetch_accessible_accounts("c1"),
+                self.adapter.fetch_accessible_accounts("c1"),
+            )
+        again = await self.adapter.fetch_accessible_accounts("c1")
+
+        expected = [("1", "100"), ("2", "100"), ("3", "200"), ("300", "300")]
+        self.assertEqual(ids(first), expected)
+        self.assertEqual(ids(again), expected)
+        self.assertEqual(second, first)
+        self.assertEqual(self.adapter.max_active, 2)
+        self.assertEqual(self.adapter.calls, 1)
+
+        GoogleAccountsAdapter.invalidate("c1")
+        await self.adapter.fetch_accessible_accounts("c1")
+        self.assertEqual(self.adapter.calls, 2)
+
+    async def test_stale_hierarchy_is_served_while_refreshing(self):
+        await self.adapter.fetch_accessible_accounts("c1")
+        self.adapter.sub_accounts["100"] = ["1", "4"]
+        self.adapter.failing_managers.add("200")
+
+        module._hierarchies.get("c1").fetched_at -= module.ACCOUNTS_CACHE_TTL + 1
+        stale = await self.adapter.fetch_accessible_accounts("c1")
+        await module._refreshing["c1"]
+        refreshed = await self.adapter.fetch_accessible_accounts("c1")
+
+        self.assertEqual(ids(stale)[:2], [("1", "100"), ("2", "100")])
+        # Manager 200 failed to expand, so its last known sub-accounts are kept.
+        self.assertEqual(
+            ids(refreshed),
+            [("1", "100"), ("4", "100"), ("2", "200"), ("3", "200"), ("300", "300")],
+        )
+
+    async def test_refresh_started_before_invalidation_is_not_cached(self):
+        pending = asyncio.create_task(self.adapter.fetch_accessible_accounts("c1"))
+        await asyncio.sleep(0)
+        self.adapter.sub_accounts["100"] = ["1", "4"]
+        GoogleAccountsAdapter.invalidate("c1")
+
+        await pending
+        self.assertIsNone(module._hierarchies.get("c1"))
+        fresh = await self.adapter.fetch_accessible_accounts("c1")
+
+        self.assertEqual(ids(fresh)[:2], [("1", "100"), ("4", "100")])
+        self.assertEqual(self.adapter.calls, 2)
+
+    async def test_unreadable_manager_keeps_its_last_expansion(self):
+        self.adapter.unreadable.add("300")
+        first = await self.adapter.fetch_accessible_accounts("c1")
+        # Never read successfully, so it is listed as a plain account.
+        self.assertEqual(ids(first)[-1], ("300", "300"))
+
+        self.adapter.unreadable = {"100"}
+        refreshed = await self.adapter.fetch_accessible_accounts("c1", refresh=True)
+
+        self.assertEqual(ids(refreshed), ids(first))
+        self.assertTrue(module._hierarchies.get("c1").expansions["100"].is_manager)
+
+
+if __name__ == "__main__":
+    unittest.main()
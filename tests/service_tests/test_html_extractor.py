@@ -0,0 +1,173 @@
+import unittest
+
+from bs4 import BeautifulSoup
+
+from models.business_model import BlockReason
+from services.html_extractor import extract_coordinates, extract_page_data
+from services.scraper_service import ScraperService
+
+PAGE = """
+<html><head>
+  <title> Acme Interiors </title>
+  <meta name="description" content=" Custom kitchens ">
+  <meta name="keywords" content="kitchens, wardrobes">
+  <meta name="description" content="ignored duplicate">
+  <style>p { color: red }</style>
+</head>
+<body>
+<!-- navigation -->
+<div id="outer">
+  <div class="hero">Welcome <span>to</span><script>var tracking = 1;</script> Acme</div>
+  <p>   </p>
+  <p>Modular <b>kitchens</b><![CDATA[ and more ]]></p>
+  <h1>Acme <em>Interiors</em></h1><h3>Projects</h3><h3></h3>
+  <ul><li>Design<ol><li>3D renders</li></ol></li><li>Install</li></ul>
+  <table>
+    <tr><th>Plan</th><th>Price</th></tr>
+    <tr><td>Basic</td><td>10k<table><tr><td>nested</td></tr></table></td></tr>
+    <tr></tr>
+  </table>
+  <a href="/about">About <span>us</span></a><a href="">Empty</a><a name="anchor">No href</a>
+  <img src="/logo.png" alt="Logo"><img alt="missing src">
+  <iframe src="https://www.google.com/maps/embed?pb=!2d77.59!3d12.97" title="Map"></iframe>
+  <iframe src=""></iframe><iframe title="no src"></iframe>
+  <template><p>template text</p></template>
+</div>
+</body></html>
+"""
+
+
+def _legacy_extract(soup: BeautifulSoup) -> dict:
+    """The original find_all-based extraction, kept as the reference output."""
+    return {
+        "title": soup.title.string.strip() if soup.title and soup.title.string else "",
+        "meta": {
+            "description": (
+                soup.find("meta", attrs={"name": "description"})
+                .get("content", "")
+                .strip()
+                if soup.find("meta", attrs={"name": "description"})
+                else ""
+            ),
+            "keywords": (
+                soup.find("meta", attrs={"name": "keywords"}).get("content", "").strip()
+                if soup.find("meta", attrs={"name": "keywords"})
+                else ""
+            ),
+        },
+        "headings": {
+            tag: [h.get_text(strip=True) for h in soup.find_all(tag)]
+            for tag in ["h1", "h2", "h3", "h4", "h5", "h6"]
+        },
+        "paragraphs": [
+            p.get_text(strip=True) for p in soup.find_all("p") if p.get_text(strip=True)
+        ],
+        "spans": [
+            s.get_text(strip=True)
+            for s in soup.find_all("span")
+            if s.get_text(strip=True)
+        ],
+        "divs": [
+            d.get_text(strip=True)
+            for d in soup.find_all("div")
+            if d.get_text(strip=True)
+        ],
+        "lists": {
+            "unordered": [
+                [li.get_text(strip=True) for li in ul.find_all("li")]
+                for ul in soup.find_all("ul")
+            ],
+            "ordered": [
+                [li.get_text(strip=True) for li in ol.find_all("li")]
+                for ol in soup.find_all("ol")
+            ],
+        },
+        "tables": [
+            {
+                "headers": [th.get_text(strip=True) for th in table.find_all("th")],
+                "rows": [
+                    [td.get_text(strip=True) for td in row.find_all("td")]
+                    for row in table.find_all("tr")
+                    if row.find_all("td")
+                ],
+            }
+            for table in soup.find_all("table")
+        ],
+        "links": [
+            {"text": a.get_text(strip=True), "href": a["href"]}
+            for a in soup.find_all("a", href=True)
+        ],
+        "images": [
+            {"alt": img.get("alt", ""), "src": img["src"]}
+            for img in soup.find_all("img", src=True)
+        ],
+        "iframes": [
+            {"src": iframe.get("src", ""), "title": iframe.get("title", "")}
+            for iframe in soup.find_all("iframe", src=True)
+        ],
+        "map_embeds": [
+            {
+                "src": iframe.get("src", ""),
+                "title": iframe.get("title", ""),
+                "coordinates": extract_coordinates(iframe.get("src", "")),
+            }
+            for iframe in soup.find_all("iframe", src=True)
+            if iframe.get("src")
+            and (
+                "google.com/maps" in iframe.get("src", "")
+                or "maps.google.com" in iframe.get("src", "")
+            )
+        ],
+    }
+
+
+class TestHtmlExtractor(unittest.TestCase):
+    def test_matches_reference_extraction(self):
+        soup = BeautifulSoup(PAGE, "html.parser")
+
+        self.assertEqual(extract_page_data(soup), _legacy_extract(soup))
+
+    def test_nested_divs_and_lists(self):
+        data = extract_page_data(BeautifulSoup(PAGE, "html.parser"))
+
+        self.assertEqual(data["divs"][1], "WelcometoAcme")
+        self.assertEqual(
+            data["lists"]["unordered"], [["Design3D renders", "3D renders", "Install"]]
+        )
+        self.assertEqual(
+            data["tables"][0]["rows"], [["Basic", "10knested", "nested"], ["nested"]]
+        )
+        self.assertEqual(
+            data["map_embeds"][0]["coordinates"], {"lng": 77.59, "lat": 12.97}
+        )
+
+    def test_empty_document(self):
+        data = extract_page_data(BeautifulSoup("", "html.parser"))
+
+        self.assertEqual(data["title"], "")
+        self.assertEqual(data["meta"], {"description": "", "keywords": ""})
+        self.assertEqual(data["links"], [])
+
+
+class TestBlockMarkers(unittest.TestCase):
+    def test_captcha_takes_precedence_over_bot_protection(self):
+        html = "<title>Just a moment...</title><div class='G-RECAPTCHA'></div>"
+
+        error = ScraperService()._detect_blocking(html)
+
+        self.assertEqual(error.type, BlockReason.CAPTCHA_REQUIRED)
+
+    def test_bot_provider_follows_pattern_order(self):
+        html = "<p>Access Denied</p><p>Checking your browser before accessing</p>"
+
+        error = ScraperService()._detect_blocking(html)
+
+        self.assertEqual(error.type, BlockReason.BOT_PROTECTION)
+        self.assertIn("cloudflare", error.message)
+
+    def test_clean_page(self):
+        self.assertIsNone(ScraperService()._detect_blocking(PAGE))
+
+
+if __name__ == "__main__":
+    unittest.main()
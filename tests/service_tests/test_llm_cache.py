@@ -0,0 +1,170 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from core.infrastructure import llm_cache
+from core.infrastructure.llm_cache import LLMResponseCache, is_cacheable
+from services import openai_client
+from services.business_service import BusinessService
+
+MESSAGES = [{"role": "user", "content": "Classify: modular kitchen"}]
+JSON_FORMAT = {"type": "json_object"}
+
+
+class TestLLMResponseCache(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.cache = LLMResponseCache(maxsize=100, ttl=60)
+        patcher = patch.object(llm_cache, "_default_cache", self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.gate = asyncio.Event()
+        self.gate.set()
+
+        async def create(messages, model, kwargs):
+            await self.gate.wait()
+            return f"{model}:{messages[-1]['content']}"
+
+        self.create = AsyncMock(side_effect=create)
+        patcher = patch.object(openai_client, "_create_chat_completion", self.create)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_cacheability(self):
+        self.assertTrue(is_cacheable({"temperature": 0}))
+        self.assertFalse(
+            is_cacheable({"temperature": 0.2, "response_format": JSON_FORMAT})
+        )
+        self.assertFalse(is_cacheable({"response_format": JSON_FORMAT}))
+        self.assertFalse(is_cacheable({"temperature": 0.7}))
+        self.assertFalse(is_cacheable({}))
+        self.assertFalse(
+            is_cacheable({"temperature": 0, "tools": [{"type": "function"}]})
+        )
+        self.assertFalse(is_cacheable({"temperature": 0, "n": 3}))
+
+    async def test_repeated_deterministic_call_is_served_from_cache(self):
+        first = await openai_client.chat_completion(MESSAGES, model="m", temperature=0)
+        second = await openai_client.chat_completion(
+            list(MESSAGES), model="m", temperature=0
+        )
+        await openai_client.chat_completion(MESSAGES, model="other", temperature=0)
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.create.await_count, 2)
+
+    async def test_non_deterministic_calls_are_not_cached(self):
+        await openai_client.chat_completion(MESSAGES, model="m", temperature=0.7)
+        await openai_client.chat_completion(MESSAGES, model="m", temperature=0.7)
+        await openai_client.chat_completion(
+            MESSAGES, model="m", temperature=0, cache=False
+        )
+
+        self.assertEqual(self.create.await_count, 3)
+        self.assertEqual(self.cache.stats()["call_sites"], {})
+
+    async def test_concurrent_identical_calls_share_one_request(self):
+        self.gate.clear()
+        calls = [
+            openai_client.chat_completion(
+                MESSAGES, model="m", response_format=JSON_FORMAT, cache=True
+            )
+            for _ in range(5)
+        ]
+        pending = asyncio.gather(*calls)
+        await asyncio.sleep(0)
+        self.gate.set()
+
+        results = await pending
+
+        self.assertEqual(len(set(results)), 1)
+        self.assertEqual(self.create.await_count, 1)
+        site = self.cache.stats()["call_sites"][f"{__name__}.{self._testMethodName}"]
+        self.assertEqual((site["misses"], site["joined"]), (1, 4))
+
+    async def test_cancelled_caller_does_not_cancel_shared_call(self):
+        self.gate.clear()
+        impatient = asyncio.create_task(
+            openai_client.chat_completion(MESSAGES, model="m", temperature=0)
+        )
+        await asyncio.sleep(0)
+        patient = asyncio.create_task(
+            openai_client.chat_completion(MESSAGES, model="m", temperature=0)
+        )
+        await asyncio.sleep(0)
+        impatient.cancel()
+        self.gate.set()
+
+        self.assertEqual(await patient, "m:Classify: modular kitchen")
+        self.assertEqual(self.create.await_count, 1)
+
+    async def test_failures_are_not_cached(self):
+        self.create.side_effect = [RuntimeError("rate limited"), "ok"]
+
+        with self.assertRaises(RuntimeError):
+            await openai_client.chat_completion(MESSAGES, model="m", temperature=0)
+        result = await openai_client.chat_completion(MESSAGES, model="m", temperature=0)
+
+        self.assertEqual(result, "ok")
+
+    async def test_json_calls_are_cached_only_when_opted_in(self):
+        for _ in range(2):
+            await openai_client.chat_completion(
+                MESSAGES, model="m", temperature=0.3, response_format=JSON_FORMAT
+            )
+        self.assertEqual(self.create.await_count, 2)
+
+        for _ in range(2):
+            await openai_client.chat_completion(
+                MESSAGES, model="m", response_format=JSON_FORMAT, cache=True
+            )
+        self.assertEqual(self.create.await_count, 3)
+
+    async def test_rejected_response_is_evicted(self):
+        self.create.side_effect = ["not json", '{"ok": true}']
+
+        first = await openai_client.chat_completion(MESSAGES, model="m", temperature=0)
+        openai_client.evict_chat_completion(MESSAGES, model="m", temperature=0)
+        second = await openai_client.chat_completion(MESSAGES, model="m", temperature=0)
+        third = await openai_client.chat_completion(MESSAGES, model="m", temperature=0)
+
+        self.assertEqual(
+            (first, second, third), ("not json", '{"ok": true}', '{"ok": true}')
+        )
+        self.assertEqual(self.create.await_count, 2)
+
+    async def test_explicit_call_site_label(self):
+        for _ in range(3):
+            await openai_client.chat_completion(
+                MESSAGES, model="m", temperature=0, call_site="search_terms"
+            )
+
+        site = self.cache.stats()["call_sites"]["search_terms"]
+        self.assertEqual(
+            (site["hits"], site["misses"], site["hit_rate"]), (2, 1, 0.6667)
+        )
+
+    async def test_business_extraction_is_cached_and_bad_json_evicted(self):
+        def reply(content):
+            return SimpleNamespace(
+                choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+            )
+
+        self.create.side_effect = [
+            reply("not json"),
+            reply('{"features": ["Free design visit"]}'),
+        ]
+        service = BusinessService()
+
+        results = [
+            await service.extract_business_unique_features("Acme Interiors summary")
+            for _ in range(3)
+        ]
+
+        self.assertEqual(results, [[], ["Free design visit"], ["Free design visit"]])
+        self.assertEqual(self.create.await_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
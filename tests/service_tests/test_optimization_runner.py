@@ -0,0 +1,137 @@
+import asyncio
+import unittest
+
+from agents.optimization.runner import GOOGLE, LLM, OptimizationRunner
+from core.models.optimization import CampaignRecommendation, OptimizationFields
+
+ACCOUNTS = [{"customer_id": str(i), "login_customer_id": "9"} for i in range(4)]
+
+
+def make_rec(campaign_id: str) -> CampaignRecommendation:
+    return CampaignRecommendation(
+        platform="GOOGLE",
+        parent_account_id="9",
+        account_id="1",
+        product_id=None,
+        campaign_id=campaign_id,
+        campaign_name=campaign_id,
+        campaign_type="SEARCH",
+        completed=False,
+        fields=OptimizationFields(),
+    )
+
+
+class FakeStorage:
+    def __init__(self, fail_on: str | None = None):
+        self.fail_on = fail_on
+        self.events: list[str] = []
+        self.active: dict[str, int] = {}
+        self.max_active_per_campaign = 0
+
+    async def store(self, rec, client_code):
+        if rec.campaign_id == self.fail_on:
+            raise RuntimeError("storage down")
+        self.active[rec.campaign_id] = self.active.get(rec.campaign_id, 0) + 1
+        self.max_active_per_campaign = max(
+            self.max_active_per_campaign, *self.active.values()
+        )
+        await asyncio.sleep(0.001)
+        self.active[rec.campaign_id] -= 1
+        self.events.append(f"store:{rec.campaign_id}")
+
+
+class TestOptimizationRunner(unittest.IsolatedAsyncioTestCase):
+    def make_runner(self, storage, **kwargs) -> OptimizationRunner:
+        return OptimizationRunner(
+            fetch_concurrency=2,
+            analysis_concurrency=2,
+            storage_concurrency=3,
+            queue_size=2,
+            rates={GOOGLE: (0, 1), LLM: (0, 1)},
+            storage=storage,
+            **kwargs,
+        )
+
+    async def test_pipelines_stages_and_keeps_account_order(self):
+        storage = FakeStorage()
+        runner = self.make_runner(storage)
+        analyzing = {"now": 0, "max": 0}
+
+        async def fetch(account):
+            await asyncio.sleep(0.002 * (4 - int(account["customer_id"])))
+            return [f"{account['customer_id']}-a", f"{account['customer_id']}-b"]
+
+        async def analyze(unit):
+            analyzing["now"] += 1
+            analyzing["max"] = max(analyzing["max"], analyzing["now"])
+            await asyncio.sleep(0.002)
+            analyzing["now"] -= 1
+            storage.events.append(f"analyzed:{unit}")
+            # Two recommendations for the same campaign must not be stored concurrently.
+            return [make_rec(unit[0]), make_rec(unit[0])]
+
+        stored = await runner.run("c1", ACCOUNTS, fetch, analyze, agent="test")
+
+        self.assertEqual(
+            [r.campaign_id for r in stored],
+            [str(i) for i in range(4) for _ in range(4)],
+        )
+        self.assertEqual(analyzing["max"], 2)
+        self.assertEqual(storage.max_active_per_campaign, 1)
+        events = storage.events
+        first_store = next(i for i, e in enumerate(events) if e.startswith("store:"))
+        last_analysis = max(
+            i for i, e in enumerate(events) if e.startswith("analyzed:")
+        )
+        self.assertLess(first_store, last_analysis)
+
+    async def test_failed_accounts_and_units_are_skipped(self):
+        runner = self.make_runner(FakeStorage())
+
+        async def fetch(account):
+            if account["customer_id"] == "1":
+                raise RuntimeError("PERMISSION_DENIED")
+            return [account["customer_id"]]
+
+        async def analyze(unit):
+            if unit == "2":
+                raise ValueError("bad LLM json")
+            return make_rec(unit) if unit != "3" else None
+
+        stored = await runner.run("c1", ACCOUNTS, fetch, analyze, agent="test")
+
+        self.assertEqual([r.campaign_id for r in stored], ["0"])
+        self.assertEqual(
+            [(f["stage"], f["account_id"]) for f in stored.failures],
+            [("fetch", "1"), ("analysis", "2")],
+        )
+
+    async def test_raises_when_every_account_fetch_fails(self):
+        runner = self.make_runner(FakeStorage())
+
+        async def fetch(account):
+            raise RuntimeError("UNAUTHENTICATED")
+
+        async def analyze(unit):
+            return make_rec(unit)
+
+        with self.assertRaisesRegex(RuntimeError, "UNAUTHENTICATED"):
+            await runner.run("c1", ACCOUNTS, fetch, analyze, agent="test")
+
+    async def test_storage_failure_is_raised_after_draining(self):
+        storage = FakeStorage(fail_on="1")
+        runner = self.make_runner(storage)
+
+        async def fetch(account):
+            return [account["customer_id"]]
+
+        async def analyze(unit):
+            return make_rec(unit)
+
+        with self.assertRaises(RuntimeError):
+            await runner.run("c1", ACCOUNTS, fetch, analyze, agent="test")
+        self.assertEqual(sorted(storage.events), ["store:0", "store:2", "store:3"])
+
+
+if __name__ == "__main__":
+    unittest.main()
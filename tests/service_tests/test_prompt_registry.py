@@ -0,0 +1,79 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from utils.prompt_loader import format_prompt, load_prompt
+from utils.prompt_registry import PromptRegistry
+
+
+class TestPromptRegistry(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        (self.dir / "nested").mkdir()
+        (self.dir / "greeting.txt").write_text(
+            "Hello {name}, today is {day.name}. {{literal}}"
+        )
+        (self.dir / "nested" / "raw.txt").write_text('Return {\n  "key": "value"\n}')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_templates_are_parsed_at_load(self):
+        registry = PromptRegistry(self.dir)
+
+        self.assertEqual(len(registry), 2)
+        self.assertEqual(registry.get("greeting.txt").placeholders, {"name", "day"})
+        self.assertIsNone(registry.get("nested/raw.txt").placeholders)
+        self.assertIn('"key"', registry.text("nested/raw.txt"))
+
+    def test_render_and_missing_fields(self):
+        registry = PromptRegistry(self.dir)
+
+        class Day:
+            name = "Friday"
+
+        self.assertEqual(
+            registry.render("greeting.txt", name="Ana", day=Day()),
+            "Hello Ana, today is Friday. {literal}",
+        )
+        with self.assertRaises(KeyError):
+            registry.render("greeting.txt", name="Ana")
+        with self.assertRaises(ValueError):
+            registry.render("nested/raw.txt")
+
+    def test_bind_validates_fields_up_front(self):
+        registry = PromptRegistry(self.dir)
+
+        prompt = registry.bind("greeting.txt", fields=("name", "day", "unused"))
+        self.assertTrue(
+            prompt.render(name="A", day=Path("B")).startswith("Hello A, today is B")
+        )
+        with self.assertRaises(KeyError):
+            registry.bind("greeting.txt", fields=("name",))
+        with self.assertRaises(FileNotFoundError):
+            registry.bind("missing.txt", fields=())
+
+    def test_reload_picks_up_edited_files(self):
+        registry = PromptRegistry(self.dir, reload=True)
+        path = self.dir / "greeting.txt"
+        path.write_text("Bye {name}")
+        stat = path.stat()
+        os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+
+        self.assertEqual(registry.render("greeting.txt", name="Ana"), "Bye Ana")
+        self.assertEqual(
+            PromptRegistry(self.dir).get("greeting.txt").placeholders, {"name"}
+        )
+
+
+class TestPromptLoader(unittest.TestCase):
+    def test_repository_prompts_load_and_format(self):
+        self.assertIn("{TODAY}", load_prompt("chatv2/collect_data.txt"))
+        prompt = format_prompt("business/pdf_chunk_summary.txt", text="chunk body")
+        self.assertIn("chunk body", prompt)
+
+
+if __name__ == "__main__":
+    unittest.main()
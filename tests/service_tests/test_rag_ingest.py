@@ -0,0 +1,129 @@
+import asyncio
+import struct
+import unittest
+import uuid
+from unittest.mock import AsyncMock, patch
+
+from db.pgvector import decode_vector, encode_vector
+from rag.embedding_service import EmbeddingService
+from rag.models import IngestItem
+
+
+class FakeRepository:
+    def __init__(self, session):
+        self.documents: dict[str, uuid.UUID] = {}
+        self.chunks: list[dict] = []
+        FakeRepository.last = self
+
+    async def get_or_create_collection(self, name, description):
+        return uuid.UUID(int=1)
+
+    async def get_or_create_document(self, collection_id, external_id, uri, source):
+        return self.documents.setdefault(external_id, uuid.uuid4())
+
+    async def get_next_ords(self, document_ids):
+        return {doc_id: 3 for doc_id in document_ids}
+
+    async def create_chunks(self, chunks):
+        self.chunks.extend(chunks)
+        return [uuid.uuid4() for _ in chunks]
+
+
+class FakeSession:
+    def __init__(self, engine):
+        self.committed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def commit(self):
+        self.committed = True
+
+
+class TestVectorCodec(unittest.TestCase):
+    def test_matches_pgvector_binary_format(self):
+        data = encode_vector([0.5, -1.25, 3.0])
+
+        self.assertEqual(data, struct.pack(">HH3f", 3, 0, 0.5, -1.25, 3.0))
+        self.assertEqual(decode_vector(data), [0.5, -1.25, 3.0])
+
+
+class TestIngestMany(unittest.IsolatedAsyncioTestCase):
+    async def test_batches_embeddings_and_numbers_chunks_per_document(self):
+        calls: list[list[str]] = []
+
+        async def generate_embeddings(texts, model):
+            calls.append(list(texts))
+            return [[float(len(t))] for t in texts]
+
+        service = EmbeddingService.__new__(EmbeddingService)
+        service.engine = None
+        service.EMBEDDING_BATCH_SIZE = 2
+        items = [
+            IngestItem(external_id="acme", content="buy shoes", metadata={"k": "a"}),
+            IngestItem(external_id="acme", content="red shoes"),
+            IngestItem(external_id="globex", content="shoe store"),
+        ]
+
+        ensure_index = AsyncMock()
+        with (
+            patch("rag.embedding_service.RAGRepository", FakeRepository),
+            patch("rag.embedding_service.AsyncSession", FakeSession),
+            patch(
+                "rag.embedding_service.openai_client.generate_embeddings",
+                generate_embeddings,
+            ),
+            patch("rag.embedding_service.ensure_collection_index", ensure_index),
+            patch("rag.embedding_service._indexed_collections", set()),
+        ):
+            chunk_ids = await service.ingest_many("feedback", items, source="test")
+            chunks = FakeRepository.last.chunks
+            await service.ingest_many("feedback", items[:1], source="test")
+
+        self.assertEqual(len(chunk_ids), 3)
+        self.assertEqual(calls[:2], [["buy shoes", "red shoes"], ["shoe store"]])
+        self.assertEqual([c["ord"] for c in chunks], [3, 4, 3])
+        self.assertEqual([c["embedding"] for c in chunks], [[9.0], [9.0], [10.0]])
+        self.assertEqual({c["collection_id"] for c in chunks}, {uuid.UUID(int=1)})
+        self.assertIn("created_at", chunks[0]["metadata"])
+        self.assertNotIn("created_at", items[0].metadata)
+        ensure_index.assert_awaited_once_with(None, uuid.UUID(int=1))
+
+    async def test_embedding_requests_are_capped(self):
+        in_flight = peak = 0
+
+        async def generate_embeddings(texts, model):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [[1.0] for _ in texts]
+
+        service = EmbeddingService.__new__(EmbeddingService)
+        service.engine = None
+        service.EMBEDDING_BATCH_SIZE = 1
+        items = [
+            IngestItem(external_id=f"d{i}", content=f"text {i}") for i in range(10)
+        ]
+
+        with (
+            patch("rag.embedding_service.RAGRepository", FakeRepository),
+            patch("rag.embedding_service.AsyncSession", FakeSession),
+            patch(
+                "rag.embedding_service.openai_client.generate_embeddings",
+                generate_embeddings,
+            ),
+            patch("rag.embedding_service.ensure_collection_index", AsyncMock()),
+            patch("rag.embedding_service.EMBEDDING_MAX_CONCURRENCY", 3),
+        ):
+            await service.ingest_many("feedback", items, source="test")
+
+        self.assertEqual(peak, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+import tempfile
+import unittest
+from unittest.mock import AsyncMock, patch
+
+import httpx
+
+from core.infrastructure import http_client
+from core.infrastructure.cache import DiskCache
+from models.business_model import FetchTier
+from services import scrape_cache
+from services.scrape_cache import ScrapeCache
+from services.scraper_service import ScraperService
+
+ARTICLE = " ".join(["We build custom kitchens and wardrobes in Bangalore."] * 20)
+PAGE = f"<html><head><title>Acme</title></head><body><p>{ARTICLE}</p></body></html>"
+ETAG = '"v1"'
+
+
+class TestScrapeCache(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.requests: list[httpx.Request] = []
+        self.page = PAGE
+        self.honor_etag = True
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            if request.url.path == "/robots.txt":
+                return httpx.Response(404)
+            if self.honor_etag and request.headers.get("if-none-match") == ETAG:
+                return httpx.Response(304)
+            return httpx.Response(
+                200,
+                text=self.page,
+                headers={"content-type": "text/html", "etag": ETAG},
+            )
+
+        http_client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.disk = DiskCache("scrape", max_bytes=10_000_000, directory=directory.name)
+        self.addCleanup(self.disk.close)
+        self.cache = ScrapeCache(disk=self.disk, ttl=3600)
+        patcher = patch.object(scrape_cache, "_default_cache", self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.browser_fetch = AsyncMock(return_value=(PAGE, None))
+        patcher = patch.object(ScraperService, "_fetch_html", self.browser_fetch)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def asyncTearDown(self):
+        await http_client.close_http_client()
+
+    def page_requests(self) -> list[httpx.Request]:
+        return [r for r in self.requests if r.url.path != "/robots.txt"]
+
+    async def test_fresh_entry_served_without_requests(self):
+        first = await ScraperService().scrape("https://Acme.test/home/")
+        second = await ScraperService().scrape("https://acme.test/home#contact")
+
+        self.assertFalse(first.from_cache)
+        self.assertTrue(second.from_cache)
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(second.tier, FetchTier.HTTP)
+        self.assertEqual(len(self.page_requests()), 1)
+
+    async def test_revalidation_uses_etag(self):
+        await ScraperService().scrape("https://acme.test/")
+
+        result = await ScraperService().scrape("https://acme.test/", revalidate=True)
+
+        self.assertTrue(result.from_cache)
+        self.assertEqual(self.page_requests()[-1].headers["if-none-match"], ETAG)
+        self.assertEqual(self.cache.stats()["revalidated_hits"], 1)
+
+    async def test_identical_body_counts_as_unchanged(self):
+        await ScraperService().scrape("https://acme.test/")
+        self.honor_etag = False
+
+        result = await ScraperService().scrape("https://acme.test/", revalidate=True)
+
+        self.assertTrue(result.from_cache)
+
+    async def test_changed_page_is_rescraped_from_revalidation_body(self):
+        await ScraperService().scrape("https://acme.test/")
+        self.honor_etag = False
+        self.page = PAGE.replace("Acme", "Acme Studio")
+        before = len(self.page_requests())
+
+        result = await ScraperService().scrape("https://acme.test/", revalidate=True)
+
+        self.assertFalse(result.from_cache)
+        self.assertEqual(result.data["title"], "Acme Studio")
+        self.assertEqual(len(self.page_requests()) - before, 1)
+
+    async def test_browser_results_expire_by_ttl_only(self):
+        self.page = "<html><body><div id='root'></div></body></html>"
+        await ScraperService().scrape("https://acme.test/spa")
+
+        result = await ScraperService().scrape("https://acme.test/spa", revalidate=True)
+
+        self.assertFalse(result.from_cache)
+        self.assertEqual(self.browser_fetch.await_count, 2)
+
+    async def test_website_summary_generated_once_per_prompt_and_params(self):
+        generate = AsyncMock(return_value='{"summary": "Kitchens"}')
+        prompt = f"Summarize: {ARTICLE}"
+        params = {"model": "gpt-4o-mini", "temperature": 0.2}
+
+        first = await self.cache.website_summary(prompt, params, generate)
+        second = await self.cache.website_summary(prompt, dict(params), generate)
+        await self.cache.website_summary(
+            f"Summarize briefly: {ARTICLE}", params, generate
+        )
+        await self.cache.website_summary(
+            prompt, {**params, "temperature": 0.7}, generate
+        )
+
+        self.assertEqual(first, second)
+        self.assertEqual(generate.await_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from agents.chatv2.scrape_manager import AuthParams, ScrapeTaskManager
+from agents.scrape.scrape_agent import ScrapeAgent
+
+AUTH = AuthParams("token", "client", "host", "443")
+
+
+class TestScrapeTaskManager(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.manager = ScrapeTaskManager()
+        self.gates: dict[str, asyncio.Event] = {}
+
+        async def fake_run(manager, session_id, job, auth):
+            url = job.url
+            try:
+                job.progress.publish(("fetch", "start", url))
+                await self.gates.setdefault(url, asyncio.Event()).wait()
+                job.progress.publish(("fetch", "end", url))
+                job.result = f"summary:{url}"
+            finally:
+                if manager._scrape_jobs.get(session_id) is job:
+                    job.finish()
+
+        self.patch = patch.object(ScrapeTaskManager, "_run_scrape", fake_run)
+        self.patch.start()
+
+    async def asyncTearDown(self):
+        self.patch.stop()
+
+    async def _collect(self, subscription) -> list:
+        return [event async for event in subscription]
+
+    async def test_progress_is_broadcast_to_every_subscriber(self):
+        self.manager.start_scrape("s1", "https://a", AUTH)
+        await asyncio.sleep(0)
+        subscribers = [
+            asyncio.create_task(self._collect(self.manager.subscribe_progress("s1")))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        self.gates["https://a"].set()
+
+        first, second = await asyncio.gather(*subscribers)
+        expected = [("fetch", "start", "https://a"), ("fetch", "end", "https://a")]
+        self.assertEqual(first, expected)
+        self.assertEqual(second, expected)
+        self.assertEqual(self.manager.drain_progress("s1"), [])
+
+    async def test_undelivered_progress_is_drained_once(self):
+        self.manager.start_scrape("s1", "https://a", AUTH)
+        await asyncio.sleep(0)
+        self.assertEqual(
+            self.manager.drain_progress("s1"), [("fetch", "start", "https://a")]
+        )
+        self.assertEqual(self.manager.drain_progress("s1"), [])
+        self.manager.cleanup("s1")
+
+    async def test_wait_for_result_wakes_on_completion(self):
+        self.manager.start_scrape("s1", "https://a", AUTH)
+        waiter = asyncio.create_task(self.manager.wait_for_result("s1", timeout=5))
+        await asyncio.sleep(0)
+        self.gates.setdefault("https://a", asyncio.Event()).set()
+        self.assertEqual(await waiter, "summary:https://a")
+
+    async def test_wait_for_result_follows_replaced_scrape(self):
+        self.manager.start_scrape("s1", "https://a", AUTH)
+        waiter = asyncio.create_task(self.manager.wait_for_result("s1", timeout=5))
+        await asyncio.sleep(0)
+        self.manager.start_scrape("s1", "https://b", AUTH)
+        await asyncio.sleep(0)
+        self.gates["https://b"].set()
+        self.assertEqual(await waiter, "summary:https://b")
+
+    async def test_wait_for_result_times_out(self):
+        self.manager.start_scrape("s1", "https://a", AUTH)
+        self.assertIsNone(await self.manager.wait_for_result("s1", timeout=0.01))
+        self.assertIsNone(await self.manager.wait_for_result("missing", timeout=1))
+        self.manager.cleanup("s1")
+
+
+class TestScrapeJobReplacement(unittest.IsolatedAsyncioTestCase):
+    async def test_cancelled_scrape_does_not_finish_replacement_for_same_url(self):
+        manager = ScrapeTaskManager()
+        gate = asyncio.Event()
+
+        async def run(_self, url, **kwargs):
+            await gate.wait()
+            return f"summary:{url}"
+
+        with patch.object(ScrapeAgent, "run", run):
+            manager.start_scrape("s1", "https://a", AUTH)
+            await asyncio.sleep(0)
+            old = manager._scrape_jobs["s1"]
+            manager.cleanup("s1")
+            manager.start_scrape("s1", "https://a", AUTH)
+            new = manager._scrape_jobs["s1"]
+            await asyncio.sleep(0)
+
+            self.assertTrue(old.task.cancelled())
+            self.assertFalse(new.done.is_set())
+            gate.set()
+            self.assertEqual(
+                await manager.wait_for_result("s1", timeout=1), "summary:https://a"
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
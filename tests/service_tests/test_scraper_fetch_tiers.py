@@ -0,0 +1,86 @@
+import unittest
+from unittest.mock import AsyncMock, patch
+
+import httpx
+
+from core.infrastructure import http_client
+from models.business_model import FetchTier
+from services import scrape_cache, scraper_service as scraper_module
+from services.scraper_service import ScraperService
+
+ARTICLE = " ".join(["We build custom kitchens and wardrobes in Bangalore."] * 20)
+SERVER_RENDERED = f"""
+<html><head><title>Acme Interiors</title></head>
+<body><h1>Acme Interiors</h1><p>{ARTICLE}</p></body></html>
+"""
+SPA_SHELL = """
+<html><head><title>App</title><script>window.__STATE__ = {"big": "blob"}</script></head>
+<body><div id="root"></div><script src="/bundle.js"></script></body></html>
+"""
+ROBOTS = "User-agent: *\nDisallow: /private\n"
+
+
+class TestScraperFetchTiers(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.requests: list[str] = []
+        self.pages = {"/": SERVER_RENDERED, "/spa": SPA_SHELL}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request.url.path)
+            if request.url.path == "/robots.txt":
+                return httpx.Response(200, text=ROBOTS)
+            if request.url.path == "/blocked":
+                return httpx.Response(403, text="Forbidden")
+            return httpx.Response(
+                200,
+                text=self.pages.get(request.url.path, SERVER_RENDERED),
+                headers={"content-type": "text/html; charset=utf-8"},
+            )
+
+        http_client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        scraper_module._robots_cache.clear()
+        scraper_module._tier_counts.clear()
+        patcher = patch.object(
+            scrape_cache, "_default_cache", scrape_cache.ScrapeCache(disk=None)
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.browser_fetch = AsyncMock(return_value=(SERVER_RENDERED, None))
+        patcher = patch.object(ScraperService, "_fetch_html", self.browser_fetch)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def asyncTearDown(self):
+        await http_client.close_http_client()
+
+    async def test_server_rendered_page_served_without_browser(self):
+        result = await ScraperService().scrape("https://acme.test/")
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.tier, FetchTier.HTTP)
+        self.assertEqual(result.data["title"], "Acme Interiors")
+        self.browser_fetch.assert_not_called()
+
+    async def test_js_shell_and_blocked_pages_fall_back_to_browser(self):
+        for path in ("/spa", "/blocked"):
+            result = await ScraperService().scrape(f"https://acme.test{path}")
+            self.assertEqual(result.tier, FetchTier.BROWSER, path)
+
+        self.assertEqual(self.browser_fetch.await_count, 2)
+        stats = scraper_module.get_tier_stats()
+        self.assertEqual((stats["http"], stats["browser"]), (0, 2))
+
+    async def test_robots_fetched_once_per_host(self):
+        scraper = ScraperService()
+        private = await scraper.scrape("https://acme.test/private/page")
+        await scraper.scrape("https://acme.test/")
+        await ScraperService().scrape("https://acme.test/about")
+
+        self.assertEqual(self.requests.count("/robots.txt"), 1)
+        self.assertEqual(
+            [w.type.value for w in private.warnings], ["robots_txt_disallow"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
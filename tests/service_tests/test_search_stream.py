@@ -0,0 +1,77 @@
+import json
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+from adapters.google.client import GoogleAdsClient
+from adapters.google.stream_parser import JsonArrayStreamParser
+from core.infrastructure import http_client
+
+BATCHES = [
+    {"results": [{"keyword": 'a {tricky} "quoted" [text]'}, {"keyword": "b"}]},
+    {"results": [{"keyword": "c\\\\"}], "fieldMask": "x", "requestId": "r1"},
+    {"fieldMask": "x", "requestId": "r1"},
+]
+
+
+def _chunks(text: str, size: int) -> list[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+class TestJsonArrayStreamParser(unittest.TestCase):
+    def test_objects_emitted_for_any_chunking(self):
+        payload = json.dumps(BATCHES, indent=2)
+        for size in (1, 3, 7, 64, len(payload)):
+            parser = JsonArrayStreamParser()
+            objects = [
+                obj for chunk in _chunks(payload, size) for obj in parser.feed(chunk)
+            ]
+            objects += parser.close()
+            self.assertEqual(objects, BATCHES, f"chunk size {size}")
+
+    def test_batches_emitted_before_stream_ends(self):
+        with patch.object(JsonArrayStreamParser, "MIN_ATTEMPT_SIZE", 1):
+            parser = JsonArrayStreamParser()
+            first = parser.feed('[{"results": [{"a": 1}]}, {"results": [')
+            rest = parser.feed('{"a": 2}]}]') + parser.close()
+
+        self.assertEqual(first, [{"results": [{"a": 1}]}])
+        self.assertEqual(rest, [{"results": [{"a": 2}]}])
+
+    def test_truncated_stream_raises(self):
+        parser = JsonArrayStreamParser()
+        parser.feed('[{"results": [{"a": "b')
+        with self.assertRaises(ValueError):
+            parser.close()
+
+
+class TestIterSearchStream(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        payload = json.dumps(BATCHES).encode()
+
+        async def body():
+            for chunk in _chunks(payload.decode(), 5):
+                yield chunk.encode()
+
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, content=body())
+        )
+        http_client._client = httpx.AsyncClient(transport=transport)
+        self.client = GoogleAdsClient()
+        self.client.developer_token = "dev"
+
+    async def asyncTearDown(self):
+        await http_client.close_http_client()
+
+    async def test_yields_batches_and_search_stream_flattens(self):
+        with patch.object(GoogleAdsClient, "_get_google_api_token", return_value="tok"):
+            batches = [
+                b async for b in self.client.iter_search_stream("q", "1", "2", "c")
+            ]
+            rows = await self.client.search_stream("q", "1", "2", "c")
+
+        self.assertEqual([len(b) for b in batches], [2, 1, 0])
+        self.assertEqual(
+            [r["keyword"] for r in rows], ['a {tricky} "quoted" [text]', "b", "c\\\\"]
+        )
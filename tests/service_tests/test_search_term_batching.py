@@ -0,0 +1,69 @@
+import json
+import unittest
+from unittest.mock import patch
+
+from core.search_term.analyzer import SearchTermAnalyzer
+
+
+def _single(check_type: str, term: str) -> dict:
+    if check_type == "brand":
+        own = "acme" in term
+        return {"brand": {"match": own, "type": "own_brand" if own else "generic"}}
+    if check_type == "overall":
+        return {
+            "overall": {"suggestion_type": "positive", "match_level": "Strong Match"}
+        }
+    return {check_type: {"match": False, "match_level": "No Match"}}
+
+
+class TestSearchTermBatching(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.analyzer = SearchTermAnalyzer()
+        self.labels: list[str] = []
+
+    async def _fake_llm(self, system_msg: str, user_msg: str, label: str) -> dict:
+        self.labels.append(label)
+        if not label.endswith("_batch"):
+            return _single(label, user_msg.split("SEARCH TERM:")[1].split("\n")[0])
+        check_type = label.removesuffix("_batch")
+        items = json.loads(user_msg.split("SEARCH TERMS:", 1)[1])
+        results = [
+            {"id": item["id"], **_single(check_type, item["search_term"])}
+            for item in items
+            if item["search_term"] != "broken term"
+        ]
+        return {"results": results}
+
+    async def test_one_call_per_check_type_for_small_campaign(self):
+        terms = [("acme homes", {}), ("cheap flats", {}), ("acme homes", {})]
+
+        with patch.object(self.analyzer, "_call_llm", side_effect=self._fake_llm):
+            results = await self.analyzer.analyze_terms("summary", terms)
+
+        self.assertEqual(
+            sorted(self.labels),
+            ["brand_batch", "configuration_batch", "location_batch", "overall_batch"],
+        )
+        self.assertEqual([r["text"] for r in results], [t for t, _ in terms])
+        self.assertEqual(results[0]["recommendation_type"], "positive")
+        self.assertEqual(results[1]["recommendation_type"], "negative")
+
+    async def test_unparsed_items_fall_back_to_single_calls(self):
+        terms = [("acme homes", {}), ("broken term", {})]
+
+        with patch.object(self.analyzer, "_call_llm", side_effect=self._fake_llm):
+            results = await self.analyzer.analyze_terms("summary", terms)
+
+        self.assertIn("brand", self.labels)
+        self.assertIn("configuration", self.labels)
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[1]["analysis"]["brand"]["type"], "generic")
+
+    async def test_terms_are_chunked_by_batch_size(self):
+        self.analyzer.BATCH_SIZE = 2
+        terms = [(f"term {i}", {}) for i in range(5)]
+
+        with patch.object(self.analyzer, "_call_llm", side_effect=self._fake_llm):
+            await self.analyzer.analyze_terms("summary", terms)
+
+        self.assertEqual(self.labels.count("brand_batch"), 3)
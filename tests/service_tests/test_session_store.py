@@ -0,0 +1,224 @@
+import asyncio
+import time
+import unittest
+from datetime import timedelta
+from typing import Annotated, TypedDict
+from unittest.mock import AsyncMock, patch
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langgraph.graph import END, StateGraph, add_messages
+
+from agents.chatv2.checkpointer import SessionCheckpointSaver
+from agents.chatv2.state import create_initial_state
+from core.chatv2.models import ChatStatus
+from core.infrastructure.session_store import (
+    InMemoryBackend,
+    RedisBackend,
+    SessionStore,
+    _encode_command,
+)
+
+
+class FakeRedisServer:
+    """Minimal RESP server supporting the commands RedisBackend issues."""
+
+    def __init__(self):
+        self.data: dict[bytes, tuple[bytes, float]] = {}
+        self._server = None
+
+    async def start(self) -> str:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self._server.sockets[0].getsockname()[1]
+        return f"redis://127.0.0.1:{port}/0"
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                header = await reader.readuntil(b"\r\n")
+                args = []
+                for _ in range(int(header[1:-2])):
+                    length = int((await reader.readuntil(b"\r\n"))[1:-2])
+                    args.append((await reader.readexactly(length + 2))[:-2])
+                writer.write(self._dispatch(args))
+                await writer.drain()
+        except asyncio.IncompleteReadError:
+            writer.close()
+
+    def _live(self, key):
+        entry = self.data.get(key)
+        if entry and time.monotonic() < entry[1]:
+            return entry[0]
+        self.data.pop(key, None)
+        return None
+
+    def _dispatch(self, args):
+        command, keys = args[0].upper(), args[1:]
+        if command == b"GET":
+            value = self._live(keys[0])
+            return b"$-1\r\n" if value is None else _encode_command((value,))[4:]
+        if command == b"SET":
+            self.data[keys[0]] = (keys[1], time.monotonic() + int(keys[3]) / 1000)
+            return b"+OK\r\n"
+        if command == b"DEL":
+            count = sum(1 for k in keys if self._live(k) is not None)
+            for k in keys:
+                self.data.pop(k, None)
+            return b":%d\r\n" % count
+        if command == b"EXISTS":
+            return b":%d\r\n" % (self._live(keys[0]) is not None)
+        if command == b"PEXPIRE":
+            value = self._live(keys[0])
+            if value is None:
+                return b":0\r\n"
+            self.data[keys[0]] = (value, time.monotonic() + int(keys[1]) / 1000)
+            return b":1\r\n"
+        return b"-ERR unknown command\r\n"
+
+
+class TestSessionStore(unittest.IsolatedAsyncioTestCase):
+    async def _exercise(self, store: SessionStore):
+        state = create_initial_state()
+        state["messages"] = [HumanMessage(content="hi"), AIMessage(content="hello")]
+        state["ad_plan"] = {"platform": "google", "budget": 1500.5}
+
+        session_id = await store.create(state)
+        loaded = await store.get(session_id)
+
+        self.assertEqual(loaded["status"], ChatStatus.IN_PROGRESS)
+        self.assertEqual([m.content for m in loaded["messages"]], ["hi", "hello"])
+        self.assertIsInstance(loaded["messages"][0], HumanMessage)
+        self.assertEqual(loaded["ad_plan"], state["ad_plan"])
+        self.assertIsNotNone(await store.get_last_activity(session_id))
+
+        loaded["ad_plan"]["budget"] = 10
+        self.assertEqual((await store.get(session_id))["ad_plan"]["budget"], 1500.5)
+        self.assertTrue(await store.update(session_id, loaded))
+        self.assertEqual((await store.get(session_id))["ad_plan"]["budget"], 10)
+
+        self.assertTrue(await store.delete(session_id))
+        self.assertFalse(await store.exists(session_id))
+        self.assertIsNone(await store.get(session_id))
+        self.assertFalse(await store.update(session_id, loaded))
+
+    async def test_in_memory_backend_round_trip(self):
+        await self._exercise(SessionStore(InMemoryBackend()))
+
+    async def test_redis_backend_round_trip(self):
+        server = FakeRedisServer()
+        backend = RedisBackend(await server.start())
+        try:
+            await self._exercise(SessionStore(backend))
+        finally:
+            await backend.close()
+            await server.stop()
+
+    async def test_sessions_expire_and_are_swept(self):
+        backend = InMemoryBackend()
+        store = SessionStore(backend, timeout=timedelta(milliseconds=50))
+        session_id = await store.create({"a": 1})
+
+        store.start_sweeper(interval=0.02)
+        await asyncio.sleep(0.15)
+        await store.close()
+
+        self.assertEqual(backend._data, {})
+        self.assertIsNone(await store.get(session_id))
+
+    async def test_redis_backend_times_out_on_unresponsive_server(self):
+        async def silent(reader, writer):
+            await reader.read()
+
+        server = await asyncio.start_server(silent, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        backend = RedisBackend(f"redis://127.0.0.1:{port}/0", command_timeout=0.05)
+        try:
+            with self.assertRaises(TimeoutError):
+                await backend.get("k")
+        finally:
+            await backend.close()
+            server.close()
+
+    async def test_rediss_url_connects_over_tls(self):
+        refused = AsyncMock(side_effect=ConnectionRefusedError)
+        for url, tls in (
+            ("rediss://:pw@cache.internal:6380/0", True),
+            ("redis://cache.internal", False),
+        ):
+            backend = RedisBackend(url)
+            with patch("asyncio.open_connection", refused):
+                with self.assertRaises(ConnectionRefusedError):
+                    await backend.get("k")
+            kwargs = refused.await_args.kwargs
+            self.assertEqual(kwargs["ssl"] is not None, tls)
+            self.assertEqual(
+                kwargs["server_hostname"], "cache.internal" if tls else None
+            )
+
+
+class _State(TypedDict):
+    messages: Annotated[list[BaseMessage], add_messages]
+    turns: int
+
+
+async def _reply(state: _State) -> dict:
+    return {"messages": [AIMessage(content="ok")], "turns": state["turns"] + 1}
+
+
+class TestSessionCheckpointSaver(unittest.IsolatedAsyncioTestCase):
+    async def test_graph_state_persists_on_backend(self):
+        store = SessionStore(InMemoryBackend())
+        graph = StateGraph(_State)
+        graph.add_node("reply", _reply)
+        graph.set_entry_point("reply")
+        graph.add_edge("reply", END)
+        compiled = graph.compile(checkpointer=SessionCheckpointSaver(store))
+        config = {"configurable": {"thread_id": "s1"}}
+
+        await compiled.ainvoke(
+            {"messages": [HumanMessage(content="one")], "turns": 0}, config
+        )
+        await compiled.ainvoke({"messages": [HumanMessage(content="two")]}, config)
+        snapshot = await compiled.aget_state(config)
+
+        self.assertEqual(snapshot.values["turns"], 2)
+        self.assertEqual(
+            [m.content for m in snapshot.values["messages"]], ["one", "ok", "two", "ok"]
+        )
+        self.assertEqual(len(store.backend._data), 2)
+
+        await compiled.checkpointer.adelete_thread("s1")
+        self.assertEqual(store.backend._data, {})
+        self.assertEqual((await compiled.aget_state(config)).values, {})
+
+    async def test_delete_thread_removes_subgraph_namespaces(self):
+        store = SessionStore(InMemoryBackend())
+        saver = SessionCheckpointSaver(store)
+        for checkpoint_ns in ("", "child:1", "child:2"):
+            config = {
+                "configurable": {"thread_id": "s1", "checkpoint_ns": checkpoint_ns}
+            }
+            saved = await saver.aput(
+                config,
+                {"id": f"cp-{checkpoint_ns}", "v": 1, "channel_values": {}},
+                {},
+                {},
+            )
+            await saver.aput_writes(saved, [("messages", "x")], "task")
+        await saver.aput(
+            {"configurable": {"thread_id": "s2", "checkpoint_ns": ""}},
+            {"id": "other", "v": 1, "channel_values": {}},
+            {},
+            {},
+        )
+
+        await saver.adelete_thread("s1")
+
+        self.assertEqual(list(store.backend._data), ["checkpoint:s2:"])
+
+
+if __name__ == "__main__":
+    unittest.main()
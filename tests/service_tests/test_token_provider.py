@@ -0,0 +1,134 @@
+import asyncio
+import time
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+from adapters.google.client import GoogleAdsClient
+from core.infrastructure import http_client
+from oserver.services.token_provider import TokenProvider
+
+
+class TestTokenProvider(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.fetches = 0
+
+    async def _fetch(self):
+        self.fetches += 1
+        await asyncio.sleep(0.01)
+        return f"token-{self.fetches}", None
+
+    async def test_concurrent_requests_share_one_fetch(self):
+        provider = TokenProvider(default_ttl=600, refresh_margin=60)
+
+        tokens = await asyncio.gather(
+            *[
+                provider.get_token(("client", "GOOGLE_API"), self._fetch)
+                for _ in range(10)
+            ]
+        )
+
+        self.assertEqual(self.fetches, 1)
+        self.assertEqual(set(tokens), {"token-1"})
+
+    async def test_cached_per_client_and_connection(self):
+        provider = TokenProvider(default_ttl=600, refresh_margin=60)
+
+        await provider.get_token(("a", "GOOGLE_API"), self._fetch)
+        await provider.get_token(("a", "GOOGLE_API"), self._fetch)
+        await provider.get_token(("b", "GOOGLE_API"), self._fetch)
+        await provider.get_token(("a", "META_API"), self._fetch)
+
+        self.assertEqual(self.fetches, 3)
+
+    async def test_refresh_window_serves_cached_token_and_refreshes_in_background(self):
+        provider = TokenProvider(default_ttl=600, refresh_margin=60)
+        key = ("client", "GOOGLE_API")
+        await provider.get_token(key, self._fetch)
+
+        with patch(
+            "oserver.services.token_provider.time.monotonic", return_value=10**9 + 0.0
+        ):
+            provider._tokens[key].refresh_at = 0
+            provider._tokens[key].expires_at = 10**10
+            token = await provider.get_token(key, self._fetch)
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(token, "token-1")
+        self.assertEqual(self.fetches, 2)
+        self.assertEqual(await provider.get_token(key, self._fetch), "token-2")
+
+    async def test_expiry_from_token_service_is_respected(self):
+        provider = TokenProvider(default_ttl=600, refresh_margin=60)
+
+        async def hour_token():
+            return "hour", 3600.0
+
+        await provider.get_token(("c", "GOOGLE_API"), hour_token)
+
+        remaining = provider._tokens[("c", "GOOGLE_API")].expires_at - time.monotonic()
+        self.assertAlmostEqual(remaining, 3540, delta=5)
+
+    async def test_invalidate_keeps_token_refreshed_by_another_caller(self):
+        provider = TokenProvider(default_ttl=600, refresh_margin=60)
+        key = ("client", "GOOGLE_API")
+        await provider.get_token(key, self._fetch)
+
+        provider.invalidate(key, "token-1")
+        self.assertEqual(await provider.get_token(key, self._fetch), "token-2")
+        provider.invalidate(key, "token-1")
+        self.assertEqual(await provider.get_token(key, self._fetch), "token-2")
+
+
+class TestGoogleClientTokenRejection(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.seen_tokens = []
+
+        def handler(request):
+            token = request.headers["Authorization"].removeprefix("Bearer ")
+            self.seen_tokens.append(token)
+            if token == "token-1":
+                return httpx.Response(
+                    401, json={"error": {"message": "UNAUTHENTICATED"}}
+                )
+            return httpx.Response(200, json={"results": [{"id": 1}]})
+
+        http_client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        self.provider = TokenProvider(default_ttl=600, refresh_margin=60)
+        self.fetches = 0
+
+    async def asyncTearDown(self):
+        await http_client.close_http_client()
+
+    async def _fetch(self):
+        self.fetches += 1
+        return f"token-{self.fetches}", None
+
+    async def test_401_invalidates_token_and_retries_once(self):
+        client = GoogleAdsClient()
+        client.developer_token = "dev"
+
+        async def get_token(client_code):
+            return await self.provider.get_token(
+                (client_code, "GOOGLE_API"), self._fetch
+            )
+
+        with (
+            patch("adapters.google.client._get_oauth_token", return_value=None),
+            patch("adapters.google.client.get_google_api_token", get_token),
+            patch("oserver.services.token_provider.token_provider", self.provider),
+        ):
+            batches = [
+                b
+                async for b in client.iter_search_stream(
+                    "q", "1", "2", "c", use_cache=False
+                )
+            ]
+            self.provider.invalidate(("c", "GOOGLE_API"))
+            self.fetches = 0
+            rows = await client.search("q", "1", "2", "c")
+
+        self.assertEqual(rows, [{"id": 1}])
+        self.assertEqual(batches, [[{"id": 1}]])
+        self.assertEqual(self.seen_tokens, ["token-1", "token-2", "token-1", "token-2"])
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import hashlib
 import json
 from typing import Any
 from urllib.parse import urlparse
@@ -9,6 +10,9 @@ from models.competitor_model import Competitor
 
 logger = get_logger(__name__)
 
+# Bump when discovery changes enough that stored analyses should be redone.
+DISCOVERY_VERSION = 1
+
 
 async def select_strategic_pages(
     links: list[dict[str, Any]],
@@ -92,14 +96,34 @@ def merge_page_data(pages: list[dict[str, Any]]) -> list[dict[str, Any]]:
     return cleaned_pages
 
 
+def competitor_input_hash(competitor: Competitor) -> str:
+    """Hash of what discovery is run from: the competitor entry itself."""
+    payload = json.dumps(
+        {
+            "version": DISCOVERY_VERSION,
+            "name": competitor.name.strip(),
+            "url": competitor.url.strip(),
+            "reasoning": (competitor.reasoning or "").strip(),
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
 def filter_already_analyzed_competitors(
     raw_competitors: list[Competitor],
     existing_analysis: list[Competitor],
     force_fresh_analysis: bool = False,
+    checkpoints: list[Competitor] | None = None,
 ) -> tuple[list[Competitor], list[Competitor]]:
     """
     Categorize competitors into 'to discover' and 'already done' based on existing storage data.
 
+    Checkpoints (results saved by an unfinished run) take precedence over the
+    stored analysis. A stored result is reused only while its input_hash matches
+    the competitor entry; results saved before hashes existed are reused and
+    stamped with the current hash.
+
     Returns:
         tuple: (list_of_raw_to_discover, list_of_competitor_objects_already_done)
     """
@@ -107,15 +131,23 @@ def filter_already_analyzed_competitors(
         return [], []
 
     # 1. Map raw_competitors URLs to see what the user actually wants NOW
-    desired_urls = {c.url for c in raw_competitors if c.url}
+    desired_hashes = {c.url: competitor_input_hash(c) for c in raw_competitors if c.url}
 
     # 2. Identify "already-done" competitors if not forcing fresh discovery
     already_done_map: dict[str, Competitor] = {}
-    if not force_fresh_analysis and existing_analysis:
-        for c_obj in existing_analysis:
+    if not force_fresh_analysis:
+        for c_obj in [*existing_analysis, *(checkpoints or [])]:
             # Only keep if they have keywords AND are in the current desired list
-            if c_obj.extracted_keywords and c_obj.url in desired_urls:
-                already_done_map[c_obj.url] = c_obj
+            input_hash = desired_hashes.get(c_obj.url)
+            if not c_obj.extracted_keywords or input_hash is None:
+                continue
+            if c_obj.input_hash is None:
+                c_obj = c_obj.model_copy(update={"input_hash": input_hash})
+            elif c_obj.input_hash != input_hash:
+                # The entry changed since this result; anything older is stale too.
+                already_done_map.pop(c_obj.url, None)
+                continue
+            already_done_map[c_obj.url] = c_obj
 
     # 3. Filter for "delta" discovery
     to_discover = []
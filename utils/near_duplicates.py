@@ -0,0 +1,65 @@
+"""Vectorized near-duplicate detection for short texts (ad headlines, descriptions).
+
+Each text is reduced to the set of its character bigrams, hashed into a fixed
+number of buckets. Similarity is the Dice coefficient of two bigram sets,
+2·|A∩B| / (|A|+|B|), which tracks difflib's SequenceMatcher ratio (2·M / T)
+closely enough to reuse its thresholds. A new text is compared against every
+kept text in one numpy operation instead of one SequenceMatcher per pair.
+"""
+
+import zlib
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+NGRAM_SIZE = 2
+HASH_BUCKETS = 4096
+
+
+def ngram_buckets(
+    text: str, n: int = NGRAM_SIZE, buckets: int = HASH_BUCKETS
+) -> np.ndarray:
+    """Sorted unique bucket ids of the text's character n-grams."""
+    normalized = f" {' '.join(text.lower().split())} "
+    grams = {normalized[i : i + n] for i in range(max(1, len(normalized) - n + 1))}
+    return np.unique(
+        np.fromiter(
+            (zlib.crc32(g.encode("utf-8")) % buckets for g in grams), dtype=np.int64
+        )
+    )
+
+
+class NearDuplicateIndex:
+    """Incremental index of kept texts answering "is this a near-duplicate?"."""
+
+    def __init__(self, threshold: float, buckets: int = HASH_BUCKETS):
+        self.threshold = threshold
+        self.texts: List[str] = []
+        self._buckets = buckets
+        self._rows = np.zeros((16, buckets), dtype=np.float32)
+        self._sizes = np.zeros(16, dtype=np.float32)
+
+    def match(self, text: str) -> Optional[Tuple[str, float]]:
+        """Return (most similar kept text, similarity) if at or above threshold."""
+        if not self.texts:
+            return None
+        scores = self._scores(ngram_buckets(text, buckets=self._buckets))
+        best = int(scores.argmax())
+        if scores[best] >= self.threshold:
+            return self.texts[best], float(scores[best])
+        return None
+
+    def add(self, text: str) -> None:
+        count = len(self.texts)
+        if count == len(self._rows):
+            self._rows = np.vstack([self._rows, np.zeros_like(self._rows)])
+            self._sizes = np.concatenate([self._sizes, np.zeros_like(self._sizes)])
+        grams = ngram_buckets(text, buckets=self._buckets)
+        self._rows[count, grams] = 1.0
+        self._sizes[count] = len(grams)
+        self.texts.append(text)
+
+    def _scores(self, grams: np.ndarray) -> np.ndarray:
+        count = len(self.texts)
+        shared = self._rows[:count, grams].sum(axis=1)
+        return 2.0 * shared / (self._sizes[:count] + len(grams))
@@ -1,24 +1,23 @@
-import os
+from utils.prompt_registry import get_prompt_registry
 from utils.text_utils import safe_truncate_to_sentence
 from structlog import get_logger  # type: ignore
-from typing import Any, Dict
+from typing import Any, AbstractSet, Dict
 
 logger = get_logger(__name__)
 
 
 def load_prompt(prompt_name: str) -> str:
-    # Get the root directory (Adzump-AI) regardless of where this file is
-    root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    prompt_path = os.path.join(root_dir, "prompts", prompt_name)
-    with open(prompt_path, "r", encoding="utf-8") as f:
-        return f.read()
+    return get_prompt_registry().text(prompt_name)
 
 
 def format_prompt(prompt_file: str, **context: Any) -> str:
+    format_dict: Dict[str, Any] = {}
     try:
-        template = load_prompt(prompt_file)
-        format_dict = build_template_variables(template, context)
-        formatted_prompt = template.format(**format_dict)
+        template = get_prompt_registry().get(prompt_file)
+        format_dict = build_template_variables(
+            template.placeholders or frozenset(), context
+        )
+        formatted_prompt = template.text.format(**format_dict)
         logger.debug(f"Successfully formatted prompt:{prompt_file}")
         return formatted_prompt
     except FileNotFoundError:
@@ -33,18 +32,20 @@ def format_prompt(prompt_file: str, **context: Any) -> str:
         raise
 
 
-def build_template_variables(template: str, context: Dict[str, Any]) -> Dict[str, Any]:
+def build_template_variables(
+    placeholders: AbstractSet[str], context: Dict[str, Any]
+) -> Dict[str, Any]:
     format_dict: Dict[str, Any] = {}
     for key, value in context.items():
         if value is None:
             continue
         if key == "scraped_data":
             format_dict["scraped_data"] = value
-            if "{content_summary}" in template:
+            if "content_summary" in placeholders:
                 format_dict["content_summary"] = safe_truncate_to_sentence(
                     str(value), 2000
                 )
-            if "{business_summary}" in template:
+            if "business_summary" in placeholders:
                 # Only populate if not already provided in context to avoid overwriting
                 if "business_summary" not in context:
                     format_dict["business_summary"] = safe_truncate_to_sentence(
@@ -59,7 +60,7 @@ def build_template_variables(template: str, context: Dict[str, Any]) -> Dict[str
                 ", ".join(value.service_areas) or "Not provided"
             )
 
-            if "{location_context}" in template:
+            if "location_context" in placeholders:
                 location_context = ""
                 if value.primary_location != "Unknown":
                     location_context += f"Primary Location: {value.primary_location}\n"
@@ -73,7 +74,7 @@ def build_template_variables(template: str, context: Dict[str, Any]) -> Dict[str
 
         if key == "unique_features" and isinstance(value, list):
             format_dict["unique_features"] = value
-            if "{features_context}" in template:
+            if "features_context" in placeholders:
                 format_dict["features_context"] = (
                     f"Unique Features: {', '.join(value)}\n" if value else ""
                 )
@@ -0,0 +1,142 @@
+"""In-memory registry of the prompt templates under prompts/.
+
+Every file is read and parsed once, when the registry is first used (at
+import time for most modules, and in the app lifespan otherwise), so
+rendering a prompt never touches the disk. Each template's placeholder
+names are computed up front.
+
+Code that renders a fixed prompt binds it once with bind(name, fields); an
+unknown prompt, or a template placeholder the caller never supplies, then
+fails at import instead of on a request. Files whose braces are not a
+str.format template (raw JSON examples) are still served by text() but
+cannot be rendered.
+
+With PROMPT_RELOAD=true, a template is re-read when its file's mtime
+changes, for editing prompts without restarting.
+"""
+
+import os
+import string
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from structlog import get_logger
+
+logger = get_logger(__name__)
+
+PROMPTS_DIR = Path(__file__).resolve().parent.parent / "prompts"
+PROMPT_RELOAD = os.getenv("PROMPT_RELOAD", "false").lower() == "true"
+
+_formatter = string.Formatter()
+
+
+def _placeholders(text: str) -> Optional[frozenset[str]]:
+    """Top-level field names of a str.format template, or None if it is not one."""
+    names = set()
+    try:
+        for _, field_name, _, _ in _formatter.parse(text):
+            if field_name is None:
+                continue
+            root = field_name.split(".", 1)[0].split("[", 1)[0]
+            if not root.isidentifier():
+                return None
+            names.add(root)
+    except ValueError:
+        return None
+    return frozenset(names)
+
+
+@dataclass(frozen=True)
+class PromptTemplate:
+    name: str
+    text: str
+    # None when the file is not a str.format template.
+    placeholders: Optional[frozenset[str]]
+    mtime: float
+
+    def render(self, values: dict[str, Any]) -> str:
+        if self.placeholders is None:
+            raise ValueError(f"Prompt {self.name} is not a format template")
+        missing = self.placeholders - values.keys()
+        if missing:
+            raise KeyError(f"Prompt {self.name} is missing fields: {sorted(missing)}")
+        return self.text.format_map(values)
+
+
+class PromptRegistry:
+    def __init__(self, directory: Path = PROMPTS_DIR, reload: bool = PROMPT_RELOAD):
+        self.directory = Path(directory)
+        self.reload = reload
+        self._templates: dict[str, PromptTemplate] = {}
+        for path in sorted(self.directory.rglob("*")):
+            if path.is_file():
+                self._load(path.relative_to(self.directory).as_posix())
+        logger.info("prompts_loaded", count=len(self._templates), reload=self.reload)
+
+    def get(self, name: str) -> PromptTemplate:
+        template = self._templates.get(name)
+        if template is None:
+            # Not present at startup; FileNotFoundError if it still is not.
+            return self._load(name)
+        if self.reload:
+            path = self.directory / name
+            if path.stat().st_mtime != template.mtime:
+                logger.info("prompt_reloaded", prompt=name)
+                return self._load(name)
+        return template
+
+    def text(self, name: str) -> str:
+        return self.get(name).text
+
+    def render(self, name: str, /, **values: Any) -> str:
+        return self.get(name).render(values)
+
+    def bind(self, name: str, fields: Iterable[str]) -> "BoundPrompt":
+        """Check now that fields cover the template's placeholders; render later."""
+        template = self.get(name)
+        if template.placeholders is None:
+            raise ValueError(f"Prompt {name} is not a format template")
+        missing = template.placeholders - set(fields)
+        if missing:
+            raise KeyError(
+                f"Prompt {name} needs fields not supplied: {sorted(missing)}"
+            )
+        return BoundPrompt(self, name)
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def _load(self, name: str) -> PromptTemplate:
+        path = self.directory / name
+        text = path.read_text(encoding="utf-8")
+        template = PromptTemplate(
+            name=name,
+            text=text,
+            placeholders=_placeholders(text),
+            mtime=path.stat().st_mtime,
+        )
+        self._templates[name] = template
+        return template
+
+
+@dataclass(frozen=True)
+class BoundPrompt:
+    """A prompt whose fields were validated when it was bound."""
+
+    registry: PromptRegistry
+    name: str
+
+    def render(self, /, **values: Any) -> str:
+        return self.registry.render(self.name, **values)
+
+
+_registry: Optional[PromptRegistry] = None
+
+
+def get_prompt_registry() -> PromptRegistry:
+    """Get the shared prompt registry, loading every prompt on first use."""
+    global _registry
+    if _registry is None:
+        _registry = PromptRegistry()
+    return _registry